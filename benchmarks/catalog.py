@@ -0,0 +1,79 @@
+"""플리마켓 물품 카탈로그 벤치마크.
+
+물품 ``--items`` 개(기본 10만)를 카탈로그에 채운 뒤, 첫 페이지·깊은 페이지·카테고리·판매자
+조회 시간과 플리마켓 페이지 전체 재실행 시간(AppTest)을 측정합니다. 페이지 재실행
+p50 이 ``--budget-ms`` (기본 100ms)를 넘으면 종료 코드 1로 끝납니다.
+
+    python -m benchmarks.catalog --items 100000
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.rerun import APP, PAGES
+
+
+def _ms(run, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def run(items, repeat, budget_ms):
+    # ESG_DB_PATH 를 지정한 뒤에 저장소 모듈을 불러옴
+    from streamlit.testing.v1 import AppTest
+
+    from esg import datagen
+    from esg.catalog import ItemCatalog
+    from esg.store import EventStore
+
+    store = EventStore()
+    start = time.perf_counter()
+    employees = items * datagen.BASE_EMPLOYEES // len(datagen.FLEA_ITEMS)
+    # 플리마켓만 물품 수에 맞춰 생성 (나머지 캠페인은 앱이 기본 규모로 채움)
+    datagen.seed_store(store, {"flea_market": datagen.generate_campaign("flea_market", seed=42, employees=employees)}, replace=True)
+    catalog = ItemCatalog(store)
+    listed = store.snapshot("flea_market")["total_items"]
+    print(f"seed       {(time.perf_counter() - start) * 1000:>8.0f}ms  (물품 {listed:,}개)")
+
+    last = catalog.page(after=0, limit=listed)[0][-1]["id"]
+    queries = {
+        "first page": lambda: catalog.page(),
+        "deep page": lambda: catalog.page(after=last - 20),
+        "category": lambda: catalog.page(category="운동용품", after=last // 2),
+        "seller": lambda: catalog.page(seller="캠핑러", after=last // 2),
+    }
+    for name, query in queries.items():
+        print(f"{name:<10} {_ms(query, repeat * 20):>8.2f}ms")
+
+    at = AppTest.from_file(APP, default_timeout=300)
+    at.run()
+    at.switch_page(PAGES["flea-market"]).run()
+    page_ms = _ms(at.run, repeat)
+    buy_ms = _ms(lambda: at.button(key=[b.key for b in at.button if b.key and b.key.startswith("buy_")][0]).click().run(), repeat)
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    print(f"page rerun {page_ms:>8.0f}ms  (budget {budget_ms}ms)")
+    print(f"purchase   {buy_ms:>8.0f}ms")
+    return page_ms <= budget_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=int, default=100)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["ESG_DB_PATH"] = os.path.join(tmp, "catalog.db")
+        ok = run(args.items, args.repeat, args.budget_ms)
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
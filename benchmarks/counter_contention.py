@@ -0,0 +1,79 @@
+"""공유 카운터 경합 벤치마크.
+
+여러 스레드가 같은 사옥 카운터를 동시에 증가시킬 때의 처리량과 유실 여부를
+측정합니다. 클릭마다 트랜잭션을 여는 방식과 ``CounterService`` 의 쓰기
+병합 방식을 비교합니다.
+
+    python -m benchmarks.counter_contention --threads 64 --clicks 2000
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from esg.counters import CounterService
+from esg.store import EventStore
+
+BUILDINGS = ["잠실", "판교IT", "판교물류", "상암", "수원"]
+
+
+def _seed(store):
+    store.seed("stair_climbing", {key: {"name": key, "image": "🏢", "participants": 0} for key in BUILDINGS}, replace=True)
+
+
+def _hammer(threads, clicks, click):
+    barrier = threading.Barrier(threads)
+
+    def worker(index):
+        barrier.wait()
+        for n in range(clicks):
+            click(BUILDINGS[(index + n) % len(BUILDINGS)])
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def _total(store):
+    return sum(building["participants"] for building in store.snapshot("stair_climbing").values())
+
+
+def run(threads, clicks, direct_clicks):
+    with tempfile.TemporaryDirectory() as tmp:
+        store = EventStore(os.path.join(tmp, "bench.db"))
+
+        _seed(store)
+        elapsed = _hammer(threads, direct_clicks, lambda key: store.append("stair_climbing", [("incr", [key, "participants"], 1)]))
+        expected = threads * direct_clicks
+        print(f"[direct]    {expected:>9,} clicks  {expected / elapsed:>12,.0f}/s  lost={expected - _total(store)}")
+
+        _seed(store)
+        first_event = store.history("stair_climbing", limit=1)[0]["id"]
+        counters = CounterService(store, flush_interval=0.05)
+        elapsed = _hammer(threads, clicks, lambda key: counters.incr("stair_climbing", [key, "participants"]))
+        start = time.perf_counter()
+        counters.close()
+        elapsed += time.perf_counter() - start
+        expected = threads * clicks
+        writes = store.history("stair_climbing", limit=1)[0]["id"] - first_event
+        print(f"[coalesced] {expected:>9,} clicks  {expected / elapsed:>12,.0f}/s  lost={expected - _total(store)}  writes={writes}")
+        return expected - _total(store)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=64)
+    parser.add_argument("--clicks", type=int, default=2000, help="스레드당 클릭 수 (쓰기 병합)")
+    parser.add_argument("--direct-clicks", type=int, default=50, help="스레드당 클릭 수 (클릭당 트랜잭션)")
+    args = parser.parse_args()
+    lost = run(args.threads, args.clicks, args.direct_clicks)
+    raise SystemExit(1 if lost else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""탄소 발자국 기간 선택(누적 합) 벤치마크.
+
+``--days`` 일(기본 5년) 동안의 일별 참여 건수·탄소 절약량 구간 합계를 기록한 뒤 다음을 측정합니다.
+
+1. 예전 방식: 기간의 일별 구간 합계를 ``DataFrame`` 으로 읽어 pandas 로 이동 평균과
+   평일/주말 평균을 계산하는 시간
+2. ``Rollups.cumulative``: 누적 합을 처음 만드는 시간과 캐시에서 다시 얻는 시간
+3. 누적 합으로 임의 기간 합계 100개, 전체 기간 7/30일 이동 평균, 평일/주말 평균을 계산하는 시간
+4. 모든 값이 pandas 로 계산한 값과 같은지
+
+누적 합 계산 p50 이 ``--budget-ms`` (기본 5ms)를 넘거나 값이 다르면 종료 코드 1로 끝납니다.
+
+    python -m benchmarks.cumulative --days 1825
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+
+def _ms(run, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def run(days, repeat, budget_ms):
+    from esg import datagen
+    from esg.rollups import Rollups, date_bucket
+    from esg.store import EventStore
+
+    store = EventStore()
+    datagen.seed_store(
+        store, {"carbon_footprint": datagen.generate_campaign("carbon_footprint", seed=42, days=days)}, replace=True
+    )
+    rollups = Rollups(store)
+    end = date_bucket("day", date.today())
+    start = end - days + 1
+    print(f"일별 구간 {days:,}일 × 2개 지표")
+
+    def legacy():
+        frame = rollups.frame("carbon_footprint", ["participations"], "day", start, end)
+        weekend = pd.to_datetime(frame["start"]).dt.weekday >= 5
+        return (frame["participations"].rolling(7, min_periods=1).mean(),
+                frame["participations"].rolling(30, min_periods=1).mean(),
+                frame.groupby(weekend)["participations"].mean())
+
+    legacy_ms = _ms(legacy, repeat)
+    print(f"legacy DataFrame + pandas rolling  {legacy_ms:>8.2f}ms")
+
+    build_start = time.perf_counter()
+    cumulative = rollups.cumulative("carbon_footprint", "participations")
+    build_ms = (time.perf_counter() - build_start) * 1000
+    cached_ms = _ms(lambda: rollups.cumulative("carbon_footprint", "participations"), repeat)
+    print(f"cumulative build  {build_ms:>8.2f}ms  cached {cached_ms:.3f}ms")
+
+    rng = np.random.default_rng(0)
+    starts = rng.integers(start, end, 100)
+    ends = starts + rng.integers(0, end - starts + 1)
+    timings = {
+        "range totals x100": _ms(lambda: cumulative.total(starts, ends), repeat),
+        "rolling 7 + 30 (all days)": _ms(
+            lambda: (cumulative.rolling(7, start, end), cumulative.rolling(30, start, end)), repeat
+        ),
+        "weekday/weekend mean": _ms(
+            lambda: (cumulative.mean(start, end, "weekday"), cumulative.mean(start, end, "weekend")), repeat
+        ),
+    }
+    for name, value in timings.items():
+        print(f"{name:<26} {value:>7.3f}ms")
+
+    rolling_7, rolling_30, by_weekend = legacy()
+    values = rollups.series("carbon_footprint", "participations", "day", start, end)
+    expected_totals = [values[a - start:b - start + 1].sum() for a, b in zip(starts, ends)]
+    same = (
+        np.allclose(cumulative.total(starts, ends), expected_totals)
+        and np.allclose(cumulative.rolling(7, start, end), rolling_7)
+        and np.allclose(cumulative.rolling(30, start, end), rolling_30)
+        and np.isclose(cumulative.mean(start, end, "weekday"), by_weekend[False])
+        and np.isclose(cumulative.mean(start, end, "weekend"), by_weekend[True])
+    )
+    print(f"same as pandas {same}  (budget {budget_ms}ms)")
+    return same and max(timings.values()) <= budget_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=1825)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=5)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["ESG_DB_PATH"] = os.path.join(tmp, "cumulative.db")
+        ok = run(args.days, args.repeat, args.budget_ms)
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
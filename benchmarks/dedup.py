@@ -0,0 +1,95 @@
+"""아이디어 중복 제안 탐지(MinHash/LSH) 벤치마크.
+
+합성 아이디어 제목 ``--ideas`` 건(기본 5만, ``benchmarks.search`` 의 어절 조합 + 실제 아이디어
+제목)을 저장소에 채운 뒤 다음을 측정합니다.
+
+- 첫 색인 생성(서명 계산·저장 포함)과, 저장된 서명으로 색인을 다시 만드는 시간
+- 변형 제목 질의의 응답 시간과, 모든 제목과 Jaccard 유사도를 하나씩 계산하는 방식의 시간
+- 하나씩 계산한 결과(유사도 0.5 이상) 대비 LSH 가 찾아낸 비율(재현율)
+
+가장 느린 질의가 ``--budget-ms`` (기본 100ms)를 넘으면 종료 코드 1로 끝납니다.
+
+    python -m benchmarks.dedup --ideas 50000
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.search import IDEA_TITLES, corpus
+
+QUERIES = [
+    "스마트조명 시스템 도입하기", "사무실 재활용 시스템 개선안", "전기차 충전소 확대",
+    "회의실 대기 전력 차단", "텀블러 세척기 설치 요청", "원격 근무 환경 최적화",
+]
+
+
+def _ms(run, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), max(samples)
+
+
+def run(ideas, repeat, budget_ms):
+    from esg import datagen
+    from esg.ideas import IdeaBoard
+    from esg.minhash import THRESHOLD, DuplicateIndex
+    from esg.search import grams
+    from esg.store import EventStore
+
+    titles = [title for _, title, _ in corpus(ideas - len(IDEA_TITLES))] + IDEA_TITLES
+    state = datagen.generate_campaign("idea", seed=42)
+    template = state["ideas"][0]
+    state["ideas"] = [dict(template, title=title, stage="제안") for title in titles]
+    board = IdeaBoard(EventStore())
+    board.seed(state, replace=True)
+
+    start = time.perf_counter()
+    DuplicateIndex(board).refresh()
+    print(f"build {len(titles):,} ideas   {(time.perf_counter() - start) * 1000:>8.0f}ms  (서명 계산·저장)")
+    index = DuplicateIndex(board)
+    start = time.perf_counter()
+    index.refresh()
+    print(f"reload              {(time.perf_counter() - start) * 1000:>8.0f}ms  (저장된 서명)")
+
+    # 비교 기준: 모든 제목의 n-gram 집합과 Jaccard 유사도를 하나씩 계산
+    shingles = [set(grams(title)) for title in titles]
+
+    def scan(query):
+        q = set(grams(query))
+        return {i + 1 for i, s in enumerate(shingles) if len(q & s) / len(q | s) >= THRESHOLD}
+
+    worst = 0
+    found_total = expected_total = 0
+    for query in QUERIES:
+        p50, slowest = _ms(lambda: index.similar(query), repeat)
+        scan_ms, _ = _ms(lambda: scan(query), 1)
+        worst = max(worst, slowest)
+        expected = scan(query)
+        found = {idea_id for idea_id, _ in index.similar(query, limit=None)}
+        found_total += len(found & expected)
+        expected_total += len(expected)
+        print(f"  {query:<16} p50 {p50:>6.2f}ms  max {slowest:>6.2f}ms  "
+              f"pairwise {scan_ms:>7.1f}ms  (found {len(found & expected):,}/{len(expected):,})")
+    print(f"\nrecall {found_total / max(expected_total, 1):.1%}  worst {worst:.2f}ms (budget {budget_ms}ms)")
+    return worst <= budget_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ideas", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--budget-ms", type=int, default=100)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["ESG_DB_PATH"] = os.path.join(tmp, "dedup.db")
+        ok = run(args.ideas, args.repeat, args.budget_ms)
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
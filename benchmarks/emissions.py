@@ -0,0 +1,91 @@
+"""배출계수 변경 후 1년치 감축량 재계산 벤치마크.
+
+전사 임직원의 1년치 활동 이벤트(활동 코드, 수량, 날짜 배열)를 만들고, 연중에
+전력 배출계수(EF)가 바뀐 상황에서 ``esg.emissions.compute`` 로 전체 감축량을 다시
+계산하는 시간을 측정합니다. 레코드마다 계수를 찾아 계산하는 파이썬 반복과
+결과·시간을 비교합니다 (반복 방식은 ``--loop-sample`` 건으로 측정해 환산).
+
+    python -m benchmarks.emissions --employees 20000 --days 365
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+import numpy as np
+
+from esg import emissions
+from esg.store import EventStore
+
+
+def make_events(employees, days, seed=0):
+    rng = np.random.default_rng(seed)
+    n = employees * days
+    today = np.datetime64(date.today(), "D")
+    codes = rng.integers(0, len(emissions.ACTIVITIES), n)
+    quantities = rng.integers(1, 5, n).astype(float)
+    dates = today - rng.integers(0, days, n).astype("timedelta64[D]")
+    return codes, quantities, dates
+
+
+def loop_compute(codes, quantities, dates, factors):
+    # 레코드마다 날짜별 계수를 찾는 기존 방식
+    names = list(emissions.ACTIVITIES)
+    return [
+        quantity * float(emissions.unit_reduction(names[code], day, factors))
+        for code, quantity, day in zip(codes.tolist(), quantities.tolist(), dates)
+    ]
+
+
+def run(employees, days, loop_sample, repeat):
+    codes, quantities, dates = make_events(employees, days)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = EventStore(os.path.join(tmp, "bench.db"))
+        store.add_factors(emissions.DEFAULT_FACTORS)
+        before = emissions.load(store)
+        baseline = emissions.compute(codes, quantities, dates, before)
+
+        # 연중 전력 배출계수 개정
+        revised_on = (date.today() - timedelta(days=days // 2)).isoformat()
+        store.add_factors([("EF", revised_on, 0.4781, "kgCO₂eq/kWh", "벤치마크용 개정 계수")])
+        start = time.perf_counter()
+        after = emissions.load(store)
+        load_ms = (time.perf_counter() - start) * 1000
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = emissions.compute(codes, quantities, dates, after)
+        totals = emissions.totals(codes, result)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    sample = slice(0, min(loop_sample, len(codes)))
+    start = time.perf_counter()
+    expected = loop_compute(codes[sample], quantities[sample], dates[sample], after)
+    loop_ms = (time.perf_counter() - start) * 1000 * len(codes) / max(sample.stop, 1)
+    error = float(np.max(np.abs(result[sample] - expected))) if expected else 0.0
+
+    print(f"events     {len(codes):>12,}  ({employees:,}명 × {days}일)")
+    print(f"load       {load_ms:>10.1f}ms  (계수 테이블 v{after.version})")
+    print(f"vectorized {min(timings):>10.1f}ms  (compute + totals, best of {repeat})")
+    print(f"loop       {loop_ms:>10.0f}ms  (추정, {sample.stop:,}건 측정)")
+    print(f"change     {sum(totals.values()) - float(baseline.sum()):>+10.1f}kgCO₂eq  max |loop - vectorized| = {error:.2e}")
+    for activity, total in totals.items():
+        print(f"  {activity:<16} {total:>14,.1f}kg")
+    return error
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--employees", type=int, default=20000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--loop-sample", type=int, default=100000, help="파이썬 반복으로 계산할 이벤트 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    error = run(args.employees, args.days, args.loop_sample, args.repeat)
+    raise SystemExit(1 if error > 1e-9 else 0)
+
+
+if __name__ == "__main__":
+    main()
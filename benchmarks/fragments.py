@@ -0,0 +1,178 @@
+"""카드 버튼 클릭당 전송량 / 서버 CPU 벤치마크.
+
+실제 ``streamlit run`` 서버를 띄우고 브라우저처럼 웹소켓으로 접속해, 등록하기·스탬프 적립·
+봉사 참여·구매하기 버튼을 반복 클릭합니다. 클릭마다 서버가 보낸 메시지 수와 바이트,
+서버 프로세스 CPU 시간(/proc 기준, Linux)을 측정합니다. 버튼이 조각(fragment) 안에
+있으면 브라우저와 같이 조각 재실행을 요청합니다.
+
+    python -m benchmarks.fragments                 # 현재 작업 트리
+    python -m benchmarks.fragments --rev HEAD~1    # 이전 커밋과 비교
+"""
+import argparse
+import asyncio
+import contextlib
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.startup import ROOT, export_revision
+
+# (url_path, 버튼 라벨)
+CASES = [
+    ("", "등록하기"),
+    ("green-ribbon", "스탬프 적립"),
+    ("volunteer", "봉사 참여"),
+    ("flea-market", "구매하기"),
+]
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _cpu_seconds(pid):
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    # utime, stime (clock ticks)
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+class Session:
+    """브라우저 한 탭처럼 재실행을 요청하고 응답 메시지를 집계하는 웹소켓 세션."""
+
+    def __init__(self, ws):
+        self.ws = ws
+        self.pages = {}
+        self.buttons = {}
+        self.button_ids = []
+        self.deltas = 0
+
+    async def run(self, page_hash="", widget_id=None, fragment_id=""):
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.page_script_hash = page_hash
+        if widget_id is not None:
+            widget = msg.rerun_script.widget_states.widgets.add()
+            widget.id = widget_id
+            widget.trigger_value = True
+            msg.rerun_script.fragment_id = fragment_id
+        await self.ws.send(msg.SerializeToString())
+
+        size = count = deltas = 0
+        buttons = {}
+        button_ids = []
+        while True:
+            raw = await self.ws.recv()
+            size += len(raw)
+            count += 1
+            forward = ForwardMsg()
+            forward.ParseFromString(raw)
+            kind = forward.WhichOneof("type")
+            if kind == "navigation":
+                self.pages = {page.url_pathname: page.page_script_hash for page in forward.navigation.app_pages}
+            elif kind == "delta":
+                deltas += 1
+                element = forward.delta.new_element
+                if forward.delta.WhichOneof("type") == "new_element" and element.WhichOneof("type") == "button":
+                    buttons.setdefault(element.button.label, (element.button.id, forward.delta.fragment_id))
+                    button_ids.append(element.button.id)
+            elif kind == "script_finished" and forward.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                break
+        # 조각 재실행 응답에는 조각 안 버튼만 있으므로 새로 받은 버튼만 갱신
+        self.buttons.update(buttons)
+        self.button_ids = button_ids
+        self.deltas = deltas
+        return size, count
+
+
+async def connect(port):
+    import websockets
+
+    for _ in range(300):
+        try:
+            return await websockets.connect(f"ws://127.0.0.1:{port}/_stcore/stream", max_size=None)
+        except OSError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError("streamlit 서버에 연결할 수 없습니다.")
+
+
+@contextlib.contextmanager
+def serve(app_dir, db_path):
+    """``app_dir`` 의 앱을 빈 포트에서 실행하고 ``(포트, 서버 pid)`` 를 돌려줍니다."""
+    port = _free_port()
+    env = dict(os.environ, PYTHONPATH=app_dir, ESG_DB_PATH=db_path)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", os.path.join(app_dir, "app.py"),
+         "--server.headless", "true", "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        cwd=app_dir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        yield port, server.pid
+    finally:
+        server.terminate()
+        server.wait()
+
+
+async def _measure(port, pid, clicks):
+    results = []
+    async with await connect(port) as ws:
+        session = Session(ws)
+        await session.run()
+        for url_path, label in CASES:
+            page_hash = session.pages.get(url_path, "")
+            session.buttons = {}
+            await session.run(page_hash)
+            samples = []
+            for _ in range(clicks):
+                widget_id, fragment_id = session.buttons[label]
+                cpu = _cpu_seconds(pid)
+                start = time.perf_counter()
+                size, count = await session.run(page_hash, widget_id, fragment_id)
+                samples.append((size, count, (_cpu_seconds(pid) - cpu) * 1000, (time.perf_counter() - start) * 1000))
+            results.append((url_path or "stair-climbing", label, bool(fragment_id), samples))
+    return results
+
+
+def measure(app_dir, db_path, clicks):
+    with serve(app_dir, db_path) as (port, pid):
+        return asyncio.run(_measure(port, pid, clicks))
+
+
+def report(label, results):
+    print(f"\n[{label}]")
+    print(f"{'page':<16} {'button':<10} {'scope':<9} {'msgs':>5} {'bytes':>8} {'cpu':>8} {'wall':>8}")
+    for page, button, fragment, samples in results:
+        print(
+            f"{page:<16} {button:<10} {'fragment' if fragment else 'app':<9} "
+            f"{statistics.median(s[1] for s in samples):>5.0f} "
+            f"{statistics.median(s[0] for s in samples) / 1024:>6.1f}KB "
+            f"{statistics.median(s[2] for s in samples):>6.0f}ms "
+            f"{statistics.median(s[3] for s in samples):>6.0f}ms"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rev", help="비교할 git 리비전 (예: HEAD~1)")
+    parser.add_argument("--clicks", type=int, default=10, help="버튼별 클릭 횟수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.rev:
+            rev_dir = os.path.join(tmp, "rev")
+            os.makedirs(rev_dir)
+            report(args.rev, measure(export_revision(args.rev, rev_dir), os.path.join(tmp, "rev.db"), args.clicks))
+        report("현재", measure(ROOT, os.path.join(tmp, "current.db"), args.clicks))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""임직원 아이디어 Workflow 벤치마크.
+
+아이디어 약 ``--ideas`` 건(기본 10만)을 저장소에 채운 뒤 제안·단계 이동 시간,
+집계 행으로 읽는 단계별 건수와 테이블을 다시 세는 방식(GROUP BY)의 시간,
+아이디어 페이지 재실행 시간(AppTest)을 측정합니다. 페이지 재실행 p50 이
+``--budget-ms`` (기본 150ms)를 넘거나 집계가 테이블과 다르면 종료 코드 1로 끝납니다.
+
+    python -m benchmarks.ideas --ideas 100000
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.rerun import APP, PAGES
+
+
+def _ms(run, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def run(ideas, repeat, budget_ms):
+    # ESG_DB_PATH 를 지정한 뒤에 저장소 모듈을 불러옴
+    from streamlit.testing.v1 import AppTest
+
+    from esg import datagen
+    from esg.ideas import STAGES, IdeaBoard
+    from esg.store import EventStore
+
+    store = EventStore()
+    start = time.perf_counter()
+    # 기본 규모(500명)에서 단계별 건수 범위의 중간값 합은 약 121건
+    employees = ideas * datagen.BASE_EMPLOYEES // 121
+    datagen.seed_store(store, {"idea": datagen.generate_campaign("idea", seed=42, employees=employees)}, replace=True)
+    board = IdeaBoard(store)
+    print(f"seed       {(time.perf_counter() - start) * 1000:>8.0f}ms  (아이디어 {board.count():,}건)")
+
+    idea = {"title": "벤치마크 아이디어", "description": "설명", "category": "기타", "department": "환경팀",
+            "priority": "보통", "impact": "보통", "period": "1개월", "author": "홍길동"}
+    submitted = []
+    print(f"submit     {_ms(lambda: submitted.append(board.submit(idea)), repeat * 10):>8.2f}ms")
+    moves = iter([(idea_id, stage) for stage in STAGES[:-1] for idea_id in submitted])
+    print(f"advance    {_ms(lambda: board.advance(*next(moves)), repeat * 10):>8.2f}ms")
+
+    conn = store.connection()
+    recount = lambda: dict(conn.execute("SELECT stage, COUNT(*) FROM ideas GROUP BY stage").fetchall())
+    snapshot = lambda: {name: stage["count"] for name, stage in store.snapshot("idea")["workflow_stages"].items()}
+    print(f"counts     {_ms(snapshot, repeat * 10):>8.3f}ms  (집계 행)")
+    print(f"recount    {_ms(recount, repeat):>8.1f}ms  (GROUP BY)")
+    consistent = snapshot() == {stage: recount().get(stage, 0) for stage in STAGES}
+    print(f"consistent {consistent}")
+
+    at = AppTest.from_file(APP, default_timeout=300)
+    at.run()
+    at.switch_page(PAGES["ideas"]).run()
+    page_ms = _ms(at.run, repeat)
+    advance_ms = _ms(lambda: at.button(key=[b.key for b in at.button if b.key and b.key.startswith("advance_")][0]).click().run(), repeat)
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    print(f"page rerun {page_ms:>8.0f}ms  (budget {budget_ms}ms)")
+    print(f"advance UI {advance_ms:>8.0f}ms")
+    return consistent and page_ms <= budget_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ideas", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=int, default=150)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["ESG_DB_PATH"] = os.path.join(tmp, "ideas.db")
+        ok = run(args.ideas, args.repeat, args.budget_ms)
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""아이디어 좋아요·인기 순위 벤치마크.
+
+아이디어 약 ``--ideas`` 건(기본 10만)을 저장소에 채운 뒤 다음을 측정합니다.
+
+1. 인기 아이디어 TOP 5: ``hot`` 인덱스 범위 읽기와, 모든 아이디어의 감쇠 점수를 계산해
+   정렬하는 방식의 시간
+2. 좋아요 폭주: ``--threads`` 명이 ``--clicks`` 번씩 몇몇 인기 아이디어에 몰리게 누를 때,
+   클릭마다 바로 기록하는 방식과 ``LikeBuffer`` 로 모아 기록하는 방식의 처리량·응답 시간
+3. 모아 기록한 뒤의 좋아요 수와 인기 점수가 클릭 시각으로 다시 계산한 값과 같은지
+
+TOP 5 p50 이 ``--budget-ms`` (기본 5ms)를 넘거나 좋아요 수·점수가 어긋나면 종료 코드 1로 끝납니다.
+
+    python -m benchmarks.likes --ideas 100000 --threads 32 --clicks 200
+"""
+import argparse
+import math
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+
+def _ms(run, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _burst(click, threads, targets):
+    """스레드마다 ``targets`` 를 차례로 누르고 ``(걸린 초, 응답 시간 목록, 클릭 기록)`` 을 반환합니다."""
+    barrier = threading.Barrier(threads)
+    latencies = []
+    clicks = []
+    lock = threading.Lock()
+
+    def worker(index):
+        samples = []
+        mine = []
+        barrier.wait()
+        for idea_id in targets[index]:
+            at = time.time()
+            start = time.perf_counter()
+            click(idea_id, at)
+            samples.append((time.perf_counter() - start) * 1000)
+            mine.append((idea_id, at))
+        with lock:
+            latencies.extend(samples)
+            clicks.extend(mine)
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return time.perf_counter() - start, sorted(latencies), clicks
+
+
+def run(ideas, threads, clicks, repeat, budget_ms):
+    from esg import datagen
+    from esg.ideas import HOT_TAU, HOT_WEIGHTS, IdeaBoard, hot_add, hot_term
+    from esg.likes import LikeBuffer
+    from esg.store import EventStore
+
+    store = EventStore()
+    # 기본 규모(500명)에서 단계별 건수 범위의 중간값 합은 약 121건
+    employees = ideas * datagen.BASE_EMPLOYEES // 121
+    datagen.seed_store(store, {"idea": datagen.generate_campaign("idea", seed=42, employees=employees)}, replace=True)
+    board = IdeaBoard(store)
+    conn = store.connection()
+    print(f"아이디어 {board.count():,}건")
+
+    def full_sort():
+        now = time.time()
+        rows = conn.execute("SELECT id, likes, comments, created_at FROM ideas").fetchall()
+        # 좋아요·댓글을 제안 시각에 받은 것으로 보고 지금 기준 감쇠 점수로 정렬
+        return sorted(
+            rows,
+            key=lambda row: (HOT_WEIGHTS["submit"] + row[1] * HOT_WEIGHTS["like"] + row[2] * HOT_WEIGHTS["comment"])
+            * math.exp((row[3] - now) / HOT_TAU),
+            reverse=True,
+        )[:5]
+
+    top_ms = _ms(lambda: board.hot(5), repeat * 10)
+    sort_ms = _ms(full_sort, repeat)
+    same = [row[0] for row in full_sort()] == [idea["id"] for idea in board.hot(5)]
+    print(f"TOP 5 hot index  {top_ms:>8.3f}ms  (budget {budget_ms}ms)")
+    print(f"TOP 5 full sort  {sort_ms:>8.1f}ms  (same order {same})")
+
+    # 인기 아이디어 몇 건에 몰리는 클릭 (상위 20건에 절반)
+    first = board.first_id()
+    ids = np.arange(first, first + board.count())
+    hot_ids = [idea["id"] for idea in board.hot(20)]
+    rng = np.random.default_rng(42)
+    targets = [
+        np.where(rng.random(clicks) < 0.5, rng.choice(hot_ids, clicks), rng.choice(ids, clicks)).tolist()
+        for _ in range(threads)
+    ]
+    before = dict(conn.execute("SELECT id, hot FROM ideas").fetchall())
+    likes_before = conn.execute("SELECT SUM(likes) FROM ideas").fetchone()[0]
+
+    elapsed, latencies, direct = _burst(
+        lambda idea_id, at: board.add_likes({idea_id: (1, hot_term(HOT_WEIGHTS["like"], at))}), threads, targets
+    )
+    print(f"\ndirect   {len(latencies) / elapsed:>9,.0f} clicks/s  p50 {statistics.median(latencies):.3f}ms  "
+          f"p99 {latencies[int(len(latencies) * 0.99)]:.3f}ms  ({len(latencies):,} transactions)")
+
+    buffer = LikeBuffer(board)
+    flushes = []
+    flush = buffer.flush
+    buffer.flush = lambda: flushes.append(flush())
+    elapsed, latencies, buffered = _burst(lambda idea_id, at: buffer.like(idea_id, at), threads, targets)
+    buffer.close()
+    print(f"buffered {len(latencies) / elapsed:>9,.0f} clicks/s  p50 {statistics.median(latencies):.3f}ms  "
+          f"p99 {latencies[int(len(latencies) * 0.99)]:.3f}ms  ({sum(1 for n in flushes if n):,} transactions)")
+
+    # 클릭 시각으로 인기 점수를 처음부터 다시 계산해 비교
+    expected = dict(before)
+    for idea_id, at in sorted(direct + buffered, key=lambda click: click[1]):
+        expected[idea_id] = hot_add(expected[idea_id], hot_term(HOT_WEIGHTS["like"], at))
+    stored = dict(conn.execute("SELECT id, hot FROM ideas").fetchall())
+    drift = max(abs(stored[idea_id] - hot) for idea_id, hot in expected.items())
+    likes_ok = conn.execute("SELECT SUM(likes) FROM ideas").fetchone()[0] - likes_before == len(direct) + len(buffered)
+    top_ok = [idea["id"] for idea in board.hot(5)] == sorted(expected, key=expected.get, reverse=True)[:5]
+    print(f"\nlikes consistent {likes_ok}  top 5 consistent {top_ok}  max score drift {drift:.2e}")
+    print(f"hot index range {conn.execute('EXPLAIN QUERY PLAN SELECT id FROM ideas ORDER BY hot DESC LIMIT 5').fetchone()[3]}")
+    return likes_ok and top_ok and drift < 1e-9 and top_ms <= budget_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ideas", type=int, default=100000)
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--clicks", type=int, default=200, help="스레드당 클릭 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=int, default=5)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["ESG_DB_PATH"] = os.path.join(tmp, "likes.db")
+        ok = run(args.ideas, args.threads, args.clicks, args.repeat, args.budget_ms)
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""플리마켓 물품 목록 전송량 / 렌더링 시간 벤치마크.
+
+물품 수(``--sizes``, 기본 100·1000·10000)별로 저장소를 채우고 실제 ``streamlit run`` 서버에
+웹소켓으로 접속해 플리마켓 페이지를 열었을 때와 ``다음 ▶`` 으로 다음 페이지를 불러올 때
+서버가 보낸 메시지 수·델타(화면 요소) 수·바이트, 서버 CPU 시간과 응답 완료까지의 시간을
+측정합니다. 저장소는 측정하는 리비전의 샘플 데이터 생성기로 채웁니다.
+
+    python -m benchmarks.listing                 # 현재 작업 트리
+    python -m benchmarks.listing --rev HEAD~2    # 모든 물품을 그리던 리비전과 비교
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.fragments import Session, _cpu_seconds, connect, serve
+from benchmarks.startup import ROOT, export_revision
+
+SEED_SCRIPT = """
+import sys
+from esg import datagen
+from esg.store import EventStore
+
+items = int(sys.argv[1])
+employees = items * datagen.BASE_EMPLOYEES // len(datagen.FLEA_ITEMS)
+state = datagen.generate_campaign("flea_market", seed=42, employees=employees)
+datagen.seed_store(EventStore(sys.argv[2]), {"flea_market": state}, replace=True)
+"""
+
+
+def seed(app_dir, db_path, items):
+    # 리비전마다 저장 방식(집계 행 리스트 / 카탈로그 테이블)이 다르므로 해당 리비전 코드로 채움
+    env = dict(os.environ, PYTHONPATH=app_dir)
+    subprocess.run([sys.executable, "-c", SEED_SCRIPT, str(items), db_path], cwd=app_dir, env=env, check=True)
+
+
+async def _measure(port, pid, repeat):
+    results = {"open": [], "next": []}
+    async with await connect(port) as ws:
+        session = Session(ws)
+        await session.run()
+        page_hash = session.pages["flea-market"]
+        home = next(iter(session.pages.values()))
+        for _ in range(repeat):
+            # 다른 페이지에서 플리마켓으로 이동 (첫 페이지 전체 재실행)
+            await session.run(home)
+            session.buttons = {}
+            cpu = _cpu_seconds(pid)
+            start = time.perf_counter()
+            size, count = await session.run(page_hash)
+            results["open"].append((size, count, session.deltas, (_cpu_seconds(pid) - cpu) * 1000,
+                                    (time.perf_counter() - start) * 1000))
+            # 페이지 버튼이 없는 리비전(모든 물품을 한 번에 그림)은 다음 페이지 측정 생략
+            if "다음 ▶" not in session.buttons:
+                continue
+            widget_id, fragment_id = session.buttons["다음 ▶"]
+            cpu = _cpu_seconds(pid)
+            start = time.perf_counter()
+            size, count = await session.run(page_hash, widget_id, fragment_id)
+            results["next"].append((size, count, session.deltas, (_cpu_seconds(pid) - cpu) * 1000,
+                                    (time.perf_counter() - start) * 1000))
+    return results
+
+
+def measure(app_dir, db_path, items, repeat):
+    seed(app_dir, db_path, items)
+    with serve(app_dir, db_path) as (port, pid):
+        return asyncio.run(_measure(port, pid, repeat))
+
+
+def report(label, rows):
+    print(f"\n[{label}]")
+    print(f"{'items':>7} {'action':<6} {'msgs':>6} {'deltas':>7} {'bytes':>10} {'cpu':>8} {'wall':>8}")
+    for items, results in rows:
+        for action, samples in results.items():
+            if not samples:
+                continue
+            print(
+                f"{items:>7,} {action:<6} "
+                f"{statistics.median(s[1] for s in samples):>6.0f} "
+                f"{statistics.median(s[2] for s in samples):>7.0f} "
+                f"{statistics.median(s[0] for s in samples) / 1024:>8.1f}KB "
+                f"{statistics.median(s[3] for s in samples):>6.0f}ms "
+                f"{statistics.median(s[4] for s in samples):>6.0f}ms"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rev", help="비교할 git 리비전 (예: HEAD~2)")
+    parser.add_argument("--sizes", default="100,1000,10000", help="쉼표로 구분한 물품 수")
+    parser.add_argument("--repeat", type=int, default=3, help="물품 수별 측정 횟수")
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.rev:
+            rev_dir = os.path.join(tmp, "rev")
+            os.makedirs(rev_dir)
+            export_revision(args.rev, rev_dir)
+            report(args.rev, [(n, measure(rev_dir, os.path.join(tmp, f"rev-{n}.db"), n, args.repeat)) for n in sizes])
+        report("현재", [(n, measure(ROOT, os.path.join(tmp, f"current-{n}.db"), n, args.repeat)) for n in sizes])
+
+
+if __name__ == "__main__":
+    main()
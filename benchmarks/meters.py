@@ -0,0 +1,153 @@
+"""스마트 미터 15분 계량값 적재·분석 벤치마크.
+
+5개 사옥 × ``--years`` 년(기본 5년)의 합성 15분 계량값(사옥당 하루 96건)을 CSV 로 만들어
+다음을 측정합니다.
+
+1. ``MeterStore.ingest`` 처리량(행/초)과 같은 파일을 다시 넣었을 때 값이 그대로인지
+2. 새 프로세스가 전체 배열을 처음 읽는 시간과 모의 계량값(``feed``) 뒤 이어 읽는 시간
+3. 페이지가 쓰는 분석: 최근 30일 절감량(``summary``), 전체 기간 일별 합계(``daily``),
+   임의 90일 기간의 기준선·절감량(``savings``) 지연 시간
+4. 기준선·절감량·일별 합계가 원본 계량값을 pandas 로 한 건씩 묶은 값과 같은지
+
+분석 p50 이 ``--budget-ms`` (기본 50ms)를 넘거나 값이 다르면 종료 코드 1로 끝납니다.
+
+    python -m benchmarks.meters --years 5
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+
+def _ms(run, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _write_readings(tmp, years, seed=42):
+    """``(CSV 경로, 계량값 DataFrame(time, building, kwh))``. 일부 계량값은 빠져 있음."""
+    from esg import meters
+    from esg.datagen import BUILDINGS, METER_LOAD_KW, draw
+    from esg.rollups import UTC_OFFSET
+
+    rng = np.random.default_rng(seed)
+    last_day = int(meters.slot_of(time.time())[0]) - 1
+    first_day = last_day - years * 365 + 1
+    kwh = meters.simulate(rng, draw(rng, METER_LOAD_KW), first_day, last_day,
+                          challenge_start=last_day - meters.CHALLENGE_DAYS + 1)
+    slots = (first_day * meters.SLOTS + np.arange(kwh.shape[1] * meters.SLOTS))
+    frame = pd.DataFrame({
+        "time": np.tile(slots * meters.SLOT_SECONDS - UTC_OFFSET, len(BUILDINGS)),
+        "building": np.repeat(list(BUILDINGS), len(slots)),
+        "kwh": kwh.reshape(-1).round(4),
+    })
+    frame = frame[rng.random(len(frame)) > 0.001].reset_index(drop=True)
+    path = os.path.join(tmp, "meters.csv")
+    csv = frame.copy()
+    # 계량 파일은 시간대 없는 로컬 시각 문자열
+    csv["time"] = pd.to_datetime(csv["time"] + UTC_OFFSET, unit="s").dt.strftime("%Y-%m-%d %H:%M:%S")
+    csv.to_csv(path, index=False)
+    return path, frame
+
+
+def _expected(frame, start, end):
+    """원본 계량값 한 건씩: 일별 합계, 기간 직전 기준선 대비 절전 대상 시간대 절감량 ``{사옥: kWh}``."""
+    from esg import meters
+    from esg.rollups import UTC_OFFSET
+
+    local = pd.to_datetime(frame["time"] + UTC_OFFSET, unit="s")
+    readings = pd.DataFrame({
+        "building": frame["building"],
+        "day": (local - pd.Timestamp("1970-01-01")).dt.days,
+        "slot": local.dt.hour * 4 + local.dt.minute // 15,
+        "weekend": local.dt.weekday >= 5,
+        "kwh": frame["kwh"].astype(np.float32),
+    })
+    daily = readings.groupby(["building", "day"])["kwh"].sum()
+    before = readings[(readings["day"] >= start - meters.BASELINE_DAYS) & (readings["day"] < start)]
+    profile = before.groupby(["building", "weekend", "slot"])["kwh"].mean().rename("baseline")
+    during = readings[(readings["day"] >= start) & (readings["day"] <= end)
+                      & meters.TARGET_SLOTS[readings["slot"].to_numpy()]]
+    during = during.join(profile, on=["building", "weekend", "slot"])
+    saved = (during["baseline"] - during["kwh"]).groupby(during["building"]).sum()
+    return daily, saved.to_dict()
+
+
+def run(years, repeat, budget_ms):
+    from esg import datagen, meters
+    from esg.store import EventStore
+
+    store = EventStore()
+    datagen.seed_store(store, {"power_saving": datagen.generate_campaign("power_saving", seed=42)}, replace=True)
+    meter_store = meters.MeterStore(store)
+    meter_store.clear()
+    with tempfile.TemporaryDirectory() as tmp:
+        path, frame = _write_readings(tmp, years)
+        print(f"계량값 {len(frame):,}건, 5개 사옥 × {years}년: CSV {os.path.getsize(path) / 1e6:.0f}MB")
+        result = meter_store.ingest(path)
+        print(f"ingest        {result['rows']:>10,} rows  {result['seconds']:>6.1f}s  {result['rows_per_sec']:>10,.0f} rows/s")
+        first = meter_store.matrix()[2].copy()
+        start = time.perf_counter()
+        meter_store.ingest(path)
+        print(f"re-ingest     {(time.perf_counter() - start):>24.1f}s")
+        idempotent = np.array_equal(first, meter_store.matrix()[2], equal_nan=True)
+    size = store.connection().execute("SELECT COUNT(*), SUM(LENGTH(kwh)) FROM meter_days").fetchone()
+    print(f"meter_days    {size[0]:>10,} rows  {size[1] / 1e6:.1f}MB")
+
+    start = time.perf_counter()
+    cold = meters.MeterStore(store)
+    cold.refresh()
+    print(f"cold refresh  {(time.perf_counter() - start) * 1000:>8.0f}ms")
+    fed = meter_store.feed(np.random.default_rng(0))
+    start = time.perf_counter()
+    cold.refresh()
+    print(f"feed {fed:,} readings, incremental refresh  {(time.perf_counter() - start) * 1000:.1f}ms")
+    consistent = np.array_equal(cold.matrix()[2], meter_store.matrix()[2], equal_nan=True)
+
+    buildings, days, kwh = cold.matrix()
+    end = int(days[-1]) - 1
+    window = (end - 89, end)
+    timings = {
+        "summary (30 days)": _ms(lambda: cold.summary(end), repeat),
+        "daily (all days)": _ms(lambda: cold.daily(), repeat),
+        "savings (90 days)": _ms(lambda: meters.savings(kwh, days, *window), repeat),
+    }
+    for name, value in timings.items():
+        print(f"{name:<20} {value:>7.2f}ms")
+
+    daily, saved = _expected(frame, *window)
+    _, all_days, totals = cold.daily(None, end)
+    index = daily.index.get_level_values
+    actual_daily = totals[[buildings.index(b) for b in index(0)], index(1).to_numpy() - all_days[0]]
+    daily_ok = np.allclose(actual_daily, daily.to_numpy(), rtol=1e-4)
+    expected, actual = meters.savings(kwh, days, *window)
+    computed = dict(zip(buildings, (expected - actual).sum(axis=-1, dtype=np.float64).tolist()))
+    savings_ok = all(np.isclose(computed[b], saved[b], rtol=1e-3, atol=1) for b in buildings)
+    print(f"idempotent re-ingest {idempotent}  incremental refresh consistent {consistent}  "
+          f"daily same as pandas {daily_ok}  savings same as pandas {savings_ok}  (budget {budget_ms}ms)")
+    print({b: round(computed[b]) for b in buildings})
+    return idempotent and consistent and daily_ok and savings_ok and max(timings.values()) <= budget_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=50)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["ESG_DB_PATH"] = os.path.join(tmp, "meters.db")
+        ok = run(args.years, args.repeat, args.budget_ms)
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
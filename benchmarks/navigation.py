@@ -0,0 +1,74 @@
+"""메뉴 이동당 전송 메시지 벤치마크.
+
+실제 ``streamlit run`` 서버에 웹소켓으로 접속해 메뉴의 모든 페이지를 차례로 이동하며,
+이동 한 번에 서버가 보낸 메시지 수·델타(화면 요소) 수·바이트와 서버 CPU 시간을
+측정합니다. 사이드바 버튼 메뉴(버튼 클릭 → ``st.switch_page`` 재실행)인 리비전은
+버튼을 누르고, 내비게이션 셸 리비전은 브라우저처럼 페이지 주소(page hash)만 바꿔
+재실행을 요청합니다.
+
+    python -m benchmarks.navigation                 # 현재 작업 트리
+    python -m benchmarks.navigation --rev HEAD~1    # 이전 커밋과 비교
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.fragments import Session, _cpu_seconds, connect, serve
+from benchmarks.startup import ROOT, export_revision
+
+
+async def _measure(port, pid, rounds):
+    results = []
+    async with await connect(port) as ws:
+        session = Session(ws)
+        await session.run()
+        pages = list(session.pages.items())
+        current = pages[0][1]
+        for _ in range(rounds):
+            # 기본 페이지에서 시작해 다음 페이지로 한 칸씩 이동하고 마지막에 기본 페이지로 복귀
+            for url_path, page_hash in pages[1:] + pages[:1]:
+                # 사이드바 버튼 메뉴 (key=level2_<url_path>) 가 있으면 버튼 클릭, 없으면 주소 이동
+                button = [i for i in session.button_ids if i.endswith(f"-level2_{url_path}")]
+                cpu = _cpu_seconds(pid)
+                start = time.perf_counter()
+                if button:
+                    size, count = await session.run(current, button[0])
+                else:
+                    size, count = await session.run(page_hash)
+                results.append((url_path, "button" if button else "url", size, count, session.deltas,
+                                (_cpu_seconds(pid) - cpu) * 1000, (time.perf_counter() - start) * 1000))
+                current = page_hash
+    return results
+
+
+def measure(app_dir, db_path, rounds):
+    with serve(app_dir, db_path) as (port, pid):
+        return asyncio.run(_measure(port, pid, rounds))
+
+
+def report(label, results):
+    print(f"\n[{label}] 메뉴 이동 {len(results)}회 ({results[0][1]})")
+    for name, column, unit in (("msgs", 3, ""), ("deltas", 4, ""), ("bytes", 2, "KB"), ("cpu", 5, "ms"), ("wall", 6, "ms")):
+        values = [row[column] / (1024 if unit == "KB" else 1) for row in results]
+        print(f"  {name:<7} p50 {statistics.median(values):>8.1f}{unit:<2}  max {max(values):>8.1f}{unit}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rev", help="비교할 git 리비전 (예: HEAD~1)")
+    parser.add_argument("--rounds", type=int, default=2, help="메뉴 전체를 도는 횟수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.rev:
+            rev_dir = os.path.join(tmp, "rev")
+            os.makedirs(rev_dir)
+            report(args.rev, measure(export_revision(args.rev, rev_dir), os.path.join(tmp, "rev.db"), args.rounds))
+        report("현재", measure(ROOT, os.path.join(tmp, "current.db"), args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""인쇄 서버 로그 적재 벤치마크.
+
+``--days`` 일(기본 30일) 동안 ``--rows`` 건(기본 200만, 주말과 수요일 감소분은 빠짐)의 합성
+인쇄 작업 로그를 CSV(ISO 시각)와 JSON lines(epoch 초) 두 파일로 나눠 만든 뒤 다음을 측정합니다.
+
+1. 묶음(``--chunk-mb``) 단위 적재 처리량(행/초)
+2. 중간에 끊긴 적재: 첫 파일(CSV)을 절반쯤 기록한 묶음에서 중단한 뒤 다시 실행해 이어서 적재
+   (파일이 묶음 하나보다 작으면 다시 실행할 때 읽을 행이 없음)
+3. ``print_daily``·``rollups`` 의 (날짜, 부서)별 작업 수·장수와 ``N`` 이 원본 로그를 pandas 로
+   한 번에 묶은 값과 같은지 (중단·재개 후에도 같은 행을 두 번 세지 않음)
+
+전체 처리량이 ``--min-rate`` (행/초, 기본 10만)에 못 미치거나 값이 다르면 종료 코드 1로 끝납니다.
+
+    python -m benchmarks.printlogs --rows 2000000 --days 30
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+
+def _write_logs(tmp, rows, days, seed=42):
+    """``(CSV 경로, JSON lines 경로, 전체 로그 DataFrame)``. 수요일은 작업이 40% 적음."""
+    from esg.datagen import DEPARTMENTS
+    from esg.rollups import UTC_OFFSET, local_timestamp
+
+    rng = np.random.default_rng(seed)
+    midnight = local_timestamp(date.today(), hour=0)
+    day_offset = rng.integers(0, days, rows)
+    at = midnight - day_offset * 86400 + rng.integers(8 * 3600, 19 * 3600, rows)
+    weekday = (date.today().weekday() - day_offset) % 7
+    keep = (weekday < 5) & ((weekday != 2) | (rng.random(rows) < 0.6))
+    departments = np.array(list(DEPARTMENTS))
+    frame = pd.DataFrame({
+        "time": np.sort(at[keep]),
+        "department": departments[rng.integers(0, len(departments), int(keep.sum()))],
+        "pages": rng.integers(1, 21, int(keep.sum())),
+        "copies": rng.integers(1, 4, int(keep.sum())),
+    })
+    half = len(frame) // 2
+    csv_path = os.path.join(tmp, "print_jobs.csv")
+    csv = frame.iloc[:half].copy()
+    # CSV 는 시간대 없는 로컬 시각 문자열
+    csv["time"] = pd.to_datetime(csv["time"] + UTC_OFFSET, unit="s").dt.strftime("%Y-%m-%d %H:%M:%S")
+    csv.to_csv(csv_path, index=False)
+    jsonl_path = os.path.join(tmp, "print_jobs.jsonl")
+    frame.iloc[half:].to_json(jsonl_path, orient="records", lines=True, force_ascii=False)
+    return csv_path, jsonl_path, frame
+
+
+def _expected(frame):
+    from esg.printlogs import PAPERLESS_WEEKDAY
+    from esg.rollups import buckets
+
+    sheets = frame["pages"] * frame["copies"]
+    grouped = pd.DataFrame({"day": buckets("day", frame["time"].to_numpy()), "department": frame["department"],
+                            "sheets": sheets}).groupby(["day", "department"])["sheets"].agg(["size", "sum"])
+    # 부서별 일반 평일 평균 × 페이퍼리스 데이 수 − 페이퍼리스 데이 장수
+    days = np.arange(grouped.index.get_level_values(0).min(), grouped.index.get_level_values(0).max() + 1)
+    weekday = (days + 3) % 7
+    paperless_days = np.count_nonzero(weekday == PAPERLESS_WEEKDAY)
+    regular_days = np.count_nonzero(weekday < 5) - paperless_days
+    per_day = grouped["sum"].reset_index()
+    per_day["paperless"] = (per_day["day"] + 3) % 7 == PAPERLESS_WEEKDAY
+    totals = per_day.groupby(["department", "paperless"])["sum"].sum().unstack(fill_value=0)
+    saved = int(round(np.clip(totals[False] / regular_days * paperless_days - totals[True], 0, None).sum()))
+    return grouped, saved
+
+
+class _Interrupt(Exception):
+    pass
+
+
+def run(rows, days, chunk_mb, min_rate):
+    from esg import datagen
+    from esg.printlogs import PrintLogs
+    from esg.rollups import buckets
+    from esg.store import EventStore
+
+    store = EventStore()
+    datagen.seed_store(store, {"paperless": datagen.generate_campaign("paperless", seed=42)}, replace=True)
+    logs = PrintLogs(store)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path, jsonl_path, frame = _write_logs(tmp, rows, days)
+        print(f"로그 {len(frame):,}행, {days}일: CSV {os.path.getsize(csv_path) / 1e6:.0f}MB, "
+              f"JSON lines {os.path.getsize(jsonl_path) / 1e6:.0f}MB")
+        chunk_bytes = int(chunk_mb * 1024 * 1024)
+
+        def interrupt(read, offset, size, elapsed):
+            if offset >= size / 2:
+                raise _Interrupt()
+
+        start = time.perf_counter()
+        try:
+            logs.ingest(csv_path, chunk_bytes, interrupt)
+        except _Interrupt:
+            print(f"interrupted after {logs.checkpoint(csv_path)[1]:,} rows")
+        for path in (csv_path, jsonl_path):
+            result = logs.ingest(path, chunk_bytes)
+            print(f"{os.path.basename(path):<18} {result['rows']:>10,} rows  {result['seconds']:>6.1f}s  "
+                  f"{result['rows_per_sec']:>10,.0f} rows/s  (resumed after {result['resumed_after']:,})")
+        rate = len(frame) / (time.perf_counter() - start)
+        print(f"total {len(frame):>23,} rows  {rate:>17,.0f} rows/s")
+
+    grouped, saved = _expected(frame)
+    stored = pd.DataFrame(
+        store.connection().execute("SELECT day, department, jobs, sheets FROM print_daily").fetchall(),
+        columns=["day", "department", "size", "sum"],
+    ).set_index(["day", "department"]).sort_index()
+    daily_ok = stored.equals(grouped.sort_index())
+    first, last = int(grouped.index.get_level_values(0).min()), int(grouped.index.get_level_values(0).max())
+    expected_prints = np.bincount(buckets("day", frame["time"].to_numpy()) - first, minlength=last - first + 1)
+    rollups_ok = np.array_equal(logs.rollups.series("paperless", "prints", "day", first, last), expected_prints)
+    state = store.snapshot("paperless")
+    n_ok = logs.reduction_sheets() == saved == state["N"]
+    print(f"ingested {logs.count():,}/{len(frame):,}  daily consistent {daily_ok}  rollups consistent {rollups_ok}  "
+          f"N {state['N']:,} consistent {n_ok}  (min rate {min_rate:,} rows/s)")
+    return logs.count() == len(frame) and daily_ok and rollups_ok and n_ok and rate >= min_rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--chunk-mb", type=float, default=8)
+    parser.add_argument("--min-rate", type=int, default=100000, help="최소 처리량 (행/초)")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["ESG_DB_PATH"] = os.path.join(tmp, "printlogs.db")
+        ok = run(args.rows, args.days, args.chunk_mb, args.min_rate)
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""플리마켓 동시 구매 경합 테스트.
+
+``--processes`` 개 프로세스 × ``--threads`` 개 스레드의 구매자가 같은 물품 ``--items`` 개를
+동시에 무작위 순서로 구매합니다. 구매자마다 물품별 구매 토큰을 하나씩 쓰고, 같은 물품을
+``--clicks`` 번씩 눌러 중복 클릭·재시도를 흉내 냅니다. 끝난 뒤 다음을 확인하며 하나라도
+어긋나면 종료 코드 1로 끝납니다.
+
+- 물품마다 구매에 성공한 구매자는 정확히 한 명 (같은 구매자의 재요청은 같은 결과)
+- 모든 물품이 판매완료이고 구매 기록은 물품당 1건
+- 집계의 판매 수·모금액·등록 수·총 가치·카테고리 통계가 물품 테이블과 일치
+
+    python -m benchmarks.purchase_contention --processes 4 --threads 16 --items 300
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+
+
+def _buyers(db_path, process, threads, item_ids, clicks, results):
+    from esg.catalog import ItemCatalog
+    from esg.store import EventStore
+
+    catalog = ItemCatalog(EventStore(db_path))
+    barrier = threading.Barrier(threads)
+    wins = []
+    latencies = []
+    lock = threading.Lock()
+
+    def worker(index):
+        buyer = f"p{process}-t{index}"
+        order = list(item_ids)
+        random.Random(buyer).shuffle(order)
+        mine = []
+        samples = []
+        barrier.wait()
+        for item_id in order:
+            for _ in range(clicks):
+                start = time.perf_counter()
+                item = catalog.purchase(item_id, token=f"{buyer}:{item_id}")
+                samples.append((time.perf_counter() - start) * 1000)
+                if item is not None:
+                    mine.append((item_id, buyer))
+        with lock:
+            # 같은 구매자의 재요청 성공은 한 번으로 셈
+            wins.extend(set(mine))
+            latencies.extend(samples)
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    results.put((wins, latencies))
+
+
+def run(processes, threads, items, clicks):
+    from esg import datagen
+    from esg.catalog import CAMPAIGN, SOLD, ItemCatalog, category_stats
+    from esg.store import EventStore
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "purchase.db")
+        store = EventStore(db_path)
+        catalog = ItemCatalog(store)
+        employees = items * datagen.BASE_EMPLOYEES // len(datagen.FLEA_ITEMS)
+        catalog.seed(datagen.generate_campaign(CAMPAIGN, seed=42, employees=employees), replace=True)
+        before = store.snapshot(CAMPAIGN)
+        listed, _ = catalog.page(after=0, limit=before["total_items"])
+        item_ids = [item["id"] for item in listed]
+
+        results = multiprocessing.Queue()
+        pool = [
+            multiprocessing.Process(target=_buyers, args=(db_path, p, threads, item_ids, clicks, results))
+            for p in range(processes)
+        ]
+        start = time.perf_counter()
+        for process in pool:
+            process.start()
+        collected = [results.get() for _ in pool]
+        for process in pool:
+            process.join()
+        elapsed = time.perf_counter() - start
+
+        wins = [win for batch, _ in collected for win in batch]
+        latencies = sorted(ms for _, batch in collected for ms in batch)
+        after = store.snapshot(CAMPAIGN)
+        conn = store.connection()
+        sold = [catalog.get(item_id) for item_id in item_ids]
+        purchases = conn.execute("SELECT COUNT(*) FROM flea_purchases").fetchone()[0]
+        on_sale, _ = catalog.page(after=0, limit=len(item_ids))
+
+        requests = processes * threads * len(item_ids) * clicks
+        print(f"구매자 {processes * threads}명 × 물품 {len(item_ids):,}개 × {clicks}회 = 요청 {requests:,}건, "
+              f"{elapsed:.1f}s ({requests / elapsed:,.0f}/s)")
+        print(f"  응답 p50 {statistics.median(latencies):.2f}ms  p99 {latencies[int(len(latencies) * 0.99)]:.2f}ms")
+
+        winners = {}
+        for item_id, buyer in wins:
+            winners.setdefault(item_id, []).append(buyer)
+        donations = sum(item["donation_amount"] for item in sold)
+        checks = {
+            "물품당 구매 성공 1명": all(len(winners.get(item_id, [])) == 1 for item_id in item_ids),
+            "모두 판매완료": all(item["status"] == SOLD for item in sold),
+            "구매 기록 물품당 1건": purchases == len(item_ids),
+            "판매 수": after["sold_items"] - before["sold_items"] == len(item_ids),
+            "모금액": after["total_donations"] - before["total_donations"] == donations,
+            "등록 수·총 가치": (after["total_items"], after["total_value"]) == (len(on_sale), sum(i["price"] for i in on_sale)),
+            "카테고리 통계": after["categories"] == category_stats(on_sale),
+        }
+        for name, ok in checks.items():
+            print(f"  {'OK  ' if ok else 'FAIL'} {name}")
+        return all(checks.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=16, help="프로세스당 구매자 수")
+    parser.add_argument("--items", type=int, default=300)
+    parser.add_argument("--clicks", type=int, default=2, help="구매자가 물품마다 누르는 횟수")
+    args = parser.parse_args()
+    ok = run(args.processes, args.threads, args.items, args.clicks)
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
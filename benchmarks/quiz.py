@@ -0,0 +1,145 @@
+"""ESG 퀴즈데이 제출 부하 테스트.
+
+``--threads`` 개 스레드가 참여자 ``--participants`` 명(기본 2만)의 답안을 동시에 제출합니다.
+참여자마다 ``--clicks`` 번씩 제출해 중복 클릭·재시도를 흉내 내며, 제출마다 바로 기록하는
+방식과 ``QuizEngine`` 이 모아 기록하는 방식의 처리량(분당 제출 수)·응답 시간을 비교합니다.
+끝난 뒤 다음을 확인하며 하나라도 어긋나거나 모아 기록한 처리량이 ``--min-rate`` (분당, 기본
+6,000)에 못 미치면 종료 코드 1로 끝납니다.
+
+- 결과는 참여자당 1건이고, 점수는 참여자별로 출제된 문제를 하나씩 채점한 값과 같음
+- 점수 분포(``quiz_score_counts``)가 결과 테이블과 일치
+- 리더보드가 결과 테이블의 점수·풀이 시간 순 상위 k명과 같음 (새 엔진으로 다시 읽은 것도 같음)
+
+    python -m benchmarks.quiz --participants 20000 --threads 32 --clicks 2
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+
+def _burst(submit, threads, participants, clicks):
+    """참여자를 스레드에 나눠 제출하고 ``(걸린 초, 응답 시간 목록)`` 을 반환합니다."""
+    barrier = threading.Barrier(threads)
+    latencies = []
+    lock = threading.Lock()
+
+    def worker(index):
+        samples = []
+        barrier.wait()
+        for participant in range(index, len(participants), threads):
+            for _ in range(clicks):
+                start = time.perf_counter()
+                submit(participant)
+                samples.append((time.perf_counter() - start) * 1000)
+        with lock:
+            latencies.extend(samples)
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return time.perf_counter() - start, sorted(latencies)
+
+
+def _report(label, elapsed, latencies, transactions):
+    print(f"{label:<9}{len(latencies) / elapsed * 60:>12,.0f} submissions/min  p50 {statistics.median(latencies):.3f}ms  "
+          f"p99 {latencies[int(len(latencies) * 0.99)]:.3f}ms  ({transactions:,} transactions)")
+    return len(latencies) / elapsed * 60
+
+
+def _check(engine, key, ids, answers, elapsed):
+    conn = engine.store.connection()
+    rows = conn.execute(
+        "SELECT participant, score, answers FROM quiz_results WHERE round = ?", (engine.round_id,)
+    ).fetchall()
+    # 문제마다 하나씩 채점한 점수와 비교
+    scores = {int(participant): score for participant, score, _ in rows}
+    looped = {
+        i: sum(int(answer) == int(key.correct[q]) for q, answer in zip(ids[i], answers[i])) for i in range(len(answers))
+    }
+    scores_ok = len(rows) == len(answers) and scores == looped
+    stored = {int(participant): [tuple(map(int, pair.split(":"))) for pair in text.split(",")] for participant, _, text in rows}
+    answers_ok = all(stored[i] == list(zip(ids[i].tolist(), answers[i].tolist())) for i in range(len(answers)))
+    counts = dict(conn.execute("SELECT score, count FROM quiz_score_counts WHERE round = ?", (engine.round_id,)).fetchall())
+    histogram = np.bincount(list(looped.values()))
+    counts_ok = counts == {score: int(n) for score, n in enumerate(histogram) if n}
+    expected = sorted(range(len(answers)), key=lambda i: (-looped[i], elapsed[i]))[:engine.k]
+    board_ok = [int(entry["participant"]) for entry in engine.leaderboard()] == expected
+    print(f"\nresults {len(rows):,}/{len(answers):,}  scores consistent {scores_ok}  answers stored {answers_ok}  "
+          f"distribution consistent {counts_ok}  leaderboard consistent {board_ok}")
+    return scores_ok and answers_ok and counts_ok and board_ok
+
+
+def run(participants, threads, clicks, direct_participants, min_rate):
+    from esg.quiz import QuestionBank, QuizEngine, plan_size
+    from esg.store import EventStore
+
+    store = EventStore()
+    bank = QuestionBank.load()
+    key = bank.key
+    size = plan_size()
+    # 참여자별 출제, 정답률 70% 안팎의 답안(원래 보기 번호)과 겹치지 않는 풀이 시간
+    ids = np.array([[question["id"] for question in bank.draw(str(i), "bench")] for i in range(participants)])
+    rng = np.random.default_rng(42)
+    right = rng.random(ids.shape) < 0.7
+    answers = np.where(right, key.correct[ids], (key.correct[ids] + rng.integers(1, 4, ids.shape)) % 4)
+    elapsed = rng.permutation(participants) * 0.01 + 30
+
+    start = time.perf_counter()
+    vectorized = key.score_many(ids, answers)
+    print(f"score_many {participants:,} answers  {(time.perf_counter() - start) * 1000:.1f}ms  "
+          f"(mean {vectorized.mean():.2f}/{size})")
+
+    direct = QuizEngine(store, key, size, round_id="direct", flush_interval=0)
+
+    def submit_direct(participant):
+        direct.submit(str(participant), f"참여자{participant}", ids[participant].tolist(), answers[participant].tolist(),
+                      elapsed[participant])
+        direct.flush()
+
+    took, latencies = _burst(submit_direct, threads, range(direct_participants), clicks)
+    _report("direct", took, latencies, direct_participants)
+
+    engine = QuizEngine(store, key, size, round_id="bench")
+    flushes = []
+    flush = engine.flush
+    engine.flush = lambda: flushes.append(flush())
+    took, latencies = _burst(
+        lambda participant: engine.submit(str(participant), f"참여자{participant}", ids[participant].tolist(),
+                                          answers[participant].tolist(), elapsed[participant]),
+        threads, range(participants), clicks,
+    )
+    engine.close()
+    rate = _report("buffered", took, latencies, sum(1 for n in flushes if n))
+
+    ok = _check(engine, key, ids, answers, elapsed)
+    # 다른 프로세스가 새로 띄운 엔진도 같은 리더보드를 읽음
+    reloaded = QuizEngine(store, key, size, round_id="bench", flush_interval=0)
+    reload_ok = reloaded.leaderboard() == engine.leaderboard() and reloaded.stats() == engine.stats()
+    print(f"reloaded leaderboard consistent {reload_ok}  stats {engine.stats()}  (min rate {min_rate:,}/min)")
+    return ok and reload_ok and rate >= min_rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--participants", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--clicks", type=int, default=2, help="참여자당 제출 횟수")
+    parser.add_argument("--direct-participants", type=int, default=2000, help="제출마다 바로 기록하는 참여자 수")
+    parser.add_argument("--min-rate", type=int, default=6000, help="모아 기록할 때 최소 분당 제출 수")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["ESG_DB_PATH"] = os.path.join(tmp, "quiz.db")
+        ok = run(args.participants, args.threads, args.clicks, args.direct_participants, args.min_rate)
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
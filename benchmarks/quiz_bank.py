@@ -0,0 +1,113 @@
+"""퀴즈 문제 은행 적재·출제 벤치마크.
+
+문제 ``--sizes`` 개(기본 100·1,000·10,000·100,000)짜리 합성 문제 은행 파일을 만들어 다음을
+측정합니다.
+
+1. 파일 적재 시간 (프로세스당 한 번)
+2. 참여자별 출제(``QuestionBank.draw``) 시간 p50/p99: 문제 수와 관계없이 비슷해야 함
+3. 같은 참여자·회차는 항상 같은 문제·보기 순서, 출제 계획의 분야·난이도별 문제 수, 중복 없음
+4. 가장 작은 은행에서 칸 안의 문제가 고르게 뽑히는지 (가장 많이/적게 뽑힌 문제의 비율)
+
+출제 p50 이 ``--budget-ms`` (기본 1ms)를 넘거나 3번 확인이 어긋나면 종료 코드 1로 끝납니다.
+
+    python -m benchmarks.quiz_bank --sizes 100,1000,10000,100000 --draws 2000
+"""
+import argparse
+import collections
+import json
+import os
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+
+def _write_bank(path, size, seed=42):
+    from esg.quiz import DIFFICULTIES, TOPICS
+
+    rng = np.random.default_rng(seed)
+    topics = rng.integers(0, len(TOPICS), size)
+    difficulties = rng.integers(0, len(DIFFICULTIES), size)
+    correct = rng.integers(0, 4, size)
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(size):
+            f.write(json.dumps({
+                "id": i,
+                "topic": TOPICS[topics[i]],
+                "difficulty": DIFFICULTIES[difficulties[i]],
+                "question": f"합성 문제 {i}",
+                "options": [f"보기 {i}-{j}" for j in range(4)],
+                "correct": int(correct[i]),
+            }, ensure_ascii=False) + "\n")
+
+
+def _valid(bank, drawn, plan):
+    ids = [question["id"] for question in drawn]
+    if len(set(ids)) != len(ids):
+        return False
+    for topic, difficulty, k in plan:
+        matched = [question for question in drawn
+                   if topic in (None, question["topic"]) and difficulty in (None, question["difficulty"])]
+        if len(matched) != k:
+            return False
+    for question in drawn:
+        original = bank.questions[question["id"]]["options"]
+        if [original[i] for i in question["order"]] != question["options"]:
+            return False
+    return True
+
+
+def run(sizes, draws, budget_ms):
+    from esg.quiz import DEFAULT_PLAN, QuestionBank
+
+    ok = True
+    print(f"{'questions':>10} {'load':>9} {'draw p50':>9} {'draw p99':>9}  valid")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f"bank_{size}.jsonl")
+            _write_bank(path, size)
+            start = time.perf_counter()
+            bank = QuestionBank.load(path)
+            load_ms = (time.perf_counter() - start) * 1000
+
+            samples = []
+            valid = True
+            for participant in range(draws):
+                start = time.perf_counter()
+                drawn = bank.draw(f"user{participant}", "bench")
+                samples.append((time.perf_counter() - start) * 1000)
+                if participant % 50 == 0:
+                    valid = valid and _valid(bank, drawn, DEFAULT_PLAN) and bank.draw(f"user{participant}", "bench") == drawn
+            samples.sort()
+            p50 = statistics.median(samples)
+            print(f"{size:>10,} {load_ms:>7.1f}ms {p50:>7.3f}ms {samples[int(len(samples) * 0.99)]:>7.3f}ms  {valid}")
+            ok = ok and valid and p50 <= budget_ms
+
+            if size == sizes[0]:
+                # 가장 작은 은행: 어려움 칸(모든 분야)에서 문제별로 뽑힌 횟수
+                hard = collections.Counter(
+                    question["id"]
+                    for participant in range(draws * 5)
+                    for question in bank.draw(f"uniform{participant}", "bench")
+                    if question["difficulty"] == DEFAULT_PLAN[-1][1]
+                )
+                counts = [hard.get(question_id, 0) for question_id, question in bank.questions.items()
+                          if question["difficulty"] == DEFAULT_PLAN[-1][1]]
+                print(f"{'':>10} uniformity: {len(counts)} hard questions, min {min(counts)} / max {max(counts)} draws")
+    print(f"(budget {budget_ms}ms)")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,10000,100000")
+    parser.add_argument("--draws", type=int, default=2000, help="은행마다 출제할 참여자 수")
+    parser.add_argument("--budget-ms", type=float, default=1)
+    args = parser.parse_args()
+    ok = run([int(size) for size in args.sizes.split(",")], args.draws, args.budget_ms)
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+"""페이지 재실행(rerun) 지연 벤치마크.
+
+``AppTest`` 로 사이드바의 모든 메뉴 페이지를 열고, 페이지의 등록 버튼·퀴즈·폼 제출을
+실제 사용자처럼 눌러 스크립트 1회 실행 시간(p50/p95)과 최대 메모리를 측정합니다.
+데이터 규모별로 새 프로세스에서 ``esg.datagen`` 으로 저장소를 채운 뒤 측정하며,
+p95 가 예산(``BUDGETS_MS``)을 넘는 항목이 있으면 종료 코드 1로 끝납니다.
+
+    python -m benchmarks.rerun                          # 기본 규모 (small, medium)
+    python -m benchmarks.rerun --scales small,large --repeat 10
+    python -m benchmarks.rerun --pages flea-market,idea --json /tmp/rerun.json
+
+측정 항목
+
+- open: 다른 페이지에서 메뉴로 이 페이지를 열어 그려질 때까지 (주소 기반 전환, 1회 실행)
+- rerun: 입력 없이 같은 페이지를 다시 실행 (다른 위젯 조작 시 기본 비용)
+- 버튼/폼: 클릭 후 ``st.rerun()`` 까지 포함한 한 번의 상호작용
+- peak: 위 동작 한 번을 ``tracemalloc`` 으로 추적한 최대 할당량
+"""
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "app.py")
+
+# 규모 이름: (임직원 수, 일별 이력 일수)
+SCALES = {
+    "small": (500, 30),
+    "medium": (5000, 90),
+    "large": (20000, 365),
+}
+DEFAULT_SCALES = "small,medium"
+
+# p95 예산 (ms). 기본값과 (url_path, 동작) 별 예외 (동작이 None 이면 페이지 전체)
+DEFAULT_BUDGET_MS = 1500
+BUDGETS_MS = {}
+
+DEFAULT_PAGE = "stair-climbing"
+
+
+def click_key(prefix):
+    def action(at):
+        keys = [button.key for button in at.button if button.key and button.key.startswith(prefix)]
+        if not keys:
+            return None
+        return at.button(key=keys[0]).click()
+    return action
+
+
+def click_label(label):
+    def action(at):
+        buttons = [button for button in at.button if button.label == label and not button.disabled]
+        if not buttons:
+            return None
+        return buttons[0].click()
+    return action
+
+
+def submit_form(label, fields):
+    """텍스트 입력을 채운 뒤 폼 제출 버튼을 누릅니다."""
+    def action(at):
+        for field_label, value in fields.items():
+            widgets = [w for w in list(at.text_input) + list(at.text_area) if w.label == field_label]
+            widgets[0].input(value)
+        for number in at.number_input:
+            if number.label == "가격 (원)":
+                number.set_value(10000)
+        return click_label(label)(at)
+    return action
+
+
+def quiz_step(at):
+    # 다음 문제 → ... → 퀴즈 완료 순서로 한 단계씩 진행하고, 제출한 뒤에는 새 참여자로 다시 시작
+    if click_label("다음 문제")(at) is not None:
+        return at
+    names = [w for w in at.text_input if w.label == "리더보드 표시 이름"]
+    if names and not names[0].disabled:
+        names[0].input("벤치마크")
+        return click_label("퀴즈 완료")(at)
+    at.session_state["quiz_participant"] = uuid.uuid4().hex
+    del at.session_state["quiz_state"]
+    return at
+
+
+# 페이지별 상호작용 (사이드바 url_path 기준)
+ACTIONS = {
+    "stair-climbing": {"등록하기": click_key("register_")},
+    "zero-challenge": {
+        "개인 컵 등록": click_key("personal_cup"),
+        "텀블러 등록": click_key("tumbler"),
+        "도시락 등록": click_key("lunchbox"),
+    },
+    "power-saving": {"절전 등록": click_key("power_register_")},
+    "plogging": {
+        "플로깅 참여": click_key("plogging_participate"),
+        "쓰레기 수거 등록": click_key("waste_collect"),
+    },
+    "carbon-footprint": {
+        "계단 이용 등록": click_key("stairs_usage"),
+        "대중교통 이용 등록": click_key("public_transport"),
+        "자전거 이용 등록": click_key("bicycle_usage"),
+    },
+    "flea-market": {
+        "구매하기": click_key("buy_"),
+        "물품 등록": submit_form("물품 등록", {"물품명": "벤치마크 물품", "판매자명": "홍길동"}),
+    },
+    "green-ribbon": {"스탬프 적립": click_key("stamp_")},
+    "volunteer": {
+        "봉사 참여": click_key("volunteer_"),
+        "봉사 참여 등록": submit_form("봉사 참여 등록", {
+            "참여자명": "홍길동", "봉사 장소": "한강공원", "봉사 활동 내용": "환경정화",
+        }),
+    },
+    "ideas": {
+        "아이디어 제안": submit_form("아이디어 제안", {
+            "아이디어 제목": "벤치마크 아이디어", "아이디어 상세 설명": "설명",
+        }),
+        "단계 이동": click_key("advance_"),
+    },
+    "esg-education": {"퀴즈": quiz_step},
+    "digital-diet": {
+        "디지털 다이어트 등록": submit_form("디지털 다이어트 등록", {
+            "참여자명": "홍길동", "정리 내용": "메일함 정리",
+        }),
+    },
+}
+
+
+def new_app():
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP, default_timeout=300)
+    at.run()
+    return at
+
+
+def menu_pages(app=APP):
+    """``app.py`` 페이지 레지스트리의 ``{url_path: 스크립트 경로}`` (메뉴 순서)."""
+    with open(app, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    pages = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and getattr(node.func, "attr", None) == "Page":
+            options = {keyword.arg: keyword.value.value for keyword in node.keywords if isinstance(keyword.value, ast.Constant)}
+            pages[options["url_path"]] = node.args[0].value
+    return pages
+
+
+PAGES = menu_pages()
+
+
+def open_page(at, url_path):
+    # 메뉴 클릭과 같이 주소(페이지)만 바꿔 한 번 실행
+    return at.switch_page(PAGES[url_path]).run()
+
+
+def timed(at, action=None):
+    if action is not None and action(at) is None:
+        return None
+    start = time.perf_counter()
+    at.run()
+    elapsed = (time.perf_counter() - start) * 1000
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return elapsed
+
+
+def traced(run):
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure_page(url_path, repeat):
+    results = []
+
+    # open: 다른 페이지에서 메뉴 클릭
+    at = new_app()
+    away = DEFAULT_PAGE if url_path != DEFAULT_PAGE else list(PAGES)[1]
+    samples = []
+    for _ in range(repeat):
+        open_page(at, away)
+        samples.append(timed(at, lambda at: at.switch_page(PAGES[url_path])))
+    open_page(at, away)
+    peak = traced(lambda: open_page(at, url_path))
+    open_page(at, url_path)
+    results.append((None, "open", samples, peak))
+
+    # rerun: 같은 페이지 재실행
+    samples = [timed(at) for _ in range(repeat)]
+    peak = traced(at.run)
+    results.append((url_path, "rerun", samples, peak))
+
+    for name, action in ACTIONS.get(url_path, {}).items():
+        samples = []
+        for _ in range(repeat):
+            elapsed = timed(at, action)
+            if elapsed is None:
+                break
+            samples.append(elapsed)
+        peak = traced(lambda: timed(at, action))
+        results.append((url_path, name, samples, peak))
+    return results
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def budget_for(url_path, action):
+    return BUDGETS_MS.get((url_path, action), BUDGETS_MS.get((url_path, None), DEFAULT_BUDGET_MS))
+
+
+def worker(scale, repeat, pages):
+    """새 프로세스에서 한 규모를 측정하고 결과를 JSON 한 줄로 출력합니다."""
+    from esg import datagen
+    from esg.store import EventStore
+
+    employees, days = SCALES[scale]
+    start = time.perf_counter()
+    datagen.seed_store(EventStore(), datagen.generate(seed=42, employees=employees, days=days), replace=True)
+    seeded_ms = (time.perf_counter() - start) * 1000
+
+    rows = []
+    for url_path in PAGES:
+        if pages and url_path not in pages:
+            continue
+        for _, action, samples, peak in measure_page(url_path, repeat):
+            if not samples:
+                continue
+            rows.append({
+                "scale": scale,
+                "page": url_path,
+                "action": action,
+                "n": len(samples),
+                "p50_ms": statistics.median(samples),
+                "p95_ms": percentile(samples, 0.95),
+                "peak_kb": peak / 1024,
+                "budget_ms": budget_for(url_path, action),
+            })
+    print(json.dumps({"scale": scale, "seed_ms": seeded_ms, "rows": rows}, ensure_ascii=False))
+
+
+def run_scale(scale, repeat, pages):
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, PYTHONPATH=ROOT, ESG_DB_PATH=os.path.join(tmp, f"{scale}.db"))
+        command = [sys.executable, "-m", "benchmarks.rerun", "--worker", scale, "--repeat", str(repeat)]
+        if pages:
+            command += ["--pages", ",".join(pages)]
+        out = subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True)
+        if out.returncode != 0:
+            sys.stderr.write(out.stderr[-4000:])
+            raise SystemExit(f"{scale} 규모 측정에 실패했습니다.")
+        return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default=DEFAULT_SCALES, help=f"측정할 규모 ({', '.join(SCALES)})")
+    parser.add_argument("--repeat", type=int, default=5, help="동작별 반복 횟수")
+    parser.add_argument("--pages", default="", help="측정할 페이지 url_path (쉼표 구분, 생략 시 전체)")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    pages = [page for page in args.pages.split(",") if page]
+
+    if args.worker:
+        worker(args.worker, args.repeat, pages)
+        return
+
+    reports = []
+    over = []
+    for scale in args.scales.split(","):
+        report = run_scale(scale, args.repeat, pages)
+        reports.append(report)
+        employees, days = SCALES[scale]
+        print(f"\n[{scale}] 임직원 {employees:,}명, {days}일 (데이터 생성 {report['seed_ms']:.0f}ms)")
+        print(f"{'page':<18} {'action':<20} {'p50':>8} {'p95':>8} {'budget':>7} {'peak':>9}")
+        for row in report["rows"]:
+            flag = ""
+            if row["p95_ms"] > row["budget_ms"]:
+                flag = "  ⚠ 예산 초과"
+                over.append(row)
+            print(
+                f"{row['page']:<18} {row['action']:<20} {row['p50_ms']:>6.0f}ms {row['p95_ms']:>6.0f}ms "
+                f"{row['budget_ms']:>5}ms {row['peak_kb'] / 1024:>7.1f}MB{flag}"
+            )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(reports, f, ensure_ascii=False, indent=2)
+
+    if over:
+        print(f"\n예산 초과 {len(over)}건: " + ", ".join(f"{r['scale']}/{r['page']}/{r['action']}" for r in over))
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
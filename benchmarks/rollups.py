@@ -0,0 +1,122 @@
+"""캠페인 지표 구간 합계(rollup) 벤치마크.
+
+``--days`` 일(기본 2년) 동안 약 ``--events`` 건(기본 100만)의 참여 이벤트(시각, 탄소 절약량)를
+만들어 다음을 측정합니다.
+
+1. 예전 방식: 이벤트 행을 딕셔너리 리스트로 두고 재실행마다 ``DataFrame`` 으로 바꿔
+   최근 구간을 단위별로 묶는 시간
+2. ``Rollups.add_many``: 전체 이벤트를 hour/day/week/month 구간 합계로 기록하는 시간
+3. ``Rollups.series``/``days``: 최근 48시간·30일·12주·24개월 구간을 읽는 시간
+4. 버튼 한 번의 기록(``recorder`` 를 넘긴 ``EventStore.append``) 시간
+5. 모든 단위의 구간 값이 원본 이벤트를 pandas 로 묶은 값과 같은지
+
+구간 읽기 p50 이 ``--budget-ms`` (기본 5ms)를 넘거나 값이 다르면 종료 코드 1로 끝납니다.
+
+    python -m benchmarks.rollups --events 1000000 --days 730
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+# 최근 구간 길이: 단위 → 구간 수
+WINDOWS = {"hour": 48, "day": 30, "week": 12, "month": 24}
+
+
+def _ms(run, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _expected(times, values, grain):
+    # 원본 이벤트를 pandas 로 로컬 시각 기준 구간별 합계
+    from esg.rollups import buckets
+
+    return pd.Series(values).groupby(buckets(grain, times)).sum()
+
+
+def run(events, days, repeat, budget_ms):
+    from esg.rollups import GRAINS, Rollups, date_bucket
+    from esg.store import EventStore
+
+    store = EventStore()
+    store.seed("bench", {"total_participations": 0}, replace=True)
+    rollups = Rollups(store)
+    rng = np.random.default_rng(42)
+    now = int(time.time())
+    times = np.sort(now - rng.integers(0, days * 86400, events))
+    values = rng.uniform(0.1, 0.3, events)
+    print(f"이벤트 {events:,}건, {days:,}일")
+
+    # 예전 방식: 딕셔너리 리스트 → DataFrame → 최근 30일 일별 합계
+    legacy = [{"at": at, "carbon_saved": value} for at, value in zip(times.tolist(), values.tolist())]
+    cutoff = now - WINDOWS["day"] * 86400
+
+    def legacy_daily():
+        frame = pd.DataFrame(legacy)
+        recent = frame[frame["at"] >= cutoff]
+        return recent.groupby(pd.to_datetime(recent["at"], unit="s").dt.date)["carbon_saved"].sum()
+
+    legacy_ms = _ms(legacy_daily, max(repeat // 5, 1))
+    print(f"legacy DataFrame rebuild (30 days)  {legacy_ms:>8.1f}ms")
+
+    start = time.perf_counter()
+    rows = rollups.add_many("bench", "carbon_saved", times, values)
+    print(f"add_many {(time.perf_counter() - start) * 1000:>8.0f}ms  ({rows:,} bucket rows for {len(GRAINS)} grains)")
+
+    today = date.today()
+    worst = 0
+    for grain, n in WINDOWS.items():
+        end = date_bucket(grain, today) + (23 if grain == "hour" else 0)
+        read_ms = _ms(lambda: rollups.series("bench", "carbon_saved", grain, end - n + 1, end), repeat)
+        worst = max(worst, read_ms)
+        print(f"series {grain:<6} last {n:>3}  {read_ms:>7.3f}ms")
+    days_ms = _ms(lambda: rollups.days("bench", ["carbon_saved"], today, 30), repeat)
+    print(f"days() DataFrame (30 days)   {days_ms:>7.3f}ms")
+
+    def click():
+        store.append("bench", rollups.recorder(
+            "bench", {"carbon_saved": 0.2}, [("incr", ["total_participations"], 1)]
+        ))
+
+    click_ms = _ms(click, repeat)
+    times = np.append(times, int(time.time()) + np.zeros(repeat, dtype=np.int64))
+    values = np.append(values, np.full(repeat, 0.2))
+    print(f"recorder append              {click_ms:>7.3f}ms")
+
+    same = True
+    for grain in GRAINS:
+        expected = _expected(times, values, grain)
+        first, last = int(expected.index.min()), int(expected.index.max())
+        actual = rollups.series("bench", "carbon_saved", grain, first, last)
+        dense = np.zeros(last - first + 1)
+        dense[expected.index.to_numpy() - first] = expected.to_numpy()
+        same = same and np.allclose(actual, dense)
+    print(f"same sums as pandas groupby {same}  (budget {budget_ms}ms)")
+    return same and worst <= budget_ms and days_ms <= budget_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=1000000)
+    parser.add_argument("--days", type=int, default=730)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=5)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["ESG_DB_PATH"] = os.path.join(tmp, "rollups.db")
+        ok = run(args.events, args.days, args.repeat, args.budget_ms)
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""n-gram 검색 색인 벤치마크.
+
+1. 물품명·설명·아이디어 제목의 어절을 섞은 합성 문서 ``--docs`` 개(기본 10만)를 색인하고
+   색인 시간, 문서 1개 증분 추가 시간, 검색어별 응답 시간을 측정합니다.
+2. 플리마켓 카탈로그에 물품 ``--items`` 개를 채우고 ``RecordSearch`` 로 첫 페이지를
+   검색합니다 (첫 검색은 색인 생성 포함, 이후 판매 여부·카테고리 필터 포함).
+
+가장 느린 검색이 ``--budget-ms`` (기본 50ms)를 넘으면 종료 코드 1로 끝납니다.
+
+    python -m benchmarks.search --docs 100000 --items 100000
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+QUERIES = ["자전거", "무선 헤드폰", "조명시스템", "친환경 인증", "재활용을", "책", "게임기 포함", "없는검색어"]
+
+IDEA_TITLES = [
+    "사무용 전기차 충전소 확대", "스마트 조명 시스템 도입", "공급업체 친환경 인증 제도",
+    "사무실 내 재활용 시스템 개선", "원격근무 환경 최적화", "회의실 대기전력 차단",
+    "텀블러 세척기 설치", "출장 탄소 배출량 자동 집계", "폐전자제품 회수 캠페인",
+]
+
+
+def corpus(docs, seed=42):
+    from esg.datagen import FLEA_ITEMS
+
+    words = sorted({
+        word
+        for text in IDEA_TITLES + [f"{item[0]} {item[4]}" for item in FLEA_ITEMS]
+        for word in text.replace(",", " ").split()
+    })
+    rng = np.random.default_rng(seed)
+    for doc_id in range(1, docs + 1):
+        title = rng.choice(words, rng.integers(2, 5))
+        body = rng.choice(words, rng.integers(5, 15))
+        yield doc_id, " ".join(title), " ".join(body)
+
+
+def _ms(run, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), max(samples)
+
+
+def run(docs, items, repeat, budget_ms):
+    from esg import datagen
+    from esg.catalog import ON_SALE, ItemCatalog
+    from esg.search import NgramIndex, RecordSearch
+    from esg.store import EventStore
+
+    documents = list(corpus(docs))
+    index = NgramIndex()
+    start = time.perf_counter()
+    for doc_id, title, body in documents:
+        index.add(doc_id, title, body)
+    print(f"index {docs:,} docs   {(time.perf_counter() - start) * 1000:>8.0f}ms")
+    add_ms, _ = _ms(lambda: index.add(len(index) + 1, "새 아이디어 제목", "증분 추가 본문"), 1)
+    print(f"add 1 doc          {add_ms:>8.2f}ms")
+    worst = 0
+    for query in QUERIES:
+        p50, slowest = _ms(lambda: index.search(query), repeat)
+        worst = max(worst, slowest)
+        print(f"  {query:<12} p50 {p50:>6.2f}ms  max {slowest:>6.2f}ms  ({len(index.search(query, limit=None)):,} hits)")
+
+    store = EventStore()
+    employees = items * datagen.BASE_EMPLOYEES // len(datagen.FLEA_ITEMS)
+    datagen.seed_store(store, {"flea_market": datagen.generate_campaign("flea_market", seed=42, employees=employees)}, replace=True)
+    search = RecordSearch(ItemCatalog(store), status=ON_SALE)
+    first_ms, _ = _ms(lambda: search.search("자전거"), 1)
+    print(f"\ncatalog {items:,} items, first search (builds index) {first_ms:>8.0f}ms")
+    for query, category in (("자전거", None), ("헤드폰", "전자제품"), ("자전거", "도서")):
+        p50, slowest = _ms(lambda: search.search(query, category=category), repeat)
+        worst = max(worst, slowest)
+        print(f"  {query:<6} {category or '전체':<6} p50 {p50:>6.2f}ms  max {slowest:>6.2f}ms")
+    print(f"\nworst {worst:.2f}ms (budget {budget_ms}ms)")
+    return worst <= budget_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=100000)
+    parser.add_argument("--items", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--budget-ms", type=int, default=50)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["ESG_DB_PATH"] = os.path.join(tmp, "search.db")
+        ok = run(args.docs, args.items, args.repeat, args.budget_ms)
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
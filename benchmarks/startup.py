@@ -0,0 +1,113 @@
+"""앱 콜드 스타트 / 첫 화면 벤치마크.
+
+새 프로세스에서 ``streamlit`` 을 import 하고 기본 페이지를 처음 실행할 때까지의
+시간을 측정합니다. 이전 리비전과 비교하려면 ``--rev`` 로 git 리비전을 지정합니다.
+
+    python -m benchmarks.startup                 # 현재 작업 트리
+    python -m benchmarks.startup --rev HEAD~1    # 이전 커밋과 비교
+
+측정 항목
+
+- compile: 첫 실행에 필요한 스크립트(엔트리 + 기본 페이지)를 읽고 컴파일하는 시간
+- import: 새 프로세스에서 streamlit / plotly / pandas import 시간
+- first paint: 첫 스크립트 실행이 끝나 화면 요소가 모두 전송될 때까지의 시간
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_CHILD = r"""
+import json, os, sys, time
+t0 = time.perf_counter()
+import streamlit, plotly.express, pandas
+from streamlit.testing.v1 import AppTest
+t1 = time.perf_counter()
+at = AppTest.from_file(os.path.join(os.getcwd(), "app.py"), default_timeout=120)
+at.run()
+t2 = time.perf_counter()
+print(json.dumps({
+    "import_ms": (t1 - t0) * 1000,
+    "first_paint_ms": (t2 - t1) * 1000,
+    "elements": len(list(at.main)) + len(list(at.sidebar)),
+    "exceptions": [e.value for e in at.exception],
+}))
+"""
+
+
+def first_run_scripts(app_dir):
+    """첫 실행에서 컴파일되는 스크립트 목록 (엔트리 + 기본 페이지)."""
+    scripts = [os.path.join(app_dir, "app.py")]
+    default_view = os.path.join(app_dir, "views", "stair_climbing.py")
+    if os.path.exists(default_view):
+        scripts.append(default_view)
+    return scripts
+
+
+def compile_cost(paths, repeat=5):
+    size = sum(os.path.getsize(path) for path in paths)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                compile(f.read(), path, "exec")
+        timings.append((time.perf_counter() - start) * 1000)
+    return size, statistics.median(timings)
+
+
+def cold_start(app_dir, db_path, repeat=3):
+    results = []
+    env = dict(os.environ, PYTHONPATH=app_dir, ESG_DB_PATH=db_path)
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", _CHILD], cwd=app_dir, env=env, capture_output=True, text=True, check=True
+        )
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return results
+
+
+def export_revision(rev, dest):
+    archive = os.path.join(dest, "rev.tar")
+    subprocess.run(["git", "archive", "-o", archive, rev], cwd=ROOT, check=True)
+    with tarfile.open(archive) as tar:
+        tar.extractall(dest)
+    return dest
+
+
+def report(label, app_dir, db_path, repeat):
+    size, compile_ms = compile_cost(first_run_scripts(app_dir))
+    runs = cold_start(app_dir, db_path, repeat)
+    exceptions = [e for run in runs for e in run["exceptions"]]
+    print(
+        f"{label:<10} compile {size / 1024:>6.0f}KB {compile_ms:>7.1f}ms | "
+        f"import {statistics.median(r['import_ms'] for r in runs):>7.0f}ms | "
+        f"first paint {statistics.median(r['first_paint_ms'] for r in runs):>7.0f}ms | "
+        f"elements {runs[0]['elements']}"
+        + (f" | 예외 {exceptions}" if exceptions else "")
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rev", help="비교할 git 리비전 (예: HEAD~1)")
+    parser.add_argument("--repeat", type=int, default=3, help="콜드 스타트 반복 횟수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.rev:
+            rev_dir = os.path.join(tmp, "rev")
+            os.makedirs(rev_dir)
+            report(args.rev, export_revision(args.rev, rev_dir), os.path.join(tmp, "rev.db"), args.repeat)
+        report("현재", ROOT, os.path.join(tmp, "current.db"), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""제로컵 등록 시간대·요일별 집계 벤치마크.
+
+제로컵 위크(``--days`` 일, 기본 7일) 동안 약 ``--registrations`` 건(기본 10만)의 등록을
+저장소에 채운 뒤 다음을 측정합니다.
+
+1. 예전 방식: 집계 행의 ``{"type", "timestamp": "HH:MM", "date"}`` 리스트를 매번 훑어 오늘
+   시간대별 건수(문자열 분리)와 요일별 건수(날짜 파싱)를 세는 시간, 집계 행 JSON 크기
+2. ``RegistrationLog``: 처음 테이블을 읽어 배열을 만드는 시간과, 이후 재실행마다
+   ``hourly``/``weekly`` 를 ``np.bincount`` 로 계산하는 시간 (새 등록 ``--new`` 건을 이어 읽는 경우 포함)
+3. 두 방식의 결과가 같은지
+
+재실행 집계 p50 이 ``--budget-ms`` (기본 10ms)를 넘거나 결과가 다르면 종료 코드 1로 끝납니다.
+
+    python -m benchmarks.zero_registrations --registrations 100000 --days 7
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+from datetime import date, datetime
+
+import numpy as np
+
+
+def _ms(run, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _legacy_hourly(rows, today):
+    # 예전 페이지 코드: 오늘 등록만 골라 "HH" 로 집계
+    hourly = {}
+    for reg in rows:
+        if reg['date'] == today:
+            hour = reg['timestamp'].split(':')[0]
+            hourly[(reg['type'], hour)] = hourly.get((reg['type'], hour), 0) + 1
+    return hourly
+
+
+def _legacy_weekly(rows):
+    weekly = {}
+    for reg in rows:
+        weekday = datetime.strptime(reg['date'], "%Y-%m-%d").weekday()
+        weekly[(reg['type'], weekday)] = weekly.get((reg['type'], weekday), 0) + 1
+    return weekly
+
+
+def run(registrations, days, new, repeat, budget_ms):
+    from esg import datagen
+    from esg.registrations import TYPES, RegistrationLog
+    from esg.store import EventStore
+
+    store = EventStore()
+    # 하루 20-40건(기본 규모 500명)에 비례하도록 임직원 수를 맞춤
+    employees = registrations * datagen.BASE_EMPLOYEES // (30 * days)
+    state = datagen.generate_campaign("zero_challenge", seed=42, employees=employees, days=days)
+    log = RegistrationLog(store)
+    log.seed(state, replace=True)
+    kinds, times = state["registrations"]["kind"], state["registrations"]["at"]
+    print(f"등록 {len(times):,}건, {days}일")
+
+    legacy = [
+        {'type': TYPES[kind], 'timestamp': at.strftime("%H:%M"), 'date': at.strftime("%Y-%m-%d")}
+        for kind, at in zip(kinds.tolist(), map(datetime.fromtimestamp, times.tolist()))
+    ]
+    legacy_state = dict(state, registrations=None, daily_registrations=legacy)
+    today = date.today()
+    legacy_hourly_ms = _ms(lambda: _legacy_hourly(legacy, today.strftime("%Y-%m-%d")), repeat)
+    legacy_weekly_ms = _ms(lambda: _legacy_weekly(legacy), max(repeat // 5, 1))
+    print(f"legacy   hourly {legacy_hourly_ms:>8.1f}ms  weekly {legacy_weekly_ms:>8.1f}ms  "
+          f"state JSON {len(json.dumps(legacy_state, ensure_ascii=False, default=str)) / 1e6:.1f}MB")
+
+    start = time.perf_counter()
+    log.refresh()
+    cold_ms = (time.perf_counter() - start) * 1000
+    hourly_ms = _ms(lambda: log.hourly(today), repeat)
+    weekly_ms = _ms(log.weekly, repeat)
+    print(f"arrays   hourly {hourly_ms:>8.2f}ms  weekly {weekly_ms:>8.2f}ms  "
+          f"(first load {cold_ms:.0f}ms, {sum(a.nbytes for a in log.arrays()) / 1e6:.1f}MB)")
+
+    # 다른 세션의 등록을 이어 읽는 재실행
+    rng = np.random.default_rng(7)
+    now = int(time.time())
+    extra = [(TYPES[kind], now - offset) for kind, offset in zip(rng.integers(0, 3, new).tolist(),
+                                                                     rng.integers(0, 3600, new).tolist())]
+
+    added = []
+
+    def catch_up():
+        kind, at = extra.pop()
+        added.append((kind, at))
+        store.append("zero_challenge", log.recorder(kind, [("incr", ["N"], 1)], at=at))
+        start = time.perf_counter()
+        log.hourly(today)
+        log.weekly()
+        return (time.perf_counter() - start) * 1000
+
+    rerun_ms = statistics.median(catch_up() for _ in range(new))
+    print(f"rerun after new registration {rerun_ms:>6.2f}ms  (budget {budget_ms}ms)")
+
+    legacy += [
+        {'type': kind, 'timestamp': at.strftime("%H:%M"), 'date': at.strftime("%Y-%m-%d")}
+        for kind, at in ((kind, datetime.fromtimestamp(at)) for kind, at in added)
+    ]
+    expected_hourly = _legacy_hourly(legacy, today.strftime("%Y-%m-%d"))
+    expected_weekly = _legacy_weekly(legacy)
+    hourly = log.hourly(today)
+    weekly = log.weekly()
+    same = (
+        {(TYPES[k], f"{h:02d}"): int(hourly[k, h]) for k, h in zip(*np.nonzero(hourly))} == expected_hourly
+        and {(TYPES[k], int(d)): int(weekly[k, d]) for k, d in zip(*np.nonzero(weekly))} == expected_weekly
+    )
+    print(f"same counts as legacy {same}  total {log.count():,}")
+    return same and hourly_ms + weekly_ms <= budget_ms and rerun_ms <= budget_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--registrations", type=int, default=100000)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--new", type=int, default=50, help="이어 읽을 새 등록 수")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=10)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["ESG_DB_PATH"] = os.path.join(tmp, "zero.db")
+        ok = run(args.registrations, args.days, args.new, args.repeat, args.budget_ms)
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""삼성SDS ESG Re:source 공용 모듈."""
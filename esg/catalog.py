@@ -0,0 +1,243 @@
+"""사무실 미니 플리마켓 물품 카탈로그.
+
+물품은 캠페인 집계 행(JSON)의 리스트가 아니라 같은 SQLite 파일의 ``flea_items``
+테이블에 저장합니다.
+
+- 물품 번호는 ``AUTOINCREMENT`` 로 발급되어 판매·초기화 후에도 다시 쓰이지 않습니다.
+- 판매된 물품은 지우지 않고 상태만 ``판매완료`` 로 바꿉니다.
+- 상태, (상태, 카테고리), (판매자, 상태) 보조 인덱스로 필터링하고, 목록은 마지막 물품
+  번호를 커서로 넘기는 방식(keyset)으로 페이지를 나눕니다. 물품이 10만 개여도
+  한 페이지를 읽는 비용은 페이지 크기만큼입니다.
+
+등록·구매는 물품 행과 ``flea_market`` 집계(등록 수, 총 가치, 카테고리별 통계, 모금액)를
+한 트랜잭션에서 함께 갱신합니다. 구매는 상태가 ``판매중`` 일 때만 바꾸는 조건부 갱신
+(낙관적 잠금)이라 여러 구매자가 동시에 눌러도 한 명만 성공하고, 구매 요청 토큰을
+``flea_purchases`` 에 함께 기록해 같은 요청을 다시 보내도(중복 클릭, 재시도) 한 번만 집계됩니다.
+"""
+import json
+import time
+import uuid
+
+CAMPAIGN = "flea_market"
+
+ON_SALE = "판매중"
+SOLD = "판매완료"
+
+CATEGORIES = ["전자제품", "도서", "의류/신발", "생활용품", "액세서리", "운동용품", "기타"]
+
+PAGE_SIZE = 12
+
+COLUMNS = ["id", "name", "category", "price", "seller", "description", "image", "image_url", "status", "donation_amount"]
+
+
+def _item(row):
+    return dict(zip(COLUMNS, row))
+
+
+def category_stats(items):
+    """물품 목록의 카테고리별 ``{"count", "total_value"}`` (집계 초기값용)."""
+    stats = {category: {"count": 0, "total_value": 0} for category in CATEGORIES}
+    for item in items:
+        entry = stats.setdefault(item["category"], {"count": 0, "total_value": 0})
+        entry["count"] += 1
+        entry["total_value"] += item["price"]
+    return stats
+
+
+class ItemCatalog:
+    def __init__(self, store):
+        self.store = store
+        conn = store.connection()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS flea_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                category TEXT NOT NULL,
+                price INTEGER NOT NULL,
+                seller TEXT NOT NULL,
+                description TEXT NOT NULL,
+                image TEXT NOT NULL,
+                image_url TEXT NOT NULL,
+                status TEXT NOT NULL,
+                donation_amount INTEGER NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        # 인덱스 항목은 같은 키 안에서 rowid(id) 순이므로, 필터별로 id 커서 위치부터 바로 이어 읽음
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_flea_items_status ON flea_items (status)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_flea_items_status_category ON flea_items (status, category)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_flea_items_seller_status ON flea_items (seller, status)")
+        # 구매 기록: 토큰(요청 식별자)당 1건, 물품당 1건
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS flea_purchases (
+                token TEXT PRIMARY KEY,
+                item_id INTEGER NOT NULL UNIQUE,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+
+    def _insert(self, conn, items, keep_ids=False):
+        columns = COLUMNS if keep_ids else COLUMNS[1:]
+        now = time.time()
+        conn.executemany(
+            f"INSERT INTO flea_items ({', '.join(columns)}, created_at) VALUES ({', '.join('?' * len(columns))}, ?)",
+            [[item[column] for column in columns] + [now] for item in items],
+        )
+
+    def seed(self, state, replace=False):
+        """샘플 상태(``items`` 포함)를 물품 테이블과 집계 행으로 나눠 기록합니다.
+
+        ``replace`` 면 기존 물품을 지우고 다시 채웁니다. 물품 번호는 이어서 발급됩니다.
+        물품 테이블과 집계 행은 한 트랜잭션에서 기록합니다.
+        """
+        state = dict(state)
+        items = state.pop("items")
+        state["categories"] = category_stats(items)
+
+        def fill(conn):
+            conn.execute("DELETE FROM flea_items")
+            conn.execute("DELETE FROM flea_purchases")
+            self._insert(conn, items)
+
+        return self.store.seed(CAMPAIGN, state, replace=replace, tables=fill)
+
+    def migrate(self):
+        """물품을 집계 행의 ``items`` 리스트에 두던 저장소를 테이블로 옮깁니다 (물품 번호 유지).
+
+        물품 행 기록과 집계 행의 ``items`` 제거가 한 트랜잭션이고, 트랜잭션 안에서 집계 행을
+        다시 읽으므로 여러 프로세스가 동시에 옮겨도 한 번만 옮겨집니다.
+        """
+        state = self.store.snapshot(CAMPAIGN)
+        if state is None or "items" not in state:
+            return False
+
+        def move(conn):
+            row = conn.execute("SELECT state FROM campaign_state WHERE campaign = ?", (CAMPAIGN,)).fetchone()
+            items = json.loads(row[0]).get("items")
+            if items is None:
+                return None
+            self._insert(conn, items, keep_ids=True)
+            return [("unset", ["items"], None), ("set", ["categories"], category_stats(items))]
+
+        return self.store.append(CAMPAIGN, move) is not None
+
+    def get(self, item_id, conn=None):
+        row = (conn or self.store.connection()).execute(
+            f"SELECT {', '.join(COLUMNS)} FROM flea_items WHERE id = ?", (item_id,)
+        ).fetchone()
+        return _item(row) if row else None
+
+    def page(self, category=None, seller=None, status=ON_SALE, after=0, limit=PAGE_SIZE):
+        """``after`` 다음 물품 번호부터 ``limit`` 개와 다음 페이지 커서(없으면 None)를 반환합니다."""
+        where = ["status = ?", "id > ?"]
+        params = [status, after]
+        if category is not None:
+            where.append("category = ?")
+            params.append(category)
+        if seller is not None:
+            where.append("seller = ?")
+            params.append(seller)
+        rows = self.store.connection().execute(
+            f"SELECT {', '.join(COLUMNS)} FROM flea_items WHERE {' AND '.join(where)} ORDER BY id LIMIT ?",
+            params + [limit + 1],
+        ).fetchall()
+        items = [_item(row) for row in rows[:limit]]
+        return items, (items[-1]["id"] if len(rows) > limit else None)
+
+    def get_many(self, item_ids, category=None, status=None):
+        """물품 번호 순서 그대로 물품 목록을 반환합니다 (없거나 조건에 맞지 않는 물품은 제외)."""
+        where = [f"id IN ({', '.join('?' * len(item_ids))})"]
+        params = list(item_ids)
+        if category is not None:
+            where.append("category = ?")
+            params.append(category)
+        if status is not None:
+            where.append("status = ?")
+            params.append(status)
+        rows = self.store.connection().execute(
+            f"SELECT {', '.join(COLUMNS)} FROM flea_items WHERE {' AND '.join(where)}", params
+        ).fetchall()
+        found = {row[0]: _item(row) for row in rows}
+        return [found[item_id] for item_id in item_ids if item_id in found]
+
+    def first_id(self):
+        return self.store.connection().execute("SELECT MIN(id) FROM flea_items").fetchone()[0]
+
+    def texts(self, after=0, limit=10000):
+        """검색 색인용 ``(물품 번호, 물품명, 설명)`` 을 ``after`` 다음 번호부터 반환합니다 (판매 여부 무관)."""
+        return self.store.connection().execute(
+            "SELECT id, name, description FROM flea_items WHERE id > ? ORDER BY id LIMIT ?", (after, limit)
+        ).fetchall()
+
+    def image_urls(self):
+        """물품 사진 주소 목록 (중복 제거)."""
+        rows = self.store.connection().execute("SELECT DISTINCT image_url FROM flea_items").fetchall()
+        return [row[0] for row in rows]
+
+    def replace_image_url(self, old, new):
+        """사진 주소를 바꾸고 바뀐 물품 수를 반환합니다 (원격 사진을 로컬 썸네일로 교체할 때)."""
+        conn = self.store.connection()
+        return conn.execute("UPDATE flea_items SET image_url = ? WHERE image_url = ?", (new, old)).rowcount
+
+    def add(self, item):
+        """물품을 등록하고 발급된 물품 번호를 반환합니다."""
+        item = dict(item, status=ON_SALE)
+        if item["category"] not in CATEGORIES:
+            raise ValueError(f"알 수 없는 카테고리입니다: {item['category']}")
+
+        def register(conn):
+            self._insert(conn, [item])
+            item["id"] = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+            return [
+                ("incr", ["total_items"], 1),
+                ("incr", ["total_value"], item["price"]),
+                ("incr", ["categories", item["category"], "count"], 1),
+                ("incr", ["categories", item["category"], "total_value"], item["price"]),
+            ]
+
+        self.store.append(CAMPAIGN, register)
+        return item["id"]
+
+    def purchase(self, item_id, token=None):
+        """판매중인 물품을 판매완료로 바꾸고 물품을 반환합니다. 이미 팔렸으면 None.
+
+        ``token`` 은 구매 요청 식별자입니다. 같은 토큰으로 다시 요청하면 집계를 다시 올리지
+        않고 처음 구매한 물품을 그대로 반환합니다 (다른 물품에 쓰인 토큰이면 ValueError).
+        """
+        token = token or uuid.uuid4().hex
+        purchased = {}
+
+        def sell(conn):
+            row = conn.execute("SELECT item_id FROM flea_purchases WHERE token = ?", (token,)).fetchone()
+            if row is not None:
+                if row[0] != item_id:
+                    raise ValueError(f"다른 물품에 사용된 구매 토큰입니다: {token}")
+                purchased.update(self.get(item_id, conn))
+                return None
+            # 판매중일 때만 판매완료로 바꿈: 다른 구매자가 먼저 샀으면 0행
+            rows = conn.execute(
+                f"UPDATE flea_items SET status = ? WHERE id = ? AND status = ? RETURNING {', '.join(COLUMNS)}",
+                (SOLD, item_id, ON_SALE),
+            ).fetchall()
+            if not rows:
+                return None
+            purchased.update(_item(rows[0]))
+            conn.execute(
+                "INSERT INTO flea_purchases (token, item_id, created_at) VALUES (?, ?, ?)",
+                (token, item_id, time.time()),
+            )
+            return [
+                ("incr", ["sold_items"], 1),
+                ("incr", ["total_donations"], purchased["donation_amount"]),
+                ("incr", ["total_items"], -1),
+                ("incr", ["total_value"], -purchased["price"]),
+                ("incr", ["categories", purchased["category"], "count"], -1),
+                ("incr", ["categories", purchased["category"], "total_value"], -purchased["price"]),
+            ]
+
+        self.store.append(CAMPAIGN, sell)
+        return purchased or None
@@ -0,0 +1,114 @@
+"""세션 간 공유 카운터 (원자적 증가 + 쓰기 병합).
+
+점심시간처럼 수백 명이 몇 초 안에 같은 버튼을 누르는 경우, 클릭마다
+SQLite 트랜잭션을 열면 쓰기 잠금 경합이 커집니다. ``CounterService`` 는
+증가분을 메모리에서 잠금 하나로 누적하고, 백그라운드 스레드가 주기적으로
+캠페인당 이벤트 하나로 묶어 ``EventStore`` 에 기록합니다.
+
+- 증가는 프로세스 내 잠금으로 원자적이며, 기록은 ``incr`` 연산이므로
+  여러 프로세스가 같은 DB를 써도 갱신이 유실되지 않습니다.
+- 기록에 실패한 증가분은 다시 대기열로 돌려 다음 주기에 재시도합니다.
+- ``view`` 는 아직 기록되지 않은 증가분까지 반영한 상태를 돌려주므로
+  클릭한 사용자는 즉시 자신의 등록을 확인할 수 있습니다.
+- 카운터를 쓰는 캠페인은 ``seed`` 로 다시 채워야 초기화 전 증가분이 새 상태에 더해지지 않습니다.
+"""
+import atexit
+import copy
+import threading
+
+from esg.store import apply_ops
+
+
+class CounterService:
+    def __init__(self, store, flush_interval=0.2):
+        self.store = store
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = {}
+        self._derive = {}
+        self._stop = threading.Event()
+        self._thread = None
+        if flush_interval:
+            self._thread = threading.Thread(target=self._run, name="esg-counter-flusher", daemon=True)
+            self._thread.start()
+        atexit.register(self.close)
+
+    def incr(self, campaign, path, by=1, derive=None):
+        self.incr_many(campaign, [(path, by)], derive=derive)
+
+    def incr_many(self, campaign, deltas, derive=None):
+        """여러 카운터를 한 번에 증가시킵니다. 같은 클릭의 증가분은 같은 기록에 묶입니다."""
+        with self._lock:
+            pending = self._pending.setdefault(campaign, {})
+            for path, by in deltas:
+                key = tuple(path)
+                pending[key] = pending.get(key, 0) + by
+            if derive is not None:
+                self._derive[campaign] = derive
+
+    def pending(self, campaign):
+        with self._lock:
+            return dict(self._pending.get(campaign, {}))
+
+    def view(self, campaign):
+        """저장된 집계 상태에 미기록 증가분을 더한 상태를 반환합니다."""
+        return self.versioned_view(campaign)[1]
+
+    def versioned_view(self, campaign):
+        """``(버전, 상태)`` 를 반환합니다. 버전은 저장 버전과 미기록 증가분을 함께 나타냅니다."""
+        version, state = self.store.versioned_snapshot(campaign)
+        pending = self.pending(campaign)
+        if not pending or state is None:
+            return version, state
+        state = apply_ops(copy.deepcopy(state), [("incr", list(path), by) for path, by in pending.items()])
+        derive = self._derive.get(campaign)
+        if derive is not None:
+            derive(state)
+        return (version, tuple(sorted(pending.items()))), state
+
+    def seed(self, campaign, state, replace=False):
+        """미기록 증가분을 버리고 ``EventStore.seed`` 로 상태를 기록합니다.
+
+        진행 중인 기록이 끝난 뒤 기록 스레드를 멈춘 채 초기화하므로, 초기화 전 증가분이
+        새 상태에 더해지지 않습니다.
+        """
+        with self._flush_lock:
+            with self._lock:
+                self._pending.pop(campaign, None)
+            return self.store.seed(campaign, state, replace=replace)
+
+    def flush(self):
+        """대기 중인 증가분을 캠페인당 이벤트 하나로 기록합니다. 기록한 연산 수를 반환합니다."""
+        with self._flush_lock:
+            with self._lock:
+                drained, self._pending = self._pending, {}
+            written = 0
+            items = list(drained.items())
+            for i, (campaign, deltas) in enumerate(items):
+                ops = [("incr", list(path), by) for path, by in deltas.items() if by]
+                if not ops:
+                    continue
+                try:
+                    self.store.append(campaign, ops, derive=self._derive.get(campaign))
+                except Exception:
+                    # 유실 방지: 실패한 캠페인과 남은 캠페인의 증가분을 대기열로 되돌림
+                    for failed_campaign, failed_deltas in items[i:]:
+                        self.incr_many(failed_campaign, list(failed_deltas.items()))
+                    raise
+                written += len(ops)
+            return written
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                # 다음 주기에 재시도
+                pass
+
+    def close(self):
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+        self.flush()
@@ -0,0 +1,679 @@
+"""캠페인 샘플 데이터 생성기.
+
+13개 캠페인의 초기 상태를 NumPy 배열 연산으로 한 번에 만듭니다. 화면용 샘플
+데이터와 부하·장기 테스트용 대용량 데이터를 같은 코드로 생성합니다.
+
+- ``seed`` 를 지정하면 같은 데이터가 재현됩니다 (환경 변수 ``ESG_SEED``).
+- ``employees`` 는 인원 규모입니다. 기본값 500명에서 기존 샘플 범위와 같고,
+  인원·건수·누적량 지표는 이 규모에 비례해 커집니다 (비율 지표는 그대로).
+- ``days`` 는 일별 이력의 길이입니다 (페이퍼리스·플로깅·탄소 발자국 일별 현황, 제로컵 등록 내역,
+  소등·절전 15분 계량값은 최소 ``METER_DAYS`` 일, 탄소 발자국 일별 참여는 최소 ``CARBON_DAYS`` 일).
+
+대용량 데이터로 저장소를 채우려면::
+
+    python -m esg.datagen --employees 50000 --days 730 --seed 42 --db /tmp/load.db
+"""
+import argparse
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+
+from esg import catalog, emissions, ideas, meters, registrations, rollups
+
+BASE_EMPLOYEES = 500
+BASE_DAYS = 30
+
+BUILDINGS = {
+    "잠실": "잠실 사옥",
+    "판교IT": "판교 IT 사옥",
+    "판교물류": "판교 물류 사옥",
+    "상암": "상암 사옥",
+    "수원": "수원 사옥",
+}
+
+DEPARTMENTS = {
+    "솔루션사업부": ("💻", "#007bff"),
+    "클라우드사업부": ("☁️", "#28a745"),
+    "전마실": ("🏢", "#ffc107"),
+    "물류사업": ("🚛", "#20c997"),
+    "경영지원": ("📊", "#6f42c1"),
+    "개발센터": ("🔧", "#fd7e14"),
+}
+
+# 계단 오르기: 사옥별 참여자 수
+STAIR_RANGES = [[15, 35], [20, 40], [10, 25], [12, 30], [8, 20]]
+
+# 소등·절전: 사옥별 [참여자, 절약량(kWh, 계량값으로 대체), 조명소등률(%), 모니터소등률(%)]
+POWER_RANGES = [
+    [[25, 45], [150, 250], [80, 95], [70, 90]],
+    [[30, 50], [180, 280], [85, 95], [75, 90]],
+    [[20, 35], [120, 200], [75, 90], [65, 85]],
+    [[22, 40], [140, 220], [80, 95], [70, 90]],
+    [[18, 30], [100, 180], [75, 90], [65, 85]],
+]
+
+# 소등·절전: 사옥별 최대 부하 (kW)
+METER_LOAD_KW = [[70, 90], [90, 120], [40, 60], [55, 80], [30, 50]]
+METER_DAYS = 730
+
+# 탄소 발자국: 일별 참여 이력 최소 길이 (기간 선택용)
+CARBON_DAYS = 730
+
+# 디지털 다이어트: 부서별 [저장용량(GB), 이메일 감소율(%), 삭제 파일 수, 전력 절약(%)]
+DIGITAL_DIET_RANGES = [
+    [[15, 25], [20, 35], [500, 800], [8, 15]],
+    [[12, 20], [15, 25], [300, 500], [6, 12]],
+    [[10, 18], [18, 30], [400, 600], [5, 10]],
+    [[18, 28], [25, 40], [600, 900], [10, 18]],
+    [[20, 30], [30, 45], [700, 1000], [12, 20]],
+    [[22, 32], [35, 50], [800, 1200], [15, 25]],
+]
+
+# ESG 교육: 과정별 (키, 이름, 아이콘, 색상, 시간, 난이도) 와 [참여자, 수료율(%), 평균 점수]
+COURSES = [
+    ("ESG기초", "ESG 기초 교육", "📚", "#007bff", "2시간", "초급"),
+    ("환경경영", "환경 경영 교육", "🌱", "#28a745", "3시간", "중급"),
+    ("사회책임", "사회적 책임 교육", "🤝", "#ffc107", "2.5시간", "중급"),
+    ("지배구조", "지배구조 교육", "⚖️", "#6f42c1", "2시간", "고급"),
+    ("지속가능성", "지속가능성 교육", "♻️", "#20c997", "3.5시간", "고급"),
+]
+COURSE_RANGES = [
+    [[80, 120], [85, 95], [75, 85]],
+    [[60, 90], [80, 90], [70, 80]],
+    [[70, 100], [82, 92], [72, 82]],
+    [[50, 80], [75, 85], [65, 75]],
+    [[45, 75], [70, 80], [60, 70]],
+]
+
+# ESG 성과 공개: 부서별 [전력 절감(%), 자원 절감(%), 봉사 참여(명), 목표 달성률(%), 참여율(%)]
+PLATFORM_RANGES = [
+    [[15, 25], [20, 30], [8, 15], [85, 95], [90, 100]],
+    [[25, 35], [30, 40], [12, 20], [90, 100], [95, 100]],
+    [[10, 20], [25, 35], [6, 12], [80, 90], [85, 95]],
+    [[30, 40], [35, 45], [15, 25], [95, 100], [98, 100]],
+    [[12, 22], [18, 28], [10, 18], [82, 92], [88, 98]],
+    [[20, 30], [25, 35], [12, 20], [88, 98], [92, 100]],
+]
+
+# 지역 사회 봉사: 활동별 (키, 이름, 아이콘, 색상, 빈도, 장소) 와 [참여자, 봉사시간, 사회가치]
+ACTIVITIES = [
+    ("환경정화", "환경정화 봉사", "🌱", "#28a745", "월 2회", "한강공원, 도심 공원"),
+    ("장애인시설", "장애인 시설 봉사", "♿", "#007bff", "월 1회", "지역 장애인 복지관"),
+    ("지역농가", "지역 농가 돕기", "🚜", "#ffc107", "분기 1회", "경기도 농장"),
+    ("노인복지", "노인 복지 봉사", "👴", "#6f42c1", "월 1회", "지역 노인복지관"),
+    ("아동복지", "아동 복지 봉사", "👶", "#fd7e14", "월 1회", "지역 아동센터"),
+]
+ACTIVITY_RANGES = [
+    [[25, 40], [200, 320], [150, 250]],
+    [[15, 25], [120, 200], [100, 180]],
+    [[20, 35], [160, 280], [120, 200]],
+    [[18, 30], [140, 240], [110, 190]],
+    [[22, 35], [180, 300], [130, 220]],
+]
+
+# 그린리본: 사옥 카페별 [참여자, 스탬프, ESG 구매, 총 구매]
+CAFE_NAMES = ["잠실 카페", "판교 IT 카페", "판교 물류 카페", "상암 카페", "수원 카페"]
+CAFE_RANGES = [
+    [[35, 55], [120, 180], [25, 40], [80, 120]],
+    [[40, 60], [140, 200], [30, 45], [90, 130]],
+    [[25, 40], [100, 150], [20, 35], [60, 100]],
+    [[30, 45], [110, 160], [22, 38], [70, 110]],
+    [[20, 35], [80, 130], [18, 30], [50, 90]],
+]
+
+# 임직원 아이디어: 단계별 (이름, 색상, 설명, 아이콘, 건수 범위) 와 카테고리별 [전체, 구현]
+IDEA_STAGES = [
+    ("제안", "#FF6B6B", "새로운 아이디어 제안", "💡", [40, 50]),
+    ("검토", "#4ECDC4", "전문가 검토 중", "🔍", [25, 35]),
+    ("평가", "#45B7D1", "실현가능성 평가", "📊", [15, 25]),
+    ("승인", "#96CEB4", "구현 승인됨", "✅", [10, 15]),
+    ("구현", "#FFEAA7", "실제 구현 중", "🚀", [5, 12]),
+    ("완료", "#DDA0DD", "구현 완료", "🎉", [3, 8]),
+]
+# 임직원 아이디어: 데모 아이디어 (제목, 카테고리, 설명)
+IDEA_TEMPLATES = [
+    ("사무용 전기차 충전소 확대", "Scope 1", "사옥 주차장 충전기를 늘려 업무용 차량을 전기차로 전환"),
+    ("업무용 차량 공유 예약제", "Scope 1", "부서별 차량을 공용 예약제로 바꿔 운행 대수 축소"),
+    ("스마트 조명 시스템 도입", "Scope 2", "재실 센서와 조도 센서로 빈 공간 조명 자동 소등"),
+    ("회의실 대기전력 차단", "Scope 2", "예약이 없는 회의실의 모니터·공조 전원을 일괄 차단"),
+    ("공급업체 친환경 인증 제도", "Scope 3", "협력사 탄소 배출 관리 수준을 평가해 인증 부여"),
+    ("출장 탄소 배출량 자동 집계", "Scope 3", "출장 예약 데이터로 이동 수단별 배출량 자동 계산"),
+    ("사무실 내 재활용 시스템 개선", "순환경제", "층별 분리배출함을 재질별로 세분화하고 수거량 기록"),
+    ("폐전자제품 회수 캠페인", "순환경제", "사내 폐전자제품을 모아 재활용 업체에 일괄 인계"),
+    ("원격근무 환경 최적화", "기타", "원격근무 일수를 늘려 통근 배출과 사옥 에너지 절감"),
+]
+IDEA_AUTHORS = ["김혁신", "이그린", "박에코", "최순환", "정절전", "한탄소"]
+
+# 사무실 미니 플리마켓: 데모 물품 (이름, 카테고리, 가격, 판매자, 설명, 아이콘, 사진 ID)
+FLEA_ITEMS = [
+    ("MacBook Pro 13인치", "전자제품", 800000, "김개발", "2020년 모델, 상태 양호", "💻", "photo-1517336714731-489689fd1ca8"),
+    ("해리포터 시리즈 전집", "도서", 50000, "이책사", "1-7권 완전판, 새책 수준", "📚", "photo-1481627834876-b7833e8f5570"),
+    ("나이키 운동화", "의류/신발", 80000, "박운동", "사이즈 270, 몇 번만 착용", "👟", "photo-1542291026-7eec264c27ff"),
+    ("무지 후드티", "의류/신발", 15000, "최패션", "L사이즈, 깨끗한 상태", "👕", "photo-1556821840-3a63f95609a7"),
+    ("아이폰 12 케이스", "전자제품", 10000, "정폰케이스", "투명 케이스, 스크래치 없음", "📱", "photo-1511707171634-5f897ff02aa9"),
+    ("커피머신", "생활용품", 120000, "한커피", "네스프레소 캡슐 머신", "☕", "photo-1495474472287-4d71bcdd2085"),
+    ("헤드폰", "전자제품", 60000, "음악사랑", "소니 무선 헤드폰", "🎧", "photo-1484704849700-f032a568e944"),
+    ("가방", "의류/신발", 40000, "백백백", "브랜드 백팩, 내구성 좋음", "🎒", "photo-1553062407-98eeb64c6a62"),
+    ("시계", "액세서리", 200000, "타임키퍼", "스위스 시계, 정품", "⌚", "photo-1594534475808-b18fc33b045e"),
+    ("자전거", "운동용품", 300000, "바이크러버", "로드바이크, 잘 관리됨", "🚲", "photo-1571068316344-75bc76f77890"),
+    ("캠핑용품 세트", "생활용품", 150000, "캠핑러", "텐트, 매트, 랜턴 포함", "⛺", "photo-1487730116645-74489c95b41b"),
+    ("게임기", "전자제품", 400000, "게이머", "플레이스테이션 5, 게임 3개 포함", "🎮", "photo-1606144042614-b2417e99c4e3"),
+]
+
+def draw(rng, ranges, scale=1.0):
+    """``[low, high)`` 범위 배열에서 정수를 한 번에 뽑습니다.
+
+    ``scale`` 은 범위 전체에 곱해지며, 스칼라 또는 범위와 브로드캐스트되는 배열입니다.
+    """
+    ranges = np.asarray(ranges, dtype=np.float64)
+    scale = np.asarray(scale, dtype=np.float64)
+    low = np.floor(ranges[..., 0] * scale).astype(np.int64)
+    high = np.maximum(np.ceil(ranges[..., 1] * scale).astype(np.int64), low + 1)
+    return rng.integers(low, high)
+
+
+def _per_metric_scale(k, scaled):
+    # 지표별 규모 계수: 건수·누적량 지표만 인원 규모에 비례
+    return np.where(np.asarray(scaled), k, 1.0)
+
+
+def _daily(today, days):
+    """최근 ``days`` 일(오늘 포함)의 로컬 정오 epoch 초 배열과 요일 배열 (월=0)."""
+    noon = rollups.local_timestamp(today)
+    offset = np.arange(days - 1, -1, -1)
+    return noon - offset * 86400, (today.weekday() - offset) % 7
+
+
+def build_stair_climbing(rng, k, days, today):
+    participants = draw(rng, STAIR_RANGES, k).tolist()
+    return {
+        key: {"name": name, "image": "🏢", "participants": count}
+        for (key, name), count in zip(BUILDINGS.items(), participants)
+    }
+
+
+def build_zero_challenge(rng, k, days, today):
+    personal_cups, tumblers, lunchboxes, W = draw(rng, [[25, 50], [30, 60], [15, 35], [50, 100]], k).tolist()
+    total_participants = personal_cups + tumblers + lunchboxes
+    single_use_reduction = personal_cups + tumblers + (lunchboxes * 2)  # 도시락은 2개 절약
+
+    # 등록 내역: 하루 20-40건 (규모 비례) × days 일, 08-18시, 유형 코드·epoch 초 배열 (esg.registrations)
+    per_day = draw(rng, np.tile([[20, 40]], (days, 1)), k)
+    n = int(per_day.sum())
+    day_offset = np.repeat(np.arange(days - 1, -1, -1), per_day)
+    midnight = int(datetime(today.year, today.month, today.day).timestamp())
+    at = midnight - day_offset * 86400 + rng.integers(8 * 3600, 18 * 3600, n)
+    registered = {"kind": rng.integers(0, 3, n).astype(np.int8), "at": at.astype(np.int64)}
+
+    A_single = emissions.DEFAULT.current("A_single", today)  # 일회용품 1개당 탄소배출량 (kg CO₂eq)
+    A_multi = emissions.DEFAULT.current("A_multi", today)  # 다회용품 1개당 탄소배출량 (kg CO₂eq)
+    N = single_use_reduction  # 절약된 일회용품 수
+    R = personal_cups + tumblers  # 재사용 용기 수
+    C = lunchboxes  # 순환용기 수 (도시락)
+    return {
+        "participants": total_participants,
+        "personal_cups": personal_cups,
+        "tumblers": tumblers,
+        "lunchboxes": lunchboxes,
+        "single_use_reduction": single_use_reduction,
+        "registrations": registered,
+        # 탄소감축량 관련
+        "A_single": A_single,
+        "A_multi": A_multi,
+        "N": N,
+        "carbon_reduction": emissions.reduction("zero_cup", N, today),
+        # 순환이용률 관련
+        "R": R,
+        "C": C,
+        "W": W,
+        "circular_rate": ((R + C) / (W + C)) * 100
+    }
+
+
+def build_paperless(rng, k, days, today):
+    base_prints, base_paper_purchase, N, cost_savings = draw(
+        rng, [[200, 400], [50, 100], [5000, 15000], [500, 800]], k
+    ).tolist()
+    digital_adoption_rate, paper_savings = draw(rng, [[65, 80], [20, 35]]).tolist()
+
+    # 일별 이력 (최근 days 일, 주말 제외): 페이퍼리스 데이(수요일)는 인쇄 30%, 종이 구매 25% 감소
+    at, weekday = _daily(today, days)
+    workday = weekday < 5
+    at, weekday = at[workday], weekday[workday]
+    n = len(at)
+    is_paperless = weekday == 2
+    center_prints = np.where(is_paperless, int(base_prints * 0.7), base_prints)
+    spread_prints = np.where(is_paperless, 20, 30) * k
+    center_paper = np.where(is_paperless, int(base_paper_purchase * 0.75), base_paper_purchase)
+    spread_paper = np.where(is_paperless, 5, 10) * k
+    prints = rng.integers((center_prints - spread_prints).astype(np.int64), (center_prints + spread_prints).astype(np.int64))
+    paper = rng.integers((center_paper - spread_paper).astype(np.int64), (center_paper + spread_paper).astype(np.int64))
+    # 디지털 사용률(%)은 더할 수 있도록 디지털 문서 수로 기록 (사용률 = 디지털 / (인쇄 + 디지털))
+    digital = np.where(is_paperless, rng.integers(80, 95, n), rng.integers(40, 60, n))
+    digital_docs = np.round(prints * digital / (100 - digital))
+    week = at > rollups.local_timestamp(today) - 7 * 86400
+
+    Ep = emissions.DEFAULT.current("Ep", today)  # A4 1장당 배출계수 (kg CO₂eq/장)
+    return {
+        "series": {"prints": (at, prints), "paper_purchase": (at, paper), "digital_docs": (at, digital_docs)},
+        # 최근 1주 합계
+        "total_prints": int(prints[week].sum()),
+        "total_paper_purchase": int(paper[week].sum()),
+        "digital_adoption_rate": digital_adoption_rate,
+        "paper_savings": paper_savings,
+        "cost_savings": cost_savings,  # 천원 단위
+        # 탄소감축량 관련
+        "N": N,
+        "Ep": Ep,
+        "carbon_reduction": emissions.reduction("paperless", N, today)
+    }
+
+
+def build_power_saving(rng, k, days, today):
+    values = draw(rng, POWER_RANGES, _per_metric_scale(k, [True, False, False, False]))
+    # 15분 계량값: 최근 METER_DAYS 일(이상), 최근 챌린지 기간은 절전 대상 시간대 사용량 감소
+    last_day, now_slot = (int(x) for x in meters.slot_of(today.timestamp()))
+    first_day = last_day - max(days, METER_DAYS) + 1
+    kwh = meters.simulate(rng, draw(rng, METER_LOAD_KW, k), first_day, last_day,
+                          challenge_start=last_day - meters.CHALLENGE_DAYS + 1)
+    kwh[:, -1, now_slot:] = np.nan  # 아직 끝나지 않은 구간
+    expected, actual = meters.savings(kwh, np.arange(first_day, last_day + 1),
+                                      last_day - meters.CHALLENGE_DAYS + 1, last_day)
+    power_saved = np.maximum(np.round((expected - actual).sum(axis=-1)), 0).astype(np.int64)
+    buildings = {
+        key: {
+            "name": name,
+            "image": "🏢",
+            "participants": row[0],
+            "power_saved": saved,  # kWh (최근 챌린지 기간 계량 절감량)
+            "lights_off_rate": row[2],
+            "monitors_off_rate": row[3]
+        }
+        for (key, name), row, saved in zip(BUILDINGS.items(), values.tolist(), power_saved.tolist())
+    }
+    total_participants = int(values[:, 0].sum())
+    total_power_saved = int(power_saved.sum())
+    H = int(rng.integers(2, 6))
+    P = emissions.DEFAULT.current("P_light", today)  # 조명 1개의 소비전력 (kW)
+    EF = emissions.DEFAULT.current("EF", today)  # 전력 배출계수 (kgCO₂eq/kWh, 한국전력 기준)
+    # 절감량을 소등 시간 H 의 조명 개수로 환산 (P × H × N = 절감량)
+    N = int(round(total_power_saved / (P * H)))
+    return {
+        "meters": {"buildings": list(BUILDINGS), "first_day": first_day, "kwh": kwh},
+        "buildings": buildings,
+        "total_participants": total_participants,
+        "total_power_saved": total_power_saved,
+        "total_bill_saved": total_power_saved * meters.PRICE_PER_KWH,
+        "participation_rate": int(rng.integers(85, 95)),
+        "average_daily_saving": total_power_saved // meters.CHALLENGE_DAYS,
+        # 탄소감축량 관련
+        "P": P,
+        "H": H,
+        "N": N,
+        "EF": EF,
+        "carbon_reduction": emissions.reduction("power_saving", H * N, today)
+    }
+
+
+def build_plogging(rng, k, days, today):
+    (total_participants, total_waste_collected, plastic_bottles, cans, paper_waste, other_waste,
+     R, C, W, delta_R, delta_C) = draw(
+        rng, [[45, 80], [120, 200], [30, 60], [20, 40], [15, 30], [55, 70],
+              [15, 25], [8, 15], [40, 60], [2, 5], [1, 3]], k
+    ).tolist()
+    original_circular_rate = ((R + C) / (W + C)) * 100
+    improved_circular_rate = (((R + delta_R) + (C + delta_C)) / (W + C + delta_C)) * 100
+
+    # 일별 이력 (최근 days 일): 화·목 플로깅 데이에만 참여·수거
+    at, weekday = _daily(today, days)
+    at = at[(weekday == 1) | (weekday == 3)]
+    participants = draw(rng, np.tile([[8, 15]], (len(at), 1)), k)
+    waste = draw(rng, np.tile([[20, 35]], (len(at), 1)), k)
+    return {
+        "total_participants": total_participants,
+        "total_waste_collected": total_waste_collected,
+        "plastic_bottles": plastic_bottles,
+        "cans": cans,
+        "paper_waste": paper_waste,
+        "other_waste": other_waste,
+        "series": {"participants": (at, participants), "waste_collected": (at, waste)},
+        "participation_rate": int(rng.integers(75, 90)),
+        # 순환율 관련
+        "R": R,
+        "C": C,
+        "W": W,
+        "delta_R": delta_R,
+        "delta_C": delta_C,
+        "original_circular_rate": original_circular_rate,
+        "improved_circular_rate": improved_circular_rate,
+        "circular_rate_improvement": improved_circular_rate - original_circular_rate
+    }
+
+
+def build_carbon_footprint(rng, k, days, today):
+    total_participations, stairs_usage, public_transport, bicycle_usage = draw(
+        rng, [[200, 350], [80, 120], [60, 100], [40, 80]], k
+    ).tolist()
+    P_elevator = emissions.DEFAULT.current("P_elevator", today)  # 엘리베이터 1회 이용 시 소비 전력 (kWh)
+    EF = emissions.DEFAULT.current("EF", today)  # 전력 배출계수 (kgCO₂eq/kWh)
+    E_car = emissions.DEFAULT.current("E_car", today)  # 자가용 1회 평균 배출량 (kgCO₂eq)
+    E_transit = emissions.DEFAULT.current("E_transit", today)  # 대중교통 1회 평균 배출량 (kgCO₂eq)
+    C_stairs = emissions.reduction("commute_stairs", stairs_usage, today)
+    C_transit = emissions.reduction("commute_transit", public_transport, today)
+    C_bike = emissions.reduction("commute_bike", bicycle_usage, today)
+
+    # 일별 이력 (최근 days 일, 최소 CARBON_DAYS 일): 평일 8-15건, 주말 3-8건
+    at, weekday = _daily(today, max(days, CARBON_DAYS))
+    is_weekday = weekday < 5
+    participations = draw(rng, np.where(is_weekday[:, None], [8, 15], [3, 8]), k)
+    carbon_saved = participations * rng.uniform(0.1, np.where(is_weekday, 0.3, 0.2))
+    return {
+        "total_participations": total_participations,
+        "stairs_usage": stairs_usage,
+        "public_transport": public_transport,
+        "bicycle_usage": bicycle_usage,
+        "carbon_savings": {
+            'stairs': C_stairs,
+            'public_transport': C_transit,
+            'bicycle': C_bike
+        },
+        "series": {"participations": (at, participations), "carbon_saved": (at, carbon_saved)},
+        "participation_rate": int(rng.integers(70, 85)),
+        # 탄소감축량 관련
+        "P_elevator": P_elevator,
+        "EF": EF,
+        "E_car": E_car,
+        "E_transit": E_transit,
+        "C_stairs": C_stairs,
+        "C_transit": C_transit,
+        "C_bike": C_bike,
+        "total_carbon_reduction": C_stairs + C_transit + C_bike
+    }
+
+
+def build_flea_market(rng, k, days, today):
+    # 기본 규모에서는 데모 물품 12개, 규모가 커지면 데모 물품을 반복해 가격만 변동
+    n = max(len(FLEA_ITEMS), int(round(len(FLEA_ITEMS) * k)))
+    template = np.arange(n) % len(FLEA_ITEMS)
+    base_price = np.array([item[2] for item in FLEA_ITEMS])[template]
+    jitter = np.where(np.arange(n) < len(FLEA_ITEMS), 1.0, rng.uniform(0.8, 1.2, n))
+    prices = (np.round(base_price * jitter / 1000) * 1000).astype(np.int64)
+    # 물품 번호는 카탈로그가 발급 (esg.catalog)
+    items = []
+    for t, price in zip(template.tolist(), prices.tolist()):
+        name, category, _, seller, description, image, photo = FLEA_ITEMS[t]
+        items.append({
+            "name": name,
+            "category": category,
+            "price": price,
+            "seller": seller,
+            "description": description,
+            "image": image,
+            "image_url": f"https://images.unsplash.com/{photo}?w=300&h=200&fit=crop",
+            "status": catalog.ON_SALE,
+            "donation_amount": 0
+        })
+    sold_items, total_donations, participants = draw(rng, [[3, 8], [50000, 150000], [25, 45]], k).tolist()
+    return {
+        "items": items,
+        "total_items": n,
+        "total_value": int(prices.sum()),
+        "sold_items": sold_items,
+        "total_donations": total_donations,
+        "participants": participants,
+        "recycling_rate": int(rng.integers(85, 95))
+    }
+
+
+def build_digital_diet(rng, k, days, today):
+    values = draw(rng, DIGITAL_DIET_RANGES, _per_metric_scale(k, [True, False, True, False]))
+    departments = {
+        key: {
+            "name": key,
+            "icon": icon,
+            "color": color,
+            "storage_saved": row[0],
+            "emails_reduced": row[1],
+            "files_deleted": row[2],
+            "power_saved": row[3]
+        }
+        for (key, (icon, color)), row in zip(DEPARTMENTS.items(), values.tolist())
+    }
+    totals = values.sum(axis=0).tolist()
+    return {
+        "departments": departments,
+        "total_storage_saved": totals[0],
+        "total_emails_reduced": totals[1],
+        "total_files_deleted": totals[2],
+        "total_power_saved": totals[3],
+        "avg_storage_saved": round(totals[0] / len(departments), 1),
+        "avg_emails_reduced": round(totals[1] / len(departments), 1),
+        "participation_rate": int(rng.integers(80, 95))
+    }
+
+
+def build_esg_education(rng, k, days, today):
+    values = draw(rng, COURSE_RANGES, _per_metric_scale(k, [True, False, False]))
+    courses = {
+        key: {
+            "name": name,
+            "icon": icon,
+            "color": color,
+            "participants": row[0],
+            "completion_rate": row[1],
+            "avg_score": row[2],
+            "duration": duration,
+            "difficulty": difficulty
+        }
+        for (key, name, icon, color, duration, difficulty), row in zip(COURSES, values.tolist())
+    }
+    return {
+        "courses": courses,
+        "total_participants": int(values[:, 0].sum()),
+        "avg_completion_rate": round(float(values[:, 1].mean()), 1),
+        "avg_score": round(float(values[:, 2].mean()), 1),
+        "total_completed": int((values[:, 0] * values[:, 1] // 100).sum()),
+        "participation_rate": int(rng.integers(75, 90)),
+        "awareness_score": int(rng.integers(70, 85))
+    }
+
+
+def build_esg_platform(rng, k, days, today):
+    values = draw(rng, PLATFORM_RANGES, _per_metric_scale(k, [False, False, True, False, False]))
+    departments = {
+        key: {
+            "name": key,
+            "icon": icon,
+            "color": color,
+            "power_saving": row[0],
+            "resource_saving": row[1],
+            "volunteer_participation": row[2],
+            "target_achievement": row[3],
+            "participation_rate": row[4]
+        }
+        for (key, (icon, color)), row in zip(DEPARTMENTS.items(), values.tolist())
+    }
+    return {
+        "departments": departments,
+        "total_power_saving": int(values[:, 0].sum()),
+        "total_resource_saving": int(values[:, 1].sum()),
+        "total_volunteer_participation": int(values[:, 2].sum()),
+        "avg_target_achievement": round(float(values[:, 3].mean()), 1),
+        "avg_participation_rate": round(float(values[:, 4].mean()), 1),
+        "participating_teams": int((values[:, 4] >= 80).sum())
+    }
+
+
+def build_volunteer(rng, k, days, today):
+    values = draw(rng, ACTIVITY_RANGES, k)
+    activities = {
+        key: {
+            "name": name,
+            "icon": icon,
+            "color": color,
+            "participants": row[0],
+            "total_hours": row[1],
+            "social_value": row[2],
+            "frequency": frequency,
+            "location": location
+        }
+        for (key, name, icon, color, frequency, location), row in zip(ACTIVITIES, values.tolist())
+    }
+    total_participants, total_hours, total_social_value = values.sum(axis=0).tolist()
+    return {
+        "activities": activities,
+        "total_participants": total_participants,
+        "total_hours": total_hours,
+        "total_social_value": total_social_value,
+        "avg_hours_per_person": round(total_hours / total_participants, 1) if total_participants > 0 else 0,
+        "participation_rate": int(rng.integers(70, 85))
+    }
+
+
+def build_green_ribbon(rng, k, days, today):
+    values = draw(rng, CAFE_RANGES, k)
+    cafes = {
+        key: {
+            "name": name,
+            "image": "☕",
+            "participants": row[0],
+            "stamps_collected": row[1],
+            "esg_products": row[2],
+            "total_purchases": row[3]
+        }
+        for key, name, row in zip(BUILDINGS, CAFE_NAMES, values.tolist())
+    }
+    total_participants, total_stamps, total_esg_products, total_purchases = values.sum(axis=0).tolist()
+    return {
+        "cafes": cafes,
+        "total_participants": total_participants,
+        "total_stamps": total_stamps,
+        "total_esg_products": total_esg_products,
+        "total_purchases": total_purchases,
+        "esg_purchase_rate": round((total_esg_products / total_purchases) * 100, 1) if total_purchases > 0 else 0,
+        "participation_rate": int(rng.integers(75, 90))
+    }
+
+
+def build_idea(rng, k, days, today):
+    counts = draw(rng, [stage[4] for stage in IDEA_STAGES], k)
+    workflow_stages = {
+        name: {"count": 0, "color": color, "description": description, "icon": icon}
+        for name, color, description, icon, _ in IDEA_STAGES
+    }
+    # 단계별 건수만큼 아이디어 레코드를 만들고, 단계별·카테고리별 집계는 레코드로 계산
+    n = int(counts.sum())
+    stages = np.repeat(np.arange(len(IDEA_STAGES)), counts)
+    template = rng.integers(0, len(IDEA_TEMPLATES), n)
+    options = [rng.integers(0, len(values), n).tolist()
+               for values in (ideas.DEPARTMENTS, ideas.PRIORITIES, ideas.IMPACTS, ideas.PERIODS, IDEA_AUTHORS)]
+    # 좋아요는 뒤 단계일수록 많고, 제안 시각은 최근 days 일 안에서 번호 순
+    likes = rng.poisson(2 + 4 * stages)
+    created_at = np.sort(today.timestamp() - rng.uniform(0, days * 86400, n))
+    records = []
+    for t, stage, department, priority, impact, period, author, like, created in zip(
+            template.tolist(), stages.tolist(), *options, likes.tolist(), created_at.tolist()):
+        title, category, description = IDEA_TEMPLATES[t]
+        records.append({
+            "title": title,
+            "description": description,
+            "category": category,
+            "department": ideas.DEPARTMENTS[department],
+            "priority": ideas.PRIORITIES[priority],
+            "impact": ideas.IMPACTS[impact],
+            "period": ideas.PERIODS[period],
+            "author": IDEA_AUTHORS[author],
+            "stage": IDEA_STAGES[stage][0],
+            "likes": like,
+            "comments": 0,
+            "created_at": created,
+        })
+    return ideas.stage_stats(records, {"ideas": records, "workflow_stages": workflow_stages})
+
+
+BUILDERS = {
+    "stair_climbing": build_stair_climbing,
+    "zero_challenge": build_zero_challenge,
+    "paperless": build_paperless,
+    "power_saving": build_power_saving,
+    "plogging": build_plogging,
+    "carbon_footprint": build_carbon_footprint,
+    "flea_market": build_flea_market,
+    "digital_diet": build_digital_diet,
+    "esg_education": build_esg_education,
+    "esg_platform": build_esg_platform,
+    "volunteer": build_volunteer,
+    "green_ribbon": build_green_ribbon,
+    "idea": build_idea,
+}
+
+
+# 페이지의 데이터 초기화 버튼은 모든 임직원이 공유하는 저장소를 덮어쓰므로 관리자 배포에서만 보임
+ALLOW_RESET = os.environ.get("ESG_ALLOW_RESET") == "1"
+
+
+def _default_seed(seed):
+    if seed is None and os.environ.get("ESG_SEED"):
+        return int(os.environ["ESG_SEED"])
+    return seed
+
+
+def generate(seed=None, employees=BASE_EMPLOYEES, days=BASE_DAYS, today=None):
+    """13개 캠페인의 초기 상태를 ``{캠페인: 상태}`` 로 반환합니다."""
+    rng = np.random.default_rng(_default_seed(seed))
+    k = employees / BASE_EMPLOYEES
+    today = today or datetime.now()
+    return {name: builder(rng, k, days, today) for name, builder in BUILDERS.items()}
+
+
+def generate_campaign(campaign, seed=None, employees=BASE_EMPLOYEES, days=BASE_DAYS, today=None):
+    """캠페인 하나의 초기 상태를 반환합니다 (데이터 초기화 버튼용)."""
+    rng = np.random.default_rng(_default_seed(seed))
+    return BUILDERS[campaign](rng, employees / BASE_EMPLOYEES, days, today or datetime.now())
+
+
+def seed_store(store, states, replace=False):
+    for campaign, state in states.items():
+        if campaign == catalog.CAMPAIGN:
+            # 플리마켓 물품은 집계 행이 아니라 물품 테이블에 기록
+            catalog.ItemCatalog(store).seed(state, replace=replace)
+        elif campaign == ideas.CAMPAIGN:
+            # 아이디어도 레코드는 아이디어 테이블에 기록
+            ideas.IdeaBoard(store).seed(state, replace=replace)
+        elif campaign == registrations.CAMPAIGN:
+            # 제로컵 등록 내역은 등록 테이블에 기록
+            registrations.RegistrationLog(store).seed(state, replace=replace)
+        elif campaign == meters.CAMPAIGN:
+            # 15분 계량값은 계량 테이블에 기록
+            meters.MeterStore(store).seed(state, replace=replace)
+        elif "series" in state:
+            # 요일별·일별 현황은 구간 합계 테이블에 기록
+            rollups.Rollups(store).seed(campaign, state, replace=replace)
+        else:
+            store.seed(campaign, state, replace=replace)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="캠페인 샘플 데이터를 생성해 저장소에 기록합니다.")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--employees", type=int, default=BASE_EMPLOYEES)
+    parser.add_argument("--days", type=int, default=BASE_DAYS)
+    parser.add_argument("--db", help="기록할 SQLite 파일 (생략 시 생성 시간만 측정)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    states = generate(args.seed, args.employees, args.days)
+    generated = time.perf_counter()
+    print(f"생성: {len(states)}개 캠페인, {(generated - start) * 1000:.0f}ms "
+          f"(임직원 {args.employees:,}명, {args.days:,}일)")
+    if args.db:
+        from esg.store import EventStore
+
+        seed_store(EventStore(args.db), states, replace=True)
+        print(f"기록: {args.db}, {(time.perf_counter() - generated) * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""캠페인 데이터 버전별 Plotly 차트 캐시.
+
+차트는 캠페인 집계 상태만으로 그려지므로, 데이터 버전이 같으면 모든 세션이 같은
+차트를 보게 됩니다. ``(캠페인, 차트)`` 마다 마지막 버전의 Figure 하나만 보관하고
+버전이 바뀌면 교체합니다::
+
+    fig_stairs = figures.get("stair_climbing", "stairs", stair_climbing_version)
+    if fig_stairs is None:
+        fig_stairs = px.bar(...)
+        fig_stairs.update_layout(...)
+        figures.put("stair_climbing", "stairs", stair_climbing_version, fig_stairs)
+    st.plotly_chart(fig_stairs, use_container_width=True)
+
+JSON 문자열 대신 검증이 끝난 Figure 를 보관합니다. ``st.plotly_chart`` 는 dict/JSON
+입력을 매번 ``go.Figure`` 로 다시 검증하지만, Figure 는 직렬화만 하기 때문입니다.
+캐시된 Figure 는 여러 세션이 공유하므로 ``put`` 이후에는 수정하지 않습니다.
+"""
+import threading
+
+_lock = threading.Lock()
+_cache = {}
+
+stats = {"hits": 0, "misses": 0}
+
+
+def get(campaign, chart, version):
+    with _lock:
+        entry = _cache.get((campaign, chart))
+        if entry is not None and entry[0] == version:
+            stats["hits"] += 1
+            return entry[1]
+        stats["misses"] += 1
+    return None
+
+
+def put(campaign, chart, version, figure):
+    with _lock:
+        _cache[(campaign, chart)] = (version, figure)
+    return figure
+
+
+def clear(campaign=None):
+    with _lock:
+        for key in [key for key in _cache if campaign is None or key[0] == campaign]:
+            del _cache[key]
@@ -0,0 +1,377 @@
+"""임직원 아이디어 레코드와 Workflow 상태 기계.
+
+아이디어는 같은 SQLite 파일의 ``ideas`` 테이블에 한 건씩 저장되고, 단계는
+제안 → 검토 → 평가 → 승인 → 구현 → 완료 순서로 한 칸씩만 이동합니다.
+
+- 단계 이동은 현재 단계가 화면에서 본 단계와 같을 때만 바꾸는 조건부 갱신입니다.
+  두 검토자가 같은 아이디어를 동시에 넘겨도 한 번만 이동합니다.
+- 단계별·카테고리별 건수, 총 건수, 구현률은 ``idea`` 집계 행에 있고 제안·이동마다
+  같은 트랜잭션에서 증감합니다. 아이디어가 10만 건이어도 Workflow 차트와 통계는
+  집계 행 하나만 읽습니다.
+- 이동 이력은 ``idea_transitions`` 에, 중복 탐지용 제목 서명(``esg.minhash``)은
+  ``idea_signatures`` 에, 댓글은 ``idea_comments`` 에 남습니다.
+- 인기 점수(``hot``)는 제안·좋아요·댓글마다 ``가중치 × exp((시각 - HOT_EPOCH) / HOT_TAU)``
+  를 더한 값의 로그입니다. 지금 시각 기준으로 반감기 ``HOT_HALF_LIFE`` 마다 절반이 되는
+  점수와 순서가 같으므로, 시간이 지나도 다시 계산하지 않고 활동이 있을 때만 더합니다.
+  ``hot`` 인덱스를 앞에서부터 읽으면 인기 아이디어 TOP N 입니다.
+"""
+import math
+import time
+
+from esg import minhash
+
+CAMPAIGN = "idea"
+
+STAGES = ["제안", "검토", "평가", "승인", "구현", "완료"]
+CATEGORIES = ["Scope 1", "Scope 2", "Scope 3", "순환경제", "기타"]
+DEPARTMENTS = ["IT개발팀", "시설관리팀", "구매팀", "환경팀", "마케팅팀", "인사팀"]
+PRIORITIES = ["낮음", "보통", "높음", "긴급"]
+IMPACTS = ["낮음", "보통", "높음", "매우 높음"]
+PERIODS = ["1개월", "3개월", "6개월", "1년", "1년 이상"]
+
+PAGE_SIZE = 10
+
+COLUMNS = ["id", "title", "description", "category", "department", "priority", "impact", "period", "author", "stage",
+           "likes", "comments", "hot"]
+
+HOT_EPOCH = 1704067200  # 2024-01-01
+HOT_HALF_LIFE = 3 * 24 * 3600
+HOT_TAU = HOT_HALF_LIFE / math.log(2)
+HOT_WEIGHTS = {"submit": 1, "like": 1, "comment": 2}
+
+
+def _idea(row):
+    return dict(zip(COLUMNS, row))
+
+
+def next_stage(stage):
+    """다음 단계 (마지막 단계면 None)."""
+    index = STAGES.index(stage)
+    return STAGES[index + 1] if index + 1 < len(STAGES) else None
+
+
+def hot_term(weight, at):
+    """``at`` 시각의 활동(가중치 ``weight``)이 인기 점수에 더하는 항 (로그 값)."""
+    return math.log(weight) + (at - HOT_EPOCH) / HOT_TAU
+
+
+def hot_add(hot, term):
+    """인기 점수에 항을 더합니다: ``log(exp(hot) + exp(term))``."""
+    high, low = max(hot, term), min(hot, term)
+    return high + math.log1p(math.exp(low - high))
+
+
+def hot_score(hot, now=None):
+    """``now`` 시각(기본 지금) 기준으로 감쇠한 인기 점수."""
+    return math.exp(hot - ((now or time.time()) - HOT_EPOCH) / HOT_TAU)
+
+
+def derive(state):
+    # 구현률은 완료 건수 / 총 건수
+    total = state["total_ideas"]
+    state["implementation_rate"] = round(state["implemented_ideas"] / total * 100, 1) if total else 0.0
+
+
+def stage_stats(ideas, state):
+    """아이디어 목록으로 집계 상태의 단계별·카테고리별 건수와 구현률을 채웁니다 (초기값용)."""
+    for stage in state["workflow_stages"].values():
+        stage["count"] = 0
+    state["category_stats"] = {category: {"total": 0, "implemented": 0} for category in CATEGORIES}
+    for idea in ideas:
+        state["workflow_stages"][idea["stage"]]["count"] += 1
+        entry = state["category_stats"].setdefault(idea["category"], {"total": 0, "implemented": 0})
+        entry["total"] += 1
+        entry["implemented"] += idea["stage"] == STAGES[-1]
+    state["total_ideas"] = len(ideas)
+    state["implemented_ideas"] = state["workflow_stages"][STAGES[-1]]["count"]
+    derive(state)
+    return state
+
+
+class IdeaBoard:
+    def __init__(self, store):
+        self.store = store
+        conn = store.connection()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS ideas (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                description TEXT NOT NULL,
+                category TEXT NOT NULL,
+                department TEXT NOT NULL,
+                priority TEXT NOT NULL,
+                impact TEXT NOT NULL,
+                period TEXT NOT NULL,
+                author TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                likes INTEGER NOT NULL DEFAULT 0,
+                comments INTEGER NOT NULL DEFAULT 0,
+                hot REAL NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        # 좋아요·댓글 이전에 만든 테이블: 열을 추가하고 인기 점수는 제안 시각으로 채움
+        if "hot" not in {row[1] for row in conn.execute("PRAGMA table_info(ideas)")}:
+            conn.execute("ALTER TABLE ideas ADD COLUMN likes INTEGER NOT NULL DEFAULT 0")
+            conn.execute("ALTER TABLE ideas ADD COLUMN comments INTEGER NOT NULL DEFAULT 0")
+            conn.execute("ALTER TABLE ideas ADD COLUMN hot REAL NOT NULL DEFAULT 0")
+            conn.execute("UPDATE ideas SET hot = (created_at - ?) / ?", (HOT_EPOCH, HOT_TAU))
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_ideas_stage ON ideas (stage)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_ideas_category_stage ON ideas (category, stage)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_ideas_hot ON ideas (hot)")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS idea_transitions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                idea_id INTEGER NOT NULL,
+                from_stage TEXT NOT NULL,
+                to_stage TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS idea_signatures (
+                idea_id INTEGER PRIMARY KEY,
+                signature BLOB NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS idea_comments (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                idea_id INTEGER NOT NULL,
+                author TEXT NOT NULL,
+                body TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_idea_comments_idea ON idea_comments (idea_id, id)")
+
+    def _insert(self, conn, ideas):
+        columns = COLUMNS[1:-1]
+        now = time.time()
+        rows = []
+        for idea in ideas:
+            created_at = idea.get("created_at", now)
+            # 샘플 아이디어의 좋아요·댓글은 제안 시각에 받은 것으로 계산
+            weight = HOT_WEIGHTS["submit"] + idea["likes"] * HOT_WEIGHTS["like"] + idea["comments"] * HOT_WEIGHTS["comment"]
+            rows.append([idea[column] for column in columns] + [hot_term(weight, created_at), created_at, now])
+        conn.executemany(
+            f"INSERT INTO ideas ({', '.join(columns)}, hot, created_at, updated_at) "
+            f"VALUES ({', '.join('?' * len(columns))}, ?, ?, ?)",
+            rows,
+        )
+
+    def seed(self, state, replace=False):
+        """샘플 상태(``ideas`` 포함)를 아이디어 테이블과 집계 행으로 나눠 기록합니다.
+
+        아이디어 테이블과 집계 행은 한 트랜잭션에서 기록합니다.
+        """
+        state = dict(state)
+        ideas = state.pop("ideas")
+        stage_stats(ideas, state)
+
+        def fill(conn):
+            conn.execute("DELETE FROM ideas")
+            conn.execute("DELETE FROM idea_transitions")
+            conn.execute("DELETE FROM idea_signatures")
+            conn.execute("DELETE FROM idea_comments")
+            self._insert(conn, ideas)
+
+        return self.store.seed(CAMPAIGN, state, replace=replace, tables=fill)
+
+    def count(self):
+        return self.store.connection().execute("SELECT COUNT(*) FROM ideas").fetchone()[0]
+
+    def get(self, idea_id):
+        row = self.store.connection().execute(
+            f"SELECT {', '.join(COLUMNS)} FROM ideas WHERE id = ?", (idea_id,)
+        ).fetchone()
+        return _idea(row) if row else None
+
+    def page(self, stage=None, category=None, before=None, limit=PAGE_SIZE):
+        """최신순으로 ``before`` 보다 작은 번호부터 ``limit`` 건과 다음 페이지 커서(없으면 None)."""
+        where = []
+        params = []
+        if before is not None:
+            where.append("id < ?")
+            params.append(before)
+        if stage is not None:
+            where.append("stage = ?")
+            params.append(stage)
+        if category is not None:
+            where.append("category = ?")
+            params.append(category)
+        rows = self.store.connection().execute(
+            f"SELECT {', '.join(COLUMNS)} FROM ideas {'WHERE ' + ' AND '.join(where) if where else ''} "
+            f"ORDER BY id DESC LIMIT ?",
+            params + [limit + 1],
+        ).fetchall()
+        ideas = [_idea(row) for row in rows[:limit]]
+        return ideas, (ideas[-1]["id"] if len(rows) > limit else None)
+
+    def get_many(self, idea_ids, category=None, stage=None):
+        """번호 순서 그대로 아이디어 목록을 반환합니다 (없거나 조건에 맞지 않는 아이디어는 제외)."""
+        where = [f"id IN ({', '.join('?' * len(idea_ids))})"]
+        params = list(idea_ids)
+        if category is not None:
+            where.append("category = ?")
+            params.append(category)
+        if stage is not None:
+            where.append("stage = ?")
+            params.append(stage)
+        rows = self.store.connection().execute(
+            f"SELECT {', '.join(COLUMNS)} FROM ideas WHERE {' AND '.join(where)}", params
+        ).fetchall()
+        found = {row[0]: _idea(row) for row in rows}
+        return [found[idea_id] for idea_id in idea_ids if idea_id in found]
+
+    def hot(self, limit=5):
+        """인기 점수 순 상위 ``limit`` 건 (``hot`` 인덱스를 큰 쪽부터 ``limit`` 건만 읽음)."""
+        rows = self.store.connection().execute(
+            f"SELECT {', '.join(COLUMNS)} FROM ideas ORDER BY hot DESC LIMIT ?", (limit,)
+        ).fetchall()
+        return [_idea(row) for row in rows]
+
+    def first_id(self):
+        return self.store.connection().execute("SELECT MIN(id) FROM ideas").fetchone()[0]
+
+    def texts(self, after=0, limit=10000):
+        """검색 색인용 ``(번호, 제목, 설명)`` 을 ``after`` 다음 번호부터 반환합니다."""
+        return self.store.connection().execute(
+            "SELECT id, title, description FROM ideas WHERE id > ? ORDER BY id LIMIT ?", (after, limit)
+        ).fetchall()
+
+    def signatures(self, after=0, limit=10000):
+        """중복 탐지 색인용 ``(번호, 제목, 서명 또는 None)`` 을 ``after`` 다음 번호부터 반환합니다."""
+        return self.store.connection().execute(
+            """
+            SELECT ideas.id, ideas.title, idea_signatures.signature
+            FROM ideas LEFT JOIN idea_signatures ON idea_signatures.idea_id = ideas.id
+            WHERE ideas.id > ? ORDER BY ideas.id LIMIT ?
+            """,
+            (after, limit),
+        ).fetchall()
+
+    def save_signatures(self, rows):
+        """``(번호, 서명 바이트)`` 를 저장합니다 (이미 있으면 그대로 둠)."""
+        self.store.connection().executemany(
+            "INSERT OR IGNORE INTO idea_signatures (idea_id, signature) VALUES (?, ?)", rows
+        )
+
+    def submit(self, idea):
+        """아이디어를 제안 단계로 등록하고 발급된 번호를 반환합니다."""
+        idea = dict(idea, stage=STAGES[0], likes=0, comments=0)
+        if idea["category"] not in CATEGORIES:
+            raise ValueError(f"알 수 없는 카테고리입니다: {idea['category']}")
+
+        sig = minhash.signature(idea["title"]).tobytes()
+
+        def register(conn):
+            self._insert(conn, [idea])
+            idea["id"] = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+            conn.execute("INSERT INTO idea_signatures (idea_id, signature) VALUES (?, ?)", (idea["id"], sig))
+            return [
+                ("incr", ["workflow_stages", STAGES[0], "count"], 1),
+                ("incr", ["category_stats", idea["category"], "total"], 1),
+                ("incr", ["total_ideas"], 1),
+            ]
+
+        self.store.append(CAMPAIGN, register, derive=derive)
+        return idea["id"]
+
+    def add_likes(self, likes):
+        """``{번호: (좋아요 수, 인기 점수 항)}`` 을 한 트랜잭션에서 더하고 반영한 아이디어 수를 반환합니다.
+
+        좋아요는 ``esg.likes.LikeBuffer`` 가 모아서 주기적으로 넘깁니다 (없는 아이디어는 건너뜀).
+        """
+        idea_ids = list(likes)
+        conn = self.store.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = conn.execute(
+                f"SELECT id, hot FROM ideas WHERE id IN ({', '.join('?' * len(idea_ids))})", idea_ids
+            ).fetchall()
+            conn.executemany(
+                "UPDATE ideas SET likes = likes + ?, hot = ? WHERE id = ?",
+                [(likes[idea_id][0], hot_add(hot, likes[idea_id][1]), idea_id) for idea_id, hot in rows],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return len(rows)
+
+    def comment(self, idea_id, author, body):
+        """댓글을 등록하고 발급된 댓글 번호를 반환합니다 (아이디어가 없으면 None)."""
+        now = time.time()
+        conn = self.store.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT hot FROM ideas WHERE id = ?", (idea_id,)).fetchone()
+            if row is None:
+                conn.execute("ROLLBACK")
+                return None
+            conn.execute(
+                "UPDATE ideas SET comments = comments + 1, hot = ? WHERE id = ?",
+                (hot_add(row[0], hot_term(HOT_WEIGHTS["comment"], now)), idea_id),
+            )
+            comment_id = conn.execute(
+                "INSERT INTO idea_comments (idea_id, author, body, created_at) VALUES (?, ?, ?, ?)",
+                (idea_id, author, body, now),
+            ).lastrowid
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return comment_id
+
+    def comments(self, idea_id, limit=5):
+        """아이디어의 최근 댓글 ``limit`` 건 (최신순)."""
+        rows = self.store.connection().execute(
+            "SELECT id, author, body, created_at FROM idea_comments WHERE idea_id = ? ORDER BY id DESC LIMIT ?",
+            (idea_id, limit),
+        ).fetchall()
+        return [dict(zip(["id", "author", "body", "created_at"], row)) for row in rows]
+
+    def advance(self, idea_id, stage):
+        """``stage`` 단계인 아이디어를 다음 단계로 옮기고 새 단계를 반환합니다.
+
+        아이디어가 이미 다른 단계로 옮겨졌으면 None, 마지막 단계면 ValueError.
+        """
+        target = next_stage(stage)
+        if target is None:
+            raise ValueError(f"{stage} 단계는 마지막 단계입니다.")
+
+        def move(conn):
+            now = time.time()
+            # 화면에서 본 단계 그대로일 때만 이동: 다른 사람이 먼저 옮겼으면 0행
+            rows = conn.execute(
+                "UPDATE ideas SET stage = ?, updated_at = ? WHERE id = ? AND stage = ? RETURNING category",
+                (target, now, idea_id, stage),
+            ).fetchall()
+            if not rows:
+                return None
+            conn.execute(
+                "INSERT INTO idea_transitions (idea_id, from_stage, to_stage, created_at) VALUES (?, ?, ?, ?)",
+                (idea_id, stage, target, now),
+            )
+            ops = [
+                ("incr", ["workflow_stages", stage, "count"], -1),
+                ("incr", ["workflow_stages", target, "count"], 1),
+            ]
+            if target == STAGES[-1]:
+                ops += [
+                    ("incr", ["implemented_ideas"], 1),
+                    ("incr", ["category_stats", rows[0][0], "implemented"], 1),
+                ]
+            return ops
+
+        return target if self.store.append(CAMPAIGN, move, derive=derive) is not None else None
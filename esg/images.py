@@ -0,0 +1,105 @@
+"""플리마켓 물품 사진 저장소.
+
+업로드한 사진(또는 미리 받아 둔 원격 사진)은 내용 해시로 이름 붙인 고정 크기 썸네일
+(300x200 JPEG)로 한 번만 만들어 앱의 ``static/thumbs/`` 에 저장합니다. 썸네일은
+Streamlit 정적 파일 서빙(``.streamlit/config.toml`` 의 ``server.enableStaticServing``)으로
+``app/static/thumbs/<해시>.jpg`` 주소에서 제공됩니다.
+
+- 같은 사진은 항상 같은 주소이고 파일은 한 번 쓰면 바뀌지 않으므로 브라우저·프록시가
+  오래 캐시해도 됩니다 (ETag 재검증, 앞단 프록시에서는 ``immutable`` 지정 가능).
+- 카드는 로컬 썸네일만 그리고 원격 주소는 가져오지 않으므로 오프라인에서도 동작합니다.
+  썸네일이 없는 물품은 물품 아이콘으로 표시합니다.
+
+데모 물품의 원격 사진은 네트워크가 될 때 한 번 받아 썸네일로 바꿀 수 있습니다.
+
+    python -m esg.images --fetch
+"""
+import argparse
+import hashlib
+import io
+import os
+import threading
+import urllib.request
+
+from PIL import Image, ImageOps
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_IMAGE_DIR = os.path.join(ROOT, "static", "thumbs")
+URL_PREFIX = "app/static/thumbs/"
+
+THUMBNAIL_SIZE = (300, 200)
+MAX_IMAGE_BYTES = 10 * 1024 * 1024
+
+
+def is_local(url):
+    return url.startswith(URL_PREFIX)
+
+
+class ImageStore:
+    def __init__(self, root=DEFAULT_IMAGE_DIR):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, url):
+        return os.path.join(self.root, os.path.basename(url))
+
+    def has(self, url):
+        """로컬 썸네일 주소이고 파일이 있으면 True."""
+        return is_local(url) and os.path.exists(self.path(url))
+
+    def put(self, data):
+        """사진 바이트로 썸네일을 만들고 (이미 있으면 재사용) 썸네일 주소를 반환합니다.
+
+        사진이 아니거나 너무 크면 ValueError.
+        """
+        if len(data) > MAX_IMAGE_BYTES:
+            raise ValueError(f"사진은 {MAX_IMAGE_BYTES // (1024 * 1024)}MB 이하만 등록할 수 있습니다.")
+        url = f"{URL_PREFIX}{hashlib.sha256(data).hexdigest()[:32]}.jpg"
+        path = self.path(url)
+        if os.path.exists(path):
+            return url
+        try:
+            with Image.open(io.BytesIO(data)) as image:
+                image = ImageOps.exif_transpose(image).convert("RGB")
+                thumbnail = ImageOps.fit(image, THUMBNAIL_SIZE, Image.LANCZOS)
+        except (OSError, Image.DecompressionBombError) as exc:
+            raise ValueError("사진 파일을 읽을 수 없습니다.") from exc
+        # 다른 세션이 같은 사진을 동시에 올려도 완성된 파일만 보이도록 임시 파일에서 교체
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        thumbnail.save(tmp, "JPEG", quality=80, optimize=True, progressive=True)
+        os.replace(tmp, path)
+        return url
+
+    def fetch(self, url, timeout=10):
+        """원격 사진을 받아 썸네일 주소를 반환합니다 (미리 받기용, 페이지 렌더링에서는 쓰지 않음)."""
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            data = response.read(MAX_IMAGE_BYTES + 1)
+        return self.put(data)
+
+
+def main():
+    from esg.catalog import ItemCatalog
+    from esg.store import EventStore
+
+    parser = argparse.ArgumentParser(description="플리마켓 물품 사진 썸네일 관리")
+    parser.add_argument("--fetch", action="store_true", help="원격 사진을 받아 로컬 썸네일로 교체")
+    parser.add_argument("--db", help="저장소 경로 (기본: ESG_DB_PATH 또는 data/esg.db)")
+    args = parser.parse_args()
+
+    images = ImageStore()
+    catalog = ItemCatalog(EventStore(args.db) if args.db else EventStore())
+    remote = [url for url in catalog.image_urls() if url and not is_local(url)]
+    print(f"원격 사진 {len(remote)}개, 썸네일 {len(os.listdir(images.root))}개 ({images.root})")
+    if not args.fetch:
+        return
+    for url in remote:
+        try:
+            local = images.fetch(url)
+        except (OSError, ValueError) as exc:
+            print(f"  실패 {url}: {exc}")
+            continue
+        print(f"  {catalog.replace_image_url(url, local):>7,}개 물품 → {local}")
+
+
+if __name__ == "__main__":
+    main()
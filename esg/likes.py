@@ -0,0 +1,78 @@
+"""아이디어 좋아요 쓰기 병합.
+
+좋아요는 클릭마다 아이디어 행(좋아요 수, 인기 점수)을 갱신해야 하지만, 클릭마다
+SQLite 트랜잭션을 열면 쓰기 잠금 경합이 커집니다. ``LikeBuffer`` 는
+``esg.counters.CounterService`` 와 같은 방식으로 좋아요를 메모리에서 아이디어별로
+모으고, 백그라운드 스레드가 주기적으로 한 트랜잭션에 기록합니다
+(``IdeaBoard.add_likes``).
+
+- 인기 점수 항은 클릭 시각으로 계산해 로그 합으로 모으므로, 늦게 기록되어도 점수는
+  클릭할 때 바로 기록한 것과 같습니다.
+- 기록에 실패한 좋아요는 다시 대기열로 돌려 다음 주기에 재시도합니다.
+- ``pending`` 은 아직 기록되지 않은 좋아요 수로, 화면에 바로 더해 보여줍니다.
+"""
+import atexit
+import threading
+import time
+
+from esg.ideas import HOT_WEIGHTS, hot_add, hot_term
+
+
+class LikeBuffer:
+    def __init__(self, board, flush_interval=0.2):
+        self.board = board
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = {}
+        self._stop = threading.Event()
+        self._thread = None
+        if flush_interval:
+            self._thread = threading.Thread(target=self._run, name="esg-like-flusher", daemon=True)
+            self._thread.start()
+        atexit.register(self.close)
+
+    def _merge(self, idea_id, count, term):
+        entry = self._pending.get(idea_id)
+        self._pending[idea_id] = (count, term) if entry is None else (entry[0] + count, hot_add(entry[1], term))
+
+    def like(self, idea_id, at=None):
+        term = hot_term(HOT_WEIGHTS["like"], at or time.time())
+        with self._lock:
+            self._merge(idea_id, 1, term)
+
+    def pending(self):
+        """아직 기록되지 않은 ``{번호: 좋아요 수}``."""
+        with self._lock:
+            return {idea_id: count for idea_id, (count, _) in self._pending.items()}
+
+    def flush(self):
+        """대기 중인 좋아요를 한 트랜잭션에 기록합니다. 기록한 좋아요 수를 반환합니다."""
+        with self._flush_lock:
+            with self._lock:
+                drained, self._pending = self._pending, {}
+            if not drained:
+                return 0
+            try:
+                self.board.add_likes(drained)
+            except Exception:
+                # 유실 방지: 대기열로 되돌림
+                with self._lock:
+                    for idea_id, (count, term) in drained.items():
+                        self._merge(idea_id, count, term)
+                raise
+            return sum(count for count, _ in drained.values())
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                # 다음 주기에 재시도
+                pass
+
+    def close(self):
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+        self.flush()
@@ -0,0 +1,122 @@
+"""아이디어 중복 제안 탐지 (MinHash / LSH).
+
+아이디어 제목의 n-gram 집합을 64개 해시 함수의 최솟값(MinHash 서명)으로 줄이고,
+서명을 2칸씩 32개 밴드로 나눠 밴드별 버킷에 넣습니다. 새 제목과 한 밴드라도 같은
+아이디어만 후보가 되므로 전체 아이디어와 하나씩 비교하지 않습니다. 후보는 서명 일치
+비율(유사도 추정치)로 한 번 거른 뒤, 남은 후보만 제목의 n-gram 집합으로 실제 Jaccard
+유사도를 계산합니다.
+
+- 유사도 0.5 인 쌍은 후보에 들 확률이 약 0.9999, 0.2 인 쌍은 약 0.73 입니다.
+- 서명은 제안할 때 계산해 ``idea_signatures`` 에 저장하고, 서명이 없는 예전 아이디어는
+  색인을 채울 때 계산해 저장합니다.
+"""
+import threading
+import zlib
+
+import numpy as np
+
+from esg.search import grams
+
+NUM_PERM = 64
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+THRESHOLD = 0.5
+# 서명 추정치의 표준편차는 약 0.06: 추정치가 기준보다 이만큼 낮은 후보까지 실제 유사도를 계산
+MARGIN = 0.15
+
+_PRIME = (1 << 31) - 1
+_rng = np.random.default_rng(20240611)
+_A = _rng.integers(1, _PRIME, NUM_PERM, dtype=np.uint64)[:, None]
+_B = _rng.integers(0, _PRIME, NUM_PERM, dtype=np.uint64)[:, None]
+
+
+def signature(text):
+    """텍스트의 MinHash 서명 (``uint32`` 배열, 길이 ``NUM_PERM``)."""
+    shingles = set(grams(text))
+    if not shingles:
+        return np.full(NUM_PERM, _PRIME, dtype=np.uint32)
+    hashes = np.fromiter((zlib.crc32(s.encode()) & _PRIME for s in shingles), dtype=np.uint64, count=len(shingles))
+    return ((_A * hashes + _B) % _PRIME).min(axis=1).astype(np.uint32)
+
+
+def _bands(sig):
+    return [sig[band * ROWS:(band + 1) * ROWS].tobytes() for band in range(BANDS)]
+
+
+class DuplicateIndex:
+    """아이디어 제목 LSH 색인. 확인할 때마다 새로 제안된 아이디어의 서명을 이어서 넣습니다.
+
+    ``board`` 는 ``first_id()``, ``signatures(after)``, ``save_signatures(rows)`` 를 가진
+    아이디어 저장소입니다 (``esg.ideas.IdeaBoard``).
+    """
+
+    def __init__(self, board):
+        self.board = board
+        self._reset()
+        self._lock = threading.Lock()
+
+    def _reset(self):
+        self.buckets = [{} for _ in range(BANDS)]
+        self.rows = {}
+        self.titles = []
+        self.matrix = np.zeros((1024, NUM_PERM), dtype=np.uint32)
+        self.ids = np.zeros(1024, dtype=np.int64)
+        self.last_id = 0
+
+    def _add(self, idea_id, title, sig):
+        row = len(self.rows)
+        if row == len(self.matrix):
+            self.matrix = np.concatenate([self.matrix, np.zeros_like(self.matrix)])
+            self.ids = np.concatenate([self.ids, np.zeros_like(self.ids)])
+        self.matrix[row] = sig
+        self.ids[row] = idea_id
+        self.rows[idea_id] = row
+        self.titles.append(title)
+        for band, key in enumerate(_bands(sig)):
+            self.buckets[band].setdefault(key, []).append(row)
+
+    def refresh(self):
+        with self._lock:
+            first = self.board.first_id()
+            # 아이디어를 다시 채우면 기존 아이디어가 모두 지워지므로 색인도 새로 만듦
+            if self.rows and (first is None or first > self.last_id):
+                self._reset()
+            while True:
+                rows = self.board.signatures(after=self.last_id)
+                if not rows:
+                    break
+                computed = []
+                for idea_id, title, blob in rows:
+                    if blob is None:
+                        sig = signature(title)
+                        computed.append((idea_id, sig.tobytes()))
+                    else:
+                        sig = np.frombuffer(blob, dtype=np.uint32)
+                    self._add(idea_id, title, sig)
+                if computed:
+                    self.board.save_signatures(computed)
+                self.last_id = rows[-1][0]
+
+    def similar(self, title, threshold=THRESHOLD, limit=5):
+        """제목이 비슷한 아이디어 ``[(번호, 유사도), ...]`` 를 유사도 내림차순으로 반환합니다."""
+        self.refresh()
+        shingles = set(grams(title))
+        sig = signature(title)
+        with self._lock:
+            candidates = set()
+            for band, key in enumerate(_bands(sig)):
+                candidates.update(self.buckets[band].get(key, ()))
+            if not candidates:
+                return []
+            rows = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+            rows = rows[(self.matrix[rows] == sig).mean(axis=1) >= threshold - MARGIN]
+            candidates = [(self.ids[row], self.titles[row]) for row in rows.tolist()]
+        found = []
+        for idea_id, other in candidates:
+            other = set(grams(other))
+            score = len(shingles & other) / len(shingles | other) if shingles | other else 0.0
+            if score >= threshold:
+                found.append((int(idea_id), score))
+        # 유사도가 같으면 최근 아이디어가 앞
+        found.sort(key=lambda pair: (-pair[1], -pair[0]))
+        return found[:limit]
@@ -0,0 +1,282 @@
+"""페이퍼리스 데이 인쇄 서버 로그 적재.
+
+인쇄 서버 작업 로그(CSV 또는 JSON lines, 한 달 수백만 행)를 ``chunk_bytes`` (기본 8MB)
+단위의 완전한 줄 묶음으로 읽어, 묶음마다 한 트랜잭션에서 다음을 기록합니다. 파일 크기와
+관계없이 메모리에는 묶음 하나만 올라갑니다.
+
+- ``print_daily``: (날짜, 부서)별 인쇄 작업 수·장수와 페이퍼리스 데이(수요일) 여부
+- ``rollups``: ``paperless`` 캠페인의 ``prints`` (작업 수)·``sheets`` (장수) 구간 합계
+- ``print_ingest``: 파일별로 읽은 바이트 위치와 행 수 (체크포인트)
+- ``paperless`` 집계 행: 최근 1주 인쇄 건수, 줄인 종이 장수 ``N`` 과 감축량 ``N × Ep``
+
+체크포인트는 집계와 같은 트랜잭션에서 갱신되므로, 중간에 끊긴 적재를 다시 실행하면
+마지막으로 기록한 묶음 다음부터 읽고 같은 행을 두 번 세지 않습니다. 뒤에 이어 쓰는
+로그 파일도 같은 방식으로 새로 붙은 줄만 읽습니다. 처음 적재할 때 샘플 데이터의
+``prints`` 구간 합계는 로그 값으로 대체됩니다.
+
+로그 열 (대소문자 무시): ``time`` (ISO 8601 문자열 또는 epoch 초, 시간대가 없으면 로컬
+시각), ``department``, ``pages``, 선택 ``copies`` (기본 1).
+
+``N`` 은 부서마다 (일반 평일 하루 평균 장수 × 페이퍼리스 데이 수 − 페이퍼리스 데이 장수)
+를 0 이상으로 자른 값의 합입니다 (로그 기간의 주말 제외).
+
+    python -m esg.printlogs logs/2026-10.csv logs/2026-11.jsonl
+"""
+import argparse
+import io
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from esg import emissions
+from esg.rollups import Rollups, buckets, date_bucket, epoch_seconds, weekday
+
+CAMPAIGN = "paperless"
+
+METRICS = ["prints", "sheets"]
+
+# 페이퍼리스 데이 요일 (월=0)
+PAPERLESS_WEEKDAY = 2
+
+CHUNK_BYTES = 8 * 1024 * 1024
+
+REQUIRED = {"time", "department", "pages"}
+
+
+def parse(lines, header=None):
+    """줄 묶음 → ``(epoch 초 배열, 부서 배열, 장수 배열)``. ``header`` 가 있으면 CSV, 없으면 JSON lines."""
+    data = b"".join(lines)
+    if header is not None:
+        frame = pd.read_csv(io.BytesIO(data), names=header, header=None, skipinitialspace=True)
+    else:
+        frame = pd.read_json(io.BytesIO(data), lines=True, convert_dates=False)
+        frame.columns = [str(column).strip().lower() for column in frame.columns]
+    missing = REQUIRED - set(frame.columns)
+    if missing:
+        raise ValueError(f"인쇄 로그에 필요한 열이 없습니다: {', '.join(sorted(missing))}")
+    sheets = frame["pages"].to_numpy(dtype=np.int64)
+    if "copies" in frame:
+        sheets = sheets * frame["copies"].fillna(1).to_numpy(dtype=np.int64)
+    department = frame["department"].fillna("미지정").astype(str).to_numpy()
+    return epoch_seconds(frame["time"]), department, sheets
+
+
+class PrintLogs:
+    def __init__(self, store):
+        self.store = store
+        self.rollups = Rollups(store)
+        conn = store.connection()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS print_daily (
+                day INTEGER NOT NULL,
+                department TEXT NOT NULL,
+                paperless INTEGER NOT NULL,
+                jobs INTEGER NOT NULL,
+                sheets INTEGER NOT NULL,
+                PRIMARY KEY (day, department)
+            ) WITHOUT ROWID
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS print_ingest (
+                path TEXT PRIMARY KEY,
+                offset INTEGER NOT NULL,
+                rows INTEGER NOT NULL
+            )
+            """
+        )
+
+    def checkpoint(self, path):
+        """``(읽은 바이트 위치, 읽은 행 수)``. 처음 보는 파일이면 ``(0, 0)``."""
+        row = self.store.connection().execute(
+            "SELECT offset, rows FROM print_ingest WHERE path = ?", (os.path.abspath(path),)
+        ).fetchone()
+        return row or (0, 0)
+
+    def count(self):
+        """지금까지 적재한 로그 행 수."""
+        return self.store.connection().execute("SELECT COALESCE(SUM(rows), 0) FROM print_ingest").fetchone()[0]
+
+    def _record(self, path, offset, at, department, sheets, factors):
+        # 묶음 하나의 집계·구간 합계·체크포인트를 같은 트랜잭션에서 기록하는 EventStore.append 용 함수
+        def record(conn):
+            if conn.execute("SELECT 1 FROM print_ingest LIMIT 1").fetchone() is None:
+                self.rollups.clear(CAMPAIGN, conn, metrics=METRICS)
+            day = buckets("day", at)
+            grouped = pd.DataFrame({"day": day, "department": department, "sheets": sheets}).groupby(
+                ["day", "department"], sort=False
+            )["sheets"].agg(["size", "sum"])
+            days = grouped.index.get_level_values(0).to_numpy()
+            conn.executemany(
+                """
+                INSERT INTO print_daily (day, department, paperless, jobs, sheets) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(day, department) DO UPDATE SET
+                    jobs = jobs + excluded.jobs, sheets = sheets + excluded.sheets
+                """,
+                zip(days.tolist(), grouped.index.get_level_values(1).tolist(),
+                    (weekday(days) == PAPERLESS_WEEKDAY).tolist(),
+                    grouped["size"].tolist(), grouped["sum"].tolist()),
+            )
+            self.rollups.add_many(CAMPAIGN, "prints", at, np.ones(len(at)), conn=conn)
+            self.rollups.add_many(CAMPAIGN, "sheets", at, sheets, conn=conn)
+            conn.execute(
+                """
+                INSERT INTO print_ingest (path, offset, rows) VALUES (?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET offset = excluded.offset, rows = rows + excluded.rows
+                """,
+                (path, offset, len(at)),
+            )
+            saved = self.reduction_sheets(conn)
+            return [
+                ("set", ["total_prints"], self.recent_jobs(conn)),
+                ("set", ["N"], saved),
+                ("set", ["carbon_reduction"], emissions.reduction("paperless", saved, factors=factors)),
+            ]
+
+        return record
+
+    def ingest(self, path, chunk_bytes=CHUNK_BYTES, progress=None):
+        """로그 파일 하나를 체크포인트 다음부터 끝까지 적재하고 처리량을 반환합니다.
+
+        ``progress(읽은 행 수, 읽은 바이트 위치, 파일 크기, 경과 초)`` 는 묶음마다 호출됩니다.
+        확장자가 ``.jsonl``/``.ndjson``/``.json`` 이면 JSON lines, 아니면 헤더가 있는 CSV 로 읽습니다.
+        줄바꿈으로 끝나지 않은 마지막 줄은 아직 쓰는 중인 것으로 보고 다음 적재 때 읽습니다.
+        """
+        path = os.path.abspath(path)
+        size = os.path.getsize(path)
+        offset, resumed = self.checkpoint(path)
+        if offset > size:
+            raise ValueError(f"체크포인트보다 짧아진 로그 파일입니다 (교체된 파일은 새 이름으로 적재): {path}")
+        factors = emissions.load(self.store)
+        rows = 0
+        start = time.perf_counter()
+        with open(path, "rb") as f:
+            header = None
+            if not path.endswith((".jsonl", ".ndjson", ".json")):
+                first = f.readline()
+                header = [column.strip().lower() for column in first.decode("utf-8-sig").strip().split(",")]
+                # 헤더도 아직 다 쓰이지 않았으면 읽을 행이 없는 것으로 봄
+                offset = max(offset, f.tell()) if first.endswith(b"\n") else size
+            f.seek(offset)
+            while True:
+                lines = f.readlines(chunk_bytes)
+                if not lines:
+                    break
+                # 아직 쓰는 중인 로그의 마지막 줄(줄바꿈 없음)은 다음 적재로 미루고 그 앞에서 체크포인트
+                partial = not lines[-1].endswith(b"\n")
+                position = f.tell() - (len(lines.pop()) if partial else 0)
+                if header is None:
+                    lines = [line for line in lines if line.strip()]
+                if lines:
+                    at, department, sheets = parse(lines, header)
+                    self.store.append(CAMPAIGN, self._record(path, position, at, department, sheets, factors))
+                    rows += len(at)
+                    if progress is not None:
+                        progress(rows, position, size, time.perf_counter() - start)
+                if partial:
+                    break
+        elapsed = time.perf_counter() - start
+        return {
+            "path": path,
+            "rows": rows,
+            "resumed_after": resumed,
+            "seconds": elapsed,
+            "rows_per_sec": rows / elapsed if elapsed > 0 else 0.0,
+        }
+
+    def reduction_sheets(self, conn=None):
+        """페이퍼리스 데이에 줄인 종이 장수 ``N`` (부서별 일반 평일 평균 대비, 음수는 0)."""
+        conn = conn or self.store.connection()
+        first, last = conn.execute("SELECT MIN(day), MAX(day) FROM print_daily").fetchone()
+        if first is None:
+            return 0
+        weekdays = weekday(np.arange(first, last + 1))
+        paperless_days = int(np.count_nonzero(weekdays == PAPERLESS_WEEKDAY))
+        regular_days = int(np.count_nonzero(weekdays < 5)) - paperless_days
+        if not paperless_days or not regular_days:
+            return 0
+        rows = conn.execute(
+            """
+            SELECT department, paperless, SUM(sheets) FROM print_daily
+            WHERE (day + 3) % 7 < 5 GROUP BY department, paperless
+            """
+        ).fetchall()
+        totals = pd.DataFrame(rows, columns=["department", "paperless", "sheets"]).pivot_table(
+            index="department", columns="paperless", values="sheets", fill_value=0
+        ).reindex(columns=[0, 1], fill_value=0)
+        saved = totals[0].to_numpy() / regular_days * paperless_days - totals[1].to_numpy()
+        return int(round(np.clip(saved, 0, None).sum()))
+
+    def recent_jobs(self, conn=None, days=7):
+        """로그의 마지막 날까지 최근 ``days`` 일의 인쇄 작업 수."""
+        conn = conn or self.store.connection()
+        return conn.execute(
+            "SELECT COALESCE(SUM(jobs), 0) FROM print_daily WHERE day > (SELECT MAX(day) FROM print_daily) - ?",
+            (days,),
+        ).fetchone()[0]
+
+    def daily(self, start, end):
+        """``start``..``end`` (``date``, 포함) 의 (날짜, 부서)별 ``DataFrame``
+        (``date``, ``department``, ``is_paperless``, ``jobs``, ``sheets``)."""
+        rows = self.store.connection().execute(
+            """
+            SELECT day, department, paperless, jobs, sheets FROM print_daily
+            WHERE day BETWEEN ? AND ? ORDER BY day, department
+            """,
+            (date_bucket("day", start), date_bucket("day", end)),
+        ).fetchall()
+        frame = pd.DataFrame(rows, columns=["day", "department", "is_paperless", "jobs", "sheets"])
+        frame.insert(0, "date", frame.pop("day").to_numpy().astype("datetime64[D]"))
+        frame["is_paperless"] = frame["is_paperless"].astype(bool)
+        return frame
+
+    def clear(self):
+        """적재한 로그 집계·체크포인트와 ``paperless`` 의 인쇄 구간 합계를 지웁니다."""
+        conn = self.store.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM print_daily")
+            conn.execute("DELETE FROM print_ingest")
+            self.rollups.clear(CAMPAIGN, conn, metrics=METRICS)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+
+def main():
+    parser = argparse.ArgumentParser(description="인쇄 서버 로그를 페이퍼리스 데이 집계로 적재합니다.")
+    parser.add_argument("paths", nargs="+", help="CSV 또는 JSON lines 로그 파일")
+    parser.add_argument("--db", help="기록할 SQLite 파일 (생략 시 ESG_DB_PATH 또는 data/esg.db)")
+    parser.add_argument("--chunk-mb", type=float, default=CHUNK_BYTES / 1024 / 1024, help="묶음 크기 (MB)")
+    args = parser.parse_args()
+
+    from esg import datagen
+    from esg.store import EventStore
+
+    store = EventStore(args.db) if args.db else EventStore()
+    if not store.exists(CAMPAIGN):
+        datagen.seed_store(store, {CAMPAIGN: datagen.generate_campaign(CAMPAIGN)})
+    logs = PrintLogs(store)
+
+    def progress(rows, offset, size, elapsed):
+        print(f"\r  {offset / max(size, 1):6.1%}  {rows:>12,} rows  {rows / max(elapsed, 1e-9):>10,.0f} rows/s", end="")
+
+    try:
+        for path in args.paths:
+            print(path)
+            result = logs.ingest(path, int(args.chunk_mb * 1024 * 1024), progress)
+            print(f"\r  {result['rows']:,} rows in {result['seconds']:.1f}s ({result['rows_per_sec']:,.0f} rows/s)"
+                  + (f", resumed after {result['resumed_after']:,} rows" if result["resumed_after"] else ""))
+    except KeyboardInterrupt:
+        print("\n중단됨: 다시 실행하면 마지막으로 기록한 묶음 다음부터 이어서 적재합니다.")
+        raise SystemExit(130)
+    print(f"N = {logs.reduction_sheets():,}장, 최근 1주 인쇄 {logs.recent_jobs():,}건")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""페이지 재실행(rerun) 구간별 계측과 느린 재실행 로그.
+
+``app.py`` 가 페이지 실행을 ``rerun(page)`` 로 감싸고, 페이지 스크립트는 화면 구간
+(카드 그리드, 각 차트, 산식 블록 등)이 시작되는 곳에서 ``section(name)`` 을 호출합니다.
+``section`` 은 직전 구간을 닫고 새 구간을 여는 방식이라 들여쓰기를 바꿀 필요가 없습니다.
+``@st.fragment`` 대신 ``@timed_fragment`` 로 만든 조각은 조각만 다시 실행될 때(카드 버튼 클릭)도
+``"페이지 · 함수 이름"`` 으로 따로 계측합니다.
+
+구간마다 경과 시간(ms)과 할당 블록 증감(``sys.getallocatedblocks``)을 기록하며,
+전체 시간이 ``ESG_SLOW_RERUN_MS`` (기본 1000ms)를 넘는 재실행은 구간별 내역과 함께
+``ESG_PROFILE_LOG`` (기본 ``data/reruns.jsonl``)에 JSON 한 줄로 남깁니다.
+임계값을 0으로 두면 모든 재실행을 기록합니다.
+
+로그 요약::
+
+    python -m esg.profiling                 # 페이지·구간별 p50/p95
+    python -m esg.profiling --top 5         # 가장 느린 재실행 5건
+"""
+import argparse
+import collections
+import contextlib
+import functools
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+
+from esg.store import DEFAULT_DB_PATH
+
+DEFAULT_LOG_PATH = os.environ.get(
+    "ESG_PROFILE_LOG", os.path.join(os.path.dirname(DEFAULT_DB_PATH), "reruns.jsonl")
+)
+SLOW_RERUN_MS = float(os.environ.get("ESG_SLOW_RERUN_MS", "1000"))
+
+FIRST_SECTION = "(시작)"
+
+_local = threading.local()
+_log_lock = threading.Lock()
+
+# 최근 재실행 기록 (프로세스 내, 임계값과 무관)
+recent = collections.deque(maxlen=200)
+
+
+class _Rerun:
+    def __init__(self, page):
+        self.page = page
+        self.started = time.perf_counter()
+        self.sections = []
+        self._open(FIRST_SECTION)
+
+    def _open(self, name):
+        self._name = name
+        self._start = time.perf_counter()
+        self._blocks = sys.getallocatedblocks()
+
+    def _close(self):
+        self.sections.append({
+            "name": self._name,
+            "ms": round((time.perf_counter() - self._start) * 1000, 2),
+            "blocks": sys.getallocatedblocks() - self._blocks,
+        })
+
+    def section(self, name):
+        self._close()
+        self._open(name)
+
+    def finish(self, status):
+        self._close()
+        return {
+            "ts": time.time(),
+            "page": self.page,
+            "status": status,
+            "total_ms": round((time.perf_counter() - self.started) * 1000, 2),
+            "sections": self.sections,
+        }
+
+
+def section(name):
+    """새 화면 구간을 시작합니다. 계측 중이 아니면 아무 일도 하지 않습니다."""
+    current = getattr(_local, "rerun", None)
+    if current is not None:
+        current.section(name)
+
+
+@contextlib.contextmanager
+def rerun(page, log_path=None, threshold_ms=None):
+    """페이지 스크립트 한 번의 실행을 계측합니다.
+
+    ``st.rerun()`` / ``st.switch_page()`` 는 예외로 실행을 중단하므로 상태를 ``rerun`` 으로
+    기록하고 예외는 그대로 전달합니다.
+    """
+    previous = getattr(_local, "rerun", None)
+    current = _local.rerun = _Rerun(page)
+    status = "ok"
+    try:
+        yield current
+    except BaseException as e:
+        status = "rerun" if type(e).__name__ in ("RerunException", "StopException") else "error"
+        raise
+    finally:
+        _local.rerun = previous
+        record = current.finish(status)
+        recent.append(record)
+        threshold_ms = SLOW_RERUN_MS if threshold_ms is None else threshold_ms
+        if record["total_ms"] >= threshold_ms:
+            _write(log_path or DEFAULT_LOG_PATH, record)
+
+
+def timed_fragment(func):
+    """``st.fragment`` 과 같되, 조각만 다시 실행될 때도 ``rerun`` 으로 계측합니다.
+
+    전체 재실행 중에는 페이지 계측에 그대로 포함되고, 조각 재실행은 정의할 때의 페이지 이름과
+    함수 이름으로 따로 기록합니다 (느리면 로그에도 남음).
+    """
+    import streamlit as st
+
+    current = getattr(_local, "rerun", None)
+    page = f"{current.page if current is not None else func.__module__} · {func.__name__}"
+
+    @functools.wraps(func)
+    def run(*args, **kwargs):
+        if getattr(_local, "rerun", None) is not None:
+            return func(*args, **kwargs)
+        with rerun(page):
+            return func(*args, **kwargs)
+
+    return st.fragment(run)
+
+
+def _write(path, record):
+    line = json.dumps(record, ensure_ascii=False)
+    with _log_lock:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError:
+            # 계측 로그 실패로 페이지가 깨지지 않도록 무시
+            pass
+
+
+def load(path=DEFAULT_LOG_PATH):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def summarize(records):
+    """``{(페이지, 구간): [ms, ...]}`` 를 p50/p95 요약 행으로 바꿉니다."""
+    samples = collections.defaultdict(list)
+    for record in records:
+        samples[(record["page"], "(전체)")].append(record["total_ms"])
+        for item in record["sections"]:
+            samples[(record["page"], item["name"])].append(item["ms"])
+    rows = []
+    for (page, name), values in samples.items():
+        ordered = sorted(values)
+        rows.append({
+            "page": page,
+            "section": name,
+            "n": len(values),
+            "p50_ms": statistics.median(ordered),
+            "p95_ms": ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))],
+        })
+    return sorted(rows, key=lambda row: (row["page"], -row["p50_ms"]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="느린 재실행 로그를 요약합니다.")
+    parser.add_argument("log", nargs="?", default=DEFAULT_LOG_PATH)
+    parser.add_argument("--top", type=int, help="가장 느린 재실행 N건의 구간별 내역 출력")
+    args = parser.parse_args()
+
+    records = load(args.log)
+    if args.top:
+        for record in sorted(records, key=lambda r: -r["total_ms"])[:args.top]:
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(record["ts"]))
+            print(f"{stamp} {record['page']} {record['total_ms']:.0f}ms ({record['status']})")
+            for item in sorted(record["sections"], key=lambda s: -s["ms"]):
+                print(f"    {item['name']:<24} {item['ms']:>8.1f}ms {item['blocks']:>+9,} blocks")
+        return
+    print(f"{len(records)}건 ({args.log})")
+    for row in summarize(records):
+        print(f"{row['page']:<24} {row['section']:<24} n={row['n']:<5} p50 {row['p50_ms']:>8.1f}ms  p95 {row['p95_ms']:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,395 @@
+"""ESG 퀴즈데이 문제 은행·채점·결과 기록·리더보드.
+
+문제는 JSON Lines 파일(``quiz_questions.jsonl``, 경로는 ``ESG_QUIZ_BANK``)에서 프로세스당
+한 번 읽는 ``QuestionBank`` 에 있고, 참여자마다 회차·참여자로 정한 시드로 출제 계획
+(분야·난이도별 문제 수)에 맞춰 뽑습니다. 같은 참여자는 다시 실행해도 같은 문제를 같은
+순서로 받습니다.
+
+퀴즈데이에는 전 임직원이 같은 시간대에 답안을 제출하므로, 제출마다 트랜잭션을 열지
+않고 ``esg.counters.CounterService`` 와 같은 방식으로 결과를 메모리에 모아 주기적으로
+한 트랜잭션에 기록합니다.
+
+- 정답은 ``AnswerKey`` 가 문제 번호로 바로 찾는 배열로 미리 만들어 두고, 채점은 제출한
+  문제 번호의 정답 배열과 답안 배열을 한 번에 비교합니다.
+- 결과는 ``quiz_results`` 에 회차·참여자당 1건 저장됩니다. 처음 제출한 답안만 인정하며
+  같은 참여자의 재제출은 처음 점수를 돌려줍니다 (다른 프로세스가 먼저 기록한 경우도 같음).
+  페이지는 세션이 아니라 표시 이름(``participant_id``)으로 참여자를 정하므로 새로고침해도 같습니다.
+- 점수별 인원은 ``quiz_score_counts`` 에 회차·점수당 한 행으로 기록과 같은 트랜잭션에서
+  증가하므로, 참여자 수·평균 점수·점수 분포는 문제 수 + 1 행만 읽습니다.
+- 리더보드는 상위 ``k`` 명만 담은 최소 힙(``Leaderboard``)입니다. 제출할 때 바로 반영하고,
+  기록할 때마다 결과 인덱스에서 상위 ``k`` 명을 다시 읽어 다른 프로세스의 제출도 합칩니다.
+  순위는 점수가 높은 순, 같으면 풀이 시간이 짧은 순입니다.
+"""
+import atexit
+import hashlib
+import heapq
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+
+DEFAULT_BANK_PATH = os.environ.get(
+    "ESG_QUIZ_BANK", os.path.join(os.path.dirname(os.path.abspath(__file__)), "quiz_questions.jsonl")
+)
+
+TOPICS = ["환경", "사회", "지배구조"]
+DIFFICULTIES = ["쉬움", "보통", "어려움"]
+
+# 출제 계획: (분야, 난이도, 문제 수). None 은 모든 분야·난이도
+DEFAULT_PLAN = [
+    ("환경", "쉬움", 1),
+    ("사회", "쉬움", 1),
+    ("지배구조", "보통", 1),
+    ("환경", "보통", 1),
+    (None, "어려움", 1),
+]
+
+LEADERBOARD_SIZE = 10
+
+# 최대 SQLite 바인딩 변수 수보다 작게 나눠 조회
+_CHUNK = 500
+
+
+def plan_size(plan=DEFAULT_PLAN):
+    """출제 계획의 문제 수."""
+    return sum(k for _, _, k in plan)
+
+
+def participant_id(name):
+    """표시 이름으로 정한 참여자 키. 공백·대소문자만 다른 이름은 같은 참여자입니다."""
+    return " ".join(name.split()).casefold()
+
+
+def current_round(today=None):
+    """분기별 퀴즈 대회 회차 (예: ``2026Q4``)."""
+    today = today or datetime.now()
+    return f"{today.year}Q{(today.month - 1) // 3 + 1}"
+
+
+class AnswerKey:
+    """문제 번호 → 정답 보기 번호 배열 (없는 번호는 -1)."""
+
+    def __init__(self, questions):
+        ids = np.array([question["id"] for question in questions], dtype=np.int64)
+        self.correct = np.full(int(ids.max()) + 1 if len(ids) else 0, -1, dtype=np.int16)
+        self.correct[ids] = [question["correct"] for question in questions]
+
+    def score(self, question_ids, answers):
+        """답안 하나의 맞힌 문제 수."""
+        return int((self.correct[np.asarray(question_ids)] == np.asarray(answers)).sum())
+
+    def score_many(self, question_ids, answers):
+        """``(제출 수, 문제 수)`` 배열의 제출별 맞힌 문제 수."""
+        return (self.correct[np.asarray(question_ids)] == np.asarray(answers)).sum(axis=1)
+
+
+def _cells_overlap(a, b):
+    return all(x is None or y is None or x == y for x, y in zip(a, b))
+
+
+def _sample(rng, n, k):
+    """``range(n)`` 에서 ``k`` 개를 중복 없이 뽑습니다 (Floyd 알고리즘, ``n`` 과 무관하게 O(k))."""
+    if k > n:
+        raise ValueError(f"문제가 부족합니다: {n}문제 중 {k}문제")
+    chosen = []
+    seen = set()
+    for j in range(n - k, n):
+        t = int(rng.integers(0, j + 1))
+        if t in seen:
+            t = j
+        seen.add(t)
+        chosen.append(t)
+    return chosen
+
+
+class QuestionBank:
+    """파일에서 한 번 읽어 프로세스 안의 모든 세션이 공유하는 문제 은행.
+
+    문제는 분야·난이도 칸별 번호 배열로 나눠 두므로, 출제는 문제 수와 관계없이
+    출제할 문제 수만큼만 뽑습니다. 반환하는 문제 딕셔너리는 공유 객체라 읽기 전용입니다.
+    """
+
+    def __init__(self, questions):
+        self.questions = {question["id"]: question for question in questions}
+        self.key = AnswerKey(questions)
+        cells = {}
+        for question in questions:
+            topic, difficulty = question["topic"], question["difficulty"]
+            for cell in ((topic, difficulty), (topic, None), (None, difficulty), (None, None)):
+                cells.setdefault(cell, []).append(question["id"])
+        self._cells = {cell: np.array(ids, dtype=np.int64) for cell, ids in cells.items()}
+
+    @classmethod
+    def load(cls, path=DEFAULT_BANK_PATH):
+        """JSON Lines 파일(한 줄에 문제 하나)에서 읽습니다."""
+        with open(path, encoding="utf-8") as f:
+            return cls([json.loads(line) for line in f if line.strip()])
+
+    def __len__(self):
+        return len(self.questions)
+
+    def count(self, topic=None, difficulty=None):
+        cell = self._cells.get((topic, difficulty))
+        return 0 if cell is None else len(cell)
+
+    def draw(self, participant, round_id, plan=DEFAULT_PLAN):
+        """참여자·회차별로 항상 같은 문제 목록을 뽑습니다.
+
+        계획의 칸마다 문제를 중복 없이 뽑아 문제 순서와 보기 순서를 섞습니다. 반환하는
+        문제마다 ``order`` 는 화면의 보기 위치별 원래 보기 번호이며, 답안은 원래 번호로
+        제출합니다. 계획의 칸이 서로 겹치면 ValueError.
+        """
+        cells = [(topic, difficulty) for topic, difficulty, _ in plan]
+        for i, cell in enumerate(cells):
+            if any(_cells_overlap(cell, other) for other in cells[i + 1:]):
+                raise ValueError(f"출제 계획의 칸이 겹칩니다: {cell}")
+        seed = int.from_bytes(hashlib.blake2b(f"{round_id}:{participant}".encode(), digest_size=8).digest(), "little")
+        rng = np.random.default_rng(seed)
+        ids = []
+        for (topic, difficulty), (_, _, k) in zip(cells, plan):
+            cell = self._cells.get((topic, difficulty), np.empty(0, dtype=np.int64))
+            ids.extend(int(cell[i]) for i in _sample(rng, len(cell), k))
+        drawn = []
+        for question_id in (ids[i] for i in rng.permutation(len(ids))):
+            question = self.questions[question_id]
+            order = rng.permutation(len(question["options"])).tolist()
+            drawn.append({
+                "id": question_id,
+                "topic": question["topic"],
+                "difficulty": question["difficulty"],
+                "question": question["question"],
+                "options": [question["options"][i] for i in order],
+                "order": order,
+            })
+        return drawn
+
+
+class Leaderboard:
+    """상위 ``k`` 명을 담는 최소 힙. 힙 맨 앞이 현재 ``k`` 위입니다."""
+
+    def __init__(self, k=LEADERBOARD_SIZE):
+        self.k = k
+        self._heap = []
+        self._members = set()
+
+    def offer(self, participant, name, score, elapsed):
+        """결과를 넣어 보고 상위 ``k`` 명에 들었는지 반환합니다 (참여자당 1건)."""
+        if participant in self._members:
+            return True
+        entry = (score, -elapsed, participant, name)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry > self._heap[0]:
+            self._members.discard(heapq.heapreplace(self._heap, entry)[2])
+        else:
+            return False
+        self._members.add(participant)
+        return True
+
+    def top(self):
+        """``[{"participant", "name", "score", "elapsed"}, ...]`` (1위부터)."""
+        return [
+            {"participant": participant, "name": name, "score": score, "elapsed": -neg_elapsed}
+            for score, neg_elapsed, participant, name in sorted(self._heap, reverse=True)
+        ]
+
+
+class QuizEngine:
+    def __init__(self, store, key, size, round_id=None, k=LEADERBOARD_SIZE, flush_interval=0.2):
+        self.store = store
+        self.round_id = round_id or current_round()
+        self.key = key
+        # 한 번에 출제하는 문제 수 (점수 분포 길이 - 1)
+        self.size = size
+        self.k = k
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = {}
+        # 이 프로세스에서 제출한 참여자의 점수 (재제출은 처음 점수)
+        self._scores = {}
+        conn = store.connection()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS quiz_results (
+                round TEXT NOT NULL,
+                participant TEXT NOT NULL,
+                name TEXT NOT NULL,
+                score INTEGER NOT NULL,
+                answers TEXT NOT NULL,
+                elapsed REAL NOT NULL,
+                submitted_at REAL NOT NULL,
+                PRIMARY KEY (round, participant)
+            )
+            """
+        )
+        # 리더보드: 회차 안에서 점수 높은 순 → 풀이 시간 짧은 순으로 앞에서 k건만 읽음
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_quiz_results_rank ON quiz_results (round, score DESC, elapsed)")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS quiz_score_counts (
+                round TEXT NOT NULL,
+                score INTEGER NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (round, score)
+            )
+            """
+        )
+        self._board = self._load_board()
+        self._stop = threading.Event()
+        self._thread = None
+        if flush_interval:
+            self._thread = threading.Thread(target=self._run, name="esg-quiz-flusher", daemon=True)
+            self._thread.start()
+        atexit.register(self.close)
+
+    def _load_board(self):
+        board = Leaderboard(self.k)
+        rows = self.store.connection().execute(
+            """
+            SELECT participant, name, score, elapsed FROM quiz_results
+            WHERE round = ? ORDER BY score DESC, elapsed LIMIT ?
+            """,
+            (self.round_id, self.k),
+        ).fetchall()
+        for row in rows:
+            board.offer(*row)
+        return board
+
+    def submit(self, participant, name, question_ids, answers, elapsed):
+        """답안(원래 보기 번호)을 채점해 점수를 반환합니다. 기록은 다음 주기에 모아서 합니다.
+
+        답안은 ``"문제 번호:보기 번호"`` 를 쉼표로 이어 저장합니다.
+        """
+        if len(question_ids) != len(answers):
+            raise ValueError("문제 수와 답안 수가 다릅니다.")
+        score = self.key.score(question_ids, answers)
+        with self._lock:
+            if participant in self._scores:
+                return self._scores[participant]
+            self._scores[participant] = score
+            answer_text = ",".join(f"{question_id}:{answer}" for question_id, answer in zip(question_ids, answers))
+            self._pending[participant] = (name, score, answer_text, float(elapsed), time.time())
+            self._board.offer(participant, name, score, float(elapsed))
+        if self._stop.is_set():
+            # 닫힌 엔진(지난 회차)에 늦게 들어온 제출은 기록 스레드가 없으므로 바로 기록
+            self.flush()
+        return score
+
+    def result(self, participant):
+        """참여자의 점수 (제출하지 않았으면 None)."""
+        with self._lock:
+            if participant in self._scores:
+                return self._scores[participant]
+        row = self.store.connection().execute(
+            "SELECT score FROM quiz_results WHERE round = ? AND participant = ?", (self.round_id, participant)
+        ).fetchone()
+        return row[0] if row else None
+
+    def leaderboard(self):
+        with self._lock:
+            return self._board.top()
+
+    def distribution(self):
+        """점수별 인원 배열 (기록되지 않은 제출 포함, 길이는 출제 문제 수 + 1)."""
+        rows = self.store.connection().execute(
+            "SELECT score, count FROM quiz_score_counts WHERE round = ?", (self.round_id,)
+        ).fetchall()
+        with self._lock:
+            pending = [entry[1] for entry in self._pending.values()]
+        counts = np.bincount(np.asarray(pending, dtype=np.int64), minlength=self.size + 1)
+        for score, count in rows:
+            counts[score] += count
+        return counts
+
+    def stats(self):
+        """``{"participants", "avg_score", "perfect"}`` (점수 분포에서 계산)."""
+        counts = self.distribution()
+        participants = int(counts.sum())
+        total = int((counts * np.arange(len(counts))).sum())
+        return {
+            "participants": participants,
+            "avg_score": round(total / participants, 2) if participants else 0.0,
+            "perfect": int(counts[-1]),
+        }
+
+    def _write(self, results):
+        """``{참여자: (이름, 점수, 답안, 풀이 시간, 제출 시각)}`` 중 처음 제출한 결과만 기록합니다."""
+        conn = self.store.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            participants = list(results)
+            existing = {}
+            for i in range(0, len(participants), _CHUNK):
+                chunk = participants[i:i + _CHUNK]
+                existing.update(conn.execute(
+                    f"SELECT participant, score FROM quiz_results WHERE round = ? "
+                    f"AND participant IN ({', '.join('?' * len(chunk))})",
+                    [self.round_id] + chunk,
+                ).fetchall())
+            rows = [(self.round_id, participant) + results[participant] for participant in participants
+                    if participant not in existing]
+            conn.executemany(
+                """
+                INSERT INTO quiz_results (round, participant, name, score, answers, elapsed, submitted_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            counts = np.bincount(np.array([row[3] for row in rows], dtype=np.int64))
+            conn.executemany(
+                """
+                INSERT INTO quiz_score_counts (round, score, count) VALUES (?, ?, ?)
+                ON CONFLICT(round, score) DO UPDATE SET count = count + excluded.count
+                """,
+                [(self.round_id, score, int(count)) for score, count in enumerate(counts) if count],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return existing
+
+    def flush(self):
+        """대기 중인 결과를 한 트랜잭션에 기록하고 리더보드를 저장된 결과와 맞춥니다.
+
+        기록한 결과 수를 반환합니다.
+        """
+        with self._flush_lock:
+            with self._lock:
+                drained, self._pending = self._pending, {}
+            if not drained:
+                return 0
+            try:
+                existing = self._write(drained)
+            except Exception:
+                # 유실 방지: 대기열로 되돌림 (그 사이 새 제출은 덮어쓰지 않음)
+                with self._lock:
+                    self._pending = {**drained, **self._pending}
+                raise
+            board = self._load_board()
+            with self._lock:
+                # 다른 프로세스가 먼저 기록한 참여자는 저장된 점수를 따름
+                self._scores.update(existing)
+                for participant, (name, score, _, elapsed, _) in self._pending.items():
+                    board.offer(participant, name, score, elapsed)
+                self._board = board
+            return len(drained) - len(existing)
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                # 다음 주기에 재시도
+                pass
+
+    def close(self):
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+        self.flush()
+        atexit.unregister(self.close)
@@ -0,0 +1,200 @@
+"""일회용품 ZERO 챌린지 등록 기록.
+
+등록(개인 컵·텀블러·도시락 사용)은 집계 행의 문자열 딕셔너리 리스트가 아니라 같은
+SQLite 파일의 ``zero_registrations`` 테이블에 ``(유형 코드, 등록 시각(epoch 초))`` 로
+한 건씩 저장합니다. 등록은 ``zero_challenge`` 집계 증가와 같은 트랜잭션에서 기록됩니다.
+
+``RegistrationLog`` 는 프로세스마다 유형별 int64 시각 배열을 들고 있다가, 읽을 때마다
+마지막으로 읽은 번호 이후의 등록만 이어서 붙입니다 (다른 프로세스의 등록도 같은 방식으로
+반영). 시간대별·요일별 현황은 이 배열에서 ``np.bincount`` 한 번으로 계산하므로, 제로컵
+위크 전체 10만 건도 문자열을 다시 파싱하지 않고 수 밀리초 안에 집계합니다.
+"""
+import json
+import threading
+import time
+from datetime import date, datetime
+
+import numpy as np
+
+from esg.rollups import UTC_OFFSET
+
+CAMPAIGN = "zero_challenge"
+
+TYPES = ["개인 컵", "텀블러", "도시락"]
+
+WEEKDAYS = ["월", "화", "수", "목", "금", "토", "일"]
+
+_BATCH = 100000
+
+
+def local_day(at):
+    """epoch 초 배열 → 로컬 날짜 번호 배열 (1970-01-01 = 0)."""
+    return (np.asarray(at, dtype=np.int64) + UTC_OFFSET) // 86400
+
+
+def day_number(day):
+    """``date`` → 로컬 날짜 번호."""
+    return (day - date(1970, 1, 1)).days
+
+
+def parse_legacy(registration):
+    """예전 ``{"type", "timestamp": "HH:MM", "date": "YYYY-MM-DD"}`` 등록 → ``(유형 코드, epoch 초)``."""
+    at = datetime.strptime(f"{registration['date']} {registration['timestamp']}", "%Y-%m-%d %H:%M")
+    return TYPES.index(registration["type"]), int(at.timestamp())
+
+
+class RegistrationLog:
+    def __init__(self, store):
+        self.store = store
+        self._lock = threading.Lock()
+        self.generation = -1
+        self._reset()
+        store.connection().execute(
+            """
+            CREATE TABLE IF NOT EXISTS zero_registrations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind INTEGER NOT NULL,
+                at INTEGER NOT NULL
+            )
+            """
+        )
+
+    def _reset(self):
+        self._times = [np.zeros(1024, dtype=np.int64) for _ in TYPES]
+        self._lengths = [0] * len(TYPES)
+        self.last_id = 0
+        self.generation += 1
+
+    def _append(self, kind, at):
+        length = self._lengths[kind]
+        buffer = self._times[kind]
+        if length + len(at) > len(buffer):
+            grown = np.zeros(max(length + len(at), len(buffer) * 2), dtype=np.int64)
+            grown[:length] = buffer[:length]
+            self._times[kind] = buffer = grown
+        buffer[length:length + len(at)] = at
+        self._lengths[kind] = length + len(at)
+
+    def _insert(self, conn, kinds, times):
+        conn.executemany(
+            "INSERT INTO zero_registrations (kind, at) VALUES (?, ?)",
+            zip(np.asarray(kinds).tolist(), np.asarray(times).tolist()),
+        )
+
+    def seed(self, state, replace=False):
+        """샘플 상태(``registrations``: ``{"kind", "at"}`` 배열 포함)를 등록 테이블과 집계 행으로 나눠 기록합니다.
+
+        등록 테이블과 집계 행은 한 트랜잭션에서 기록합니다.
+        """
+        state = dict(state)
+        registrations = state.pop("registrations")
+        order = np.argsort(registrations["at"], kind="stable")
+
+        def fill(conn):
+            conn.execute("DELETE FROM zero_registrations")
+            self._insert(conn, np.asarray(registrations["kind"])[order], np.asarray(registrations["at"])[order])
+
+        return self.store.seed(CAMPAIGN, state, replace=replace, tables=fill)
+
+    def migrate(self):
+        """등록을 집계 행의 ``daily_registrations`` 리스트에 두던 저장소를 테이블로 옮깁니다.
+
+        등록 행 기록과 집계 행의 ``daily_registrations`` 제거가 한 트랜잭션이고, 트랜잭션 안에서
+        집계 행을 다시 읽으므로 여러 프로세스가 동시에 옮겨도 한 번만 옮겨집니다.
+        """
+        state = self.store.snapshot(CAMPAIGN)
+        if state is None or "daily_registrations" not in state:
+            return False
+
+        def move(conn):
+            row = conn.execute("SELECT state FROM campaign_state WHERE campaign = ?", (CAMPAIGN,)).fetchone()
+            registrations = json.loads(row[0]).get("daily_registrations")
+            if registrations is None:
+                return None
+            parsed = sorted((parse_legacy(registration) for registration in registrations), key=lambda pair: pair[1])
+            self._insert(conn, [kind for kind, _ in parsed], [at for _, at in parsed])
+            return [("unset", ["daily_registrations"], None)]
+
+        return self.store.append(CAMPAIGN, move) is not None
+
+    def recorder(self, kind, ops, at=None):
+        """등록 한 건을 기록하고 ``ops`` 를 돌려주는 ``EventStore.append`` 용 함수."""
+        kind = TYPES.index(kind)
+
+        def record(conn):
+            conn.execute(
+                "INSERT INTO zero_registrations (kind, at) VALUES (?, ?)", (kind, int(at or time.time()))
+            )
+            return ops
+
+        return record
+
+    def refresh(self):
+        """마지막으로 읽은 번호 이후의 등록을 배열에 붙입니다."""
+        conn = self.store.connection()
+        with self._lock:
+            first = conn.execute("SELECT MIN(id) FROM zero_registrations").fetchone()[0]
+            # 다시 채우면 기존 등록이 모두 지워지므로 배열도 새로 만듦
+            if self.last_id and (first is None or first > self.last_id):
+                self._reset()
+            while True:
+                rows = conn.execute(
+                    "SELECT id, kind, at FROM zero_registrations WHERE id > ? ORDER BY id LIMIT ?",
+                    (self.last_id, _BATCH),
+                ).fetchall()
+                if not rows:
+                    break
+                rows = np.array(rows, dtype=np.int64)
+                for kind in range(len(TYPES)):
+                    self._append(kind, rows[rows[:, 1] == kind, 2])
+                self.last_id = int(rows[-1, 0])
+
+    def version(self):
+        """차트 캐시용 버전 (다시 채운 횟수, 마지막 등록 번호)."""
+        self.refresh()
+        return self.generation, self.last_id
+
+    def arrays(self):
+        """유형 코드 순서의 등록 시각 배열 목록 (읽기 전용 뷰)."""
+        self.refresh()
+        with self._lock:
+            views = [buffer[:length] for buffer, length in zip(self._times, self._lengths)]
+        for view in views:
+            view.flags.writeable = False
+        return views
+
+    def times(self, kind):
+        """유형(이름 또는 코드)별 등록 시각 배열 (읽기 전용 뷰)."""
+        return self.arrays()[TYPES.index(kind) if isinstance(kind, str) else kind]
+
+    def count(self):
+        return sum(len(at) for at in self.arrays())
+
+    def hourly(self, day=None):
+        """``(유형 수, 24)`` 시간대별 등록 수. ``day`` (``date``) 를 주면 그날만 셉니다."""
+        result = np.zeros((len(TYPES), 24), dtype=np.int64)
+        for kind, at in enumerate(self.arrays()):
+            if day is not None:
+                at = at[local_day(at) == day_number(day)]
+            result[kind] = np.bincount((at + UTC_OFFSET) // 3600 % 24, minlength=24)
+        return result
+
+    def weekly(self, start=None, end=None):
+        """``(유형 수, 7)`` 요일별 등록 수 (월요일부터). ``start``/``end`` 는 포함 날짜 범위."""
+        result = np.zeros((len(TYPES), 7), dtype=np.int64)
+        for kind, at in enumerate(self.arrays()):
+            days = local_day(at)
+            if start is not None:
+                days = days[days >= day_number(start)]
+            if end is not None:
+                days = days[days <= day_number(end)]
+            # 1970-01-01 은 목요일
+            result[kind] = np.bincount((days + 3) % 7, minlength=7)
+        return result
+
+    def recent(self, limit=10):
+        """최근 등록 ``[(유형, datetime), ...]`` (최신순)."""
+        rows = self.store.connection().execute(
+            "SELECT kind, at FROM zero_registrations ORDER BY id DESC LIMIT ?", (limit,)
+        ).fetchall()
+        return [(TYPES[kind], datetime.fromtimestamp(at)) for kind, at in rows]
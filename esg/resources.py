@@ -0,0 +1,148 @@
+"""프로세스 단위로 공유되는 Streamlit 리소스.
+
+엔트리 스크립트와 각 페이지 스크립트가 같은 저장소 인스턴스를 쓰도록
+``st.cache_resource`` 로 한 번만 생성합니다.
+"""
+import threading
+
+import streamlit as st
+
+from esg import datagen, emissions
+from esg.catalog import ON_SALE, ItemCatalog
+from esg.counters import CounterService
+from esg.ideas import IdeaBoard
+from esg.images import ImageStore
+from esg.likes import LikeBuffer
+from esg.meters import MeterStore
+from esg.minhash import DuplicateIndex
+from esg.printlogs import PrintLogs
+from esg.quiz import QuestionBank, QuizEngine, plan_size
+from esg.registrations import RegistrationLog
+from esg.rollups import Rollups
+from esg.search import RecordSearch
+from esg.store import EventStore
+
+
+# 공유 이벤트 저장소 (프로세스당 1개, 모든 세션이 공유)
+@st.cache_resource
+def get_event_store():
+    store = EventStore()
+    # 비어 있는 캠페인만 샘플 데이터로 채움 (13개 캠페인을 한 번에 생성)
+    missing = [campaign for campaign in datagen.BUILDERS if not store.exists(campaign)]
+    if missing:
+        states = datagen.generate()
+        datagen.seed_store(store, {campaign: states[campaign] for campaign in missing})
+    # 배출계수 이력이 비어 있으면 기본 계수로 채움
+    if store.factor_version() == 0:
+        store.add_factors(emissions.DEFAULT_FACTORS)
+    return store
+
+
+# 클릭형 등록 버튼용 공유 카운터 (증가분을 모아 주기적으로 한 번에 기록)
+@st.cache_resource
+def get_counter_service():
+    return CounterService(get_event_store())
+
+
+# 플리마켓 물품 카탈로그 (물품 테이블, 예전 저장소의 물품 리스트는 처음 한 번 테이블로 옮김)
+@st.cache_resource
+def get_item_catalog():
+    catalog = ItemCatalog(get_event_store())
+    catalog.migrate()
+    return catalog
+
+
+# 제로컵 등록 기록 (유형별 시각 배열, 예전 저장소의 등록 리스트는 처음 한 번 테이블로 옮김)
+@st.cache_resource
+def get_zero_registrations():
+    log = RegistrationLog(get_event_store())
+    log.migrate()
+    return log
+
+
+# 캠페인 지표 구간 합계 (시간/일/주/월, 예전 저장소의 요일별·일별 현황 리스트는 처음 한 번 옮김)
+@st.cache_resource
+def get_rollups():
+    rollups = Rollups(get_event_store())
+    rollups.migrate()
+    return rollups
+
+
+# 페이퍼리스 데이 인쇄 서버 로그 집계 (적재는 python -m esg.printlogs)
+@st.cache_resource
+def get_print_logs():
+    return PrintLogs(get_event_store())
+
+
+# 소등·절전 챌린지 15분 계량값 (계량값이 없던 예전 저장소는 샘플 계량값만 채우고 절약량 갱신, 적재는 python -m esg.meters)
+@st.cache_resource
+def get_meters():
+    meters = MeterStore(get_event_store())
+    if not meters.version()[1]:
+        meters.backfill(datagen.generate_campaign("power_saving")["meters"])
+    return meters
+
+
+# 플리마켓 물품 검색 색인 (n-gram, 검색할 때 새로 등록된 물품만 이어서 색인, 판매중인 물품만)
+@st.cache_resource
+def get_item_search():
+    return RecordSearch(get_item_catalog(), status=ON_SALE)
+
+
+# 임직원 아이디어 레코드 (예전 저장소의 단계별 건수만 있던 집계는 샘플 레코드로 다시 채움)
+@st.cache_resource
+def get_idea_board():
+    store = get_event_store()
+    board = IdeaBoard(store)
+    state = store.snapshot("idea")
+    if state is not None and state["total_ideas"] and board.count() == 0:
+        board.seed(datagen.generate_campaign("idea"), replace=True)
+    return board
+
+
+# 아이디어 중복 제안 탐지 색인 (제목 MinHash/LSH)
+@st.cache_resource
+def get_idea_duplicates():
+    return DuplicateIndex(get_idea_board())
+
+
+# 아이디어 좋아요 (클릭을 모아 주기적으로 한 번에 기록)
+@st.cache_resource
+def get_idea_likes():
+    return LikeBuffer(get_idea_board())
+
+
+# 아이디어 검색 색인 (제목·설명 n-gram)
+@st.cache_resource
+def get_idea_search():
+    return RecordSearch(get_idea_board())
+
+
+# ESG 퀴즈데이 문제 은행 (파일에서 한 번만 읽고 모든 세션이 공유)
+@st.cache_resource
+def get_question_bank():
+    return QuestionBank.load()
+
+
+# ESG 퀴즈데이 채점·리더보드 (현재 회차 하나만 유지, 결과를 모아 주기적으로 한 번에 기록)
+@st.cache_resource
+def _quiz_engine_slot():
+    return {"lock": threading.Lock(), "engine": None}
+
+
+def get_quiz_engine(round_id):
+    """회차의 퀴즈 엔진. 회차가 바뀌면 이전 회차 엔진은 남은 결과를 기록하고 기록 스레드를 멈춥니다."""
+    slot = _quiz_engine_slot()
+    with slot["lock"]:
+        engine = slot["engine"]
+        if engine is None or engine.round_id != round_id:
+            if engine is not None:
+                engine.close()
+            engine = slot["engine"] = QuizEngine(get_event_store(), get_question_bank().key, plan_size(), round_id)
+        return engine
+
+
+# 플리마켓 물품 사진 썸네일 저장소 (static/thumbs, 정적 파일로 제공)
+@st.cache_resource
+def get_image_store():
+    return ImageStore()
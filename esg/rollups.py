@@ -0,0 +1,366 @@
+"""캠페인 지표의 시간 구간별 누계 (hour/day/week/month).
+
+요일별·일별 현황을 집계 행의 딕셔너리 리스트로 두고 매 실행마다 ``DataFrame`` 으로
+바꾸는 대신, 같은 SQLite 파일의 ``rollups`` 테이블에 ``(캠페인, 지표, 단위, 구간 번호)``
+마다 합계 한 행을 둡니다.
+
+- 기록할 때마다 네 단위의 구간 행에 값을 더합니다 (``recorder`` 를 ``EventStore.append``
+  에 넘기면 집계 행 갱신과 같은 트랜잭션). 대량 기록(``add_many``)은 단위마다
+  ``np.unique`` + ``np.bincount`` 로 구간별 합계를 먼저 구해 구간 수만큼만 갱신합니다.
+- 구간 번호는 로컬 시간 기준 1970-01-01 부터의 시간/일/주(월요일 시작)/월 수입니다.
+- 페이지는 원하는 단위와 구간 범위만 기본 키 순서로 읽으므로 원본 이벤트를 훑지 않습니다.
+  비율 지표(디지털 사용률 등)는 더할 수 있는 분자·분모 지표를 따로 쌓아 읽을 때 계산합니다.
+- 여러 해에 걸친 임의 기간 합계·이동 평균은 ``cumulative`` 가 일 구간 전체를 한 번 읽어 만든
+  누적 합(전체·평일·주말)의 차이로 계산합니다 (날짜마다 O(1)).
+
+집계 행 버전은 ``recorder`` 로 기록할 때 함께 올라가므로, 차트 캐시는 캠페인 버전을
+그대로 키로 씁니다.
+"""
+import threading
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+GRAINS = ["hour", "day", "week", "month"]
+
+WEEKDAYS = ["월", "화", "수", "목", "금", "토", "일"]
+
+# 로컬 시간대 오프셋 (초). 시각은 UTC epoch 로 저장하고 구간은 로컬 기준으로 나눕니다.
+UTC_OFFSET = int(datetime.now().astimezone().utcoffset().total_seconds())
+
+_EPOCH = date(1970, 1, 1)
+
+
+def buckets(grain, at):
+    """epoch 초(스칼라 또는 배열) → ``grain`` 단위 구간 번호."""
+    local = np.asarray(at, dtype=np.int64) + UTC_OFFSET
+    if grain == "hour":
+        return local // 3600
+    days = local // 86400
+    if grain == "day":
+        return days
+    if grain == "week":
+        # 1970-01-01 은 목요일: 3일을 더해 월요일 시작 주로 맞춤
+        return (days + 3) // 7
+    if grain == "month":
+        return days.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+    raise ValueError(f"알 수 없는 단위입니다: {grain}")
+
+
+def weekday(days):
+    """일 구간 번호(스칼라 또는 배열) → 요일 (월=0)."""
+    # 1970-01-01 은 목요일
+    return (np.asarray(days) + 3) % 7
+
+
+def epoch_seconds(column):
+    """로그의 시각 열 → epoch 초 배열 (숫자는 epoch 초, 시간대 없는 ISO 8601 문자열은 로컬 시각)."""
+    if pd.api.types.is_numeric_dtype(column):
+        return column.to_numpy(dtype=np.int64)
+    parsed = pd.to_datetime(column, format="ISO8601")
+    if parsed.dt.tz is not None:
+        return parsed.dt.tz_convert(None).to_numpy(dtype="datetime64[s]").astype(np.int64)
+    return parsed.to_numpy(dtype="datetime64[s]").astype(np.int64) - UTC_OFFSET
+
+
+def date_bucket(grain, day):
+    """``date`` 가 속한 ``grain`` 단위 구간 번호 (hour 는 그날 0시)."""
+    days = (day - _EPOCH).days
+    if grain == "hour":
+        return days * 24
+    if grain == "day":
+        return days
+    if grain == "week":
+        return (days + 3) // 7
+    if grain == "month":
+        return (day.year - 1970) * 12 + day.month - 1
+    raise ValueError(f"알 수 없는 단위입니다: {grain}")
+
+
+def bucket_start(grain, bucket):
+    """구간 번호 → 구간 시작 ``datetime`` (로컬)."""
+    if grain == "hour":
+        return datetime.combine(_EPOCH, datetime.min.time()) + timedelta(hours=int(bucket))
+    if grain == "day":
+        return datetime.combine(_EPOCH + timedelta(days=int(bucket)), datetime.min.time())
+    if grain == "week":
+        return datetime.combine(_EPOCH + timedelta(days=int(bucket) * 7 - 3), datetime.min.time())
+    if grain == "month":
+        return datetime(1970 + int(bucket) // 12, int(bucket) % 12 + 1, 1)
+    raise ValueError(f"알 수 없는 단위입니다: {grain}")
+
+
+def local_timestamp(day, hour=12):
+    """로컬 날짜·시각 → epoch 초 (샘플 데이터의 일별 값은 정오에 기록)."""
+    return int(datetime(day.year, day.month, day.day, hour).timestamp())
+
+
+def _recent_date(text, today):
+    # "%m/%d" → 오늘 이전의 가장 가까운 그 날짜
+    month, day = (int(part) for part in text.split("/"))
+    candidate = date(today.year, month, day)
+    return candidate if candidate <= today else date(today.year - 1, month, day)
+
+
+# 예전 집계 행의 현황 리스트: 캠페인 → 키 (행의 요일/날짜·표시용 플래그 열은 지표가 아님)
+LEGACY_SERIES = {"paperless": "weekly_data", "plogging": "weekly_data", "carbon_footprint": "daily_data"}
+LEGACY_FLAGS = {"day", "date", "is_paperless", "is_plogging_day", "is_weekday"}
+
+_UPSERT = """
+    INSERT INTO rollups (campaign, metric, grain, bucket, value) VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(campaign, metric, grain, bucket) DO UPDATE SET value = value + excluded.value
+"""
+
+
+class Cumulative:
+    """일별 값의 누적 합(prefix sum). 임의 기간 합계·평균과 이동 평균을 날짜마다 O(1) 로 계산합니다.
+
+    전체·평일·주말 값과 날짜 수를 각각 누적해 두므로 평일/주말 구분도 차이 한 번입니다.
+    날짜 인자는 일 구간 번호(스칼라 또는 배열)이고 ``first``..``last`` 밖은 0 입니다.
+    """
+
+    DAYS = {"all": 0, "weekday": 1, "weekend": 2}
+
+    def __init__(self, first, values):
+        values = np.asarray(values, dtype=np.float64)
+        self.first = first
+        self.last = first + len(values) - 1
+        weekend = weekday(first + np.arange(len(values))) >= 5
+        masks = np.stack([np.ones(len(values), dtype=bool), ~weekend, weekend])
+        self._sums = np.zeros((3, len(values) + 1))
+        np.cumsum(np.where(masks, values, 0), axis=1, out=self._sums[:, 1:])
+        self._counts = np.zeros((3, len(values) + 1), dtype=np.int64)
+        np.cumsum(masks, axis=1, out=self._counts[:, 1:])
+
+    def _before(self, day):
+        # day 전날까지 누적된 위치
+        return np.clip(np.asarray(day) - self.first, 0, self.last - self.first + 1)
+
+    def total(self, start, end, days="all"):
+        """``start``..``end`` (포함) 합계."""
+        sums = self._sums[self.DAYS[days]]
+        return sums[self._before(np.asarray(end) + 1)] - sums[self._before(start)]
+
+    def count(self, start, end, days="all"):
+        """``start``..``end`` (포함) 중 기록 범위 안의 날짜 수."""
+        counts = self._counts[self.DAYS[days]]
+        return counts[self._before(np.asarray(end) + 1)] - counts[self._before(start)]
+
+    def mean(self, start, end, days="all"):
+        """``start``..``end`` (포함) 하루 평균. 해당 날짜가 없으면 NaN."""
+        count = self.count(start, end, days)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(count > 0, self.total(start, end, days) / np.maximum(count, 1), np.nan)
+
+    def values(self, start, end):
+        """``start``..``end`` (포함) 일별 값 배열."""
+        days = np.arange(start, end + 1)
+        return self.total(days, days)
+
+    def rolling(self, window, start, end):
+        """``start``..``end`` (포함) 각 날짜까지 최근 ``window`` 일 평균 (기록 시작 전 날짜는 빼고 나눔)."""
+        days = np.arange(start, end + 1)
+        return self.mean(days - window + 1, days)
+
+
+class Rollups:
+    def __init__(self, store):
+        self.store = store
+        self._lock = threading.Lock()
+        self._cumulative = {}
+        store.connection().execute(
+            """
+            CREATE TABLE IF NOT EXISTS rollups (
+                campaign TEXT NOT NULL,
+                metric TEXT NOT NULL,
+                grain TEXT NOT NULL,
+                bucket INTEGER NOT NULL,
+                value REAL NOT NULL,
+                PRIMARY KEY (campaign, metric, grain, bucket)
+            ) WITHOUT ROWID
+            """
+        )
+
+    def _add(self, conn, campaign, values, at):
+        self._forget(campaign)
+        conn.executemany(
+            _UPSERT,
+            [
+                (campaign, metric, grain, int(buckets(grain, at)), float(value))
+                for metric, value in values.items()
+                for grain in GRAINS
+            ],
+        )
+
+    def recorder(self, campaign, values, ops, at=None):
+        """``{지표: 값}`` 을 ``at`` (기본 지금) 구간에 더하고 ``ops`` 를 돌려주는 ``EventStore.append`` 용 함수.
+
+        ``ops`` 가 함수면 같은 연결로 먼저 호출하고 그 결과를 돌려줍니다 (다른 기록과 함께 쓸 때).
+        """
+        def record(conn):
+            result = ops(conn) if callable(ops) else ops
+            if result is not None:
+                self._add(conn, campaign, values, at if at is not None else datetime.now().timestamp())
+            return result
+
+        return record
+
+    def add_many(self, campaign, metric, times, values, conn=None):
+        """이벤트 배열(epoch 초, 값)을 단위별 구간 합계로 모아 더합니다. 갱신한 행 수를 반환합니다."""
+        times = np.asarray(times, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
+        rows = []
+        for grain in GRAINS:
+            keys, index = np.unique(buckets(grain, times), return_inverse=True)
+            sums = np.bincount(index, weights=values, minlength=len(keys))
+            rows.extend(zip([campaign] * len(keys), [metric] * len(keys), [grain] * len(keys),
+                            keys.tolist(), sums.tolist()))
+        self._forget(campaign)
+        own = conn is None
+        conn = conn or self.store.connection()
+        if own:
+            conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(_UPSERT, rows)
+            if own:
+                conn.execute("COMMIT")
+        except BaseException:
+            if own:
+                conn.execute("ROLLBACK")
+            raise
+        return len(rows)
+
+    def seed(self, campaign, state, replace=False):
+        """샘플 상태(``series``: ``{지표: (epoch 초 배열, 값 배열)}`` 포함)를 집계 행과 구간 합계로 나눠 기록합니다."""
+        state = dict(state)
+        series = state.pop("series")
+        if self.store.exists(campaign) and not replace:
+            return self.store.snapshot(campaign)
+        conn = self.store.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.clear(campaign, conn)
+            for metric, (times, values) in series.items():
+                self.add_many(campaign, metric, times, values, conn=conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return self.store.seed(campaign, state, replace=True)
+
+    def migrate(self, today=None):
+        """요일별·일별 현황을 집계 행의 리스트로 두던 저장소를 구간 합계로 옮깁니다. 옮긴 캠페인 목록을 반환합니다.
+
+        예전 리스트에는 연도·주가 없으므로 요일은 이번 주, ``"%m/%d"`` 날짜는 오늘 이전의
+        가장 가까운 날로 봅니다. 페이퍼리스 디지털 사용률(%)은 인쇄 건수 대비 디지털 문서 수로 바꿉니다.
+        """
+        today = today or date.today()
+        monday = today - timedelta(days=today.weekday())
+        migrated = []
+        for campaign, key in LEGACY_SERIES.items():
+            state = self.store.snapshot(campaign)
+            if state is None or key not in state:
+                continue
+            state = dict(state)
+            rows = state.pop(key)
+            if key == "weekly_data":
+                days = [monday + timedelta(days=WEEKDAYS.index(row["day"])) for row in rows]
+            else:
+                days = [_recent_date(row["date"], today) for row in rows]
+            at = [local_timestamp(day) for day in days]
+            series = {
+                metric: [row[metric] for row in rows]
+                for metric in rows[0] if rows and metric not in LEGACY_FLAGS
+            }
+            if "digital_usage" in series:
+                usage = np.minimum(np.asarray(series.pop("digital_usage"), dtype=np.float64), 99)
+                series["digital_docs"] = np.asarray(series["prints"]) * usage / (100 - usage)
+            conn = self.store.connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.clear(campaign, conn)
+                for metric, values in series.items():
+                    self.add_many(campaign, metric, at, values, conn=conn)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            self.store.seed(campaign, state, replace=True)
+            migrated.append(campaign)
+        return migrated
+
+    def clear(self, campaign, conn=None, metrics=None):
+        """캠페인의 구간 합계를 지웁니다 (``metrics`` 를 주면 그 지표만)."""
+        self._forget(campaign)
+        conn = conn or self.store.connection()
+        if metrics is None:
+            conn.execute("DELETE FROM rollups WHERE campaign = ?", (campaign,))
+        else:
+            conn.executemany(
+                "DELETE FROM rollups WHERE campaign = ? AND metric = ?", [(campaign, metric) for metric in metrics]
+            )
+
+    def _forget(self, campaign):
+        with self._lock:
+            for key in [key for key in self._cumulative if key[0] == campaign]:
+                del self._cumulative[key]
+
+    def cumulative(self, campaign, metric, today=None):
+        """지표의 첫 기록일부터 ``today`` (기본 오늘) 까지 일별 누적 합 (``Cumulative``).
+
+        캠페인 버전이 같으면 프로세스 안에서 다시 쓰고, 바뀌면 일 구간 행을 한 번 읽어 새로 만듭니다.
+        """
+        version = self.store.version(campaign)
+        key = (campaign, metric)
+        today = date_bucket("day", today or date.today())
+        with self._lock:
+            cached = self._cumulative.get(key)
+        if cached is not None and cached[0] == version and cached[1].last >= today:
+            return cached[1]
+        first, last = self.store.connection().execute(
+            "SELECT MIN(bucket), MAX(bucket) FROM rollups WHERE campaign = ? AND metric = ? AND grain = 'day'",
+            (campaign, metric),
+        ).fetchone()
+        first = today if first is None else first
+        last = max(today, today if last is None else last)
+        cumulative = Cumulative(first, self.series(campaign, metric, "day", first, last))
+        with self._lock:
+            self._cumulative[key] = (version, cumulative)
+        return cumulative
+
+    def exists(self, campaign):
+        return self.store.connection().execute(
+            "SELECT 1 FROM rollups WHERE campaign = ? LIMIT 1", (campaign,)
+        ).fetchone() is not None
+
+    def series(self, campaign, metric, grain, start, end):
+        """구간 ``start``..``end`` (포함) 의 값 배열. 기록이 없는 구간은 0 입니다."""
+        result = np.zeros(max(end - start + 1, 0), dtype=np.float64)
+        rows = self.store.connection().execute(
+            """
+            SELECT bucket, value FROM rollups
+            WHERE campaign = ? AND metric = ? AND grain = ? AND bucket BETWEEN ? AND ?
+            """,
+            (campaign, metric, grain, start, end),
+        ).fetchall()
+        if rows:
+            rows = np.array(rows)
+            result[rows[:, 0].astype(np.int64) - start] = rows[:, 1]
+        return result
+
+    def frame(self, campaign, metrics, grain, start, end):
+        """``bucket``, ``start`` (구간 시작 시각) 과 지표별 열을 가진 ``DataFrame``."""
+        index = np.arange(start, end + 1)
+        columns = {"bucket": index, "start": [bucket_start(grain, bucket) for bucket in index]}
+        for metric in metrics:
+            columns[metric] = self.series(campaign, metric, grain, start, end)
+        return pd.DataFrame(columns)
+
+    def days(self, campaign, metrics, end, n):
+        """``end`` (``date``) 까지 최근 ``n`` 일의 일별 ``DataFrame`` (``date``, ``day`` (요일), 지표 열)."""
+        last = date_bucket("day", end)
+        frame = self.frame(campaign, metrics, "day", last - n + 1, last)
+        frame.insert(1, "date", frame.pop("start").dt.date)
+        frame.insert(2, "day", np.array(WEEKDAYS)[weekday(frame["bucket"].to_numpy())])
+        return frame
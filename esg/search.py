@@ -0,0 +1,166 @@
+"""문자 n-gram 역색인 (플리마켓 물품·임직원 아이디어 검색).
+
+한국어는 형태소 분석 없이 어절을 2글자씩 잘라(bigram) 색인합니다. 조사가 붙은
+"조명을" 은 "조명" 과 겹치는 n-gram 으로, 띄어쓰기가 다른 "조명시스템" 은
+"조명 시스템" 의 n-gram 대부분과 겹쳐서 찾아집니다.
+
+- n-gram 별 문서 번호 배열(``array('i')``, 출현 횟수만큼 반복)을 두고, 검색 시
+  검색어의 n-gram 배열만 numpy 로 모아 BM25 점수를 계산합니다. 문서 10만 개에서도
+  전체 문서를 훑지 않습니다.
+- 문서 추가는 증분이고, 삭제는 표시만 해 두고 검색 결과에서 뺍니다.
+- 한 글자 검색어는 그 글자를 포함한 n-gram 으로 넓혀 찾습니다.
+"""
+import re
+import threading
+import unicodedata
+from array import array
+
+import numpy as np
+
+from esg.catalog import PAGE_SIZE
+
+N = 2
+TITLE_WEIGHT = 2
+K1 = 1.2
+B = 0.75
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def grams(text):
+    """정규화(NFKC, 소문자)한 어절별 n-gram 목록. n 보다 짧은 어절은 그대로 씁니다."""
+    result = []
+    for token in TOKEN_PATTERN.findall(unicodedata.normalize("NFKC", text).lower()):
+        if len(token) < N:
+            result.append(token)
+        else:
+            result.extend(token[i:i + N] for i in range(len(token) - N + 1))
+    return result
+
+
+class NgramIndex:
+    """문서 번호(0 이상 정수) → 제목·본문의 n-gram 역색인. 스레드 간 공유 가능."""
+
+    def __init__(self):
+        self._postings = {}
+        # 문서별 n-gram 수 (0: 없음, -1: 삭제됨)
+        self._lengths = np.zeros(1024, dtype=np.float64)
+        self._count = 0
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, doc_id):
+        return doc_id < len(self._lengths) and self._lengths[doc_id] > 0
+
+    def add(self, doc_id, title, body=""):
+        """문서를 색인합니다. 제목 n-gram 은 ``TITLE_WEIGHT`` 배로 셉니다.
+
+        문서 번호는 다시 쓰지 않습니다 (삭제한 번호로 다시 추가하면 ValueError).
+        """
+        terms = grams(title) * TITLE_WEIGHT + grams(body)
+        with self._lock:
+            if doc_id >= len(self._lengths):
+                grown = np.zeros(max(doc_id + 1, len(self._lengths) * 2), dtype=np.float64)
+                grown[:len(self._lengths)] = self._lengths
+                self._lengths = grown
+            if self._lengths[doc_id] != 0:
+                raise ValueError(f"이미 색인한 문서 번호입니다: {doc_id}")
+            for gram in terms:
+                postings = self._postings.get(gram)
+                if postings is None:
+                    postings = self._postings[gram] = array("i")
+                postings.append(doc_id)
+            # 빈 문서도 색인된 것으로 표시
+            self._lengths[doc_id] = max(len(terms), 1)
+            self._count += 1
+            self._total += self._lengths[doc_id]
+
+    def remove(self, doc_id):
+        with self._lock:
+            if doc_id in self:
+                self._total -= self._lengths[doc_id]
+                self._lengths[doc_id] = -1
+                self._count -= 1
+
+    def search(self, query, limit=20):
+        """``[(문서 번호, 점수), ...]`` 를 점수 내림차순으로 반환합니다 (``limit`` 이 None 이면 전부)."""
+        query_grams = set(grams(query))
+        with self._lock:
+            if not self._count:
+                return []
+            terms = set()
+            for gram in query_grams:
+                if len(gram) < N:
+                    terms.update(g for g in self._postings if gram in g)
+                else:
+                    terms.add(gram)
+            lengths = self._lengths
+            norm = K1 * (1 - B + B * lengths / (self._total / self._count))
+            ids = []
+            weights = []
+            for gram in terms:
+                postings = self._postings.get(gram)
+                if postings is None:
+                    continue
+                docs, tf = np.unique(np.array(postings, dtype=np.int64), return_counts=True)
+                idf = np.log(1 + (self._count - len(docs) + 0.5) / (len(docs) + 0.5))
+                ids.append(docs)
+                weights.append(idf * tf * (K1 + 1) / (tf + norm[docs]))
+        if not ids:
+            return []
+        ids = np.concatenate(ids)
+        scores = np.bincount(ids, weights=np.concatenate(weights), minlength=len(lengths))
+        scores[lengths <= 0] = 0
+        hits = np.flatnonzero(scores)
+        if limit is not None and len(hits) > limit:
+            hits = hits[np.argpartition(-scores[hits], limit - 1)[:limit]]
+        # 점수가 같으면 먼저 등록된 문서가 앞
+        hits = hits[np.lexsort((hits, -scores[hits]))]
+        return list(zip(hits.tolist(), scores[hits].tolist()))
+
+
+class RecordSearch:
+    """테이블 레코드(플리마켓 물품, 아이디어) 검색. 검색할 때마다 새 레코드를 이어서 색인합니다.
+
+    ``source`` 는 ``first_id()``, ``texts(after)``, ``get_many(ids, **filters)`` 를 가진
+    카탈로그입니다. 레코드 번호는 다시 쓰이지 않으므로 마지막으로 색인한 번호 이후만 읽으면
+    되고, 다른 프로세스에서 등록한 레코드도 같은 방식으로 반영됩니다. 상태·카테고리 조건
+    (``filters``)은 검색 결과를 카탈로그에서 읽을 때 거릅니다.
+    """
+
+    def __init__(self, source, **filters):
+        self.source = source
+        self.filters = filters
+        self.index = NgramIndex()
+        self.last_id = 0
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        with self._lock:
+            first = self.source.first_id()
+            # 카탈로그를 다시 채우면 기존 레코드가 모두 지워지므로 색인도 새로 만듦
+            if len(self.index) and (first is None or first > self.last_id):
+                self.index = NgramIndex()
+                self.last_id = 0
+            while True:
+                rows = self.source.texts(after=self.last_id)
+                if not rows:
+                    break
+                for record_id, title, body in rows:
+                    self.index.add(record_id, title, body)
+                self.last_id = rows[-1][0]
+
+    def search(self, query, after=0, limit=PAGE_SIZE, **filters):
+        """``after`` 번째 결과부터 조건에 맞는 레코드 ``limit`` 개와 다음 페이지 커서(없으면 None)."""
+        self.refresh()
+        filters = dict(self.filters, **filters)
+        ranked = [doc_id for doc_id, _ in self.index.search(query, limit=None)]
+        records = []
+        for start in range(0, len(ranked), 500):
+            records.extend(self.source.get_many(ranked[start:start + 500], **filters))
+            if len(records) > after + limit:
+                break
+        return records[after:after + limit], (after + limit if len(records) > after + limit else None)
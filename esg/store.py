@@ -0,0 +1,296 @@
+"""캠페인 공유 이벤트 저장소.
+
+모든 캠페인 데이터는 SQLite(WAL 모드) 파일 하나에 저장됩니다.
+
+- ``events_<캠페인>``: 캠페인별 추가 전용(append-only) 이벤트 테이블
+- ``campaign_state``: 이벤트를 반영한 캠페인별 집계 행 (materialized)
+
+이벤트 기록과 집계 갱신은 한 트랜잭션에서 처리되므로, 페이지는 매 실행마다
+집계 행 하나만 읽으면 되고 모든 임직원이 같은 숫자를 보게 됩니다.
+"""
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+DEFAULT_DB_PATH = os.environ.get(
+    "ESG_DB_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "esg.db"),
+)
+
+CAMPAIGN_PATTERN = re.compile(r"^[a-z][a-z0-9_]*$")
+
+
+def _json_default(value):
+    # 샘플 데이터는 numpy 스칼라를 포함하므로 JSON 기본 타입으로 변환
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return float(value)
+    if isinstance(value, np.bool_):
+        return bool(value)
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"JSON으로 저장할 수 없는 값입니다: {type(value).__name__}")
+
+
+def dumps(value):
+    return json.dumps(value, ensure_ascii=False, default=_json_default, separators=(",", ":"))
+
+
+def apply_ops(state, ops):
+    """집계 상태에 연산 목록을 적용합니다.
+
+    연산은 ``(op, path, value)`` 형태이며 ``path`` 는 중첩 딕셔너리 키 목록입니다.
+
+    - ``incr``: 숫자 값에 ``value`` 를 더함
+    - ``set``: 값을 ``value`` 로 교체
+    - ``push``: 리스트 끝에 ``value`` 추가
+    - ``pull``: 리스트에서 ``id`` 가 ``value`` 인 항목 제거
+    - ``unset``: 키 제거 (``value`` 는 쓰지 않음)
+    """
+    for op, path, value in ops:
+        parent = state
+        for key in path[:-1]:
+            parent = parent[key]
+        key = path[-1]
+        if op == "incr":
+            parent[key] = parent[key] + value
+        elif op == "set":
+            parent[key] = value
+        elif op == "push":
+            parent[key].append(value)
+        elif op == "pull":
+            parent[key] = [item for item in parent[key] if item.get("id") != value]
+        elif op == "unset":
+            parent.pop(key, None)
+        else:
+            raise ValueError(f"알 수 없는 연산입니다: {op}")
+    return state
+
+
+class EventStore:
+    """캠페인 이벤트 로그와 집계 행을 관리하는 SQLite 저장소.
+
+    Streamlit 세션은 스레드별로 실행되므로 연결은 스레드마다 하나씩 엽니다.
+    ``snapshot`` 이 돌려주는 딕셔너리는 모든 세션이 공유하므로 읽기 전용으로
+    다루고, 변경은 반드시 ``append`` / ``seed`` 로 기록합니다.
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._cache = {}
+        self._known_tables = set()
+        self._connect().execute(
+            """
+            CREATE TABLE IF NOT EXISTS campaign_state (
+                campaign TEXT PRIMARY KEY,
+                version INTEGER NOT NULL,
+                state TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        # 배출계수 이력: 값이 바뀌면 행을 추가하고, 적용 시작일 기준으로 조회 (esg.emissions)
+        self._connect().execute(
+            """
+            CREATE TABLE IF NOT EXISTS emission_factors (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                effective_from TEXT NOT NULL,
+                value REAL NOT NULL,
+                unit TEXT NOT NULL,
+                source TEXT NOT NULL,
+                recorded_at REAL NOT NULL
+            )
+            """
+        )
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    def connection(self):
+        """현재 스레드의 SQLite 연결 (같은 파일에 자체 테이블을 두는 모듈용)."""
+        return self._connect()
+
+    def _events_table(self, campaign):
+        if not CAMPAIGN_PATTERN.match(campaign):
+            raise ValueError(f"잘못된 캠페인 이름입니다: {campaign!r}")
+        table = f"events_{campaign}"
+        if table not in self._known_tables:
+            self._connect().execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kind TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            self._known_tables.add(table)
+        return table
+
+    def version(self, campaign):
+        row = self._connect().execute(
+            "SELECT version FROM campaign_state WHERE campaign = ?", (campaign,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def exists(self, campaign):
+        return self.version(campaign) > 0
+
+    def snapshot(self, campaign):
+        """캠페인 집계 상태를 반환합니다. 버전이 같으면 프로세스 캐시를 재사용합니다."""
+        return self.versioned_snapshot(campaign)[1]
+
+    def versioned_snapshot(self, campaign):
+        """``(버전, 집계 상태)`` 를 반환합니다. 버전은 상태와 같은 행에서 읽은 값입니다."""
+        conn = self._connect()
+        version = self.version(campaign)
+        if version == 0:
+            return 0, None
+        with self._lock:
+            cached = self._cache.get(campaign)
+        if cached is not None and cached[0] == version:
+            return cached
+        row = conn.execute(
+            "SELECT version, state FROM campaign_state WHERE campaign = ?", (campaign,)
+        ).fetchone()
+        cached = (row[0], json.loads(row[1]))
+        with self._lock:
+            self._cache[campaign] = cached
+        return cached
+
+    def _write(self, conn, campaign, table, kind, payload, state, version):
+        now = time.time()
+        conn.execute(
+            f"INSERT INTO {table} (kind, payload, created_at) VALUES (?, ?, ?)",
+            (kind, dumps(payload), now),
+        )
+        conn.execute(
+            """
+            INSERT INTO campaign_state (campaign, version, state, updated_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(campaign) DO UPDATE SET
+                version = excluded.version,
+                state = excluded.state,
+                updated_at = excluded.updated_at
+            """,
+            (campaign, version, dumps(state), now),
+        )
+
+    def seed(self, campaign, state, replace=False, tables=None):
+        """초기 상태를 기록합니다. ``replace`` 가 False면 이미 있는 캠페인은 그대로 둡니다.
+
+        ``tables`` 는 상태를 기록할 때만 같은 트랜잭션 안에서 연결을 받아 호출되며,
+        레코드 테이블(물품 등)을 집계 행과 함께 채웁니다.
+        """
+        table = self._events_table(campaign)
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = self.version(campaign)
+            if version == 0 or replace:
+                if tables is not None:
+                    tables(conn)
+                state = json.loads(dumps(state))
+                self._write(conn, campaign, table, "seed", state, state, version + 1)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return self.snapshot(campaign)
+
+    def append(self, campaign, ops, derive=None):
+        """연산 이벤트를 기록하고 집계 행을 같은 트랜잭션에서 갱신합니다.
+
+        ``derive`` 는 연산 적용 후 파생 지표(감축량, 비율 등)를 다시 계산하는 함수입니다.
+        ``ops`` 가 함수면 같은 트랜잭션 안에서 연결을 받아 호출되며, 다른 테이블을 함께
+        갱신하고 연산 목록을 반환합니다. None 을 반환하면 아무것도 기록하지 않습니다.
+        반환값은 갱신된 집계 버전입니다 (기록하지 않았으면 None).
+        """
+        table = self._events_table(campaign)
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if callable(ops):
+                ops = ops(conn)
+                if ops is None:
+                    conn.execute("ROLLBACK")
+                    return None
+            ops = [(op, list(path), value) for op, path, value in ops]
+            row = conn.execute(
+                "SELECT version, state FROM campaign_state WHERE campaign = ?", (campaign,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(f"초기화되지 않은 캠페인입니다: {campaign}")
+            state = apply_ops(json.loads(row[1]), json.loads(dumps(ops)))
+            if derive is not None:
+                derive(state)
+            version = row[0] + 1
+            self._write(conn, campaign, table, "ops", ops, state, version)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return version
+
+    def factor_version(self):
+        """배출계수 테이블 버전 (마지막으로 추가된 행 번호, 비어 있으면 0)."""
+        return self._connect().execute("SELECT COALESCE(MAX(id), 0) FROM emission_factors").fetchone()[0]
+
+    def factor_rows(self):
+        """``(버전, [(이름, 적용 시작일, 값, 단위, 출처), ...])`` 를 추가된 순서로 반환합니다."""
+        rows = self._connect().execute(
+            "SELECT id, name, effective_from, value, unit, source FROM emission_factors ORDER BY id"
+        ).fetchall()
+        return (rows[-1][0] if rows else 0), [row[1:] for row in rows]
+
+    def add_factors(self, rows):
+        """배출계수 행 ``(이름, 적용 시작일, 값, 단위, 출처)`` 를 추가하고 새 버전을 반환합니다.
+
+        기존 행은 수정하지 않습니다. 같은 이름·적용 시작일의 행이 여러 개면 나중 행이 우선합니다.
+        """
+        now = time.time()
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                """
+                INSERT INTO emission_factors (name, effective_from, value, unit, source, recorded_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [(name, str(effective_from), float(value), unit, source, now) for name, effective_from, value, unit, source in rows],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return self.factor_version()
+
+    def history(self, campaign, limit=10):
+        """최근 이벤트를 최신순으로 반환합니다."""
+        table = self._events_table(campaign)
+        rows = self._connect().execute(
+            f"SELECT id, kind, payload, created_at FROM {table} ORDER BY id DESC LIMIT ?", (limit,)
+        ).fetchall()
+        return [
+            {"id": row[0], "kind": row[1], "payload": json.loads(row[2]), "created_at": row[3]}
+            for row in rows
+        ]
@@ -0,0 +1,454 @@
+# 탄소 발자국 챌린지 페이지
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import numpy as np
+from datetime import date, timedelta
+
+from esg import emissions, figures
+from esg.datagen import ALLOW_RESET, generate_campaign, seed_store
+from esg.profiling import section
+from esg.resources import get_event_store, get_rollups
+from esg.rollups import bucket_start, date_bucket
+
+store = get_event_store()
+rollups = get_rollups()
+
+st.title("👣 탄소 발자국 챌린지")
+st.write("엘리베이터 대신 계단 이용, 대중교통 출근, 자전거 이용을 독려하여 탄소 감축을 실현합니다.")
+
+# 탄소 발자국 챌린지 정보
+carbon_footprint_info = {
+    "name": "탄소 발자국 챌린지",
+    "description": "엘리베이터 대신 계단 이용, 대중교통 출근, 자전거 이용 독려",
+    "target": "일상생활에서의 탄소 감축 실천",
+    "goal": "참여 건수 증가, 출퇴근 교통수단별 탄소감축량 계산"
+}
+
+carbon_footprint_version, carbon_footprint_data = store.versioned_snapshot("carbon_footprint")
+
+# 배출계수는 이력 테이블에서 오늘 적용되는 값을 사용
+factors = emissions.load(store)
+P_elevator = factors.current("P_elevator")
+EF = factors.current("EF")
+E_car = factors.current("E_car")
+E_transit = factors.current("E_transit")
+C_stairs = emissions.reduction("commute_stairs", carbon_footprint_data['stairs_usage'], factors=factors)
+C_transit = emissions.reduction("commute_transit", carbon_footprint_data['public_transport'], factors=factors)
+C_bike = emissions.reduction("commute_bike", carbon_footprint_data['bicycle_usage'], factors=factors)
+
+st.markdown("---")
+
+section("탄소 발자국 챌린지 정보")
+# 탄소 발자국 챌린지 정보 카드
+st.subheader("📋 탄소 발자국 챌린지 정보")
+col1, col2 = st.columns(2)
+
+with col1:
+    st.info(f"""
+    **🎯 목표**: {carbon_footprint_info['target']}
+    
+    **📊 지표**: {carbon_footprint_info['goal']}
+    
+    **📝 설명**: {carbon_footprint_info['description']}
+    """)
+
+with col2:
+    st.success(f"""
+    **🌱 환경효과**: 일상생활에서의 탄소 감축 실천
+    
+    **🏃 건강효과**: 계단 이용, 자전거 타기로 건강 증진
+    
+    **💰 경제효과**: 교통비 절약, 에너지 비용 절감
+    """)
+
+st.markdown("---")
+
+section("참여 등록")
+# 참여 등록 섹션
+st.subheader("🎮 참여 등록")
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    st.markdown("""
+    <div style="
+        border: 2px solid #28a745;
+        border-radius: 10px;
+        padding: 20px;
+        text-align: center;
+        background-color: #d4edda;
+        margin-bottom: 10px;
+    ">
+        <h3 style="margin: 0; color: #155724;">🪜</h3>
+        <h4 style="margin: 10px 0; color: #155724;">계단 이용</h4>
+        <p style="margin: 5px 0; font-size: 16px; color: #155724;">
+            참여: {stairs}회
+        </p>
+    </div>
+    """.format(stairs=carbon_footprint_data['stairs_usage']), unsafe_allow_html=True)
+    
+    if st.button("계단 이용 등록", key="stairs_usage", use_container_width=True):
+        saved = emissions.unit_reduction("commute_stairs", factors=factors)
+        store.append("carbon_footprint", rollups.recorder("carbon_footprint", {
+            "participations": 1, "carbon_saved": saved
+        }, [
+            ("incr", ["stairs_usage"], 1),
+            ("incr", ["total_participations"], 1),
+            ("incr", ["carbon_savings", "stairs"], saved)
+        ]))
+        st.success("계단 이용 등록 완료! 🪜")
+        st.rerun()
+
+with col2:
+    st.markdown("""
+    <div style="
+        border: 2px solid #007bff;
+        border-radius: 10px;
+        padding: 20px;
+        text-align: center;
+        background-color: #cce7ff;
+        margin-bottom: 10px;
+    ">
+        <h3 style="margin: 0; color: #004085;">🚌</h3>
+        <h4 style="margin: 10px 0; color: #004085;">대중교통 이용</h4>
+        <p style="margin: 5px 0; font-size: 16px; color: #004085;">
+            참여: {transport}회
+        </p>
+    </div>
+    """.format(transport=carbon_footprint_data['public_transport']), unsafe_allow_html=True)
+    
+    if st.button("대중교통 이용 등록", key="public_transport", use_container_width=True):
+        saved = emissions.unit_reduction("commute_transit", factors=factors)
+        store.append("carbon_footprint", rollups.recorder("carbon_footprint", {
+            "participations": 1, "carbon_saved": saved
+        }, [
+            ("incr", ["public_transport"], 1),
+            ("incr", ["total_participations"], 1),
+            ("incr", ["carbon_savings", "public_transport"], saved)
+        ]))
+        st.success("대중교통 이용 등록 완료! 🚌")
+        st.rerun()
+
+with col3:
+    st.markdown("""
+    <div style="
+        border: 2px solid #ffc107;
+        border-radius: 10px;
+        padding: 20px;
+        text-align: center;
+        background-color: #fff3cd;
+        margin-bottom: 10px;
+    ">
+        <h3 style="margin: 0; color: #856404;">🚲</h3>
+        <h4 style="margin: 10px 0; color: #856404;">자전거 이용</h4>
+        <p style="margin: 5px 0; font-size: 16px; color: #856404;">
+            참여: {bicycle}회
+        </p>
+    </div>
+    """.format(bicycle=carbon_footprint_data['bicycle_usage']), unsafe_allow_html=True)
+    
+    if st.button("자전거 이용 등록", key="bicycle_usage", use_container_width=True):
+        saved = emissions.unit_reduction("commute_bike", factors=factors)
+        store.append("carbon_footprint", rollups.recorder("carbon_footprint", {
+            "participations": 1, "carbon_saved": saved
+        }, [
+            ("incr", ["bicycle_usage"], 1),
+            ("incr", ["total_participations"], 1),
+            ("incr", ["carbon_savings", "bicycle"], saved)
+        ]))
+        st.success("자전거 이용 등록 완료! 🚲")
+        st.rerun()
+
+st.markdown("---")
+
+section("전체 현황")
+# 전체 현황
+st.subheader("📊 전체 현황")
+
+col1, col2, col3, col4, col5 = st.columns(5)
+
+with col1:
+    st.metric(
+        label="총 참여 건수",
+        value=f"{carbon_footprint_data['total_participations']}회",
+        delta=f"+{np.random.randint(5, 15)}회"
+    )
+
+with col2:
+    total_carbon_saved = sum(carbon_footprint_data['carbon_savings'].values())
+    st.metric(
+        label="총 탄소 절약",
+        value=f"{total_carbon_saved:.1f}kg",
+        delta=f"+{np.random.uniform(1, 3):.1f}kg"
+    )
+
+with col3:
+    st.metric(
+        label="참여율",
+        value=f"{carbon_footprint_data['participation_rate']}%",
+        delta=f"+{np.random.randint(2, 8)}%"
+    )
+
+with col4:
+    st.metric(
+        label="환경 점수",
+        value=f"{int(total_carbon_saved * 10)}점",
+        delta=f"+{np.random.randint(10, 30)}점"
+    )
+
+with col5:
+    st.metric(
+        label="총 탄소감축량",
+        value=f"{C_stairs + C_transit + C_bike:.2f}kg",
+        delta="CO₂eq"
+    )
+
+st.markdown("---")
+
+section("교통수단별 탄소 절약량")
+# 교통수단별 탄소 절약량
+st.subheader("🚗 교통수단별 탄소 절약량")
+
+transport_types = ['계단 이용', '대중교통', '자전거']
+carbon_amounts = [
+    carbon_footprint_data['carbon_savings']['stairs'],
+    carbon_footprint_data['carbon_savings']['public_transport'],
+    carbon_footprint_data['carbon_savings']['bicycle']
+]
+
+fig_carbon = figures.get("carbon_footprint", "carbon", carbon_footprint_version)
+if fig_carbon is None:
+    fig_carbon = px.bar(
+        x=transport_types,
+        y=carbon_amounts,
+        title='교통수단별 탄소 절약량',
+        labels={'x': '교통수단', 'y': '탄소 절약량 (kg CO2)'},
+        color=carbon_amounts,
+        color_continuous_scale='Greens'
+    )
+    fig_carbon.update_layout(
+        xaxis_title="교통수단",
+        yaxis_title="탄소 절약량 (kg CO2)"
+    )
+    figures.put("carbon_footprint", "carbon", carbon_footprint_version, fig_carbon)
+st.plotly_chart(fig_carbon, use_container_width=True)
+
+st.markdown("---")
+
+section("일별 참여 현황")
+# 일별 참여 현황
+st.subheader("📅 일별 참여 현황")
+
+# 일별 구간 합계의 누적 합: 기간 합계·평일/주말 평균·이동 평균이 날짜마다 차이 한 번
+today = date.today()
+participations = rollups.cumulative("carbon_footprint", "participations", today)
+carbon_saved = rollups.cumulative("carbon_footprint", "carbon_saved", today)
+first_date = bucket_start("day", participations.first).date()
+
+col1, col2 = st.columns([3, 2])
+with col1:
+    daily_range = st.date_input(
+        "기간", (max(today - timedelta(days=29), first_date), today),
+        min_value=first_date, max_value=today
+    )
+with col2:
+    daily_metric = st.radio("지표", ["참여 건수", "탄소 절약량"], horizontal=True)
+
+# 날짜 하나만 고른 동안에는 그날 하루
+range_start, range_end = (daily_range[0], daily_range[-1]) if daily_range else (today, today)
+start_day, end_day = date_bucket("day", range_start), date_bucket("day", range_end)
+cumulative, unit = (participations, "회") if daily_metric == "참여 건수" else (carbon_saved, "kg")
+
+# 기간에 평일(주말)이 없으면 평균 대신 "-"
+weekday_mean, weekend_mean = (
+    f"{mean:,.1f}{unit}" if not np.isnan(mean) else "-"
+    for mean in (cumulative.mean(start_day, end_day, "weekday"), cumulative.mean(start_day, end_day, "weekend"))
+)
+
+col1, col2, col3, col4 = st.columns(4)
+with col1:
+    st.metric(label="기간 참여 건수", value=f"{participations.total(start_day, end_day):,.0f}회")
+with col2:
+    st.metric(label="기간 탄소 절약", value=f"{carbon_saved.total(start_day, end_day):,.1f}kg")
+with col3:
+    st.metric(label=f"평일 하루 평균 ({daily_metric})", value=weekday_mean)
+with col4:
+    st.metric(label=f"주말 하루 평균 ({daily_metric})", value=weekend_mean)
+
+daily_version = (carbon_footprint_version, today, start_day, end_day)
+fig_daily = figures.get("carbon_footprint", f"daily_{daily_metric}", daily_version)
+if fig_daily is None:
+    dates = pd.to_datetime(np.arange(start_day, end_day + 1), unit="D")
+    daily_df = pd.DataFrame({
+        "date": np.tile(dates, 3),
+        "value": np.concatenate([
+            cumulative.values(start_day, end_day),
+            cumulative.rolling(7, start_day, end_day),
+            cumulative.rolling(30, start_day, end_day),
+        ]),
+        "series": np.repeat(["일별", "7일 이동 평균", "30일 이동 평균"], end_day - start_day + 1),
+    })
+    fig_daily = px.line(
+        daily_df,
+        x='date',
+        y='value',
+        color='series',
+        title=f'일별 {daily_metric} 추이 ({range_start} ~ {range_end})',
+        labels={'value': f'{daily_metric} ({unit})', 'date': '날짜', 'series': ''},
+        color_discrete_map={'일별': '#b8dfc1', '7일 이동 평균': '#28a745', '30일 이동 평균': '#155724'}
+    )
+    fig_daily.update_layout(
+        xaxis_title="날짜",
+        yaxis_title=f"{daily_metric} ({unit})"
+    )
+    figures.put("carbon_footprint", f"daily_{daily_metric}", daily_version, fig_daily)
+st.plotly_chart(fig_daily, use_container_width=True)
+
+st.markdown("---")
+
+section("탄소감축량 지표 산식")
+# 탄소감축량 지표 산식
+st.subheader("📊 탄소감축량 지표 산식")
+col1, col2 = st.columns(2)
+
+with col1:
+    st.info("""
+    **👣 기본 산식 구조**
+    ```
+    총 감축량(kgCO₂eq) = C_stairs + C_transit + C_bike
+    ```
+    **📋 각 항목 산정식**
+    
+    **🪜 계단 이용에 의한 감축량**
+    ```
+    C_stairs = N_stairs × P_elevator × EF
+    ```
+    - **N_stairs**: 계단 이용 횟수
+    - **P_elevator**: 엘리베이터 1회 이용 시 소비 전력 (kWh)
+    - **EF**: 전력 배출계수 (kgCO₂eq/kWh)
+    
+    **🚌 대중교통 이용에 의한 감축량**
+    ```
+    C_transit = N_transit × (E_car - E_transit)
+    ```
+    - **N_transit**: 대중교통 이용 횟수
+    - **E_car**: 자가용 1회 평균 배출량 (kgCO₂eq)
+    - **E_transit**: 대중교통 1회 평균 배출량 (kgCO₂eq)
+    """)
+
+with col2:
+    st.success(f"""
+    **🚲 자전거 이용에 의한 감축량**
+    ```
+    C_bike = N_bike × E_car
+    ```
+    - **N_bike**: 자전거 이용 횟수
+    - **E_car**: 자가용 1회 배출량 (kgCO₂eq)
+    
+    **🎯 최종 통합 산식**
+    ```
+    총 감축량 = N_stairs × P_elevator × EF
+              + N_transit × (E_car - E_transit)
+              + N_bike × E_car
+    ```
+    **📊 예시값**
+    - **P_elevator**: {P_elevator} kWh/회
+    - **EF**: {EF} kgCO₂eq/kWh
+    - **E_car**: {E_car} kgCO₂eq/회
+    - **E_transit**: {E_transit} kgCO₂eq/회
+    """)
+
+section("실시간 계산 예시")
+st.subheader("🧮 실시간 계산 예시")
+current_data = carbon_footprint_data
+
+st.markdown(f"""
+<div style="
+    border: 2px solid #28a745;
+    border-radius: 10px;
+    padding: 20px;
+    text-align: center;
+    background-color: #d4edda;
+    margin-bottom: 10px;
+">
+    <h3 style="margin: 0; color: #155724;">📈 현재 상황</h3>
+    <div style="display: flex; justify-content: space-around; margin: 20px 0;">
+        <div>
+            <p style="margin: 5px 0; font-size: 16px; color: #155724;">
+                <strong>계단 이용:</strong><br>
+                {current_data['stairs_usage']} × {P_elevator} × {EF}<br>
+                = <strong>{C_stairs:.2f}kg CO₂eq</strong>
+            </p>
+        </div>
+        <div>
+            <p style="margin: 5px 0; font-size: 16px; color: #155724;">
+                <strong>대중교통:</strong><br>
+                {current_data['public_transport']} × ({E_car} - {E_transit})<br>
+                = <strong>{C_transit:.2f}kg CO₂eq</strong>
+            </p>
+        </div>
+        <div>
+            <p style="margin: 5px 0; font-size: 16px; color: #155724;">
+                <strong>자전거:</strong><br>
+                {current_data['bicycle_usage']} × {E_car}<br>
+                = <strong>{C_bike:.2f}kg CO₂eq</strong>
+            </p>
+        </div>
+    </div>
+    <p style="margin: 10px 0; font-size: 24px; font-weight: bold; color: #155724;">
+        <strong>총 탄소감축량: {C_stairs + C_transit + C_bike:.2f}kg CO₂eq</strong>
+    </p>
+</div>
+""", unsafe_allow_html=True)
+
+st.markdown("---")
+
+section("환경 효과")
+# 환경 효과
+st.subheader("🌱 환경 효과")
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    st.metric(
+        label="CO2 절약",
+        value=f"{total_carbon_saved:.1f}kg",
+        delta="월간 절약"
+    )
+
+with col2:
+    st.metric(
+        label="나무 보호",
+        value=f"{total_carbon_saved * 0.02:.1f}그루",
+        delta="월간 보호"
+    )
+
+with col3:
+    st.metric(
+        label="환경등가",
+        value=f"{total_carbon_saved * 0.1:.1f}L",
+        delta="휘발유 절약"
+    )
+
+st.markdown("---")
+
+section("데이터 관리")
+# 데이터 관리
+st.subheader("🔄 데이터 관리")
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    if ALLOW_RESET and st.button("📊 데이터 초기화", width='stretch'):
+        seed_store(store, {"carbon_footprint": generate_campaign("carbon_footprint")}, replace=True)
+        st.success("샘플 데이터로 초기화되었습니다!")
+        st.rerun()
+
+with col2:
+    if st.button("📈 통계 새로고침", width='stretch'):
+        st.info("통계 데이터를 새로고침했습니다!")
+
+with col3:
+    if st.button("📋 탄소 리포트", width='stretch'):
+        st.info("탄소 발자국 리포트를 생성했습니다!")
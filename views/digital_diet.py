@@ -0,0 +1,323 @@
+# 디지털 다이어트 캠페인 페이지
+
+import streamlit as st
+import plotly.express as px
+from datetime import datetime
+import numpy as np
+
+from esg import figures
+from esg.datagen import ALLOW_RESET, generate_campaign
+from esg.profiling import section
+from esg.resources import get_event_store
+
+store = get_event_store()
+
+st.title("💻 디지털 다이어트 캠페인")
+st.write("이메일, 불필요한 파일·첨부 삭제로 서버 전력 감축을 유도하여 디지털 환경을 개선합니다.")
+
+# 디지털 다이어트 캠페인 정보
+digital_diet_info = {
+    "name": "디지털 다이어트 캠페인",
+    "description": "이메일, 불필요한 파일·첨부 삭제로 서버 전력 감축 유도",
+    "schedule": "월간 정리, 분기별 대청소",
+    "goal": "사내 서버 저장용량 절감률, 발신 이메일 감소율 향상"
+}
+
+digital_diet_version, digital_diet_data = store.versioned_snapshot("digital_diet")
+
+st.markdown("---")
+
+section("디지털 다이어트 캠페인 정보")
+# 디지털 다이어트 캠페인 정보 카드
+st.subheader("📋 디지털 다이어트 캠페인 정보")
+col1, col2 = st.columns(2)
+
+with col1:
+    st.info(f"""
+    **📅 일정**: {digital_diet_info['schedule']}
+    
+    **🎯 목표**: {digital_diet_info['goal']}
+    
+    **📝 설명**: {digital_diet_info['description']}
+    """)
+
+with col2:
+    st.success(f"""
+    **💾 저장공간**: 서버 용량 절약으로 비용 절감
+    
+    **⚡ 전력절약**: 서버 부하 감소로 전력 절약
+    
+    **🌱 환경효과**: 디지털 탄소 발자국 감소
+    """)
+
+st.markdown("---")
+
+section("전체 통계")
+# 전체 통계
+st.subheader("📊 전체 통계")
+
+col1, col2, col3, col4 = st.columns(4)
+
+with col1:
+    st.metric(
+        label="총 저장용량 절감",
+        value=f"{digital_diet_data['total_storage_saved']}GB",
+        delta=f"+{np.random.randint(3, 8)}GB"
+    )
+
+with col2:
+    st.metric(
+        label="총 이메일 감소",
+        value=f"{digital_diet_data['total_emails_reduced']}%",
+        delta=f"+{np.random.randint(5, 12)}%"
+    )
+
+with col3:
+    st.metric(
+        label="총 파일 삭제",
+        value=f"{digital_diet_data['total_files_deleted']}개",
+        delta=f"+{np.random.randint(50, 150)}개"
+    )
+
+with col4:
+    st.metric(
+        label="총 전력 절약",
+        value=f"{digital_diet_data['total_power_saved']}%",
+        delta=f"+{np.random.randint(2, 6)}%"
+    )
+
+st.markdown("---")
+
+section("부서별 디지털 다이어트 현황")
+# 부서별 디지털 다이어트 현황
+st.subheader("💻 부서별 디지털 다이어트 현황")
+
+# 부서별 카드 레이아웃 (2열)
+dept_names = list(digital_diet_data['departments'].keys())
+
+for i in range(0, len(dept_names), 2):
+    cols = st.columns(2)
+    for j in range(2):
+        if i + j < len(dept_names):
+            dept_key = dept_names[i + j]
+            dept_info = digital_diet_data['departments'][dept_key]
+            
+            with cols[j]:
+                st.markdown(f"""
+                <div style="
+                    border: 2px solid {dept_info['color']};
+                    border-radius: 10px;
+                    padding: 20px;
+                    text-align: center;
+                    background-color: #f8f9fa;
+                    margin-bottom: 10px;
+                ">
+                    <h3 style="margin: 0; color: {dept_info['color']};">{dept_info['icon']}</h3>
+                    <h4 style="margin: 10px 0; color: #333;">{dept_info['name']}</h4>
+                    <p style="margin: 5px 0; font-size: 14px; font-weight: bold; color: {dept_info['color']};">
+                        저장용량절감: {dept_info['storage_saved']}GB
+                    </p>
+                    <p style="margin: 5px 0; font-size: 12px; color: #007bff;">
+                        이메일감소: {dept_info['emails_reduced']}%
+                    </p>
+                    <p style="margin: 5px 0; font-size: 12px; color: #28a745;">
+                        파일삭제: {dept_info['files_deleted']}개
+                    </p>
+                    <p style="margin: 5px 0; font-size: 12px; color: #6c757d;">
+                        전력절약: {dept_info['power_saved']}%
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
+
+st.markdown("---")
+
+section("부서별 저장용량 절감률")
+# 부서별 저장용량 절감률 차트
+st.subheader("💾 부서별 저장용량 절감률")
+
+dept_names = list(digital_diet_data['departments'].keys())
+storage_savings = [dept['storage_saved'] for dept in digital_diet_data['departments'].values()]
+colors = [dept['color'] for dept in digital_diet_data['departments'].values()]
+
+fig_storage = figures.get("digital_diet", "storage", digital_diet_version)
+if fig_storage is None:
+    fig_storage = px.bar(
+        x=dept_names,
+        y=storage_savings,
+        title='부서별 저장용량 절감률',
+        labels={'x': '부서', 'y': '저장용량 절감 (GB)'},
+        color=dept_names,
+        color_discrete_sequence=colors
+    )
+    fig_storage.update_layout(
+        xaxis_title="부서",
+        yaxis_title="저장용량 절감 (GB)"
+    )
+    figures.put("digital_diet", "storage", digital_diet_version, fig_storage)
+st.plotly_chart(fig_storage, use_container_width=True)
+
+st.markdown("---")
+
+section("부서별 이메일 감소율과 파일 삭제 수")
+# 부서별 이메일 감소율과 파일 삭제 수
+st.subheader("📧 부서별 이메일 감소율과 파일 삭제 수")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    emails_reduced = [dept['emails_reduced'] for dept in digital_diet_data['departments'].values()]
+    
+    fig_emails = figures.get("digital_diet", "emails", digital_diet_version)
+    if fig_emails is None:
+        fig_emails = px.bar(
+            x=dept_names,
+            y=emails_reduced,
+            title='부서별 이메일 감소율',
+            labels={'x': '부서', 'y': '이메일 감소율 (%)'},
+            color=dept_names,
+            color_discrete_sequence=colors
+        )
+        fig_emails.update_layout(xaxis_title="부서", yaxis_title="이메일 감소율 (%)")
+        figures.put("digital_diet", "emails", digital_diet_version, fig_emails)
+    st.plotly_chart(fig_emails, use_container_width=True)
+
+with col2:
+    files_deleted = [dept['files_deleted'] for dept in digital_diet_data['departments'].values()]
+    
+    fig_files = figures.get("digital_diet", "files", digital_diet_version)
+    if fig_files is None:
+        fig_files = px.bar(
+            x=dept_names,
+            y=files_deleted,
+            title='부서별 파일 삭제 수',
+            labels={'x': '부서', 'y': '파일 삭제 수'},
+            color=dept_names,
+            color_discrete_sequence=colors
+        )
+        fig_files.update_layout(xaxis_title="부서", yaxis_title="파일 삭제 수")
+        figures.put("digital_diet", "files", digital_diet_version, fig_files)
+    st.plotly_chart(fig_files, use_container_width=True)
+
+st.markdown("---")
+
+section("디지털 다이어트 가이드")
+# 디지털 다이어트 가이드
+st.subheader("📋 디지털 다이어트 가이드")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.info("""
+    **📧 이메일 정리**
+    - 불필요한 이메일 삭제
+    - 첨부파일 정리
+    - 스팸 메일 차단
+    - 자동 정리 규칙 설정
+    
+    **💾 파일 정리**
+    - 중복 파일 삭제
+    - 임시 파일 정리
+    - 오래된 파일 아카이브
+    - 클라우드 저장소 정리
+    """)
+
+with col2:
+    st.success("""
+    **🗂️ 폴더 정리**
+    - 체계적인 폴더 구조
+    - 불필요한 폴더 삭제
+    - 파일명 규칙화
+    - 정기적인 백업
+    
+    **⚡ 시스템 최적화**
+    - 불필요한 프로그램 제거
+    - 시작 프로그램 정리
+    - 디스크 정리 실행
+    - 시스템 업데이트
+    """)
+
+st.markdown("---")
+
+section("디지털 다이어트 참여 등록")
+# 디지털 다이어트 참여 등록
+st.subheader("📝 디지털 다이어트 참여 등록")
+
+with st.form("digital_diet_registration"):
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        participant_name = st.text_input("참여자명", placeholder="예: 홍길동")
+        department = st.selectbox("소속 부서", ["솔루션사업부", "클라우드사업부", "전마실", "물류사업", "경영지원", "개발센터"])
+        storage_cleaned = st.number_input("정리한 저장용량 (GB)", min_value=0, max_value=100, value=5)
+    
+    with col2:
+        emails_deleted = st.number_input("삭제한 이메일 수", min_value=0, max_value=1000, value=50)
+        files_deleted = st.number_input("삭제한 파일 수", min_value=0, max_value=500, value=20)
+        cleanup_date = st.date_input("정리 날짜", value=datetime.now().date())
+    
+    cleanup_description = st.text_area("정리 내용", placeholder="어떤 파일들을 정리했는지 구체적으로 작성해주세요.", height=100)
+    
+    submitted = st.form_submit_button("디지털 다이어트 등록")
+    if submitted:
+        if participant_name and cleanup_description:
+            # 전력 절약 계산 (저장용량 1GB당 0.5%, 이메일 10개당 0.1%, 파일 10개당 0.1%)
+            power_saved = round((storage_cleaned * 0.5) + (emails_deleted * 0.01) + (files_deleted * 0.01), 1)
+            
+            st.success(f"{participant_name}님의 디지털 다이어트가 성공적으로 등록되었습니다! 💻")
+            st.info(f"저장용량: {storage_cleaned}GB, 이메일: {emails_deleted}개, 파일: {files_deleted}개, 전력절약: {power_saved}%")
+        else:
+            st.error("모든 필수 항목을 입력해주세요!")
+
+st.markdown("---")
+
+section("환경 효과")
+# 환경 효과
+st.subheader("🌱 환경 효과")
+
+col1, col2, col3 = st.columns(3)
+
+total_storage = digital_diet_data['total_storage_saved']
+total_emails = digital_diet_data['total_emails_reduced']
+total_files = digital_diet_data['total_files_deleted']
+
+with col1:
+    st.metric(
+        label="CO2 절약",
+        value=f"{total_storage * 0.3:.1f}kg",
+        delta="월간 절약"
+    )
+
+with col2:
+    st.metric(
+        label="전력 절약",
+        value=f"{total_storage * 0.5:.1f}kWh",
+        delta="월간 절약"
+    )
+
+with col3:
+    st.metric(
+        label="서버 효율성",
+        value=f"{np.random.randint(85, 95)}%",
+        delta="월간 효율성"
+    )
+
+st.markdown("---")
+
+section("데이터 관리")
+# 데이터 관리
+st.subheader("🔄 데이터 관리")
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    if ALLOW_RESET and st.button("📊 데이터 초기화", width='stretch'):
+        store.seed("digital_diet", generate_campaign("digital_diet"), replace=True)
+        st.success("샘플 데이터로 초기화되었습니다!")
+        st.rerun()
+
+with col2:
+    if st.button("📈 통계 새로고침", width='stretch'):
+        st.info("통계 데이터를 새로고침했습니다!")
+
+with col3:
+    if st.button("📋 다이어트 리포트", width='stretch'):
+        st.info("디지털 다이어트 리포트를 생성했습니다!")
@@ -0,0 +1,358 @@
+# ESG 교육 및 퀴즈데이 페이지
+
+import time
+
+import streamlit as st
+import plotly.express as px
+import numpy as np
+
+from esg import figures
+from esg.datagen import ALLOW_RESET, generate_campaign
+from esg.profiling import section
+from esg.quiz import current_round, participant_id, plan_size
+from esg.resources import get_event_store, get_question_bank, get_quiz_engine
+
+store = get_event_store()
+
+st.title("🎓 ESG 교육 및 퀴즈데이")
+st.write("직원대상 ESG 온라인 교육·퀴즈를 진행하고, 점수에 따라 리워드를 제공하여 ESG 인식도를 향상시킵니다.")
+
+# ESG 교육 및 퀴즈데이 정보
+esg_education_info = {
+    "name": "ESG 교육 및 퀴즈데이",
+    "description": "직원대상 ESG 온라인 교육·퀴즈 진행, 점수에 따라 리워드 제공",
+    "schedule": "월 2회 교육, 분기별 퀴즈 대회",
+    "goal": "참여율, ESG 인식도 조사 점수 변화 향상"
+}
+
+esg_education_version, esg_education_data = store.versioned_snapshot("esg_education")
+
+st.markdown("---")
+
+section("ESG 교육 및 퀴즈데이 정보")
+# ESG 교육 및 퀴즈데이 정보 카드
+st.subheader("📋 ESG 교육 및 퀴즈데이 정보")
+col1, col2 = st.columns(2)
+
+with col1:
+    st.info(f"""
+    **📅 일정**: {esg_education_info['schedule']}
+    
+    **🎯 목표**: {esg_education_info['goal']}
+    
+    **📝 설명**: {esg_education_info['description']}
+    """)
+
+with col2:
+    st.success(f"""
+    **🎓 교육효과**: ESG 전문 지식 습득
+    
+    **🏆 경쟁효과**: 퀴즈 대회를 통한 학습 동기 부여
+    
+    **🎁 리워드효과**: 점수에 따른 인센티브 제공
+    """)
+
+st.markdown("---")
+
+section("전체 통계")
+# 전체 통계
+st.subheader("📊 전체 통계")
+
+col1, col2, col3, col4 = st.columns(4)
+
+with col1:
+    st.metric(
+        label="총 참여자",
+        value=f"{esg_education_data['total_participants']}명",
+        delta=f"+{np.random.randint(5, 15)}명"
+    )
+
+with col2:
+    st.metric(
+        label="평균 완주율",
+        value=f"{esg_education_data['avg_completion_rate']}%",
+        delta=f"+{np.random.randint(2, 5)}%"
+    )
+
+with col3:
+    st.metric(
+        label="평균 점수",
+        value=f"{esg_education_data['avg_score']}점",
+        delta=f"+{np.random.randint(3, 8)}점"
+    )
+
+with col4:
+    st.metric(
+        label="ESG 인식도",
+        value=f"{esg_education_data['awareness_score']}점",
+        delta=f"+{np.random.randint(5, 10)}점"
+    )
+
+st.markdown("---")
+
+section("교육 과정별 현황")
+# 교육 과정별 현황
+st.subheader("🎓 교육 과정별 현황")
+
+# 교육 과정별 카드 레이아웃 (2열)
+course_names = list(esg_education_data['courses'].keys())
+
+for i in range(0, len(course_names), 2):
+    cols = st.columns(2)
+    for j in range(2):
+        if i + j < len(course_names):
+            course_key = course_names[i + j]
+            course_info = esg_education_data['courses'][course_key]
+            
+            with cols[j]:
+                st.markdown(f"""
+                <div style="
+                    border: 2px solid {course_info['color']};
+                    border-radius: 10px;
+                    padding: 20px;
+                    text-align: center;
+                    background-color: #f8f9fa;
+                    margin-bottom: 10px;
+                ">
+                    <h3 style="margin: 0; color: {course_info['color']};">{course_info['icon']}</h3>
+                    <h4 style="margin: 10px 0; color: #333;">{course_info['name']}</h4>
+                    <p style="margin: 5px 0; font-size: 14px; font-weight: bold; color: {course_info['color']};">
+                        참여자: {course_info['participants']}명
+                    </p>
+                    <p style="margin: 5px 0; font-size: 12px; color: #007bff;">
+                        완주율: {course_info['completion_rate']}%
+                    </p>
+                    <p style="margin: 5px 0; font-size: 12px; color: #28a745;">
+                        평균점수: {course_info['avg_score']}점
+                    </p>
+                    <p style="margin: 5px 0; font-size: 12px; color: #6c757d;">
+                        소요시간: {course_info['duration']}
+                    </p>
+                    <p style="margin: 5px 0; font-size: 12px; color: #6c757d;">
+                        난이도: {course_info['difficulty']}
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
+
+st.markdown("---")
+
+section("교육 과정별 참여자 수")
+# 교육 과정별 참여자 수 차트
+st.subheader("👥 교육 과정별 참여자 수")
+
+course_names = list(esg_education_data['courses'].keys())
+participants_counts = [course['participants'] for course in esg_education_data['courses'].values()]
+colors = [course['color'] for course in esg_education_data['courses'].values()]
+
+fig_participants = figures.get("esg_education", "participants", esg_education_version)
+if fig_participants is None:
+    fig_participants = px.bar(
+        x=course_names,
+        y=participants_counts,
+        title='교육 과정별 참여자 수',
+        labels={'x': '교육 과정', 'y': '참여자 수'},
+        color=course_names,
+        color_discrete_sequence=colors
+    )
+    fig_participants.update_layout(
+        xaxis_title="교육 과정",
+        yaxis_title="참여자 수"
+    )
+    figures.put("esg_education", "participants", esg_education_version, fig_participants)
+st.plotly_chart(fig_participants, use_container_width=True)
+
+st.markdown("---")
+
+section("교육 과정별 완주율과 평균 점수")
+# 교육 과정별 완주율과 평균 점수
+st.subheader("📈 교육 과정별 완주율과 평균 점수")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    completion_rates = [course['completion_rate'] for course in esg_education_data['courses'].values()]
+    
+    fig_completion = figures.get("esg_education", "completion", esg_education_version)
+    if fig_completion is None:
+        fig_completion = px.bar(
+            x=course_names,
+            y=completion_rates,
+            title='교육 과정별 완주율',
+            labels={'x': '교육 과정', 'y': '완주율 (%)'},
+            color=course_names,
+            color_discrete_sequence=colors
+        )
+        fig_completion.update_layout(xaxis_title="교육 과정", yaxis_title="완주율 (%)")
+        figures.put("esg_education", "completion", esg_education_version, fig_completion)
+    st.plotly_chart(fig_completion, use_container_width=True)
+
+with col2:
+    avg_scores = [course['avg_score'] for course in esg_education_data['courses'].values()]
+    
+    fig_scores = figures.get("esg_education", "scores", esg_education_version)
+    if fig_scores is None:
+        fig_scores = px.bar(
+            x=course_names,
+            y=avg_scores,
+            title='교육 과정별 평균 점수',
+            labels={'x': '교육 과정', 'y': '평균 점수'},
+            color=course_names,
+            color_discrete_sequence=colors
+        )
+        fig_scores.update_layout(xaxis_title="교육 과정", yaxis_title="평균 점수")
+        figures.put("esg_education", "scores", esg_education_version, fig_scores)
+    st.plotly_chart(fig_scores, use_container_width=True)
+
+st.markdown("---")
+
+section("ESG 퀴즈 대회")
+# ESG 퀴즈 대회
+st.subheader("🏆 ESG 퀴즈 대회")
+
+# 간단한 퀴즈 인터페이스 (채점·기록은 서버의 퀴즈 엔진이 담당)
+quiz_round = current_round()
+quiz_engine = get_quiz_engine(quiz_round)
+quiz_plan_size = plan_size()
+
+st.write(f"**ESG 기초 퀴즈 ({quiz_plan_size}문제)** · {quiz_round} 퀴즈 대회")
+
+# 참여자는 세션이 아니라 이름으로 정함: 새로고침하거나 다른 탭에서 열어도 같은 참여자
+quiz_name = st.text_input("참여자 이름 (리더보드 표시)", max_chars=20, key="quiz_name",
+                          placeholder="예: 홍길동(12345)").strip()
+participant = participant_id(quiz_name)
+
+if not participant:
+    st.info("이름을 입력하면 퀴즈가 시작됩니다. 같은 이름은 같은 참여자로 봅니다.")
+    score = None
+else:
+    # 참여자별 출제 (회차·참여자 시드라 다시 실행해도 같은 문제·순서)
+    quiz_questions = get_question_bank().draw(participant, quiz_round)
+    quiz_ids = [question["id"] for question in quiz_questions]
+
+    # 퀴즈 상태 초기화 (화면 진행 상태만 세션에 둠, 이름이 바뀌면 처음부터)
+    if st.session_state.get('quiz_state', {}).get('participant') != participant:
+        st.session_state.quiz_state = {
+            'participant': participant,
+            'current_question': 0,
+            'answers': [],
+            'started_at': time.time()
+        }
+
+    score = quiz_engine.result(participant)
+
+if participant and score is None:
+    current_q = st.session_state.quiz_state['current_question']
+    question = quiz_questions[current_q]
+    
+    st.write(f"**문제 {current_q + 1}/{len(quiz_questions)}:** {question['question']}")
+    st.caption(f"{question['topic']} · {question['difficulty']}")
+    
+    # 보기는 섞여 있으므로 원래 보기 번호로 답함
+    selected_option = st.radio(
+        "답을 선택하세요:",
+        question['order'],
+        format_func=lambda index: question['options'][question['order'].index(index)],
+        key=f"q{current_q}"
+    )
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("다음 문제", disabled=current_q >= len(quiz_questions)-1):
+            st.session_state.quiz_state['answers'].append(selected_option)
+            st.session_state.quiz_state['current_question'] += 1
+            st.rerun()
+    
+    with col2:
+        if st.button("퀴즈 완료", disabled=current_q < len(quiz_questions)-1):
+            answers = st.session_state.quiz_state['answers'] + [selected_option]
+            quiz_engine.submit(
+                participant,
+                quiz_name,
+                quiz_ids,
+                answers,
+                time.time() - st.session_state.quiz_state['started_at']
+            )
+            st.rerun()
+
+elif participant:
+    total = len(quiz_questions)
+    percentage = (score / total) * 100
+    
+    st.success(f"🎉 퀴즈 완료! 점수: {score}/{total} ({percentage:.0f}%)")
+    
+    if percentage >= 80:
+        st.balloons()
+        st.info("🏆 우수한 성적입니다! 리워드가 지급됩니다!")
+    elif percentage >= 60:
+        st.info("👍 좋은 성적입니다! 계속 노력하세요!")
+    else:
+        st.warning("📚 더 공부가 필요합니다. 교육 과정을 다시 수강해보세요!")
+    
+    st.caption("퀴즈 대회는 회차당 참여자 이름별로 처음 제출한 답안만 인정됩니다.")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.write("**🏅 실시간 리더보드**")
+    leaderboard = quiz_engine.leaderboard()
+    if leaderboard:
+        for rank, entry in enumerate(leaderboard, 1):
+            st.write(f"{rank}. {entry['name']} — {entry['score']}/{quiz_plan_size}점 ({entry['elapsed']:.0f}초)")
+    else:
+        st.info("아직 제출한 참여자가 없습니다.")
+
+with col2:
+    quiz_stats = quiz_engine.stats()
+    st.metric(label="퀴즈 참여자", value=f"{quiz_stats['participants']:,}명")
+    st.metric(label="퀴즈 평균 점수", value=f"{quiz_stats['avg_score']}/{quiz_plan_size}점")
+    st.metric(label="만점자", value=f"{quiz_stats['perfect']:,}명")
+
+st.markdown("---")
+
+section("리워드 시스템")
+# 리워드 시스템
+st.subheader("🎁 리워드 시스템")
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    st.metric(
+        label="퀴즈 완주",
+        value="기본 리워드",
+        delta="100포인트"
+    )
+
+with col2:
+    st.metric(
+        label="80점 이상",
+        value="우수 리워드",
+        delta="200포인트"
+    )
+
+with col3:
+    st.metric(
+        label="만점 달성",
+        value="완벽 리워드",
+        delta="500포인트"
+    )
+
+st.markdown("---")
+
+section("데이터 관리")
+# 데이터 관리
+st.subheader("🔄 데이터 관리")
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    if ALLOW_RESET and st.button("📊 데이터 초기화", width='stretch'):
+        store.seed("esg_education", generate_campaign("esg_education"), replace=True)
+        st.success("샘플 데이터로 초기화되었습니다!")
+        st.rerun()
+
+with col2:
+    if st.button("📈 통계 새로고침", width='stretch'):
+        st.info("통계 데이터를 새로고침했습니다!")
+
+with col3:
+    if st.button("📋 교육 리포트", width='stretch'):
+        st.info("ESG 교육 리포트를 생성했습니다!")
@@ -0,0 +1,284 @@
+# 투명한 ESG 성과 공개 플랫폼 페이지
+
+import streamlit as st
+import plotly.express as px
+import numpy as np
+
+from esg import figures
+from esg.datagen import ALLOW_RESET, generate_campaign
+from esg.profiling import section
+from esg.resources import get_event_store
+
+store = get_event_store()
+
+st.title("📊 투명한 ESG 성과 공개 플랫폼")
+st.write("부서별 ESG 지표(전력 절감, 자원 절약, 봉사 참여 등)를 사내 대시보드로 시각화하여 투명한 성과 공개를 실현합니다.")
+
+# ESG 성과 공개 플랫폼 정보
+esg_platform_info = {
+    "name": "투명한 ESG 성과 공개 플랫폼",
+    "description": "부서별 ESG 지표를 사내 대시보드로 시각화",
+    "schedule": "월간 성과 공개, 분기별 종합 평가",
+    "goal": "목표 달성률, 참여 팀 비율 향상"
+}
+
+esg_platform_version, esg_platform_data = store.versioned_snapshot("esg_platform")
+
+st.markdown("---")
+
+section("ESG 성과 공개 플랫폼 정보")
+# ESG 성과 공개 플랫폼 정보 카드
+st.subheader("📋 ESG 성과 공개 플랫폼 정보")
+col1, col2 = st.columns(2)
+
+with col1:
+    st.info(f"""
+    **📅 일정**: {esg_platform_info['schedule']}
+    
+    **🎯 목표**: {esg_platform_info['goal']}
+    
+    **📝 설명**: {esg_platform_info['description']}
+    """)
+
+with col2:
+    st.success(f"""
+    **📊 투명성**: 부서별 성과 공개로 투명성 확보
+    
+    **🏆 경쟁성**: 부서 간 경쟁을 통한 성과 향상
+    
+    **📈 지속성**: 지속적인 ESG 경영 실현
+    """)
+
+st.markdown("---")
+
+section("전체 통계")
+# 전체 통계
+st.subheader("📊 전체 통계")
+
+col1, col2, col3, col4 = st.columns(4)
+
+with col1:
+    st.metric(
+        label="평균 목표 달성률",
+        value=f"{esg_platform_data['avg_target_achievement']}%",
+        delta=f"+{np.random.randint(2, 5)}%"
+    )
+
+with col2:
+    st.metric(
+        label="평균 참여율",
+        value=f"{esg_platform_data['avg_participation_rate']}%",
+        delta=f"+{np.random.randint(3, 7)}%"
+    )
+
+with col3:
+    st.metric(
+        label="참여 부서",
+        value=f"{esg_platform_data['participating_teams']}개",
+        delta=f"+{np.random.randint(0, 2)}개"
+    )
+
+with col4:
+    st.metric(
+        label="총 전력 절감",
+        value=f"{esg_platform_data['total_power_saving']}%",
+        delta=f"+{np.random.randint(3, 8)}%"
+    )
+
+st.markdown("---")
+
+section("부서별 ESG 성과 대시보드")
+# 부서별 ESG 성과 대시보드
+st.subheader("🏢 부서별 ESG 성과 대시보드")
+
+# 부서별 카드 레이아웃 (2열)
+dept_names = list(esg_platform_data['departments'].keys())
+
+for i in range(0, len(dept_names), 2):
+    cols = st.columns(2)
+    for j in range(2):
+        if i + j < len(dept_names):
+            dept_key = dept_names[i + j]
+            dept_info = esg_platform_data['departments'][dept_key]
+            
+            with cols[j]:
+                st.markdown(f"""
+                <div style="
+                    border: 2px solid {dept_info['color']};
+                    border-radius: 10px;
+                    padding: 20px;
+                    text-align: center;
+                    background-color: #f8f9fa;
+                    margin-bottom: 10px;
+                ">
+                    <h3 style="margin: 0; color: {dept_info['color']};">{dept_info['icon']}</h3>
+                    <h4 style="margin: 10px 0; color: #333;">{dept_info['name']}</h4>
+                    <p style="margin: 5px 0; font-size: 14px; font-weight: bold; color: {dept_info['color']};">
+                        목표달성: {dept_info['target_achievement']}%
+                    </p>
+                    <p style="margin: 5px 0; font-size: 12px; color: #007bff;">
+                        전력절감: {dept_info['power_saving']}%
+                    </p>
+                    <p style="margin: 5px 0; font-size: 12px; color: #28a745;">
+                        자원절약: {dept_info['resource_saving']}%
+                    </p>
+                    <p style="margin: 5px 0; font-size: 12px; color: #6c757d;">
+                        봉사참여: {dept_info['volunteer_participation']}명
+                    </p>
+                    <p style="margin: 5px 0; font-size: 12px; color: #6c757d;">
+                        참여율: {dept_info['participation_rate']}%
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
+
+st.markdown("---")
+
+section("부서별 목표 달성률")
+# 부서별 목표 달성률 차트
+st.subheader("🎯 부서별 목표 달성률")
+
+dept_names = list(esg_platform_data['departments'].keys())
+target_achievements = [dept['target_achievement'] for dept in esg_platform_data['departments'].values()]
+colors = [dept['color'] for dept in esg_platform_data['departments'].values()]
+
+fig_target = figures.get("esg_platform", "target", esg_platform_version)
+if fig_target is None:
+    fig_target = px.bar(
+        x=dept_names,
+        y=target_achievements,
+        title='부서별 목표 달성률',
+        labels={'x': '부서', 'y': '목표 달성률 (%)'},
+        color=dept_names,
+        color_discrete_sequence=colors
+    )
+    fig_target.update_layout(
+        xaxis_title="부서",
+        yaxis_title="목표 달성률 (%)"
+    )
+    figures.put("esg_platform", "target", esg_platform_version, fig_target)
+st.plotly_chart(fig_target, use_container_width=True)
+
+st.markdown("---")
+
+section("부서별 참여율")
+# 부서별 참여율 차트
+st.subheader("👥 부서별 참여율")
+
+participation_rates = [dept['participation_rate'] for dept in esg_platform_data['departments'].values()]
+
+fig_participation = figures.get("esg_platform", "participation", esg_platform_version)
+if fig_participation is None:
+    fig_participation = px.bar(
+        x=dept_names,
+        y=participation_rates,
+        title='부서별 참여율',
+        labels={'x': '부서', 'y': '참여율 (%)'},
+        color=dept_names,
+        color_discrete_sequence=colors
+    )
+    fig_participation.update_layout(
+        xaxis_title="부서",
+        yaxis_title="참여율 (%)"
+    )
+    figures.put("esg_platform", "participation", esg_platform_version, fig_participation)
+st.plotly_chart(fig_participation, use_container_width=True)
+
+st.markdown("---")
+
+section("ESG 지표별 성과")
+# ESG 지표별 성과
+st.subheader("📈 ESG 지표별 성과")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    power_savings = [dept['power_saving'] for dept in esg_platform_data['departments'].values()]
+    
+    fig_power = figures.get("esg_platform", "power", esg_platform_version)
+    if fig_power is None:
+        fig_power = px.bar(
+            x=dept_names,
+            y=power_savings,
+            title='부서별 전력 절감률',
+            labels={'x': '부서', 'y': '전력 절감률 (%)'},
+            color=dept_names,
+            color_discrete_sequence=colors
+        )
+        fig_power.update_layout(xaxis_title="부서", yaxis_title="전력 절감률 (%)")
+        figures.put("esg_platform", "power", esg_platform_version, fig_power)
+    st.plotly_chart(fig_power, use_container_width=True)
+
+with col2:
+    resource_savings = [dept['resource_saving'] for dept in esg_platform_data['departments'].values()]
+    
+    fig_resource = figures.get("esg_platform", "resource", esg_platform_version)
+    if fig_resource is None:
+        fig_resource = px.bar(
+            x=dept_names,
+            y=resource_savings,
+            title='부서별 자원 절약률',
+            labels={'x': '부서', 'y': '자원 절약률 (%)'},
+            color=dept_names,
+            color_discrete_sequence=colors
+        )
+        fig_resource.update_layout(xaxis_title="부서", yaxis_title="자원 절약률 (%)")
+        figures.put("esg_platform", "resource", esg_platform_version, fig_resource)
+    st.plotly_chart(fig_resource, use_container_width=True)
+
+st.markdown("---")
+
+section("부서별 ESG 성과 랭킹")
+# 랭킹 시스템
+st.subheader("🏆 부서별 ESG 성과 랭킹")
+
+# 종합 점수 계산 (목표달성률 40% + 참여율 30% + 전력절감 20% + 자원절약 10%)
+rankings = []
+for dept_key, dept_info in esg_platform_data['departments'].items():
+    total_score = (
+        dept_info['target_achievement'] * 0.4 +
+        dept_info['participation_rate'] * 0.3 +
+        dept_info['power_saving'] * 0.2 +
+        dept_info['resource_saving'] * 0.1
+    )
+    rankings.append({
+        'department': dept_info['name'],
+        'icon': dept_info['icon'],
+        'color': dept_info['color'],
+        'score': round(total_score, 1)
+    })
+
+# 점수순으로 정렬
+rankings.sort(key=lambda x: x['score'], reverse=True)
+
+# 랭킹 표시
+for i, rank in enumerate(rankings, 1):
+    medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}위"
+    
+    col1, col2, col3 = st.columns([1, 3, 1])
+    with col1:
+        st.markdown(f"<h3 style='text-align: center; color: {rank['color']};'>{medal}</h3>", unsafe_allow_html=True)
+    with col2:
+        st.markdown(f"<h4 style='text-align: center; color: #333;'>{rank['icon']} {rank['department']}</h4>", unsafe_allow_html=True)
+    with col3:
+        st.markdown(f"<h3 style='text-align: center; color: {rank['color']};'>{rank['score']}점</h3>", unsafe_allow_html=True)
+
+st.markdown("---")
+
+section("데이터 관리")
+# 데이터 관리
+st.subheader("🔄 데이터 관리")
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    if ALLOW_RESET and st.button("📊 데이터 초기화", width='stretch'):
+        store.seed("esg_platform", generate_campaign("esg_platform"), replace=True)
+        st.success("샘플 데이터로 초기화되었습니다!")
+        st.rerun()
+
+with col2:
+    if st.button("📈 통계 새로고침", width='stretch'):
+        st.info("통계 데이터를 새로고침했습니다!")
+
+with col3:
+    if st.button("📋 성과 리포트", width='stretch'):
+        st.info("ESG 성과 리포트를 생성했습니다!")
@@ -0,0 +1,382 @@
+# 사무실 미니 플리마켓 페이지
+
+import uuid
+from html import escape
+
+import streamlit as st
+import plotly.express as px
+import numpy as np
+
+from esg import figures
+from esg.catalog import CATEGORIES
+from esg.datagen import ALLOW_RESET, generate_campaign
+from esg.profiling import section, timed_fragment
+from esg.resources import get_event_store, get_image_store, get_item_catalog, get_item_search
+
+store = get_event_store()
+catalog = get_item_catalog()
+images = get_image_store()
+search = get_item_search()
+
+st.title("🛍️ 사무실 미니 플리마켓")
+st.write("직원 간 중고 물품·책 교환·판매행사를 통해 자원 재활용과 사회적 가치를 창출합니다.")
+
+# 미니 플리마켓 정보
+flea_market_info = {
+    "name": "사무실 미니 플리마켓",
+    "description": "직원 간 중고 물품·책 교환·판매행사 개최",
+    "schedule": "매월 둘째 주 금요일 (14:00~17:00)",
+    "goal": "재활용 물품 개수 증가, 모금액을 통한 기부 연결"
+}
+
+flea_market_version, flea_market_data = store.versioned_snapshot("flea_market")
+
+st.markdown("---")
+
+section("미니 플리마켓 정보")
+# 미니 플리마켓 정보 카드
+st.subheader("📋 미니 플리마켓 정보")
+col1, col2 = st.columns(2)
+
+with col1:
+    st.info(f"""
+    **📅 일정**: {flea_market_info['schedule']}
+    
+    **🎯 목표**: {flea_market_info['goal']}
+    
+    **📝 설명**: {flea_market_info['description']}
+    """)
+
+with col2:
+    st.success(f"""
+    **♻️ 환경효과**: 중고 물품 재활용으로 자원 절약
+    
+    **🤝 사회효과**: 직원 간 소통과 나눔 문화 조성
+    
+    **💰 경제효과**: 모금액을 통한 사회적 기여
+    """)
+
+st.markdown("---")
+
+# 물품 카드 공통 스타일 (카드마다 인라인 스타일을 반복하지 않도록 한 번만 전송)
+CARD_STYLE = """
+<style>
+    .flea-card {
+        border: 2px solid #e0e0e0;
+        border-radius: 10px;
+        padding: 15px;
+        text-align: center;
+        background-color: #f8f9fa;
+        margin-bottom: 10px;
+    }
+    .flea-card img, .flea-card .photo { width: 100%; height: 150px; object-fit: cover; border-radius: 8px; margin-bottom: 10px; }
+    .flea-card .photo { display: flex; align-items: center; justify-content: center; font-size: 64px; background-color: #e9ecef; }
+    .flea-card h4 { margin: 10px 0; color: #333; }
+    .flea-card p { margin: 5px 0; font-size: 12px; color: #6c757d; }
+    .flea-card p.price { font-size: 16px; font-weight: bold; color: #28a745; }
+</style>
+"""
+
+# 구매는 버튼 콜백에서 처리되어, 조각이 다시 그려질 때 바로 반영됨
+def purchase_item(item_id):
+    # 구매 처리 (물품 상태와 집계를 한 트랜잭션에서 갱신). 구매 토큰은 세션·물품마다 하나라
+    # 같은 버튼을 여러 번 눌러도 한 번만 집계됨
+    buyer = st.session_state.setdefault("flea_market_buyer", uuid.uuid4().hex)
+    item = catalog.purchase(item_id, token=f"{buyer}:{item_id}")
+    if item is None:
+        st.session_state.flea_market_message = "이미 판매된 물품입니다."
+    else:
+        st.session_state.flea_market_message = f"{item['name']} 구매 완료! 기부금 {item['donation_amount']:,}원이 추가되었습니다! 🎉"
+
+# 물품 목록 페이지 이동: 지나온 페이지의 시작 커서(마지막 물품 번호, 검색 중이면 결과 순번)를 쌓아 둠
+def reset_pages():
+    st.session_state.flea_market_cursors = [0]
+
+def next_page(cursor):
+    st.session_state.flea_market_cursors.append(cursor)
+
+def previous_page():
+    st.session_state.flea_market_cursors.pop()
+
+# 전체 통계, 물품 등록, 물품 목록은 조각(fragment)으로 분리: 구매·등록 시 이 부분만 다시 그림
+@timed_fragment
+def market_board():
+    flea_market_data = store.snapshot("flea_market")
+
+    # 콜백에서 남긴 완료 메시지 표시
+    if "flea_market_message" in st.session_state:
+        st.toast(st.session_state.pop("flea_market_message"))
+
+    # 전체 통계 자리 (물품 등록을 처리한 뒤 최신 데이터로 채움)
+    stats = st.container()
+
+    st.markdown("---")
+
+    section("새 물품 등록")
+    # 물품 등록 섹션
+    st.subheader("🛒 새 물품 등록")
+
+    with st.form("item_registration"):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            item_name = st.text_input("물품명", placeholder="예: MacBook Pro")
+            category = st.selectbox("카테고리", CATEGORIES)
+            price = st.number_input("가격 (원)", min_value=0, value=0, step=1000)
+
+        with col2:
+            seller_name = st.text_input("판매자명", placeholder="예: 홍길동")
+            description = st.text_area("물품 설명", placeholder="물품 상태, 특징 등을 입력하세요")
+            donation_rate = st.slider("기부 비율 (%)", 0, 100, 10)
+
+        photo = st.file_uploader("물품 사진 (선택)", type=["jpg", "jpeg", "png", "webp"])
+
+        submitted = st.form_submit_button("물품 등록")
+        if submitted:
+            if item_name and seller_name and price > 0:
+                try:
+                    # 사진은 썸네일로 한 번만 만들어 로컬 저장소에 두고, 카드는 그 주소만 참조
+                    image_url = images.put(photo.getvalue()) if photo is not None else ""
+                except ValueError as e:
+                    st.error(str(e))
+                else:
+                    new_item = {
+                        "name": item_name,
+                        "category": category,
+                        "price": price,
+                        "seller": seller_name,
+                        "description": description,
+                        "image": "📦",  # 기본 아이콘
+                        "image_url": image_url,  # 사진이 없으면 아이콘으로 표시
+                        "donation_amount": int(price * donation_rate / 100)
+                    }
+                    catalog.add(new_item)
+                    st.success(f"{item_name}이(가) 성공적으로 등록되었습니다! 🛍️")
+                    flea_market_data = store.snapshot("flea_market")
+            else:
+                st.error("모든 필수 항목을 입력해주세요!")
+
+    st.markdown("---")
+
+    section("등록된 물품 목록")
+    # 물품 목록
+    st.subheader("🛍️ 등록된 물품 목록")
+
+    # 검색어와 카테고리 필터 (판매중인 물품이 있는 카테고리만)
+    category_stats = flea_market_data['categories']
+    categories = ["전체"] + [name for name, stats in category_stats.items() if stats['count'] > 0]
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        query = st.text_input("물품 검색", placeholder="예: 무선 헤드폰, 자전거", on_change=reset_pages).strip()
+    with col2:
+        selected_category = st.selectbox("카테고리 필터", categories, on_change=reset_pages)
+    category = None if selected_category == "전체" else selected_category
+
+    # 현재 페이지의 물품만 조회 (검색어가 있으면 n-gram 색인 순위, 없으면 카테고리·상태 인덱스와 물품 번호 커서)
+    if "flea_market_cursors" not in st.session_state:
+        reset_pages()
+    cursors = st.session_state.flea_market_cursors
+    if query:
+        filtered_items, next_cursor = search.search(query, category=category, after=cursors[-1])
+    else:
+        filtered_items, next_cursor = catalog.page(category=category, after=cursors[-1])
+    listed = flea_market_data['total_items'] if category is None else category_stats[category]['count']
+
+    if query and not filtered_items:
+        st.info(f"'{query}' 에 해당하는 판매중인 물품이 없습니다.")
+
+    # 물품 카드 표시: 현재 페이지(최대 12개)만 그림. 카드 스타일은 클래스 하나로 공유하고
+    # 사진은 로컬 썸네일만 화면에 보일 때 불러옴 (loading="lazy"), 썸네일이 없으면 물품 아이콘
+    st.markdown(CARD_STYLE, unsafe_allow_html=True)
+    for i in range(0, len(filtered_items), 3):
+        cols = st.columns(3)
+        for j in range(3):
+            if i + j < len(filtered_items):
+                item = filtered_items[i + j]
+                with cols[j]:
+                    if images.has(item['image_url']):
+                        photo = f'<img src="{item["image_url"]}" loading="lazy" decoding="async" alt="">'
+                    else:
+                        photo = f'<div class="photo">{item["image"]}</div>'
+                    st.markdown(f"""<div class="flea-card">
+{photo}
+<h4>{escape(item['name'])}</h4>
+<p class="price">{item['price']:,}원</p>
+<p>{escape(item['category'])} | 판매자: {escape(item['seller'])}</p>
+<p>{escape(item['description'][:30])}...</p>
+</div>""", unsafe_allow_html=True)
+
+                    # 구매 버튼
+                    st.button(f"구매하기", key=f"buy_{item['id']}", use_container_width=True,
+                              on_click=purchase_item, args=(item['id'],))
+
+    # 페이지 이동
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        st.button("◀ 이전", key="flea_market_previous", disabled=len(cursors) == 1,
+                  use_container_width=True, on_click=previous_page)
+    with col2:
+        st.caption(f"{len(cursors)}페이지 · " + (f"'{query}' 검색 결과" if query else f"판매중 {listed:,}개"))
+    with col3:
+        st.button("다음 ▶", key="flea_market_next", disabled=next_cursor is None,
+                  use_container_width=True, on_click=next_page, args=(next_cursor,))
+
+    with stats:
+        section("전체 통계")
+        # 전체 통계
+        st.subheader("📊 전체 통계")
+
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.metric(
+                label="등록된 물품",
+                value=f"{flea_market_data['total_items']}개",
+                delta=f"+{np.random.randint(2, 8)}개"
+            )
+
+        with col2:
+            st.metric(
+                label="총 물품 가치",
+                value=f"{flea_market_data['total_value']:,}원",
+                delta=f"+{np.random.randint(100000, 300000):,}원"
+            )
+
+        with col3:
+            st.metric(
+                label="판매 완료",
+                value=f"{flea_market_data['sold_items']}개",
+                delta=f"+{np.random.randint(1, 4)}개"
+            )
+
+        with col4:
+            st.metric(
+                label="모금액",
+                value=f"{flea_market_data['total_donations']:,}원",
+                delta=f"+{np.random.randint(10000, 30000):,}원"
+            )
+
+
+market_board()
+
+st.markdown("---")
+
+section("카테고리별 통계")
+# 카테고리별 통계
+st.subheader("📊 카테고리별 통계")
+
+# 카테고리별 집계는 등록·구매 시 함께 갱신됨 (판매중인 물품이 있는 카테고리만 표시)
+category_stats = {name: stats for name, stats in flea_market_data['categories'].items() if stats['count'] > 0}
+
+if category_stats:
+    categories = list(category_stats.keys())
+    counts = [category_stats[cat]['count'] for cat in categories]
+    values = [category_stats[cat]['total_value'] for cat in categories]
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig_count = figures.get("flea_market", "count", flea_market_version)
+        if fig_count is None:
+            fig_count = px.bar(
+                x=categories,
+                y=counts,
+                title='카테고리별 물품 수',
+                labels={'x': '카테고리', 'y': '물품 수'},
+                color=counts,
+                color_continuous_scale='Blues'
+            )
+            fig_count.update_layout(xaxis_title="카테고리", yaxis_title="물품 수")
+            figures.put("flea_market", "count", flea_market_version, fig_count)
+        st.plotly_chart(fig_count, use_container_width=True)
+    
+    with col2:
+        fig_value = figures.get("flea_market", "value", flea_market_version)
+        if fig_value is None:
+            fig_value = px.bar(
+                x=categories,
+                y=values,
+                title='카테고리별 총 가치',
+                labels={'x': '카테고리', 'y': '총 가치 (원)'},
+                color=values,
+                color_continuous_scale='Greens'
+            )
+            fig_value.update_layout(xaxis_title="카테고리", yaxis_title="총 가치 (원)")
+            figures.put("flea_market", "value", flea_market_version, fig_value)
+        st.plotly_chart(fig_value, use_container_width=True)
+
+st.markdown("---")
+
+section("기부 현황")
+# 기부 현황
+st.subheader("💝 기부 현황")
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    st.metric(
+        label="총 모금액",
+        value=f"{flea_market_data['total_donations']:,}원",
+        delta=f"+{np.random.randint(10000, 30000):,}원"
+    )
+
+with col2:
+    st.metric(
+        label="참여자 수",
+        value=f"{flea_market_data['participants']}명",
+        delta=f"+{np.random.randint(2, 8)}명"
+    )
+
+with col3:
+    st.metric(
+        label="재활용률",
+        value=f"{flea_market_data['recycling_rate']}%",
+        delta=f"+{np.random.randint(2, 5)}%"
+    )
+
+st.markdown("---")
+
+section("기부 연결 정보")
+# 기부 연결 정보
+st.subheader("🤝 기부 연결 정보")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.info("""
+    **🎯 기부 대상**
+    - 지역 아동센터
+    - 환경보호 단체
+    - 사회적 기업 지원
+    - 재해 구호 기금
+    """)
+
+with col2:
+    st.success("""
+    **📈 기부 효과**
+    - 사회적 가치 창출
+    - ESG 경영 실현
+    - 직원 참여도 향상
+    - 브랜드 이미지 개선
+    """)
+
+st.markdown("---")
+
+section("데이터 관리")
+# 데이터 관리
+st.subheader("🔄 데이터 관리")
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    if ALLOW_RESET and st.button("📊 데이터 초기화", width='stretch'):
+        catalog.seed(generate_campaign("flea_market"), replace=True)
+        st.success("샘플 데이터로 초기화되었습니다!")
+        st.rerun()
+
+with col2:
+    if st.button("📈 통계 새로고침", width='stretch'):
+        st.info("통계 데이터를 새로고침했습니다!")
+
+with col3:
+    if st.button("📋 플리마켓 리포트", width='stretch'):
+        st.info("플리마켓 리포트를 생성했습니다!")
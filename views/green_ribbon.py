@@ -0,0 +1,325 @@
+# 그린리본 인증 캠페인 페이지
+
+import streamlit as st
+import plotly.express as px
+from datetime import datetime
+import numpy as np
+
+from esg import figures
+from esg.datagen import ALLOW_RESET, generate_campaign
+from esg.profiling import section, timed_fragment
+from esg.resources import get_counter_service, get_event_store
+
+store = get_event_store()
+counters = get_counter_service()
+
+st.title("🏆 그린리본 인증 캠페인")
+st.write("사무실 카페·편의공간에서 ESG 제품 이용 시 '인증 스탬프'를 적립하여 친환경 소비를 장려합니다.")
+
+# 그린리본 인증 캠페인 정보
+green_ribbon_info = {
+    "name": "그린리본 인증 캠페인",
+    "description": "사무실 카페·편의공간에서 ESG 제품 이용 시 '인증 스탬프' 적립",
+    "schedule": "상시 운영",
+    "goal": "ESG 제품 구매비율 증가율, 캠페인 참여율 향상"
+}
+
+green_ribbon_version, green_ribbon_data = counters.versioned_view("green_ribbon")
+
+def derive_green_ribbon(data):
+    data['esg_purchase_rate'] = round((data['total_esg_products'] / data['total_purchases']) * 100, 1)
+
+st.markdown("---")
+
+section("그린리본 인증 캠페인 정보")
+# 그린리본 인증 캠페인 정보 카드
+st.subheader("📋 그린리본 인증 캠페인 정보")
+col1, col2 = st.columns(2)
+
+with col1:
+    st.info(f"""
+    **📅 운영**: {green_ribbon_info['schedule']}
+    
+    **🎯 목표**: {green_ribbon_info['goal']}
+    
+    **📝 설명**: {green_ribbon_info['description']}
+    """)
+
+with col2:
+    st.success(f"""
+    **🌱 환경효과**: 친환경 제품 구매 증가
+    
+    **💚 사회효과**: ESG 인식 확산
+    
+    **🎁 혜택효과**: 스탬프 적립으로 리워드 제공
+    """)
+
+st.markdown("---")
+
+# 스탬프 적립은 버튼 콜백에서 처리되어, 조각이 다시 그려질 때 바로 반영됨
+def collect_stamp(cafe_key, cafe_name):
+    additional_stamps = np.random.randint(2, 5)
+    additional_esg = np.random.randint(1, 3)
+    additional_purchases = np.random.randint(2, 4)
+    counters.incr_many("green_ribbon", [
+        (["cafes", cafe_key, "participants"], 1),
+        (["cafes", cafe_key, "stamps_collected"], additional_stamps),
+        (["cafes", cafe_key, "esg_products"], additional_esg),
+        (["cafes", cafe_key, "total_purchases"], additional_purchases),
+        # 전체 통계 업데이트
+        (["total_participants"], 1),
+        (["total_stamps"], additional_stamps),
+        (["total_esg_products"], additional_esg),
+        (["total_purchases"], additional_purchases)
+    ], derive=derive_green_ribbon)
+
+    st.session_state.green_ribbon_message = f"{cafe_name}에서 스탬프 {additional_stamps}개 적립 완료! 🏆"
+
+# 전체 통계와 카페 카드는 조각(fragment)으로 분리: 스탬프 적립 시 이 부분만 다시 그림
+@timed_fragment
+def stamp_board():
+    green_ribbon_data = counters.view("green_ribbon")
+
+    # 콜백에서 남긴 완료 메시지 표시
+    if "green_ribbon_message" in st.session_state:
+        st.toast(st.session_state.pop("green_ribbon_message"))
+
+    section("전체 통계")
+    # 전체 통계
+    st.subheader("📊 전체 통계")
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric(
+            label="총 참여자",
+            value=f"{green_ribbon_data['total_participants']}명",
+            delta=f"+{np.random.randint(5, 12)}명"
+        )
+
+    with col2:
+        st.metric(
+            label="총 스탬프",
+            value=f"{green_ribbon_data['total_stamps']}개",
+            delta=f"+{np.random.randint(15, 30)}개"
+        )
+
+    with col3:
+        st.metric(
+            label="ESG 구매비율",
+            value=f"{green_ribbon_data['esg_purchase_rate']}%",
+            delta=f"+{np.random.randint(2, 5)}%"
+        )
+
+    with col4:
+        st.metric(
+            label="참여율",
+            value=f"{green_ribbon_data['participation_rate']}%",
+            delta=f"+{np.random.randint(3, 8)}%"
+        )
+
+    st.markdown("---")
+
+    # 오늘 날짜 표시
+    today = datetime.now().strftime("%Y년 %m월 %d일")
+    section("그린리본 인증 현황")
+    st.subheader(f"📅 {today} 그린리본 인증 현황")
+
+    # 사옥별 카페 카드 레이아웃
+    cols = st.columns(5)
+
+    for i, (cafe_key, cafe_info) in enumerate(green_ribbon_data['cafes'].items()):
+        with cols[i]:
+            st.markdown(f"""
+            <div style="
+                border: 2px solid #e0e0e0;
+                border-radius: 10px;
+                padding: 20px;
+                text-align: center;
+                background-color: #f8f9fa;
+                margin-bottom: 10px;
+            ">
+                <h3 style="margin: 0; color: #28a745;">{cafe_info['image']}</h3>
+                <h4 style="margin: 10px 0; color: #333;">{cafe_info['name']}</h4>
+                <p style="margin: 5px 0; font-size: 16px; font-weight: bold; color: #28a745;">
+                    참여자: {cafe_info['participants']}명
+                </p>
+                <p style="margin: 5px 0; font-size: 14px; color: #007bff;">
+                    스탬프: {cafe_info['stamps_collected']}개
+                </p>
+                <p style="margin: 5px 0; font-size: 12px; color: #6c757d;">
+                    ESG구매: {cafe_info['esg_products']}건
+                </p>
+                <p style="margin: 5px 0; font-size: 12px; color: #6c757d;">
+                    총구매: {cafe_info['total_purchases']}건
+                </p>
+            </div>
+            """, unsafe_allow_html=True)
+
+            # 스탬프 적립 버튼
+            st.button(f"스탬프 적립", key=f"stamp_{cafe_key}", use_container_width=True,
+                      on_click=collect_stamp, args=(cafe_key, cafe_info['name']))
+
+
+stamp_board()
+
+st.markdown("---")
+
+section("사옥별 스탬프 적립 현황")
+# 사옥별 스탬프 적립 현황 차트
+st.subheader("🏆 사옥별 스탬프 적립 현황")
+
+cafe_names = list(green_ribbon_data['cafes'].keys())
+stamps_collected = [cafe['stamps_collected'] for cafe in green_ribbon_data['cafes'].values()]
+
+fig_stamps = figures.get("green_ribbon", "stamps", green_ribbon_version)
+if fig_stamps is None:
+    fig_stamps = px.bar(
+        x=cafe_names,
+        y=stamps_collected,
+        title='사옥별 스탬프 적립 수',
+        labels={'x': '사옥', 'y': '스탬프 수'},
+        color=stamps_collected,
+        color_continuous_scale='Greens'
+    )
+    fig_stamps.update_layout(
+        xaxis_title="사옥",
+        yaxis_title="스탬프 수"
+    )
+    figures.put("green_ribbon", "stamps", green_ribbon_version, fig_stamps)
+st.plotly_chart(fig_stamps, use_container_width=True)
+
+st.markdown("---")
+
+section("사옥별 ESG 구매비율")
+# 사옥별 ESG 구매비율 차트
+st.subheader("🌱 사옥별 ESG 구매비율")
+
+esg_rates = []
+for cafe in green_ribbon_data['cafes'].values():
+    rate = round((cafe['esg_products'] / cafe['total_purchases']) * 100, 1) if cafe['total_purchases'] > 0 else 0
+    esg_rates.append(rate)
+
+fig_esg = figures.get("green_ribbon", "esg", green_ribbon_version)
+if fig_esg is None:
+    fig_esg = px.bar(
+        x=cafe_names,
+        y=esg_rates,
+        title='사옥별 ESG 제품 구매비율',
+        labels={'x': '사옥', 'y': 'ESG 구매비율 (%)'},
+        color=esg_rates,
+        color_continuous_scale='Blues'
+    )
+    fig_esg.update_layout(
+        xaxis_title="사옥",
+        yaxis_title="ESG 구매비율 (%)"
+    )
+    figures.put("green_ribbon", "esg", green_ribbon_version, fig_esg)
+st.plotly_chart(fig_esg, use_container_width=True)
+
+st.markdown("---")
+
+section("인증 가능한 ESG 제품")
+# ESG 제품 정보
+st.subheader("🌿 인증 가능한 ESG 제품")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.info("""
+    **☕ 카페 제품**
+    - 친환경 컵 사용
+    - 유기농 원두
+    - 재활용 포장재
+    - 지역 농산물 사용
+    """)
+
+with col2:
+    st.success("""
+    **🛒 편의공간 제품**
+    - 친환경 포장재
+    - 유기농 간식
+    - 재활용 용품
+    - 공정무역 제품
+    """)
+
+st.markdown("---")
+
+section("스탬프 적립 규칙")
+# 스탬프 적립 규칙
+st.subheader("📋 스탬프 적립 규칙")
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    st.metric(
+        label="ESG 제품 구매",
+        value="1개당 1스탬프",
+        delta="기본 적립"
+    )
+
+with col2:
+    st.metric(
+        label="친환경 컵 사용",
+        value="1회당 2스탬프",
+        delta="추가 적립"
+    )
+
+with col3:
+    st.metric(
+        label="리워드 교환",
+        value="10스탬프",
+        delta="무료 음료"
+    )
+
+st.markdown("---")
+
+section("환경 효과")
+# 환경 효과
+st.subheader("🌱 환경 효과")
+
+col1, col2, col3 = st.columns(3)
+
+total_esg = green_ribbon_data['total_esg_products']
+
+with col1:
+    st.metric(
+        label="CO2 절약",
+        value=f"{total_esg * 0.5:.1f}kg",
+        delta="월간 절약"
+    )
+
+with col2:
+    st.metric(
+        label="플라스틱 감소",
+        value=f"{total_esg * 0.3:.1f}개",
+        delta="월간 감소"
+    )
+
+with col3:
+    st.metric(
+        label="재활용률",
+        value=f"{np.random.randint(85, 95)}%",
+        delta="월간 재활용"
+    )
+
+st.markdown("---")
+
+section("데이터 관리")
+# 데이터 관리
+st.subheader("🔄 데이터 관리")
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    if ALLOW_RESET and st.button("📊 데이터 초기화", width='stretch'):
+        counters.seed("green_ribbon", generate_campaign("green_ribbon"), replace=True)
+        st.success("샘플 데이터로 초기화되었습니다!")
+        st.rerun()
+
+with col2:
+    if st.button("📈 통계 새로고침", width='stretch'):
+        st.info("통계 데이터를 새로고침했습니다!")
+
+with col3:
+    if st.button("📋 인증 리포트", width='stretch'):
+        st.info("그린리본 인증 리포트를 생성했습니다!")
@@ -0,0 +1,408 @@
+# 임직원 아이디어 페이지
+
+import streamlit as st
+import plotly.express as px
+import numpy as np
+
+from esg import figures
+from esg.datagen import ALLOW_RESET, generate_campaign
+from esg.ideas import CATEGORIES, DEPARTMENTS, IMPACTS, PERIODS, PRIORITIES, STAGES, hot_score, next_stage
+from esg.profiling import section
+from esg.resources import get_event_store, get_idea_board, get_idea_duplicates, get_idea_likes, get_idea_search
+
+store = get_event_store()
+board = get_idea_board()
+search = get_idea_search()
+duplicates = get_idea_duplicates()
+likes = get_idea_likes()
+
+st.title("💡 임직원 아이디어")
+st.write("삼성SDS 임직원들의 혁신적인 ESG 아이디어를 수집하고 단계별로 관리합니다.")
+
+# 아이디어 Workflow 정보
+workflow_info = {
+    "name": "ESG 아이디어 공모전",
+    "description": "임직원들의 혁신적인 ESG 아이디어 수집 및 단계별 관리",
+    "schedule": "분기별 공모전 개최",
+    "goal": "아이디어 구현률 20% 달성, 혁신 문화 조성"
+}
+
+# 단계 이동은 버튼 콜백에서 처리되어, 이번 실행의 통계·차트에 바로 반영됨
+def advance_idea(idea_id, stage):
+    target = board.advance(idea_id, stage)
+    if target is None:
+        st.session_state.idea_message = "이미 다른 단계로 이동한 아이디어입니다."
+    else:
+        st.session_state.idea_message = f"#{idea_id} 아이디어를 {target} 단계로 옮겼습니다."
+
+# 좋아요는 모아서 주기적으로 기록되고, 기록 전까지는 대기 중인 수를 더해 보여줌 (세션당 아이디어별 1회)
+def like_idea(idea_id):
+    likes.like(idea_id)
+    st.session_state.liked_ideas.add(idea_id)
+
+def comment_idea(idea_id):
+    body = st.session_state[f"comment_{idea_id}"].strip()
+    st.session_state[f"comment_{idea_id}"] = ""
+    if not body:
+        st.session_state.idea_message = "댓글 내용을 입력해주세요."
+    elif board.comment(idea_id, st.session_state.get("comment_author") or "익명", body) is None:
+        st.session_state.idea_message = "삭제된 아이디어입니다."
+    else:
+        st.session_state.idea_message = f"#{idea_id} 아이디어에 댓글을 남겼습니다."
+
+# 아이디어 목록 페이지 이동: 지나온 페이지의 시작 커서(검색 중이면 결과 순번)를 쌓아 둠
+def reset_idea_pages():
+    st.session_state.idea_cursors = [None]
+
+def next_idea_page(cursor):
+    st.session_state.idea_cursors.append(cursor)
+
+def previous_idea_page():
+    st.session_state.idea_cursors.pop()
+
+if "liked_ideas" not in st.session_state:
+    st.session_state.liked_ideas = set()
+liked = st.session_state.liked_ideas
+pending_likes = likes.pending()
+
+if "idea_message" in st.session_state:
+    st.toast(st.session_state.pop("idea_message"))
+
+idea_version, idea_data = store.versioned_snapshot("idea")
+
+st.markdown("---")
+
+section("아이디어 공모전 정보")
+# 아이디어 공모전 정보 카드
+st.subheader("📋 아이디어 공모전 정보")
+col1, col2 = st.columns(2)
+
+with col1:
+    st.info(f"""
+    **📅 일정**: {workflow_info['schedule']}
+    
+    **🎯 목표**: {workflow_info['goal']}
+    
+    **📝 설명**: {workflow_info['description']}
+    """)
+
+with col2:
+    st.success(f"""
+    **💡 혁신효과**: 임직원 창의성 발휘
+    
+    **🌱 ESG효과**: 지속가능한 경영 실현
+    
+    **🤝 협업효과**: 부서 간 소통 강화
+    """)
+
+st.markdown("---")
+
+section("전체 통계")
+# 전체 통계
+st.subheader("📊 전체 통계")
+
+col1, col2, col3, col4 = st.columns(4)
+
+with col1:
+    st.metric(
+        label="총 아이디어",
+        value=f"{idea_data['total_ideas']}건",
+        delta=f"+{np.random.randint(3, 8)}건"
+    )
+
+with col2:
+    st.metric(
+        label="구현 완료",
+        value=f"{idea_data['implemented_ideas']}건",
+        delta=f"+{np.random.randint(1, 3)}건"
+    )
+
+with col3:
+    st.metric(
+        label="구현률",
+        value=f"{idea_data['implementation_rate']}%",
+        delta=f"+{np.random.randint(1, 3)}%"
+    )
+
+with col4:
+    st.metric(
+        label="진행중",
+        value=f"{idea_data['workflow_stages']['구현']['count']}건",
+        delta=f"+{np.random.randint(1, 2)}건"
+    )
+
+st.markdown("---")
+
+section("아이디어 Workflow 진행현황")
+# Workflow 간반차트
+st.subheader("🔄 아이디어 Workflow 진행현황")
+
+# 간반차트 데이터 준비
+stages = list(idea_data['workflow_stages'].keys())
+counts = [idea_data['workflow_stages'][stage]['count'] for stage in stages]
+colors = [idea_data['workflow_stages'][stage]['color'] for stage in stages]
+
+# 간반차트 생성
+fig_workflow = figures.get("idea", "workflow", idea_version)
+if fig_workflow is None:
+    fig_workflow = px.funnel(
+        x=counts,
+        y=stages,
+        title='아이디어 Workflow 단계별 진행현황',
+        color=stages,
+        color_discrete_sequence=colors,
+        orientation='h'
+    )
+
+    fig_workflow.update_layout(
+        height=400,
+        xaxis_title="아이디어 수",
+        yaxis_title="Workflow 단계",
+        showlegend=False
+    )
+
+    figures.put("idea", "workflow", idea_version, fig_workflow)
+st.plotly_chart(fig_workflow, use_container_width=True)
+
+st.markdown("---")
+
+section("단계별 상세 현황")
+# 단계별 상세 정보
+st.subheader("📈 단계별 상세 현황")
+
+# 3열 레이아웃으로 단계별 카드 표시
+cols = st.columns(3)
+
+for i, (stage_name, stage_info) in enumerate(idea_data['workflow_stages'].items()):
+    col_idx = i % 3
+    with cols[col_idx]:
+        st.markdown(f"""
+        <div style="
+            border: 2px solid {stage_info['color']};
+            border-radius: 10px;
+            padding: 20px;
+            text-align: center;
+            background-color: #f8f9fa;
+            margin-bottom: 10px;
+        ">
+            <h3 style="margin: 0; color: {stage_info['color']};">{stage_info['icon']}</h3>
+            <h4 style="margin: 10px 0; color: #333;">{stage_name}</h4>
+            <p style="margin: 5px 0; font-size: 24px; font-weight: bold; color: {stage_info['color']};">
+                {stage_info['count']}건
+            </p>
+            <p style="margin: 5px 0; font-size: 12px; color: #6c757d;">
+                {stage_info['description']}
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+st.markdown("---")
+
+section("카테고리별 아이디어 현황")
+# 카테고리별 통계
+st.subheader("📊 카테고리별 아이디어 현황")
+
+categories = list(idea_data['category_stats'].keys())
+total_counts = [idea_data['category_stats'][cat]['total'] for cat in categories]
+implemented_counts = [idea_data['category_stats'][cat]['implemented'] for cat in categories]
+
+col1, col2 = st.columns(2)
+
+with col1:
+    fig_total = figures.get("idea", "total", idea_version)
+    if fig_total is None:
+        fig_total = px.bar(
+            x=categories,
+            y=total_counts,
+            title='카테고리별 총 아이디어 수',
+            labels={'x': '카테고리', 'y': '아이디어 수'},
+            color=total_counts,
+            color_continuous_scale='Blues'
+        )
+        fig_total.update_layout(xaxis_title="카테고리", yaxis_title="총 아이디어 수")
+        figures.put("idea", "total", idea_version, fig_total)
+    st.plotly_chart(fig_total, use_container_width=True)
+
+with col2:
+    fig_implemented = figures.get("idea", "implemented", idea_version)
+    if fig_implemented is None:
+        fig_implemented = px.bar(
+            x=categories,
+            y=implemented_counts,
+            title='카테고리별 구현된 아이디어 수',
+            labels={'x': '카테고리', 'y': '구현된 아이디어 수'},
+            color=implemented_counts,
+            color_continuous_scale='Greens'
+        )
+        fig_implemented.update_layout(xaxis_title="카테고리", yaxis_title="구현된 아이디어 수")
+        figures.put("idea", "implemented", idea_version, fig_implemented)
+    st.plotly_chart(fig_implemented, use_container_width=True)
+
+st.markdown("---")
+
+section("새 아이디어 제안")
+# 아이디어 제안 섹션
+st.subheader("💡 새 아이디어 제안")
+
+with st.form("idea_submission"):
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        idea_title = st.text_input("아이디어 제목", placeholder="예: 스마트 조명 시스템 도입")
+        idea_category = st.selectbox("카테고리", CATEGORIES)
+        idea_department = st.selectbox("제안 부서", DEPARTMENTS)
+        idea_author = st.text_input("제안자", placeholder="예: 홍길동 (생략 시 익명)")
+    
+    with col2:
+        idea_priority = st.selectbox("우선순위", PRIORITIES)
+        expected_impact = st.selectbox("예상 효과", IMPACTS)
+        implementation_period = st.selectbox("구현 기간", PERIODS)
+    
+    idea_description = st.text_area("아이디어 상세 설명", placeholder="아이디어의 배경, 목적, 구체적인 방안 등을 자세히 설명해주세요.", height=100)
+    
+    allow_duplicate = st.checkbox("비슷한 아이디어가 있어도 제안합니다")
+
+    submitted = st.form_submit_button("아이디어 제안")
+    if submitted:
+        # 제목이 비슷한 기존 아이디어 확인 (MinHash/LSH 색인, 전체 아이디어와 하나씩 비교하지 않음)
+        similar = duplicates.similar(idea_title) if idea_title and not allow_duplicate else []
+        if similar:
+            st.warning("제목이 비슷한 아이디어가 이미 있습니다. 기존 아이디어를 확인하고, 다른 아이디어라면 "
+                       "'비슷한 아이디어가 있어도 제안합니다' 를 선택한 뒤 다시 제안해주세요.")
+            for idea in board.get_many([idea_id for idea_id, _ in similar]):
+                score = dict(similar)[idea['id']]
+                st.markdown(f"- **#{idea['id']} {idea['title']}** · {idea['stage']} · {idea['department']} (유사도 {score:.0%})")
+        elif idea_title and idea_description:
+            idea_id = board.submit({
+                "title": idea_title,
+                "description": idea_description,
+                "category": idea_category,
+                "department": idea_department,
+                "priority": idea_priority,
+                "impact": expected_impact,
+                "period": implementation_period,
+                "author": idea_author or "익명",
+            })
+            # 위쪽 통계·차트도 새 건수로 그리도록 다시 실행
+            st.session_state.idea_message = f"'{idea_title}' 아이디어가 #{idea_id}로 제안되었습니다! 🎉 검토 단계에서 전문가 평가를 받게 됩니다."
+            st.rerun()
+        else:
+            st.error("제목과 설명을 모두 입력해주세요!")
+
+st.markdown("---")
+
+section("아이디어 Workflow 관리")
+# 아이디어 목록과 단계 이동 (검색어가 있으면 n-gram 색인 관련도 순, 없으면 최신순)
+st.subheader("🗂️ 아이디어 Workflow 관리")
+
+col1, col2, col3 = st.columns([2, 1, 1])
+with col1:
+    query = st.text_input("아이디어 검색", placeholder="예: 조명, 재활용", on_change=reset_idea_pages).strip()
+with col2:
+    selected_stage = st.selectbox("단계 필터", ["전체"] + STAGES, on_change=reset_idea_pages)
+with col3:
+    selected_category = st.selectbox("카테고리 필터", ["전체"] + CATEGORIES, on_change=reset_idea_pages)
+filters = {
+    "stage": None if selected_stage == "전체" else selected_stage,
+    "category": None if selected_category == "전체" else selected_category,
+}
+
+if "idea_cursors" not in st.session_state:
+    reset_idea_pages()
+cursors = st.session_state.idea_cursors
+if query:
+    listed_ideas, next_cursor = search.search(query, after=cursors[-1] or 0, limit=10, **filters)
+else:
+    listed_ideas, next_cursor = board.page(before=cursors[-1], **filters)
+
+if not listed_ideas:
+    st.info("조건에 맞는 아이디어가 없습니다.")
+
+for idea in listed_ideas:
+    col1, col2, col3 = st.columns([4, 1, 1])
+    with col1:
+        st.markdown(
+            f"**#{idea['id']} {idea['title']}** · {idea['stage']}  \n"
+            f"{idea['category']} · {idea['department']} · 우선순위 {idea['priority']} · 예상 효과 {idea['impact']} · {idea['period']}"
+        )
+    with col2:
+        st.button(f"👍 {idea['likes'] + pending_likes.get(idea['id'], 0)}", key=f"like_list_{idea['id']}", width='stretch',
+                  disabled=idea['id'] in liked, on_click=like_idea, args=(idea['id'],))
+    with col3:
+        target = next_stage(idea['stage'])
+        if target is None:
+            st.caption("🎉 구현 완료")
+        else:
+            st.button(f"{target} 단계로 ▶", key=f"advance_{idea['id']}", width='stretch',
+                      on_click=advance_idea, args=(idea['id'], idea['stage']))
+
+col1, col2, col3 = st.columns([1, 2, 1])
+with col1:
+    st.button("◀ 이전", key="idea_previous", disabled=len(cursors) == 1,
+              width='stretch', on_click=previous_idea_page)
+with col2:
+    st.caption(f"{len(cursors)}페이지 · " + (f"'{query}' 검색 결과" if query else f"전체 {idea_data['total_ideas']:,}건"))
+with col3:
+    st.button("다음 ▶", key="idea_next", disabled=next_cursor is None,
+              width='stretch', on_click=next_idea_page, args=(next_cursor,))
+
+st.markdown("---")
+
+section("인기 아이디어 TOP 5")
+# 인기 아이디어 TOP 5: 좋아요·댓글이 최근일수록 큰 인기 점수 순 (인기 점수 인덱스에서 5건만 읽음)
+st.subheader("🏆 인기 아이디어 TOP 5")
+st.caption("좋아요 1점, 댓글 2점이며 3일마다 절반으로 줄어드는 인기 점수 순입니다.")
+
+st.text_input("댓글 작성자", key="comment_author", placeholder="예: 홍길동 (생략 시 익명)")
+
+for i, idea in enumerate(board.hot(5), 1):
+    like_count = idea['likes'] + pending_likes.get(idea['id'], 0)
+    with st.expander(f"#{i} {idea['title']} (👍 {like_count} · 💬 {idea['comments']} · 🔥 {hot_score(idea['hot']):.1f})"):
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.write(f"**카테고리:** {idea['category']}")
+            st.write(f"**현재 단계:** {idea['stage']}")
+        
+        with col2:
+            st.write(f"**예상 효과:** {idea['impact']}")
+            st.write(f"**좋아요 수:** {like_count}개")
+        
+        with col3:
+            st.write(f"**제안 부서:** {idea['department']}")
+            st.write(f"**제안자:** {idea['author']}")
+        
+        st.write(f"**상세 설명:** {idea['description']}")
+
+        st.button("👍 좋아요", key=f"like_{idea['id']}", disabled=idea['id'] in liked,
+                  on_click=like_idea, args=(idea['id'],))
+        for comment in board.comments(idea['id']):
+            st.caption(f"💬 **{comment['author']}**: {comment['body']}")
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            st.text_input("댓글", key=f"comment_{idea['id']}", placeholder="의견을 남겨주세요", label_visibility="collapsed")
+        with col2:
+            st.button("댓글 등록", key=f"comment_button_{idea['id']}", width='stretch',
+                      on_click=comment_idea, args=(idea['id'],))
+
+st.markdown("---")
+
+section("데이터 관리")
+# 데이터 관리
+st.subheader("🔄 데이터 관리")
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    if ALLOW_RESET and st.button("📊 데이터 초기화", width='stretch'):
+        board.seed(generate_campaign("idea"), replace=True)
+        reset_idea_pages()
+        st.success("샘플 데이터로 초기화되었습니다!")
+        st.rerun()
+
+with col2:
+    if st.button("📈 통계 새로고침", width='stretch'):
+        st.info("통계 데이터를 새로고침했습니다!")
+
+with col3:
+    if st.button("📋 아이디어 리포트", width='stretch'):
+        st.info("아이디어 리포트를 생성했습니다!")
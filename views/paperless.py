@@ -0,0 +1,385 @@
+# 페이퍼리스 데이 페이지
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import numpy as np
+from datetime import date, timedelta
+
+from esg import emissions, figures
+from esg.datagen import ALLOW_RESET, generate_campaign, seed_store
+from esg.profiling import section
+from esg.resources import get_event_store, get_print_logs, get_rollups
+
+store = get_event_store()
+rollups = get_rollups()
+print_logs = get_print_logs()
+
+st.title("📄 페이퍼리스 데이")
+st.write("매주 특정 요일에 종이 없는 업무일을 지정하여 디지털 업무 환경을 구축합니다.")
+
+# 페이퍼리스 데이 정보
+paperless_info = {
+    "name": "페이퍼리스 데이",
+    "description": "매주 수요일을 종이 없는 업무일로 지정하여 전자결재, PDF 회의, 디지털 메모 사용을 장려",
+    "target_day": "매주 수요일",
+    "goal": "인쇄 건수 30% 감소, 종이 구매량 25% 감소"
+}
+
+paperless_version, paperless_data = store.versioned_snapshot("paperless")
+
+# 배출계수는 이력 테이블에서 오늘 적용되는 값을 사용
+factors = emissions.load(store)
+Ep = factors.current("Ep")
+carbon_reduction = emissions.reduction("paperless", paperless_data['N'], factors=factors)
+
+st.markdown("---")
+
+section("페이퍼리스 데이 정보")
+# 페이퍼리스 데이 정보 카드
+st.subheader("📋 페이퍼리스 데이 정보")
+col1, col2 = st.columns(2)
+
+with col1:
+    st.info(f"""
+    **📅 지정 요일**: {paperless_info['target_day']}
+    
+    **🎯 목표**: {paperless_info['goal']}
+    
+    **📝 설명**: {paperless_info['description']}
+    """)
+
+with col2:
+    st.success(f"""
+    **🌱 환경효과**: 종이 사용 감소로 산림 보호
+    
+    **💰 경제효과**: 인쇄 비용 및 종이 구매비 절약
+    
+    **⚡ 효율성**: 디지털 업무 환경 구축
+    """)
+
+st.markdown("---")
+
+section("주간 현황")
+# 주간 현황
+st.subheader("📊 주간 현황")
+
+col1, col2, col3, col4, col5 = st.columns(5)
+
+with col1:
+    st.metric(
+        label="총 인쇄 건수",
+        value=f"{paperless_data['total_prints']}건",
+        delta=f"-{paperless_data['paper_savings']}%"
+    )
+
+with col2:
+    st.metric(
+        label="종이 구매량",
+        value=f"{paperless_data['total_paper_purchase']}L",
+        delta=f"-{paperless_data['paper_savings']-5}%"
+    )
+
+with col3:
+    st.metric(
+        label="디지털 채택률",
+        value=f"{paperless_data['digital_adoption_rate']}%",
+        delta=f"+{np.random.randint(5, 15)}%"
+    )
+
+with col4:
+    st.metric(
+        label="비용 절약",
+        value=f"{paperless_data['cost_savings']}천원",
+        delta=f"+{np.random.randint(50, 100)}천원"
+    )
+
+with col5:
+    st.metric(
+        label="탄소감축량",
+        value=f"{carbon_reduction:.2f}kg",
+        delta="CO₂eq"
+    )
+
+st.markdown("---")
+
+section("요일별 상세 현황")
+# 요일별 상세 현황
+st.subheader("📅 요일별 상세 현황")
+
+# 요일별 데이터 테이블: 최근 1주(주말 제외)의 일별 구간 합계에서 읽음
+today = date.today()
+weekly_df = rollups.days("paperless", ["prints", "paper_purchase", "digital_docs"], today, 7)
+weekly_df = weekly_df[~weekly_df['day'].isin(['토', '일'])].reset_index(drop=True)
+documents = weekly_df['prints'] + weekly_df['digital_docs']
+weekly_df['digital_usage'] = np.round(np.divide(
+    weekly_df['digital_docs'] * 100, documents, out=np.zeros(len(weekly_df)), where=documents.to_numpy() > 0
+)).astype(int)
+weekly_df['is_paperless'] = weekly_df['day'] == '수'
+weekly_df = weekly_df.astype({'prints': int, 'paper_purchase': int})[
+    ['date', 'day', 'prints', 'paper_purchase', 'digital_usage', 'is_paperless']
+]
+
+# 페이퍼리스 데이 강조를 위한 스타일링
+def highlight_paperless(row):
+    if row['is_paperless']:
+        return ['background-color: #d4edda'] * len(row)
+    return [''] * len(row)
+
+styled_df = weekly_df.style.apply(highlight_paperless, axis=1)
+st.dataframe(styled_df, use_container_width=True)
+
+st.markdown("---")
+
+section("요일별 인쇄 건수 비교")
+# 요일별 인쇄 건수 차트
+st.subheader("📈 요일별 인쇄 건수 비교")
+
+fig_prints = figures.get("paperless", "prints", (paperless_version, today))
+if fig_prints is None:
+    fig_prints = px.bar(
+        weekly_df,
+        x='day',
+        y='prints',
+        title='요일별 인쇄 건수 (수요일: 페이퍼리스 데이)',
+        color='is_paperless',
+        color_discrete_map={True: '#28a745', False: '#6c757d'},
+        labels={'prints': '인쇄 건수', 'day': '요일'}
+    )
+    fig_prints.update_layout(
+        xaxis_title="요일",
+        yaxis_title="인쇄 건수"
+    )
+    figures.put("paperless", "prints", (paperless_version, today), fig_prints)
+st.plotly_chart(fig_prints, use_container_width=True)
+
+st.markdown("---")
+
+section("요일별 디지털 사용률")
+# 디지털 사용률 차트
+st.subheader("💻 요일별 디지털 사용률")
+
+fig_digital = figures.get("paperless", "digital", (paperless_version, today))
+if fig_digital is None:
+    fig_digital = px.line(
+        weekly_df,
+        x='day',
+        y='digital_usage',
+        title='요일별 디지털 사용률',
+        markers=True,
+        labels={'digital_usage': '디지털 사용률 (%)', 'day': '요일'},
+        color_discrete_sequence=['#007bff']
+    )
+    fig_digital.update_layout(
+        xaxis_title="요일",
+        yaxis_title="디지털 사용률 (%)",
+        yaxis=dict(range=[0, 100])
+    )
+    figures.put("paperless", "digital", (paperless_version, today), fig_digital)
+st.plotly_chart(fig_digital, use_container_width=True)
+
+st.markdown("---")
+
+if print_logs.count():
+    section("부서별 인쇄 현황")
+    # 인쇄 서버 로그를 적재한 경우: 최근 4주 부서별 하루 평균 인쇄 장수 (주말 제외)
+    st.subheader("🖨️ 부서별 인쇄 현황")
+
+    fig_departments = figures.get("paperless", "departments", (paperless_version, today))
+    if fig_departments is None:
+        department_df = print_logs.daily(today - timedelta(days=27), today)
+        department_df = department_df[pd.to_datetime(department_df['date']).dt.weekday < 5]
+        department_df = department_df.groupby(['department', 'is_paperless'])['sheets'].mean().reset_index()
+        fig_departments = px.bar(
+            department_df,
+            x='department',
+            y='sheets',
+            color='is_paperless',
+            barmode='group',
+            title='부서별 하루 평균 인쇄 장수 (최근 4주, 페이퍼리스 데이 비교)',
+            color_discrete_map={True: '#28a745', False: '#6c757d'},
+            labels={'sheets': '인쇄 장수', 'department': '부서', 'is_paperless': '페이퍼리스 데이'}
+        )
+        figures.put("paperless", "departments", (paperless_version, today), fig_departments)
+    st.plotly_chart(fig_departments, use_container_width=True)
+    st.caption(f"인쇄 서버 로그 {print_logs.count():,}행 기준 · 줄인 종이 N = {paperless_data['N']:,}장")
+
+    st.markdown("---")
+
+section("페이퍼리스 데이 참여 현황")
+# 페이퍼리스 데이 참여 현황
+st.subheader("🎯 페이퍼리스 데이 참여 현황")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.markdown("""
+    <div style="
+        border: 2px solid #28a745;
+        border-radius: 10px;
+        padding: 20px;
+        text-align: center;
+        background-color: #d4edda;
+        margin-bottom: 10px;
+    ">
+        <h3 style="margin: 0; color: #155724;">📄</h3>
+        <h4 style="margin: 10px 0; color: #155724;">페이퍼리스 데이</h4>
+        <p style="margin: 5px 0; font-size: 16px; color: #155724;">
+            참여 부서: {departments}개
+        </p>
+        <p style="margin: 5px 0; font-size: 16px; color: #155724;">
+            참여 직원: {employees}명
+        </p>
+    </div>
+    """.format(
+        departments=np.random.randint(8, 15),
+        employees=np.random.randint(120, 200)
+    ), unsafe_allow_html=True)
+
+with col2:
+    st.markdown("""
+    <div style="
+        border: 2px solid #007bff;
+        border-radius: 10px;
+        padding: 20px;
+        text-align: center;
+        background-color: #cce7ff;
+        margin-bottom: 10px;
+    ">
+        <h3 style="margin: 0; color: #004085;">💻</h3>
+        <h4 style="margin: 10px 0; color: #004085;">디지털 도구 사용</h4>
+        <p style="margin: 5px 0; font-size: 16px; color: #004085;">
+            Knox meeting: {knox_meeting}%
+        </p>
+        <p style="margin: 5px 0; font-size: 16px; color: #004085;">
+            PDF 회의: {pdf_meeting}%
+        </p>
+    </div>
+    """.format(
+        knox_meeting=np.random.randint(85, 95),
+        pdf_meeting=np.random.randint(70, 85)
+    ), unsafe_allow_html=True)
+
+st.markdown("---")
+
+section("탄소감축량 지표 산식")
+# 탄소감축량 지표 산식 설명
+st.subheader("📊 탄소감축량 지표 산식")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.info(f"""
+    **🌱 탄소감축량 계산 공식**
+    
+    ```
+    감축량(kg CO₂eq) = N × Ep
+    ```
+    
+    **📋 변수 정의**
+    - **N**: 줄인 종이 사용 장수 (장)
+    - **Ep**: A4 1장당 배출계수 ({Ep} kg CO₂eq/장)
+    
+    **🎯 계산 기준**
+    - A4 용지 1장당 탄소배출량: {Ep} kg CO₂eq
+    - 국제 탄소 배출 계수 기준 적용
+    - 종이 생산 과정의 탄소발자국 고려
+    """)
+
+with col2:
+    st.success(f"""
+    **📄 예시 계산**
+    
+    연간 10,000장을 절약했다면:
+    
+    ```
+    10,000 × {Ep} = {emissions.reduction("paperless", 10000, factors=factors):.1f} kg CO₂eq
+    ```
+    
+    **🌍 환경 효과**
+    • **산림 보호**: 종이 사용 감소로 나무 보존
+    • **탄소 감축**: 직접적인 CO₂ 배출량 감소
+    • **에너지 절약**: 종이 생산 과정 에너지 절약
+    • **폐기물 감소**: 종이 폐기물 발생량 감소
+    """)
+
+# 실시간 계산 예시
+st.markdown("---")
+section("실시간 계산 예시")
+st.subheader("🧮 실시간 계산 예시")
+
+current_data = paperless_data
+carbon_example = carbon_reduction
+
+st.markdown(f"""
+<div style="
+    border: 2px solid #28a745;
+    border-radius: 10px;
+    padding: 20px;
+    text-align: center;
+    background-color: #d4edda;
+    margin-bottom: 10px;
+">
+    <h3 style="margin: 0; color: #155724;">📈 현재 상황</h3>
+    <p style="margin: 10px 0; font-size: 18px; color: #155724;">
+        <strong>줄인 종이 사용량:</strong> {current_data['N']:,}장
+    </p>
+    <p style="margin: 10px 0; font-size: 18px; color: #155724;">
+        <strong>계산식:</strong> {current_data['N']:,}장 × {Ep}kg CO₂eq/장
+    </p>
+    <p style="margin: 10px 0; font-size: 24px; font-weight: bold; color: #155724;">
+        <strong>= {carbon_example:.2f}kg CO₂eq</strong>
+    </p>
+</div>
+""", unsafe_allow_html=True)
+
+st.markdown("---")
+
+section("환경 효과 및 절약 효과")
+# 환경 효과 및 절약 효과
+st.subheader("🌱 환경 효과 및 절약 효과")
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    st.metric(
+        label="절약된 종이",
+        value=f"{paperless_data['total_paper_purchase'] * 0.3:.1f}L",
+        delta="주간 절약"
+    )
+
+with col2:
+    st.metric(
+        label="CO2 절약",
+        value=f"{paperless_data['total_paper_purchase'] * 0.3 * 0.5:.1f}kg",
+        delta="주간 절약"
+    )
+
+with col3:
+    st.metric(
+        label="나무 보호",
+        value=f"{paperless_data['total_paper_purchase'] * 0.3 * 0.02:.1f}그루",
+        delta="주간 절약"
+    )
+
+st.markdown("---")
+
+section("데이터 관리")
+# 데이터 관리
+st.subheader("🔄 데이터 관리")
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    if ALLOW_RESET and st.button("📊 데이터 초기화", use_container_width=True):
+        print_logs.clear()
+        seed_store(store, {"paperless": generate_campaign("paperless")}, replace=True)
+        st.success("샘플 데이터로 초기화되었습니다!")
+        st.rerun()
+
+with col2:
+    if st.button("📈 통계 새로고침", use_container_width=True):
+        st.info("통계 데이터를 새로고침했습니다!")
+
+with col3:
+    if st.button("📋 상세 리포트", use_container_width=True):
+        st.info("상세 리포트를 생성했습니다!")
@@ -0,0 +1,360 @@
+# 플로깅 데이 페이지
+
+import streamlit as st
+import plotly.express as px
+import numpy as np
+from datetime import date
+
+from esg import figures
+from esg.datagen import ALLOW_RESET, generate_campaign, seed_store
+from esg.profiling import section
+from esg.resources import get_event_store, get_rollups
+
+store = get_event_store()
+rollups = get_rollups()
+
+st.title("🚮 플로깅 데이 (Plogging Day)")
+st.write("점심시간에 사무실 주변 쓰레기 줍기 산책을 통해 환경정화 활동을 실시합니다.")
+
+# 플로깅 데이 정보
+plogging_info = {
+    "name": "플로깅 데이",
+    "description": "점심시간에 사무실 주변 쓰레기 줍기 산책 실시",
+    "schedule": "매주 화요일, 목요일 점심시간 (12:00~13:00)",
+    "goal": "분리 배출 쓰레기 총량 감소, 참여 직원 수 증가"
+}
+
+plogging_version, plogging_data = store.versioned_snapshot("plogging")
+
+st.markdown("---")
+
+section("플로깅 데이 정보")
+# 플로깅 데이 정보 카드
+st.subheader("📋 플로깅 데이 정보")
+col1, col2 = st.columns(2)
+
+with col1:
+    st.info(f"""
+    **📅 일정**: {plogging_info['schedule']}
+    
+    **🎯 목표**: {plogging_info['goal']}
+    
+    **📝 설명**: {plogging_info['description']}
+    """)
+
+with col2:
+    st.success(f"""
+    **🌱 환경효과**: 쓰레기 수거로 지역 환경 정화
+    
+    **🏃 건강효과**: 산책을 통한 건강 증진
+    
+    **🤝 사회효과**: 지역사회 환경 보호 기여
+    """)
+
+st.markdown("---")
+
+section("참여 등록")
+# 참여 등록 섹션
+st.subheader("🎮 참여 등록")
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    st.markdown("""
+    <div style="
+        border: 2px solid #28a745;
+        border-radius: 10px;
+        padding: 20px;
+        text-align: center;
+        background-color: #d4edda;
+        margin-bottom: 10px;
+    ">
+        <h3 style="margin: 0; color: #155724;">🚮</h3>
+        <h4 style="margin: 10px 0; color: #155724;">플로깅 참여</h4>
+        <p style="margin: 5px 0; font-size: 16px; color: #155724;">
+            참여자: {participants}명
+        </p>
+    </div>
+    """.format(participants=plogging_data['total_participants']), unsafe_allow_html=True)
+    
+    if st.button("플로깅 참여", key="plogging_participate", use_container_width=True):
+        store.append("plogging", rollups.recorder("plogging", {"participants": 1}, [("incr", ["total_participants"], 1)]))
+        st.success("플로깅 데이 참여 등록 완료! 🌱")
+        st.rerun()
+
+with col2:
+    st.markdown("""
+    <div style="
+        border: 2px solid #17a2b8;
+        border-radius: 10px;
+        padding: 20px;
+        text-align: center;
+        background-color: #d1ecf1;
+        margin-bottom: 10px;
+    ">
+        <h3 style="margin: 0; color: #0c5460;">♻️</h3>
+        <h4 style="margin: 10px 0; color: #0c5460;">쓰레기 수거</h4>
+        <p style="margin: 5px 0; font-size: 16px; color: #0c5460;">
+            수거량: {waste}kg
+        </p>
+    </div>
+    """.format(waste=plogging_data['total_waste_collected']), unsafe_allow_html=True)
+    
+    if st.button("쓰레기 수거 등록", key="waste_collect", use_container_width=True):
+        additional_waste = np.random.randint(5, 15)
+        store.append("plogging", rollups.recorder(
+            "plogging", {"waste_collected": additional_waste}, [("incr", ["total_waste_collected"], additional_waste)]
+        ))
+        st.success(f"쓰레기 {additional_waste}kg 수거 등록 완료! ♻️")
+        st.rerun()
+
+with col3:
+    st.markdown("""
+    <div style="
+        border: 2px solid #ffc107;
+        border-radius: 10px;
+        padding: 20px;
+        text-align: center;
+        background-color: #fff3cd;
+        margin-bottom: 10px;
+    ">
+        <h3 style="margin: 0; color: #856404;">📊</h3>
+        <h4 style="margin: 10px 0; color: #856404;">참여율</h4>
+        <p style="margin: 5px 0; font-size: 16px; color: #856404;">
+            참여율: {rate}%
+        </p>
+    </div>
+    """.format(rate=plogging_data['participation_rate']), unsafe_allow_html=True)
+    
+    if st.button("통계 새로고침", key="refresh_stats", use_container_width=True):
+        st.info("통계 데이터를 새로고침했습니다!")
+
+st.markdown("---")
+
+section("주간 현황")
+# 주간 현황
+st.subheader("📊 주간 현황")
+
+col1, col2, col3, col4, col5 = st.columns(5)
+
+with col1:
+    st.metric(
+        label="총 참여자",
+        value=f"{plogging_data['total_participants']}명",
+        delta=f"+{np.random.randint(2, 8)}명"
+    )
+
+with col2:
+    st.metric(
+        label="쓰레기 수거량",
+        value=f"{plogging_data['total_waste_collected']}kg",
+        delta=f"+{np.random.randint(5, 15)}kg"
+    )
+
+with col3:
+    st.metric(
+        label="참여율",
+        value=f"{plogging_data['participation_rate']}%",
+        delta=f"+{np.random.randint(3, 8)}%"
+    )
+
+with col4:
+    st.metric(
+        label="환경 점수",
+        value=f"{plogging_data['total_waste_collected'] * 2}점",
+        delta=f"+{np.random.randint(10, 30)}점"
+    )
+
+with col5:
+    st.metric(
+        label="순환율 개선",
+        value=f"{plogging_data['circular_rate_improvement']:.1f}%p",
+        delta="개선"
+    )
+
+st.markdown("---")
+
+section("요일별 참여 현황")
+# 요일별 참여 현황
+st.subheader("📅 요일별 참여 현황")
+
+# 최근 7일의 일별 구간 합계 (화·목 플로깅 데이 강조)
+today = date.today()
+weekly_df = rollups.days("plogging", ["participants", "waste_collected"], today, 7)
+weekly_df['is_plogging_day'] = weekly_df['day'].isin(['화', '목'])
+
+fig_weekly = figures.get("plogging", "weekly", (plogging_version, today))
+if fig_weekly is None:
+    fig_weekly = px.bar(
+        weekly_df,
+        x='day',
+        y='participants',
+        title='요일별 플로깅 참여자 수',
+        color='is_plogging_day',
+        color_discrete_map={True: '#28a745', False: '#6c757d'},
+        labels={'participants': '참여자 수', 'day': '요일'}
+    )
+    fig_weekly.update_layout(
+        xaxis_title="요일",
+        yaxis_title="참여자 수"
+    )
+    figures.put("plogging", "weekly", (plogging_version, today), fig_weekly)
+st.plotly_chart(fig_weekly, use_container_width=True)
+
+st.markdown("---")
+
+section("쓰레기 유형별 수거 현황")
+# 쓰레기 유형별 수거 현황
+st.subheader("♻️ 쓰레기 유형별 수거 현황")
+
+waste_types = ['플라스틱 병', '캔', '종이류', '기타']
+waste_amounts = [
+    plogging_data['plastic_bottles'],
+    plogging_data['cans'],
+    plogging_data['paper_waste'],
+    plogging_data['other_waste']
+]
+
+fig_waste = figures.get("plogging", "waste", plogging_version)
+if fig_waste is None:
+    fig_waste = px.pie(
+        values=waste_amounts,
+        names=waste_types,
+        title='쓰레기 유형별 수거 비율',
+        color_discrete_sequence=['#82ca9d', '#8884d8', '#ffc658', '#ff7300']
+    )
+    fig_waste.update_layout(height=400)
+    figures.put("plogging", "waste", plogging_version, fig_waste)
+st.plotly_chart(fig_waste, use_container_width=True)
+
+st.markdown("---")
+
+section("순환율 개선 지표 산식")
+# 순환율 개선 지표 산식
+st.subheader("📊 순환율 개선 지표 산식")
+col1, col2 = st.columns(2)
+
+with col1:
+    st.info("""
+    **♻️ 기본 순환율 산정식**
+    ```
+    순환율(%) = (R + C) / (W + C) × 100
+    ```
+    **📋 변수 정의**
+    - **R**: 실질 재활용량 (톤 단위)
+    - **C**: 자원순환으로 인정된 물량 (재사용, 에너지회수량 등, 톤)
+    - **W**: 폐기물 총 발생량 (톤 단위)
+    **🎯 계산 기준**
+    - 재활용과 자원순환 인정분을 폐기물 총량과 합산한 분모에 대비해 비율 산출
+    - 플로깅 활동으로 수거된 쓰레기의 재활용 및 자원순환 효과 반영
+    """)
+
+with col2:
+    st.success("""
+    **📈 순환율 개선 계산**
+    ```
+    개선 순환율 = ((R+ΔR) + (C+ΔC)) / (W + C + ΔC) × 100
+    ```
+    **📋 개선 변수**
+    - **ΔR**: 재활용량 증가분 (톤)
+    - **ΔC**: 자원순환량 증가분 (톤)
+    **🎯 개선 정도**
+    ```
+    Δ순환율 = 개선 순환율 - 기존 순환율
+    ```
+    **🌍 환경 효과**
+    • **재활용률 향상**: 쓰레기 수거로 재활용 가능 물질 증가
+    • **자원순환 증대**: 에너지 회수 및 재사용 물량 증가
+    • **폐기물 감소**: 총 발생량 대비 순환 이용률 향상
+    """)
+
+section("실시간 계산 예시")
+st.subheader("🧮 실시간 계산 예시")
+current_data = plogging_data
+original_rate = current_data['original_circular_rate']
+improved_rate = current_data['improved_circular_rate']
+improvement = current_data['circular_rate_improvement']
+
+st.markdown(f"""
+<div style="
+    border: 2px solid #28a745;
+    border-radius: 10px;
+    padding: 20px;
+    text-align: center;
+    background-color: #d4edda;
+    margin-bottom: 10px;
+">
+    <h3 style="margin: 0; color: #155724;">📈 현재 상황</h3>
+    <div style="display: flex; justify-content: space-around; margin: 20px 0;">
+        <div>
+            <p style="margin: 5px 0; font-size: 16px; color: #155724;">
+                <strong>기존 순환율:</strong><br>
+                ({current_data['R']} + {current_data['C']}) / ({current_data['W']} + {current_data['C']}) × 100<br>
+                = <strong>{original_rate:.1f}%</strong>
+            </p>
+        </div>
+        <div>
+            <p style="margin: 5px 0; font-size: 16px; color: #155724;">
+                <strong>개선 순환율:</strong><br>
+                (({current_data['R']}+{current_data['delta_R']}) + ({current_data['C']}+{current_data['delta_C']})) / ({current_data['W']} + {current_data['C']} + {current_data['delta_C']}) × 100<br>
+                = <strong>{improved_rate:.1f}%</strong>
+            </p>
+        </div>
+    </div>
+    <p style="margin: 10px 0; font-size: 24px; font-weight: bold; color: #155724;">
+        <strong>순환율 개선: +{improvement:.1f}%p</strong>
+    </p>
+</div>
+""", unsafe_allow_html=True)
+
+st.markdown("---")
+
+section("환경 효과")
+# 환경 효과
+st.subheader("🌱 환경 효과")
+
+col1, col2, col3 = st.columns(3)
+
+total_waste = plogging_data['total_waste_collected']
+
+with col1:
+    st.metric(
+        label="CO2 절약",
+        value=f"{total_waste * 0.3:.1f}kg",
+        delta="월간 절약"
+    )
+
+with col2:
+    st.metric(
+        label="재활용률",
+        value=f"{(total_waste * 0.7):.1f}kg",
+        delta="재활용 가능"
+    )
+
+with col3:
+    st.metric(
+        label="환경 점수",
+        value=f"{total_waste * 2}점",
+        delta="누적 점수"
+    )
+
+st.markdown("---")
+
+section("데이터 관리")
+# 데이터 관리
+st.subheader("🔄 데이터 관리")
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    if ALLOW_RESET and st.button("📊 데이터 초기화", width='stretch'):
+        seed_store(store, {"plogging": generate_campaign("plogging")}, replace=True)
+        st.success("샘플 데이터로 초기화되었습니다!")
+        st.rerun()
+
+with col2:
+    if st.button("📈 통계 새로고침", width='stretch'):
+        st.info("통계 데이터를 새로고침했습니다!")
+
+with col3:
+    if st.button("📋 플로깅 리포트", width='stretch'):
+        st.info("플로깅 리포트를 생성했습니다!")
@@ -0,0 +1,484 @@
+# 소등·절전 챌린지 페이지
+
+import streamlit as st
+import plotly.express as px
+from datetime import date, datetime, timedelta
+import numpy as np
+import pandas as pd
+
+from esg import emissions, figures
+from esg.datagen import ALLOW_RESET, generate_campaign, seed_store
+from esg.meters import BASELINE_DAYS, PRICE_PER_KWH, SLOTS, TARGET_SLOTS, baseline, is_weekend, savings
+from esg.profiling import section
+from esg.resources import get_event_store, get_meters
+
+store = get_event_store()
+meters = get_meters()
+
+st.title("💡 소등·절전 챌린지")
+st.write("삼성SDS 5개 사옥에서 퇴근 후 불필요한 조명·모니터 끄기와 점심시간 조명 절반 소등을 통해 전력 사용량을 줄입니다.")
+
+# 사옥 정보
+buildings = {
+    "잠실": {
+        "name": "잠실 사옥",
+        "image": "🏢",
+        "participants": 0,
+        "power_saved": 0,
+        "lights_off_rate": 0,
+        "monitors_off_rate": 0
+    },
+    "판교IT": {
+        "name": "판교 IT 사옥", 
+        "image": "🏢",
+        "participants": 0,
+        "power_saved": 0,
+        "lights_off_rate": 0,
+        "monitors_off_rate": 0
+    },
+    "판교물류": {
+        "name": "판교 물류 사옥",
+        "image": "🏢", 
+        "participants": 0,
+        "power_saved": 0,
+        "lights_off_rate": 0,
+        "monitors_off_rate": 0
+    },
+    "상암": {
+        "name": "상암 사옥",
+        "image": "🏢",
+        "participants": 0,
+        "power_saved": 0,
+        "lights_off_rate": 0,
+        "monitors_off_rate": 0
+    },
+    "수원": {
+        "name": "수원 사옥",
+        "image": "🏢",
+        "participants": 0,
+        "power_saved": 0,
+        "lights_off_rate": 0,
+        "monitors_off_rate": 0
+    }
+}
+
+# 소등·절전 챌린지 정보
+power_saving_info = {
+    "name": "소등·절전 챌린지",
+    "description": "퇴근 후 불필요한 조명·모니터 끄기, 점심시간 조명 절반 소등을 통한 전력 절약",
+    "target_time": "퇴근 후 (18:00~), 점심시간 (12:00~13:00)",
+    "goal": "월별 전력 사용량 20% 감소, 전기요금 절약"
+}
+
+power_saving_version, power_saving_data = store.versioned_snapshot("power_saving")
+
+# 배출계수는 이력 테이블에서 오늘 적용되는 값을 사용 (감축량 수량 = 조명 개수 × 소등 시간)
+factors = emissions.load(store)
+P = factors.current("P_light")
+EF = factors.current("EF")
+carbon_reduction = emissions.reduction("power_saving", power_saving_data['N'] * power_saving_data['H'], factors=factors)
+
+st.markdown("---")
+
+section("소등·절전 챌린지 정보")
+# 소등·절전 챌린지 정보 카드
+st.subheader("📋 소등·절전 챌린지 정보")
+col1, col2 = st.columns(2)
+
+with col1:
+    st.info(f"""
+    **⏰ 대상 시간**: {power_saving_info['target_time']}
+    
+    **🎯 목표**: {power_saving_info['goal']}
+    
+    **📝 설명**: {power_saving_info['description']}
+    """)
+
+with col2:
+    st.success(f"""
+    **🌱 환경효과**: 전력 사용량 감소로 탄소 배출 줄이기
+    
+    **💰 경제효과**: 전기요금 절약으로 운영비용 감소
+    
+    **⚡ 효율성**: 에너지 효율적인 업무 환경 구축
+    """)
+
+st.markdown("---")
+
+# 오늘 날짜 표시
+today = datetime.now().strftime("%Y년 %m월 %d일")
+section("소등·절전 챌린지 현황")
+st.subheader(f"📅 {today} 소등·절전 챌린지 현황")
+
+# 사옥별 카드 레이아웃
+cols = st.columns(5)
+
+for i, (building_key, building_info) in enumerate(power_saving_data['buildings'].items()):
+    with cols[i]:
+        st.markdown(f"""
+        <div style="
+            border: 2px solid #e0e0e0;
+            border-radius: 10px;
+            padding: 20px;
+            text-align: center;
+            background-color: #f8f9fa;
+            margin-bottom: 10px;
+        ">
+            <h3 style="margin: 0; color: #1e3a8a;">{building_info['image']}</h3>
+            <h4 style="margin: 10px 0; color: #333;">{building_info['name']}</h4>
+            <p style="margin: 5px 0; font-size: 16px; font-weight: bold; color: #28a745;">
+                참여자: {building_info['participants']}명
+            </p>
+            <p style="margin: 5px 0; font-size: 14px; color: #007bff;">
+                절약량: {building_info['power_saved']}kWh
+            </p>
+            <p style="margin: 5px 0; font-size: 12px; color: #6c757d;">
+                조명소등: {building_info['lights_off_rate']}%
+            </p>
+            <p style="margin: 5px 0; font-size: 12px; color: #6c757d;">
+                모니터소등: {building_info['monitors_off_rate']}%
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # 등록 버튼 (절약량은 스마트 미터 계량값으로 계산)
+        if st.button(f"절전 등록", key=f"power_register_{building_key}", use_container_width=True):
+            store.append("power_saving", [
+                ("incr", ["buildings", building_key, "participants"], 1),
+                ("incr", ["total_participants"], 1)
+            ])
+            st.success(f"{building_info['name']}에 절전 등록 완료! 💡")
+            st.rerun()
+
+st.markdown("---")
+
+section("전체 통계")
+# 전체 통계
+st.subheader("📊 전체 통계")
+
+col1, col2, col3, col4, col5 = st.columns(5)
+
+with col1:
+    st.metric(
+        label="총 참여자",
+        value=f"{power_saving_data['total_participants']}명",
+        delta=f"+{np.random.randint(5, 15)}명"
+    )
+
+with col2:
+    st.metric(
+        label="총 전력 절약",
+        value=f"{power_saving_data['total_power_saved']}kWh",
+        delta=f"+{np.random.randint(20, 50)}kWh"
+    )
+
+with col3:
+    st.metric(
+        label="전기요금 절약",
+        value=f"{power_saving_data['total_bill_saved']:,}원",
+        delta=f"+{np.random.randint(2000, 6000):,}원"
+    )
+
+with col4:
+    st.metric(
+        label="참여율",
+        value=f"{power_saving_data['participation_rate']}%",
+        delta=f"+{np.random.randint(3, 8)}%"
+    )
+
+with col5:
+    st.metric(
+        label="탄소감축량",
+        value=f"{carbon_reduction:.2f}kg",
+        delta="CO₂eq"
+    )
+
+st.markdown("---")
+
+section("사옥별 전력 절약 현황")
+# 사옥별 전력 절약 현황 차트
+st.subheader("🏢 사옥별 전력 절약 현황")
+
+building_names = list(power_saving_data['buildings'].keys())
+power_saved_amounts = [building['power_saved'] for building in power_saving_data['buildings'].values()]
+
+fig_power = figures.get("power_saving", "power", power_saving_version)
+if fig_power is None:
+    fig_power = px.bar(
+        x=building_names,
+        y=power_saved_amounts,
+        title='사옥별 전력 절약량',
+        labels={'x': '사옥', 'y': '절약량 (kWh)'},
+        color=power_saved_amounts,
+        color_continuous_scale='Greens'
+    )
+    fig_power.update_layout(
+        xaxis_title="사옥",
+        yaxis_title="절약량 (kWh)"
+    )
+    figures.put("power_saving", "power", power_saving_version, fig_power)
+st.plotly_chart(fig_power, use_container_width=True)
+
+st.markdown("---")
+
+section("스마트 미터 전력 사용량")
+# 스마트 미터 15분 계량값: 기간·단위별 사용량, 기준선 대비 절감량, 15분 부하 곡선
+st.subheader("📟 스마트 미터 전력 사용량")
+
+meter_buildings, meter_days, meter_kwh = meters.matrix()
+epoch = date(1970, 1, 1)
+first_date = epoch + timedelta(days=int(meter_days[0]))
+last_date = epoch + timedelta(days=int(meter_days[-1]))
+
+col1, col2, col3 = st.columns([2, 3, 2])
+with col1:
+    meter_building = st.selectbox(
+        "사옥", ["전체"] + meter_buildings,
+        format_func=lambda key: power_saving_data['buildings'].get(key, {}).get('name', key)
+    )
+with col2:
+    # 기준선(기간 직전 BASELINE_DAYS 일)이 있는 날짜부터 고를 수 있음 (이력이 그보다 짧으면 처음부터)
+    min_date = first_date + timedelta(days=BASELINE_DAYS)
+    min_date = min_date if min_date <= last_date else first_date
+    meter_range = st.date_input(
+        "기간", (max(last_date - timedelta(days=89), min_date), last_date),
+        min_value=min_date, max_value=last_date
+    )
+with col3:
+    meter_grain = st.radio("단위", ["일", "주", "월"], horizontal=True)
+
+# 날짜 하나만 고른 동안에는 그날 하루
+range_start, range_end = (meter_range[0], meter_range[-1]) if meter_range else (first_date, last_date)
+start_day, end_day = (range_start - epoch).days, (range_end - epoch).days
+selected = slice(None) if meter_building == "전체" else [meter_buildings.index(meter_building)]
+meter_version = (meters.version(), meter_building, start_day, end_day)
+
+fig_usage = figures.get("power_saving", f"meter_usage_{meter_grain}", meter_version)
+if fig_usage is None:
+    _, window_days, window_kwh = meters.daily(start_day, end_day)
+    usage_df = pd.DataFrame(
+        window_kwh[selected].T,
+        index=pd.to_datetime(window_days, unit="D"),
+        columns=np.array(meter_buildings)[selected]
+    )
+    if meter_grain != "일":
+        usage_df = usage_df.resample({"주": "W-SUN", "월": "MS"}[meter_grain]).sum(min_count=1)
+    usage_df = usage_df.rename_axis("date").reset_index().melt(id_vars="date", var_name="building", value_name="kwh")
+    fig_usage = px.line(
+        usage_df,
+        x='date',
+        y='kwh',
+        color='building',
+        title=f'{meter_grain}별 전력 사용량 ({range_start} ~ {range_end})',
+        labels={'date': '날짜', 'kwh': '사용량 (kWh)', 'building': '사옥'}
+    )
+    figures.put("power_saving", f"meter_usage_{meter_grain}", meter_version, fig_usage)
+st.plotly_chart(fig_usage, use_container_width=True)
+
+# 기간 직전 기준선 대비 절전 대상 시간대 절감량 (사옥 축까지 한 번에 계산)
+expected, actual = savings(meter_kwh, meter_days, start_day, end_day)
+expected, actual = expected.sum(axis=-1, dtype=np.float64), actual.sum(axis=-1, dtype=np.float64)
+# 기간에 든 평일·주말마다 기준선 구간에 대상 시간대 계량값이 있어야 비교 (없으면 "-")
+window_weekend = is_weekend(np.arange(start_day, end_day + 1))
+needed = np.array([(~window_weekend).any(), window_weekend.any()])
+profile = baseline(meter_kwh[..., TARGET_SLOTS], meter_days, start_day - BASELINE_DAYS, start_day - 1)
+has_baseline = (~np.isnan(profile).all(axis=-1) | ~needed).all(axis=-1)
+expected = np.where(has_baseline, expected, np.nan)
+saving_df = pd.DataFrame({
+    "사옥": [power_saving_data['buildings'].get(key, {}).get('name', key) for key in meter_buildings],
+    "기준선 (kWh)": expected,
+    "실측 (kWh)": actual,
+    "절감량 (kWh)": expected - actual,
+    "절감률 (%)": (expected - actual) / np.where(expected > 0, expected, np.nan) * 100,
+    "요금 절약 (원)": (expected - actual) * PRICE_PER_KWH,
+})
+st.dataframe(
+    saving_df.style.format({
+        "기준선 (kWh)": "{:,.0f}", "실측 (kWh)": "{:,.0f}", "절감량 (kWh)": "{:,.0f}",
+        "절감률 (%)": "{:.1f}", "요금 절약 (원)": "{:,.0f}",
+    }, na_rep="-"),
+    hide_index=True,
+    use_container_width=True
+)
+st.caption(f"기준선: 기간 직전 {BASELINE_DAYS // 7}주의 평일·주말별 15분 평균 사용량 · 절감량: 점심(12-13시)·퇴근 후(18시~) 시간대 합계")
+
+fig_profile = figures.get("power_saving", "meter_profile", meter_version)
+if fig_profile is None:
+    # 평일 15분 부하 곡선: 기준선(기간 직전) vs 기간 평균
+    building_kwh = np.nansum(meter_kwh[selected], axis=0) if meter_building == "전체" else meter_kwh[selected][0]
+    if meter_building == "전체":
+        # 사옥마다 계량값이 있는 칸만 더했으므로 모두 빈 칸은 다시 NaN
+        building_kwh = np.where(np.isnan(meter_kwh).all(axis=0), np.nan, building_kwh)
+    before = baseline(building_kwh, meter_days, start_day - BASELINE_DAYS, start_day - 1)[0]
+    during = baseline(building_kwh, meter_days, start_day, end_day)[0]
+    slot_labels = [f"{slot // 4:02d}:{slot % 4 * 15:02d}" for slot in range(SLOTS)]
+    profile_df = pd.DataFrame({"time": slot_labels * 2, "kwh": np.concatenate([before, during]),
+                               "series": ["기준선"] * SLOTS + ["선택 기간"] * SLOTS})
+    fig_profile = px.line(
+        profile_df,
+        x='time',
+        y='kwh',
+        color='series',
+        title='평일 15분 평균 사용량 (기준선 vs 선택 기간)',
+        color_discrete_map={'기준선': '#6c757d', '선택 기간': '#28a745'},
+        labels={'time': '시각', 'kwh': '사용량 (kWh/15분)', 'series': ''}
+    )
+    figures.put("power_saving", "meter_profile", meter_version, fig_profile)
+st.plotly_chart(fig_profile, use_container_width=True)
+
+st.markdown("---")
+
+section("사옥별 참여자 수")
+# 사옥별 참여자 수 차트
+st.subheader("👥 사옥별 참여자 수")
+
+participants_counts = [building['participants'] for building in power_saving_data['buildings'].values()]
+
+fig_participants = figures.get("power_saving", "participants", power_saving_version)
+if fig_participants is None:
+    fig_participants = px.bar(
+        x=building_names,
+        y=participants_counts,
+        title='사옥별 참여자 수',
+        labels={'x': '사옥', 'y': '참여자 수'},
+        color=participants_counts,
+        color_continuous_scale='Blues'
+    )
+    fig_participants.update_layout(
+        xaxis_title="사옥",
+        yaxis_title="참여자 수"
+    )
+    figures.put("power_saving", "participants", power_saving_version, fig_participants)
+st.plotly_chart(fig_participants, use_container_width=True)
+
+st.markdown("---")
+
+section("탄소감축량 지표 산식")
+# 탄소감축량 지표 산식
+st.subheader("📊 탄소감축량 지표 산식")
+col1, col2 = st.columns(2)
+
+with col1:
+    st.info(f"""
+    **🌱 탄소감축량 계산 공식**
+    ```
+    감축량(kgCO₂eq) = P × H × N × EF
+    ```
+    **📋 변수 정의**
+    - **P**: 조명 1개의 소비전력 (kW)
+    - **H**: 소등 시간 (시간 단위, hr)
+    - **N**: 조명 개수
+    - **EF**: 전력 배출계수 ({EF} kgCO₂eq/kWh, 한국전력 기준)
+    **🎯 계산 기준**
+    - 조명 1개당 소비전력: {P}kW
+    - 소등 시간: 2-5시간
+    - 조명 개수: 최근 30일 스마트 미터 절감량 ÷ (P × H)
+    - 한국전력 배출계수: {EF} kgCO₂eq/kWh
+    """)
+
+with col2:
+    st.success(f"""
+    **⚡ 전력 배출계수 정보**
+    ```
+    EF = {EF} kgCO₂eq/kWh
+    ```
+    **📋 배출계수 기준**
+    - **대한민국 공식 계수**: {EF} kgCO₂eq/kWh
+    - **동일 계수**: {EF} tCO₂eq/MWh
+    - **국가별 차이**: 국가에 따라 달라짐
+    - **한국전력 기준**: 공식 인증 계수 사용
+    **🌍 환경 효과**
+    • **탄소 감축**: 직접적인 CO₂ 배출량 감소
+    • **에너지 절약**: 전력 사용량 감소
+    • **친환경 문화**: 지속가능한 에너지 사용
+    • **경제 효과**: 전기요금 절약
+    """)
+
+section("실시간 계산 예시")
+st.subheader("🧮 실시간 계산 예시")
+current_data = power_saving_data
+carbon_example = carbon_reduction
+st.markdown(f"""
+<div style="
+    border: 2px solid #28a745;
+    border-radius: 10px;
+    padding: 20px;
+    text-align: center;
+    background-color: #d4edda;
+    margin-bottom: 10px;
+">
+    <h3 style="margin: 0; color: #155724;">📈 현재 상황</h3>
+    <p style="margin: 10px 0; font-size: 18px; color: #155724;">
+        <strong>조명 소비전력:</strong> {P}kW
+    </p>
+    <p style="margin: 10px 0; font-size: 18px; color: #155724;">
+        <strong>소등 시간:</strong> {current_data['H']}시간
+    </p>
+    <p style="margin: 10px 0; font-size: 18px; color: #155724;">
+        <strong>조명 개수:</strong> {current_data['N']}개
+    </p>
+    <p style="margin: 10px 0; font-size: 18px; color: #155724;">
+        <strong>배출계수:</strong> {EF} kgCO₂eq/kWh
+    </p>
+    <p style="margin: 10px 0; font-size: 18px; color: #155724;">
+        <strong>계산식:</strong> {P} × {current_data['H']} × {current_data['N']} × {EF}
+    </p>
+    <p style="margin: 10px 0; font-size: 24px; font-weight: bold; color: #155724;">
+        <strong>= {carbon_example:.2f}kg CO₂eq</strong>
+    </p>
+</div>
+""", unsafe_allow_html=True)
+
+st.markdown("---")
+
+section("환경 효과")
+# 환경 효과
+st.subheader("🌱 환경 효과")
+
+col1, col2, col3 = st.columns(3)
+
+total_saved = power_saving_data['total_power_saved']
+
+with col1:
+    st.metric(
+        label="CO2 절약",
+        value=f"{total_saved * 0.4:.1f}kg",
+        delta="월간 절약"
+    )
+
+with col2:
+    st.metric(
+        label="나무 보호",
+        value=f"{total_saved * 0.01:.1f}그루",
+        delta="월간 보호"
+    )
+
+with col3:
+    st.metric(
+        label="환경등가",
+        value=f"{total_saved * 0.05:.1f}L",
+        delta="휘발유 절약"
+    )
+
+st.markdown("---")
+
+section("데이터 관리")
+# 데이터 관리
+st.subheader("🔄 데이터 관리")
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    if ALLOW_RESET and st.button("📊 데이터 초기화", width='stretch'):
+        seed_store(store, {"power_saving": generate_campaign("power_saving")}, replace=True)
+        st.success("샘플 데이터로 초기화되었습니다!")
+        st.rerun()
+
+with col2:
+    if st.button("📈 통계 새로고침", width='stretch'):
+        # 스마트 미터 모의 계량값을 지금까지 받아 절약량 갱신
+        st.success(f"계량값 {meters.feed():,}건을 새로 받았습니다!")
+        st.rerun()
+
+with col3:
+    if st.button("📋 절전 리포트", width='stretch'):
+        st.info("절전 리포트를 생성했습니다!")
@@ -0,0 +1,242 @@
+# 계단 오르기 페이지
+
+import streamlit as st
+import plotly.express as px
+from datetime import datetime
+
+from esg import emissions, figures
+from esg.datagen import ALLOW_RESET, generate_campaign
+from esg.profiling import section, timed_fragment
+from esg.resources import get_counter_service, get_event_store
+
+store = get_event_store()
+counters = get_counter_service()
+
+st.title("🏢 계단 오르기 캠페인")
+st.write("삼성SDS 5개 사옥에서 진행하는 친환경 계단 오르기 캠페인을 관리합니다.")
+
+stair_climbing_version, stair_climbing_data = counters.versioned_view("stair_climbing")
+
+# 계단 이용 1회당 감축량 (배출계수 이력에서 오늘 적용되는 값)
+factors = emissions.load(store)
+stair_factor = factors.current("E_stairs")
+
+st.markdown("---")
+
+# 오늘 날짜 표시
+today = datetime.now().strftime("%Y년 %m월 %d일")
+section("계단 오르기 현황")
+st.subheader(f"📅 {today} 계단 오르기 현황")
+
+# 등록 처리는 버튼 콜백에서 실행되어, 조각이 다시 그려질 때 바로 반영됨
+def register_stairs(building_key, building_name):
+    counters.incr("stair_climbing", [building_key, "participants"])
+    st.session_state.stair_climbing_message = f"{building_name}에 계단 오르기 등록 완료!"
+
+# 등록 카드와 전체 통계는 조각(fragment)으로 분리: 등록하기 클릭 시 이 부분만 다시 그림
+@timed_fragment
+def registration_board():
+    stair_climbing_data = counters.view("stair_climbing")
+
+    # 콜백에서 남긴 완료 메시지 표시
+    if "stair_climbing_message" in st.session_state:
+        st.toast(st.session_state.pop("stair_climbing_message"))
+
+    # 사옥별 카드 레이아웃
+    cols = st.columns(5)
+
+    for i, (building_key, building_info) in enumerate(stair_climbing_data.items()):
+        with cols[i]:
+            st.markdown(f"""
+            <div style="
+                border: 2px solid #e0e0e0;
+                border-radius: 10px;
+                padding: 20px;
+                text-align: center;
+                background-color: #f8f9fa;
+                margin-bottom: 10px;
+            ">
+                <h3 style="margin: 0; color: #1e3a8a;">{building_info['image']}</h3>
+                <h4 style="margin: 10px 0; color: #333;">{building_info['name']}</h4>
+                <p style="margin: 5px 0; font-size: 18px; font-weight: bold; color: #28a745;">
+                    참여자: {building_info['participants']}명
+                </p>
+                <p style="margin: 5px 0; font-size: 14px; font-weight: bold; color: #dc3545;">
+                    예상감축량: {emissions.reduction("stair_climbing", building_info['participants'], factors=factors):.1f}kg CO₂eq
+                </p>
+            </div>
+            """, unsafe_allow_html=True)
+
+            # 등록 버튼
+            st.button(f"등록하기", key=f"register_{building_key}", use_container_width=True,
+                      on_click=register_stairs, args=(building_key, building_info['name']))
+
+    st.markdown("---")
+
+    section("전체 통계")
+    # 전체 통계
+    st.subheader("📊 전체 통계")
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    total_participants = sum(building['participants'] for building in stair_climbing_data.values())
+
+    with col1:
+        st.metric(
+            label="총 참여자",
+            value=f"{total_participants}명",
+            delta=f"+{total_participants}명"
+        )
+
+    with col2:
+        st.metric(
+            label="참여 사옥",
+            value="5개",
+            delta="100%"
+        )
+
+    with col3:
+        st.metric(
+            label="평균 참여율",
+            value=f"{total_participants/5:.1f}명",
+            delta="사옥당"
+        )
+
+    with col4:
+        st.metric(
+            label="예상감축량",
+            value=f"{emissions.reduction('stair_climbing', total_participants, factors=factors):.1f}kg",
+            delta="CO₂eq"
+        )
+
+
+registration_board()
+
+st.markdown("---")
+
+section("사옥별 참여 현황")
+# 사옥별 참여 현황 차트
+st.subheader("🏢 사옥별 참여 현황")
+
+building_names = list(stair_climbing_data.keys())
+participants_count = [building['participants'] for building in stair_climbing_data.values()]
+
+fig_stairs = figures.get("stair_climbing", "stairs", stair_climbing_version)
+if fig_stairs is None:
+    fig_stairs = px.bar(
+        x=building_names,
+        y=participants_count,
+        title='사옥별 계단 오르기 참여자 수',
+        labels={'x': '사옥', 'y': '참여자 수'},
+        color=participants_count,
+        color_continuous_scale='Greens'
+    )
+    fig_stairs.update_layout(
+        xaxis_title="사옥",
+        yaxis_title="참여자 수 (명)"
+    )
+    figures.put("stair_climbing", "stairs", stair_climbing_version, fig_stairs)
+st.plotly_chart(fig_stairs, use_container_width=True)
+
+section("사옥별 예상감축량")
+# 사옥별 예상감축량 차트
+st.subheader("🌱 사옥별 예상감축량")
+
+building_names = list(stair_climbing_data.keys())
+reduction_amounts = emissions.reduction("stair_climbing", participants_count, factors=factors).tolist()
+
+# 감축량 차트는 배출계수가 바뀌어도 다시 그림
+fig_reduction = figures.get("stair_climbing", "reduction", (stair_climbing_version, factors.version))
+if fig_reduction is None:
+    fig_reduction = px.bar(
+        x=building_names,
+        y=reduction_amounts,
+        title='사옥별 예상감축량 (kg CO₂eq)',
+        labels={'x': '사옥', 'y': '예상감축량 (kg CO₂eq)'},
+        color=reduction_amounts,
+        color_continuous_scale='Reds'
+    )
+    fig_reduction.update_layout(
+        xaxis_title="사옥",
+        yaxis_title="예상감축량 (kg CO₂eq)"
+    )
+    figures.put("stair_climbing", "reduction", (stair_climbing_version, factors.version), fig_reduction)
+st.plotly_chart(fig_reduction, use_container_width=True)
+
+st.markdown("---")
+
+section("예상감축량 지표 산식")
+# 지표 산식 설명
+st.subheader("📊 예상감축량 지표 산식")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.info(f"""
+    **🌱 탄소 감축량 계산 공식**
+    
+    ```
+    예상감축량 = 참여자 수 × {stair_factor}kg CO₂eq
+    ```
+    
+    **📋 계산 기준**
+    - 계단 이용 1회당: {stair_factor}kg CO₂eq
+    - 엘리베이터 대신 계단 이용 시 절약되는 탄소량
+    - 국제 탄소 배출 계수 기준 적용
+    """)
+
+with col2:
+    st.success("""
+    **🎯 환경 효과**
+    
+    • **에너지 절약**: 엘리베이터 사용량 감소
+    • **건강 증진**: 계단 오르기로 체력 향상
+    • **탄소 감축**: 직접적인 CO₂ 배출량 감소
+    • **친환경 문화**: 지속가능한 생활습관 형성
+    """)
+
+# 실시간 계산 예시
+st.markdown("---")
+section("실시간 계산 예시")
+st.subheader("🧮 실시간 계산 예시")
+
+total_participants = sum(building['participants'] for building in stair_climbing_data.values())
+example_participants = total_participants
+example_reduction = emissions.reduction("stair_climbing", example_participants, factors=factors)
+
+st.markdown(f"""
+<div style="
+    border: 2px solid #28a745;
+    border-radius: 10px;
+    padding: 20px;
+    text-align: center;
+    background-color: #d4edda;
+    margin-bottom: 10px;
+">
+    <h3 style="margin: 0; color: #155724;">📈 현재 상황</h3>
+    <p style="margin: 10px 0; font-size: 18px; color: #155724;">
+        <strong>총 참여자:</strong> {example_participants}명
+    </p>
+    <p style="margin: 10px 0; font-size: 18px; color: #155724;">
+        <strong>계산식:</strong> {example_participants}명 × {stair_factor}kg CO₂eq
+    </p>
+    <p style="margin: 10px 0; font-size: 24px; font-weight: bold; color: #155724;">
+        <strong>= {example_reduction:.1f}kg CO₂eq</strong>
+    </p>
+</div>
+""", unsafe_allow_html=True)
+
+section("데이터 관리")
+# 리셋 버튼
+st.subheader("🔄 데이터 관리")
+col1, col2 = st.columns(2)
+
+with col1:
+    if ALLOW_RESET and st.button("📊 데이터 초기화", use_container_width=True):
+        counters.seed("stair_climbing", generate_campaign("stair_climbing"), replace=True)
+        st.success("샘플 데이터로 초기화되었습니다!")
+        st.rerun()
+
+with col2:
+    if st.button("📈 통계 보기", use_container_width=True):
+        st.info("통계 데이터를 새로고침했습니다!")
@@ -0,0 +1,389 @@
+# 지역 사회 연계 봉사 프로그램 페이지
+
+import streamlit as st
+import plotly.express as px
+from datetime import datetime
+import numpy as np
+
+from esg import figures
+from esg.datagen import ALLOW_RESET, generate_campaign
+from esg.profiling import section, timed_fragment
+from esg.resources import get_event_store
+
+store = get_event_store()
+
+st.title("🤝 지역 사회 연계 봉사 프로그램")
+st.write("환경정화, 장애인 시설 봉사, 지역 농가 돕기 등 다양한 봉사 활동을 통해 사회적 가치를 창출합니다.")
+
+# 봉사 프로그램 정보
+volunteer_info = {
+    "name": "지역 사회 연계 봉사 프로그램",
+    "description": "환경정화, 장애인 시설 봉사, 지역 농가 돕기 등 활동 정례화",
+    "schedule": "월 2회 정기 봉사, 분기별 특별 봉사",
+    "goal": "참여 시간, 봉사 인원, 사회적 가치 환산 점수 향상"
+}
+
+volunteer_version, volunteer_data = store.versioned_snapshot("volunteer")
+
+def derive_volunteer(data):
+    data['avg_hours_per_person'] = round(data['total_hours'] / data['total_participants'], 1)
+
+st.markdown("---")
+
+section("봉사 프로그램 정보")
+# 봉사 프로그램 정보 카드
+st.subheader("📋 봉사 프로그램 정보")
+col1, col2 = st.columns(2)
+
+with col1:
+    st.info(f"""
+    **📅 일정**: {volunteer_info['schedule']}
+    
+    **🎯 목표**: {volunteer_info['goal']}
+    
+    **📝 설명**: {volunteer_info['description']}
+    """)
+
+with col2:
+    st.success(f"""
+    **🤝 사회효과**: 지역사회와의 유대 강화
+    
+    **💚 환경효과**: 환경 보호 및 정화 활동
+    
+    **❤️ 인적효과**: 임직원 사회적 책임 의식 향상
+    """)
+
+st.markdown("---")
+
+# 봉사 참여는 버튼 콜백에서 처리되어, 조각이 다시 그려질 때 바로 반영됨
+def join_activity(activity_key, activity_name):
+    additional_hours = np.random.randint(4, 8)
+    additional_value = np.random.randint(8, 15)
+    store.append("volunteer", [
+        ("incr", ["activities", activity_key, "participants"], 1),
+        ("incr", ["activities", activity_key, "total_hours"], additional_hours),
+        ("incr", ["activities", activity_key, "social_value"], additional_value),
+        # 전체 통계 업데이트
+        ("incr", ["total_participants"], 1),
+        ("incr", ["total_hours"], additional_hours),
+        ("incr", ["total_social_value"], additional_value)
+    ], derive=derive_volunteer)
+
+    st.session_state.volunteer_message = f"{activity_name}에 {additional_hours}시간 참여 완료! 🤝"
+
+# 전체 통계와 활동 카드는 조각(fragment)으로 분리: 봉사 참여 시 이 부분만 다시 그림
+@timed_fragment
+def activity_board():
+    volunteer_data = store.snapshot("volunteer")
+
+    # 콜백에서 남긴 완료 메시지 표시
+    if "volunteer_message" in st.session_state:
+        st.toast(st.session_state.pop("volunteer_message"))
+
+    section("전체 통계")
+    # 전체 통계
+    st.subheader("📊 전체 통계")
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric(
+            label="총 참여자",
+            value=f"{volunteer_data['total_participants']}명",
+            delta=f"+{np.random.randint(3, 8)}명"
+        )
+
+    with col2:
+        st.metric(
+            label="총 봉사시간",
+            value=f"{volunteer_data['total_hours']}시간",
+            delta=f"+{np.random.randint(20, 40)}시간"
+        )
+
+    with col3:
+        st.metric(
+            label="사회적 가치",
+            value=f"{volunteer_data['total_social_value']}점",
+            delta=f"+{np.random.randint(15, 30)}점"
+        )
+
+    with col4:
+        st.metric(
+            label="참여율",
+            value=f"{volunteer_data['participation_rate']}%",
+            delta=f"+{np.random.randint(2, 5)}%"
+        )
+
+    st.markdown("---")
+
+    # 오늘 날짜 표시
+    today = datetime.now().strftime("%Y년 %m월 %d일")
+    section("봉사 활동 현황")
+    st.subheader(f"📅 {today} 봉사 활동 현황")
+
+    # 봉사 활동별 카드 레이아웃
+    cols = st.columns(5)
+
+    for i, (activity_key, activity_info) in enumerate(volunteer_data['activities'].items()):
+        with cols[i]:
+            st.markdown(f"""
+            <div style="
+                border: 2px solid {activity_info['color']};
+                border-radius: 10px;
+                padding: 20px;
+                text-align: center;
+                background-color: #f8f9fa;
+                margin-bottom: 10px;
+            ">
+                <h3 style="margin: 0; color: {activity_info['color']};">{activity_info['icon']}</h3>
+                <h4 style="margin: 10px 0; color: #333;">{activity_info['name']}</h4>
+                <p style="margin: 5px 0; font-size: 16px; font-weight: bold; color: {activity_info['color']};">
+                    참여자: {activity_info['participants']}명
+                </p>
+                <p style="margin: 5px 0; font-size: 14px; color: #007bff;">
+                    봉사시간: {activity_info['total_hours']}시간
+                </p>
+                <p style="margin: 5px 0; font-size: 12px; color: #6c757d;">
+                    사회가치: {activity_info['social_value']}점
+                </p>
+                <p style="margin: 5px 0; font-size: 12px; color: #6c757d;">
+                    빈도: {activity_info['frequency']}
+                </p>
+            </div>
+            """, unsafe_allow_html=True)
+
+            # 봉사 참여 버튼
+            st.button(f"봉사 참여", key=f"volunteer_{activity_key}", use_container_width=True,
+                      on_click=join_activity, args=(activity_key, activity_info['name']))
+
+
+activity_board()
+
+st.markdown("---")
+
+section("봉사 활동별 참여자 수")
+# 봉사 활동별 참여자 수 차트
+st.subheader("👥 봉사 활동별 참여자 수")
+
+activity_names = list(volunteer_data['activities'].keys())
+participants_counts = [activity['participants'] for activity in volunteer_data['activities'].values()]
+colors = [activity['color'] for activity in volunteer_data['activities'].values()]
+
+fig_participants = figures.get("volunteer", "participants", volunteer_version)
+if fig_participants is None:
+    fig_participants = px.bar(
+        x=activity_names,
+        y=participants_counts,
+        title='봉사 활동별 참여자 수',
+        labels={'x': '봉사 활동', 'y': '참여자 수'},
+        color=activity_names,
+        color_discrete_sequence=colors
+    )
+    fig_participants.update_layout(
+        xaxis_title="봉사 활동",
+        yaxis_title="참여자 수"
+    )
+    figures.put("volunteer", "participants", volunteer_version, fig_participants)
+st.plotly_chart(fig_participants, use_container_width=True)
+
+st.markdown("---")
+
+section("봉사 활동별 총 시간")
+# 봉사 시간별 현황 차트
+st.subheader("⏰ 봉사 활동별 총 시간")
+
+total_hours = [activity['total_hours'] for activity in volunteer_data['activities'].values()]
+
+fig_hours = figures.get("volunteer", "hours", volunteer_version)
+if fig_hours is None:
+    fig_hours = px.bar(
+        x=activity_names,
+        y=total_hours,
+        title='봉사 활동별 총 시간',
+        labels={'x': '봉사 활동', 'y': '총 시간 (시간)'},
+        color=activity_names,
+        color_discrete_sequence=colors
+    )
+    fig_hours.update_layout(
+        xaxis_title="봉사 활동",
+        yaxis_title="총 시간 (시간)"
+    )
+    figures.put("volunteer", "hours", volunteer_version, fig_hours)
+st.plotly_chart(fig_hours, use_container_width=True)
+
+st.markdown("---")
+
+section("사회적 가치 환산 점수")
+# 사회적 가치 환산 점수 차트
+st.subheader("💎 사회적 가치 환산 점수")
+
+social_values = [activity['social_value'] for activity in volunteer_data['activities'].values()]
+
+fig_social = figures.get("volunteer", "social", volunteer_version)
+if fig_social is None:
+    fig_social = px.bar(
+        x=activity_names,
+        y=social_values,
+        title='봉사 활동별 사회적 가치 점수',
+        labels={'x': '봉사 활동', 'y': '사회적 가치 점수'},
+        color=activity_names,
+        color_discrete_sequence=colors
+    )
+    fig_social.update_layout(
+        xaxis_title="봉사 활동",
+        yaxis_title="사회적 가치 점수"
+    )
+    figures.put("volunteer", "social", volunteer_version, fig_social)
+st.plotly_chart(fig_social, use_container_width=True)
+
+st.markdown("---")
+
+section("봉사 활동 상세 정보")
+# 봉사 활동 상세 정보
+st.subheader("📋 봉사 활동 상세 정보")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.info("""
+    **🌱 환경정화 봉사**
+    - 한강공원, 도심 공원 청소
+    - 월 2회 정기 활동
+    - 환경 보호 인식 제고
+    
+    **♿ 장애인 시설 봉사**
+    - 지역 장애인 복지관 지원
+    - 월 1회 정기 활동
+    - 사회적 포용성 강화
+    """)
+
+with col2:
+    st.success("""
+    **🚜 지역 농가 돕기**
+    - 경기도 농장 농작업 지원
+    - 분기 1회 특별 활동
+    - 지역 경제 활성화
+    
+    **👴👶 노인/아동 복지**
+    - 지역 복지관 지원
+    - 월 1회 정기 활동
+    - 사회적 약자 배려
+    """)
+
+st.markdown("---")
+
+section("사회적 가치 환산 기준")
+# 사회적 가치 환산 기준
+st.subheader("📊 사회적 가치 환산 기준")
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    st.metric(
+        label="환경정화",
+        value="시간당 1.2점",
+        delta="환경 보호 효과"
+    )
+
+with col2:
+    st.metric(
+        label="장애인/노인/아동",
+        value="시간당 1.5점",
+        delta="사회적 포용 효과"
+    )
+
+with col3:
+    st.metric(
+        label="지역 농가",
+        value="시간당 1.0점",
+        delta="지역 경제 효과"
+    )
+
+st.markdown("---")
+
+section("새 봉사 참여 등록")
+# 봉사 참여 등록
+st.subheader("📝 새 봉사 참여 등록")
+
+with st.form("volunteer_registration"):
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        volunteer_name = st.text_input("참여자명", placeholder="예: 홍길동")
+        activity_type = st.selectbox("봉사 활동 유형", ["환경정화", "장애인시설", "지역농가", "노인복지", "아동복지"])
+        volunteer_hours = st.number_input("봉사 시간", min_value=1, max_value=8, value=4)
+    
+    with col2:
+        volunteer_date = st.date_input("봉사 날짜", value=datetime.now().date())
+        volunteer_location = st.text_input("봉사 장소", placeholder="예: 한강공원")
+        volunteer_department = st.selectbox("소속 부서", ["IT개발팀", "시설관리팀", "구매팀", "환경팀", "마케팅팀", "인사팀"])
+    
+    volunteer_description = st.text_area("봉사 활동 내용", placeholder="봉사 활동의 구체적인 내용과 느낀 점을 작성해주세요.", height=100)
+    
+    submitted = st.form_submit_button("봉사 참여 등록")
+    if submitted:
+        if volunteer_name and volunteer_location and volunteer_description:
+            # 사회적 가치 점수 계산
+            value_multipliers = {
+                "환경정화": 1.2,
+                "장애인시설": 1.5,
+                "지역농가": 1.0,
+                "노인복지": 1.5,
+                "아동복지": 1.5
+            }
+            social_value_points = round(volunteer_hours * value_multipliers[activity_type], 1)
+            
+            st.success(f"{volunteer_name}님의 {activity_type} 봉사가 성공적으로 등록되었습니다! 🤝")
+            st.info(f"봉사 시간: {volunteer_hours}시간, 사회적 가치: {social_value_points}점")
+        else:
+            st.error("모든 필수 항목을 입력해주세요!")
+
+st.markdown("---")
+
+section("봉사 성과 요약")
+# 봉사 성과 요약
+st.subheader("🏆 봉사 성과 요약")
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    st.metric(
+        label="평균 봉사시간",
+        value=f"{volunteer_data['avg_hours_per_person']}시간",
+        delta="1인당 평균"
+    )
+
+with col2:
+    st.metric(
+        label="사회적 가치",
+        value=f"{volunteer_data['total_social_value']}점",
+        delta="총 누적 점수"
+    )
+
+with col3:
+    st.metric(
+        label="참여 부서",
+        value="6개 부서",
+        delta="전 부서 참여"
+    )
+
+st.markdown("---")
+
+section("데이터 관리")
+# 데이터 관리
+st.subheader("🔄 데이터 관리")
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    if ALLOW_RESET and st.button("📊 데이터 초기화", width='stretch'):
+        store.seed("volunteer", generate_campaign("volunteer"), replace=True)
+        st.success("샘플 데이터로 초기화되었습니다!")
+        st.rerun()
+
+with col2:
+    if st.button("📈 통계 새로고침", width='stretch'):
+        st.info("통계 데이터를 새로고침했습니다!")
+
+with col3:
+    if st.button("📋 봉사 리포트", width='stretch'):
+        st.info("봉사 활동 리포트를 생성했습니다!")
@@ -0,0 +1,409 @@
+# 일회용품 ZERO 챌린지 페이지
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+import plotly.express as px
+from datetime import date
+
+from esg import emissions, figures
+from esg.datagen import ALLOW_RESET, generate_campaign
+from esg.profiling import section
+from esg.registrations import TYPES, WEEKDAYS
+from esg.resources import get_event_store, get_zero_registrations
+
+store = get_event_store()
+registrations = get_zero_registrations()
+
+st.title("♻️ 일회용품 ZERO 챌린지")
+st.write("제로컵 위크 캠페인을 통해 개인 컵, 텀블러, 도시락 사용을 장려합니다.")
+
+# 챌린지 정보
+challenge_info = {
+    "name": "제로컵 위크",
+    "description": "일회용 컵·용기 사용을 줄이고 개인 컵, 텀블러, 도시락 사용을 장려하는 캠페인",
+    "duration": "2024년 10월 20일 ~ 10월 27일",
+    "goal": "일회용품 사용률 50% 감소"
+}
+
+zero_challenge_version, zero_challenge_data = store.versioned_snapshot("zero_challenge")
+
+# 배출계수는 이력 테이블에서 오늘 적용되는 값을 사용
+factors = emissions.load(store)
+A_single = factors.current("A_single")
+A_multi = factors.current("A_multi")
+carbon_reduction = emissions.reduction("zero_cup", zero_challenge_data['N'], factors=factors)
+
+# 지표 재계산 (등록 이벤트 반영 시 저장소 트랜잭션 안에서 실행)
+def derive_zero_challenge(data):
+    data['A_single'] = A_single
+    data['A_multi'] = A_multi
+    data['carbon_reduction'] = emissions.reduction("zero_cup", data['N'], factors=factors)
+    data['circular_rate'] = ((data['R'] + data['C']) / (data['W'] + data['C'])) * 100
+
+st.markdown("---")
+
+section("챌린지 정보")
+# 챌린지 정보 카드
+st.subheader("📋 챌린지 정보")
+col1, col2 = st.columns(2)
+
+with col1:
+    st.info(f"""
+    **🎯 챌린지명**: {challenge_info['name']}
+    
+    **📅 기간**: {challenge_info['duration']}
+    
+    **🎯 목표**: {challenge_info['goal']}
+    """)
+
+with col2:
+    st.success(f"""
+    **📝 설명**: {challenge_info['description']}
+    
+    **🌱 환경효과**: 일회용품 사용 감소로 탄소발자국 줄이기
+    """)
+
+st.markdown("---")
+
+section("참여 등록")
+# 참여 등록 섹션
+st.subheader("🎮 참여 등록")
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    st.markdown("""
+    <div style="
+        border: 2px solid #e0e0e0;
+        border-radius: 10px;
+        padding: 20px;
+        text-align: center;
+        background-color: #f8f9fa;
+        margin-bottom: 10px;
+    ">
+        <h3 style="margin: 0; color: #1e3a8a;">☕</h3>
+        <h4 style="margin: 10px 0; color: #333;">개인 컵 사용</h4>
+        <p style="margin: 5px 0; font-size: 16px; color: #28a745;">
+            참여자: {personal_cups}명
+        </p>
+    </div>
+    """.format(personal_cups=zero_challenge_data['personal_cups']), unsafe_allow_html=True)
+    
+    if st.button("개인 컵 등록", key="personal_cup", use_container_width=True):
+        store.append("zero_challenge", registrations.recorder("개인 컵", [
+            ("incr", ["personal_cups"], 1),
+            ("incr", ["participants"], 1),
+            ("incr", ["single_use_reduction"], 1),
+            ("incr", ["N"], 1),
+            ("incr", ["R"], 1)
+        ]), derive=derive_zero_challenge)
+        st.success("개인 컵 사용 등록 완료! 🌱")
+        st.rerun()
+
+with col2:
+    st.markdown("""
+    <div style="
+        border: 2px solid #e0e0e0;
+        border-radius: 10px;
+        padding: 20px;
+        text-align: center;
+        background-color: #f8f9fa;
+        margin-bottom: 10px;
+    ">
+        <h3 style="margin: 0; color: #1e3a8a;">🍵</h3>
+        <h4 style="margin: 10px 0; color: #333;">텀블러 사용</h4>
+        <p style="margin: 5px 0; font-size: 16px; color: #28a745;">
+            참여자: {tumblers}명
+        </p>
+    </div>
+    """.format(tumblers=zero_challenge_data['tumblers']), unsafe_allow_html=True)
+    
+    if st.button("텀블러 등록", key="tumbler", use_container_width=True):
+        store.append("zero_challenge", registrations.recorder("텀블러", [
+            ("incr", ["tumblers"], 1),
+            ("incr", ["participants"], 1),
+            ("incr", ["single_use_reduction"], 1),
+            ("incr", ["N"], 1),
+            ("incr", ["R"], 1)
+        ]), derive=derive_zero_challenge)
+        st.success("텀블러 사용 등록 완료! 🌱")
+        st.rerun()
+
+with col3:
+    st.markdown("""
+    <div style="
+        border: 2px solid #e0e0e0;
+        border-radius: 10px;
+        padding: 20px;
+        text-align: center;
+        background-color: #f8f9fa;
+        margin-bottom: 10px;
+    ">
+        <h3 style="margin: 0; color: #1e3a8a;">🍱</h3>
+        <h4 style="margin: 10px 0; color: #333;">도시락 사용</h4>
+        <p style="margin: 5px 0; font-size: 16px; color: #28a745;">
+            참여자: {lunchboxes}명
+        </p>
+    </div>
+    """.format(lunchboxes=zero_challenge_data['lunchboxes']), unsafe_allow_html=True)
+    
+    if st.button("도시락 등록", key="lunchbox", use_container_width=True):
+        store.append("zero_challenge", registrations.recorder("도시락", [
+            ("incr", ["lunchboxes"], 1),
+            ("incr", ["participants"], 1),
+            ("incr", ["single_use_reduction"], 2),  # 도시락은 용기 2개 절약
+            ("incr", ["N"], 2),
+            ("incr", ["C"], 1)
+        ]), derive=derive_zero_challenge)
+        st.success("도시락 사용 등록 완료! 🌱")
+        st.rerun()
+
+st.markdown("---")
+
+section("실시간 통계")
+# 실시간 통계
+st.subheader("📊 실시간 통계")
+
+col1, col2, col3, col4, col5, col6 = st.columns(6)
+
+with col1:
+    st.metric(
+        label="총 참여자",
+        value=f"{zero_challenge_data['participants']}명",
+        delta=f"+{zero_challenge_data['participants']}명"
+    )
+
+with col2:
+    st.metric(
+        label="일회용품 감소",
+        value=f"{zero_challenge_data['single_use_reduction']}개",
+        delta=f"-{zero_challenge_data['single_use_reduction']}개"
+    )
+
+with col3:
+    st.metric(
+        label="감소율",
+        value=f"{(zero_challenge_data['single_use_reduction']/max(zero_challenge_data['participants'], 1)*100):.1f}%",
+        delta="목표 대비"
+    )
+
+with col4:
+    st.metric(
+        label="탄소감축량",
+        value=f"{carbon_reduction:.2f}kg",
+        delta="CO₂eq"
+    )
+
+with col5:
+    st.metric(
+        label="순환이용률",
+        value=f"{zero_challenge_data['circular_rate']:.1f}%",
+        delta="환경효과"
+    )
+
+with col6:
+    st.metric(
+        label="재사용 용기",
+        value=f"{zero_challenge_data['R']}개",
+        delta="R+C"
+    )
+
+st.markdown("---")
+
+section("사용 유형별 현황")
+# 사용 유형별 현황 차트
+st.subheader("📈 사용 유형별 현황")
+
+usage_types = ['개인 컵', '텀블러', '도시락']
+usage_counts = [
+    zero_challenge_data['personal_cups'],
+    zero_challenge_data['tumblers'],
+    zero_challenge_data['lunchboxes']
+]
+
+fig_usage = figures.get("zero_challenge", "usage", zero_challenge_version)
+if fig_usage is None:
+    fig_usage = px.pie(
+        values=usage_counts,
+        names=usage_types,
+        title='친환경 용기 사용 유형별 비율',
+        color_discrete_sequence=['#82ca9d', '#8884d8', '#ffc658']
+    )
+    fig_usage.update_layout(height=400)
+    figures.put("zero_challenge", "usage", zero_challenge_version, fig_usage)
+st.plotly_chart(fig_usage, use_container_width=True)
+
+st.markdown("---")
+
+section("지표 산식 설명")
+# 지표 산식 설명
+st.subheader("📊 지표 산식 설명")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.info(f"""
+    **🌱 탄소감축량 계산 공식**
+    
+    ```
+    탄소감축량 = (A_single − A_multi) × N
+    ```
+    
+    **📋 변수 설명**
+    - **A_single**: 일회용품 1개당 탄소배출량 ({A_single}kg CO₂eq)
+    - **A_multi**: 다회용품 1개당 탄소배출량 ({A_multi}kg CO₂eq)
+    - **N**: 절약된 일회용품 수 (개)
+    
+    **🎯 계산 예시**
+    - 절약된 일회용품: 100개
+    - 탄소감축량: ({A_single} - {A_multi}) × 100 = {emissions.reduction("zero_cup", 100, factors=factors):.1f}kg CO₂eq
+    """)
+
+with col2:
+    st.success("""
+    **♻️ 순환이용률 계산 공식**
+    
+    ```
+    순환이용률 = (R + C) / (W + C) × 100
+    ```
+    
+    **📋 변수 설명**
+    - **R**: 재사용 용기 수 (개인 컵 + 텀블러)
+    - **C**: 순환용기 수 (도시락)
+    - **W**: 폐기물 수 (일회용품)
+    
+    **🎯 계산 예시**
+    - 재사용 용기: 80개, 순환용기: 20개, 폐기물: 50개
+    - 순환이용률: (80 + 20) / (50 + 20) × 100 = 142.9%
+    """)
+
+# 실시간 계산 예시
+st.markdown("---")
+section("실시간 계산 예시")
+st.subheader("🧮 실시간 계산 예시")
+
+current_data = zero_challenge_data
+carbon_example = carbon_reduction
+circular_example = ((current_data['R'] + current_data['C']) / (current_data['W'] + current_data['C'])) * 100
+
+st.markdown(f"""
+<div style="
+    border: 2px solid #28a745;
+    border-radius: 10px;
+    padding: 20px;
+    text-align: center;
+    background-color: #d4edda;
+    margin-bottom: 10px;
+">
+    <h3 style="margin: 0; color: #155724;">📈 현재 상황</h3>
+    <div style="display: flex; justify-content: space-around; margin: 20px 0;">
+        <div>
+            <p style="margin: 5px 0; font-size: 16px; color: #155724;">
+                <strong>탄소감축량:</strong><br>
+                ({A_single} - {A_multi}) × {current_data['N']}<br>
+                = <strong>{carbon_example:.2f}kg CO₂eq</strong>
+            </p>
+        </div>
+        <div>
+            <p style="margin: 5px 0; font-size: 16px; color: #155724;">
+                <strong>순환이용률:</strong><br>
+                ({current_data['R']} + {current_data['C']}) / ({current_data['W']} + {current_data['C']}) × 100<br>
+                = <strong>{circular_example:.1f}%</strong>
+            </p>
+        </div>
+    </div>
+</div>
+""", unsafe_allow_html=True)
+
+st.markdown("---")
+
+section("시간대별 등록 현황")
+# 시간대별 등록 현황
+st.subheader("⏰ 시간대별 등록 현황")
+
+# 등록 시각 배열에서 시간대별 건수를 한 번에 집계
+registrations_version = registrations.version()
+today_date = date.today()
+hourly_counts = registrations.hourly(today_date)
+
+if hourly_counts.any():
+    fig_hourly = figures.get("zero_challenge", "hourly", (registrations_version, today_date))
+    if fig_hourly is None:
+        hours = np.flatnonzero(hourly_counts.sum(axis=0))
+        hourly_frame = pd.DataFrame({
+            '시간': np.tile(hours, len(TYPES)),
+            '등록 수': hourly_counts[:, hours].ravel(),
+            '유형': np.repeat(TYPES, len(hours))
+        })
+        fig_hourly = px.bar(
+            hourly_frame,
+            x='시간',
+            y='등록 수',
+            color='유형',
+            title='오늘 시간대별 등록 현황',
+            color_discrete_sequence=['#82ca9d', '#8884d8', '#ffc658']
+        )
+        fig_hourly.update_layout(
+            xaxis_title="시간 (시)",
+            yaxis_title="등록 수"
+        )
+        figures.put("zero_challenge", "hourly", (registrations_version, today_date), fig_hourly)
+    st.plotly_chart(fig_hourly, use_container_width=True)
+elif registrations.count():
+    st.info("오늘 아직 등록된 데이터가 없습니다.")
+else:
+    st.info("등록된 데이터가 없습니다.")
+
+st.markdown("---")
+
+section("요일별 등록 현황")
+# 요일별 등록 현황 (전체 기간)
+st.subheader("📅 요일별 등록 현황")
+
+fig_weekly = figures.get("zero_challenge", "weekly", registrations_version)
+if fig_weekly is None:
+    weekly_counts = registrations.weekly()
+    weekly_frame = pd.DataFrame({
+        '요일': np.tile(WEEKDAYS, len(TYPES)),
+        '등록 수': weekly_counts.ravel(),
+        '유형': np.repeat(TYPES, len(WEEKDAYS))
+    })
+    fig_weekly = px.bar(
+        weekly_frame,
+        x='요일',
+        y='등록 수',
+        color='유형',
+        title='요일별 등록 현황',
+        color_discrete_sequence=['#82ca9d', '#8884d8', '#ffc658']
+    )
+    fig_weekly.update_layout(xaxis_title="요일", yaxis_title="등록 수")
+    figures.put("zero_challenge", "weekly", registrations_version, fig_weekly)
+st.plotly_chart(fig_weekly, use_container_width=True)
+
+st.markdown("---")
+
+section("데이터 관리")
+# 데이터 관리
+st.subheader("🔄 데이터 관리")
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    if ALLOW_RESET and st.button("📊 데이터 초기화", use_container_width=True):
+        registrations.seed(generate_campaign("zero_challenge"), replace=True)
+        st.success("샘플 데이터로 초기화되었습니다!")
+        st.rerun()
+
+with col2:
+    if st.button("📈 통계 새로고침", use_container_width=True):
+        st.info("통계 데이터를 새로고침했습니다!")
+
+with col3:
+    if st.button("📋 등록 내역 보기", use_container_width=True):
+        recent = registrations.recent(10)
+        if recent:
+            st.write("**최근 등록 내역:**")
+            for kind, at in recent:
+                st.write(f"- {kind}: {at:%Y-%m-%d %H:%M}")
+        else:
+            st.info("등록된 내역이 없습니다.")